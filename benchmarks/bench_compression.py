@@ -0,0 +1,269 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the compression modes for a range of payload sizes and links.
+
+The client sends a ``SetState`` of a data model state of the requested size
+to a local gRPC server, then gets it back with ``GetState``, through a proxy
+emulating a link with a given one-way latency and bandwidth. The median time
+of each call is measured with each compression mode, together with the number
+of bytes the request, or the response, took on the link. The server honours
+the client's request to compress responses, as described in
+``rpc_compression``.
+
+Run with ``python benchmarks/bench_compression.py``.
+"""
+
+import argparse
+from concurrent import futures
+import queue
+import socket
+import statistics
+import threading
+import time
+import warnings
+
+import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
+import ansys.api.systemcoupling.v0.command_pb2_grpc as command_pb2_grpc
+import grpc
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import (
+    ConnectionType,
+    StartupAndConnectionInfo,
+)
+from ansys.systemcoupling.core.client.rpc_compression import (
+    RESPONSE_COMPRESSION_KEY,
+    RESPONSE_THRESHOLD_KEY,
+)
+
+# Name, one-way latency in seconds and bandwidth in Mbit/s (None if unlimited).
+_LINKS = (
+    ("loopback", 0.0, None),
+    ("LAN", 0.0005, 1000.0),
+    ("WAN", 0.01, 100.0),
+    ("slow WAN", 0.03, 20.0),
+)
+
+
+def _state(size):
+    # A data model state resembling that of a setup with many data transfers.
+    state = {}
+    i = 0
+    total = 0
+    while total < size:
+        state[f"DataTransfer{i}"] = transfer = {
+            "DisplayName": f"Force{i}",
+            "Suppress": False,
+            "TargetSide": "One",
+            "Option": "UsingVariable",
+            "Source": {"Variable": "FORC", "Participant": "MAPDL-1"},
+            "Target": {"Variable": "force", "Participant": "FLUENT-2"},
+            "RampingOption": "None",
+            "RelaxationFactor": 1.0 - i * 1.0e-6,
+            "ConvergenceTarget": 0.01,
+        }
+        total += len(str(transfer))
+        i += 1
+    return state
+
+
+class _Servicer(command_pb2_grpc.CommandServicer):
+    def __init__(self):
+        self.__state = None
+
+    def InvokeCommand(self, request, context):
+        response = command_pb2.CommandResponse()
+        if request.command == "SetState":
+            self.__state = request.args[1].val
+            return response
+        response.result.CopyFrom(self.__state)
+        metadata = dict(context.invocation_metadata())
+        mode = metadata.get(RESPONSE_COMPRESSION_KEY, "none")
+        if mode == "auto":
+            threshold = int(metadata[RESPONSE_THRESHOLD_KEY])
+            mode = "gzip" if response.ByteSize() >= threshold else "none"
+        if mode != "none":
+            context.set_compression(
+                {"gzip": grpc.Compression.Gzip, "deflate": grpc.Compression.Deflate}[
+                    mode
+                ]
+            )
+        return response
+
+
+class _Link:
+    """TCP proxy emulating a link of given one-way latency and bandwidth."""
+
+    def __init__(self, target_port, latency, bandwidth):
+        self.__target_port = target_port
+        self.__latency = latency
+        self.__bandwidth = bandwidth
+        self.upstream_bytes = 0
+        self.downstream_bytes = 0
+        self.__listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self.__listener.getsockname()[1]
+        threading.Thread(target=self.__accept, daemon=True).start()
+
+    def __accept(self):
+        while True:
+            try:
+                client, _ = self.__listener.accept()
+            except OSError:
+                return
+            server = socket.create_connection(("127.0.0.1", self.__target_port))
+            for s in (client, server):
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.__forward(client, server, True)
+            self.__forward(server, client, False)
+
+    def __forward(self, src, dst, upstream):
+        packets = queue.Queue()
+
+        def receive():
+            while True:
+                try:
+                    data = src.recv(65536)
+                except OSError:
+                    data = b""
+                packets.put((time.monotonic() + self.__latency, data))
+                if not data:
+                    return
+
+        def send():
+            free_at = 0.0
+            while True:
+                due, data = packets.get()
+                if not data:
+                    try:
+                        dst.shutdown(socket.SHUT_WR)
+                    except OSError:
+                        pass
+                    return
+                if self.__bandwidth:
+                    free_at = max(free_at, time.monotonic())
+                    free_at += len(data) * 8 / (self.__bandwidth * 1.0e6)
+                    due = max(due, free_at)
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if upstream:
+                    self.upstream_bytes += len(data)
+                else:
+                    self.downstream_bytes += len(data)
+                try:
+                    dst.sendall(data)
+                except OSError:
+                    return
+
+        threading.Thread(target=receive, daemon=True).start()
+        threading.Thread(target=send, daemon=True).start()
+
+    def close(self):
+        self.__listener.close()
+
+
+def _measure(server_port, size, link, modes, repeats):
+    _, latency, bandwidth = link
+    state = _state(size)
+    proxy = _Link(server_port, latency, bandwidth)
+    rpc = SycGrpc()
+    rpc._connect(
+        connection_info=StartupAndConnectionInfo(
+            launching=False,
+            connection_type=ConnectionType.INSECURE_REMOTE,
+            host="127.0.0.1",
+            port=proxy.port,
+        )
+    )
+    rpc._skip_exit = True
+    requests, responses = [], []
+    try:
+        for mode in modes:
+            rpc.set_compression(mode)
+            rpc.SetState(ObjectPath="/SystemCoupling", State=state)
+            rpc.GetState(ObjectPath="/SystemCoupling")
+            proxy.upstream_bytes = 0
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                rpc.SetState(ObjectPath="/SystemCoupling", State=state)
+                times.append(time.perf_counter() - start)
+            requests.append((statistics.median(times), proxy.upstream_bytes / repeats))
+            proxy.downstream_bytes = 0
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                rpc.GetState(ObjectPath="/SystemCoupling")
+                times.append(time.perf_counter() - start)
+            responses.append(
+                (statistics.median(times), proxy.downstream_bytes / repeats)
+            )
+    finally:
+        rpc.exit()
+        proxy.close()
+    return requests, responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[4096, 16384, 65536, 262144, 2097152],
+        help="approximate payload sizes in bytes",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="calls measured per configuration"
+    )
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    modes = ("none", "gzip", "deflate", "auto")
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    command_pb2_grpc.add_CommandServicer_to_server(_Servicer(), server)
+    server_port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        print(
+            f"{'link':<10}{'payload':>10} {'call':<9}"
+            + "".join(f"{m:>18}" for m in modes)
+            + "  (median ms / KiB on the link)"
+        )
+        for link in _LINKS:
+            for size in args.sizes:
+                measured = _measure(server_port, size, link, modes, args.repeats)
+                for call, results in zip(("SetState", "GetState"), measured):
+                    print(
+                        f"{link[0]:<10}{size // 1024:>7}KiB {call:<9}"
+                        + "".join(
+                            f"{t * 1000:>9.1f} /{b / 1024:>6.0f}" for t, b in results
+                        )
+                    )
+    finally:
+        server.stop(None)
+
+
+if __name__ == "__main__":
+    main()
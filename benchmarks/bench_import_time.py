@@ -0,0 +1,101 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the time taken to import PySystemCoupling, with a budget.
+
+Each import is timed in a fresh interpreter. The run fails, with a non-zero
+exit status, if the median import time exceeds the budget, or if any of the
+modules that should only be loaded on demand - matplotlib, PyPIM and the
+plotting machinery - were imported.
+
+Run with ``python benchmarks/bench_import_time.py``. This is run in CI with
+the default budget.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Modules that are only needed by ``show_plot``, ``solve_with_plot`` and
+# PIM launches, and which are therefore imported on first use.
+DEFERRED_MODULES = (
+    "matplotlib",
+    "ansys.platform.instancemanagement",
+    "ansys.systemcoupling.core.charts.plot_functions",
+    "ansys.systemcoupling.core.charts.plotter",
+)
+
+_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import ansys.systemcoupling.core
+seconds = time.perf_counter() - start
+loaded = [name for name in {DEFERRED_MODULES!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "loaded": loaded}}))
+"""
+
+
+def _time_import() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="timing repeats")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=500.0,
+        help="maximum median import time, in milliseconds",
+    )
+    args = parser.parse_args()
+
+    # Warm up the file system and bytecode caches.
+    _time_import()
+    results = [_time_import() for _ in range(args.repeat)]
+    times = [r["seconds"] * 1e3 for r in results]
+    median = statistics.median(times)
+    print(f"import ansys.systemcoupling.core ({args.repeat} runs, ms)")
+    print(f"{'min':<10}{min(times):>10.1f}")
+    print(f"{'median':<10}{median:>10.1f}")
+    print(f"{'max':<10}{max(times):>10.1f}")
+    print(f"{'budget':<10}{args.budget_ms:>10.1f}")
+
+    failed = False
+    loaded = sorted(set(name for r in results for name in r["loaded"]))
+    if loaded:
+        print(f"FAIL: modules imported eagerly: {', '.join(loaded)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: median import time exceeds the budget of {args.budget_ms} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the latency between a server starting to listen and the
+client connection being established.
+
+A local gRPC server is started after a delay to emulate the launch of System
+Coupling. The legacy readiness polling is compared with the event-driven
+readiness detection, with and without the notification that a launched
+process is listening.
+
+Run with ``python benchmarks/bench_launch_latency.py``.
+"""
+
+import argparse
+from concurrent import futures
+import threading
+import time
+import warnings
+
+import grpc
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc, _find_port
+from ansys.systemcoupling.core.client.grpc_transport import (
+    ConnectionType,
+    StartupAndConnectionInfo,
+)
+from ansys.systemcoupling.core.client.server_readiness import ServerReadiness
+
+
+def _legacy_wait(connection_info, initial_timeout=5.0, factor=1.5, max_timeout=12.0):
+    # The polling previously used by SycGrpc._wait_for_grpc, using a channel
+    # with default reconnection backoff.
+    def make_channel():
+        return grpc.insecure_channel(f"127.0.0.1:{connection_info._options.port}")
+
+    channel = make_channel()
+    timeout = initial_timeout
+    while True:
+        try:
+            grpc.channel_ready_future(channel).result(timeout=timeout)
+            return channel
+        except grpc.FutureTimeoutError:
+            timeout = min(timeout * factor, max_timeout)
+            channel.close()
+            channel = make_channel()
+
+
+def _event_wait(connection_info, readiness=None):
+    rpc = SycGrpc()
+    rpc._connect(connection_info=connection_info, readiness=readiness)
+    rpc._skip_exit = True
+    return rpc
+
+
+def _measure(method, delay):
+    port = _find_port()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    connection_info = StartupAndConnectionInfo(
+        launching=False,
+        connection_type=ConnectionType.INSECURE_REMOTE,
+        host="127.0.0.1",
+        port=port,
+    )
+    readiness = ServerReadiness() if method == "event + listening" else None
+    started = {}
+
+    def start_server():
+        # The port is only bound now, as it would be by a launched server.
+        started["t"] = time.monotonic()
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        server.start()
+        if readiness:
+            readiness.notify_listening()
+
+    timer = threading.Timer(delay, start_server)
+    timer.start()
+    try:
+        if method == "legacy polling":
+            connection = _legacy_wait(connection_info)
+        else:
+            connection = _event_wait(connection_info, readiness)
+        latency = time.monotonic() - started["t"]
+        connection.close() if method == "legacy polling" else connection.exit()
+        return latency
+    finally:
+        timer.join()
+        server.stop(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--delays",
+        type=float,
+        nargs="+",
+        default=[0.5, 2.0, 4.0, 6.0],
+        help="server start delays in seconds",
+    )
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    methods = ("legacy polling", "event", "event + listening")
+    print(f"{'start delay':<13}" + "".join(f"{m:>20}" for m in methods))
+    for delay in args.delays:
+        latencies = [_measure(method, delay) for method in methods]
+        print(f"{delay:<12.1f}s" + "".join(f"{t:>19.3f}s" for t in latencies))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the processing of the server metadata from which the API
+classes are built, against the original implementation.
+
+The metadata is synthetic, with a size of the order of that of a 26.x
+server at the default scale. Three stages are timed:
+
+- merging the injected commands into the command metadata, originally with
+  a linear search by name for each injected command,
+- combining the data model and command metadata for the setup API,
+  originally with a deep copy of the data model metadata,
+- obtaining the hash that is compared with that of the generated API
+  classes, originally by serializing the static info of each API category,
+  now from the digests of the query results as received.
+
+Run with ``python benchmarks/bench_metadata_pipeline.py``.
+"""
+
+import argparse
+from copy import deepcopy
+import json
+import timeit
+
+import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
+
+from ansys.systemcoupling.core.adaptor.impl.injected_commands_provider import (
+    get_injected_cmd_metadata,
+)
+from ansys.systemcoupling.core.adaptor.impl.metadata_repository import (
+    MetadataRepository,
+)
+from ansys.systemcoupling.core.adaptor.impl.root_source import get_hash
+from ansys.systemcoupling.core.adaptor.impl.static_info import (
+    _merge_cmd_data,
+    get_cmd_metadata,
+    get_dm_metadata,
+    make_cmdonly_metadata,
+    make_combined_metadata,
+    process_cmd_data,
+)
+from ansys.systemcoupling.core.client.grpc_client import _payload_digest
+from ansys.systemcoupling.core.client.variant import to_variant
+from ansys.systemcoupling.core.types import SystemCouplingMode
+
+_DOC = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4
+_PARAMETER_TYPES = ("Integer", "Logical", "Real", "String", "Real List")
+_CATEGORIES = ("setup", "case", "solution")
+
+
+def _legacy_merge_cmd_data(target: list, source: list) -> None:
+    def find_item_by_name(items, name):
+        for item in items:
+            if item["name"] == name:
+                return item
+        raise RuntimeError(f"Did not find dict element of list with 'name' == {name}")
+
+    target_names = set(d["name"] for d in target)
+    source_names = set(d["name"] for d in source)
+    new_names = source_names - target_names
+    common_names = source_names & target_names
+    special_injected_commands = [
+        name
+        for name in common_names
+        if "pysyc_internal_name" in find_item_by_name(source, name)
+    ]
+    for name in special_injected_commands:
+        src_item = find_item_by_name(source, name)
+        tgt_item = find_item_by_name(target, name)
+        tgt_copy = deepcopy(tgt_item)
+        if "doc" in tgt_item:
+            tgt_item["doc"] = "For internal use only."
+        for _, arg_info in tgt_item.get("args", []):
+            if "doc" in arg_info:
+                arg_info["doc"] = "..."
+        tgt_item["pyname"] = src_item["pysyc_internal_name"]
+        for k, v in tgt_copy.items():
+            if k in ("essentialArgNames", "optionalArgNames", "args"):
+                src_item[k] = src_item.get(f"{k}_extra", []) + v
+            elif k == "doc":
+                src_item[k] = src_item.get("doc_prefix", "") + v
+            else:
+                src_item[k] = v
+        src_item["name"] = src_item["pyname"]
+        common_names.remove(name)
+        new_names.add(src_item["name"])
+    for src_item in source:
+        name = src_item["name"]
+        if name in new_names:
+            target.append(src_item)
+        elif name in common_names:
+            tgt_item = find_item_by_name(target, name)
+            for k, v in src_item.items():
+                tgt_item[k] = v
+
+
+def _legacy_combined_metadata(dm_metadata, cmd_metadata, category):
+    metadata = deepcopy(dm_metadata)
+    metadata["SystemCoupling"]["__commands"] = process_cmd_data(
+        cmd_metadata, category=category
+    )
+    metadata["SystemCoupling"]["category_root"] = f"{category}_root"
+    return metadata
+
+
+def _datamodel(n_types, n_parameters, depth, prefix="", ordinal=0):
+    """Return raw data model metadata and the matching PySystemCoupling data
+    model metadata for a tree of objects."""
+    parameters = {
+        f"{prefix}Parameter{i}": {
+            "ordinal": i,
+            "type": _PARAMETER_TYPES[i % len(_PARAMETER_TYPES)],
+        }
+        for i in range(n_parameters)
+    }
+    children = {}
+    children_ex = {}
+    if depth > 0:
+        for i in range(n_types):
+            name = f"{prefix}Object{i}"
+            children[name], children_ex[name] = _datamodel(
+                n_types, n_parameters, depth - 1, name, i
+            )
+    info = {
+        "__children": children,
+        "__parameters": parameters,
+        "creatableNamedChildren": [],
+        "isEntity": False,
+        "isNamed": ordinal % 3 == 1,
+        "ordinal": ordinal,
+    }
+    info_ex = {name: {"doc": _DOC} for name in parameters}
+    info_ex.update({name: {"doc": _DOC, **ex} for name, ex in children_ex.items()})
+    return info, info_ex
+
+
+def _commands(n_commands, n_args):
+    """Return raw command metadata and the matching PySystemCoupling command
+    metadata, including the commands that injected commands replace."""
+    names = [f"Command{i}" for i in range(n_commands)]
+    names += [
+        item["name"]
+        for item in get_injected_cmd_metadata(SystemCouplingMode.COSIM)
+        if "pysyc_internal_name" in item
+    ]
+    native = []
+    pysyc = {}
+    for i, name in enumerate(names):
+        args = [f"Argument{j}" for j in range(n_args)]
+        native.append(
+            {
+                "name": name,
+                "args": [(arg, {"Type": "<class 'str'>"}) for arg in args],
+                "defaults": (),
+                "essentialArgNames": args[:1],
+                "optionalArgNames": args[1:],
+                "isQuery": i % 2 == 0,
+                "retType": "<class 'object'>",
+            }
+        )
+        pysyc[name] = {
+            "exposure": _CATEGORIES[i % len(_CATEGORIES)],
+            "doc": _DOC,
+            "args": [{"name": arg, "type": "String", "doc": _DOC} for arg in args],
+        }
+    return native, pysyc
+
+
+def _count_items(info):
+    return sum(
+        1 + _count_items(child) for child in info.get("__children", {}).values()
+    ) + len(info.get("__parameters", {}))
+
+
+class _Queries:
+    """Serves the synthetic metadata in place of the *native API*."""
+
+    def __init__(self, scale):
+        dm, dm_ex = _datamodel(8 * scale, 10, 3)
+        self.dm = {"SystemCoupling": dm}
+        self.dm_ex = {"SystemCoupling": dm_ex}
+        self.cmds, self.cmds_ex = _commands(300 * scale, 6)
+
+    def GetMetadata(self, json_ret=False):
+        return deepcopy(self.dm)
+
+    def GetPySycDatamodelMetadata(self):
+        return self.dm_ex
+
+    def GetCommandAndQueryMetadata(self):
+        return self.cmds
+
+    def GetPySycCommandMetadata(self):
+        return self.cmds_ex
+
+
+class _Received:
+    """Serves the responses to the synthetic metadata queries as received
+    from a server, with the digest of each."""
+
+    def __init__(self, queries):
+        self.__responses = {}
+        for name, value in (
+            ("GetMetadata", json.dumps(queries.dm)),
+            ("GetPySycDatamodelMetadata", queries.dm_ex),
+            ("GetCommandAndQueryMetadata", queries.cmds),
+            ("GetPySycCommandMetadata", queries.cmds_ex),
+        ):
+            response = command_pb2.CommandResponse()
+            to_variant(value, response.result)
+            self.__responses[name] = response
+
+    def execute_command_with_digest(self, name, **kwargs):
+        return None, _payload_digest(self.__responses[name])
+
+
+def _time(fn, setup, repeat):
+    # The setup provides fresh inputs, as some of the stages modify them.
+    best = None
+    for _ in range(repeat):
+        args = setup()
+        best = min(best or float("inf"), timeit.timeit(lambda: fn(*args), number=1))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, help="metadata size factor")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats")
+    args = parser.parse_args()
+
+    queries = _Queries(args.scale)
+    dm_metadata = get_dm_metadata(queries, "SystemCoupling")
+    cmd_metadata = get_cmd_metadata(queries)
+    injected = get_injected_cmd_metadata(SystemCouplingMode.COSIM)
+    _merge_cmd_data(cmd_metadata, deepcopy(injected))
+    print(
+        f"{len(cmd_metadata)} commands, {_count_items(dm_metadata['SystemCoupling'])} data model "
+        f"items, {len(repr(dm_metadata)) / 1e6:.1f} MB of data model metadata"
+    )
+
+    def merge_inputs():
+        return get_cmd_metadata(queries), get_injected_cmd_metadata(
+            SystemCouplingMode.COSIM
+        )
+
+    def legacy_hashes():
+        for category in _CATEGORIES:
+            if category == "setup":
+                info = _legacy_combined_metadata(dm_metadata, cmd_metadata, category)
+            else:
+                info, _ = make_cmdonly_metadata(cmd_metadata, category)
+            get_hash(info)
+
+    received = _Received(queries)
+
+    def hashes():
+        repository = MetadataRepository(received)
+        for category in _CATEGORIES:
+            repository.static_info_hash(category)
+
+    stages = [
+        (
+            "merge injected commands",
+            _legacy_merge_cmd_data,
+            _merge_cmd_data,
+            merge_inputs,
+        ),
+        (
+            "combine setup metadata",
+            _legacy_combined_metadata,
+            make_combined_metadata,
+            lambda: (dm_metadata, cmd_metadata, "setup"),
+        ),
+        ("hash static info", legacy_hashes, hashes, tuple),
+    ]
+    print(f"{'stage':<26}{'legacy':>10}{'current':>10}  (ms)")
+    legacy_total = total = 0.0
+    for name, legacy_fn, fn, setup in stages:
+        legacy_time = _time(legacy_fn, setup, args.repeat)
+        current_time = _time(fn, setup, args.repeat)
+        legacy_total += legacy_time
+        total += current_time
+        print(f"{name:<26}{legacy_time * 1e3:>10.1f}{current_time * 1e3:>10.1f}")
+    print(f"{'total':<26}{legacy_total * 1e3:>10.1f}{total * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of client-side code against a recorded session.
+
+A session is recorded by running a script with the ``PYSYC_RPC_RECORD_FILE``
+environment variable set to the path of the trace file. The same script is
+then run repeatedly against a replay of the trace, with no server, so that
+the time measured is that spent in the client, for example in the data model
+API classes, the state key adaptation and the Variant conversions.
+
+The script must define a ``run(session)`` function, performing the work to be
+measured using the provided ``Session``.
+
+Run with ``python benchmarks/bench_replay.py TRACE_FILE SCRIPT``.
+"""
+
+import argparse
+import importlib.util
+import statistics
+import time
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.rpc_replay import load_trace
+from ansys.systemcoupling.core.session import Session
+
+
+def _load_run(script):
+    spec = importlib.util.spec_from_file_location("_bench_script", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.run
+
+
+def _measure(calls, run, time_scale):
+    rpc = SycGrpc()
+    channel = rpc.connect_replay(calls, time_scale=time_scale)
+    session = Session(rpc)
+    start = time.perf_counter()
+    run(session)
+    seconds = time.perf_counter() - start
+    session.exit()
+    return seconds, channel.mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace", help="path of the recorded trace file")
+    parser.add_argument("script", help="path of a script defining run(session)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.0,
+        help="factor applied to the recorded server think time (default 0)",
+    )
+    args = parser.parse_args()
+
+    calls = load_trace(args.trace)
+    run = _load_run(args.script)
+    times = []
+    for _ in range(args.repeat):
+        seconds, mismatches = _measure(calls, run, args.time_scale)
+        times.append(seconds)
+    print(f"{len(calls)} recorded calls, {args.repeat} runs")
+    print(
+        f"min {min(times) * 1000:.1f} ms, median {statistics.median(times) * 1000:.1f} ms"
+    )
+    if mismatches:
+        print(f"warning: {mismatches} requests did not match the recording")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the ``Variant`` codec against the original recursive
+implementation.
+
+Run with ``python benchmarks/bench_variant_codec.py``. NumPy is required.
+"""
+
+import argparse
+import timeit
+
+from ansys.api.systemcoupling.v0 import variant_pb2
+import numpy as np
+
+from ansys.systemcoupling.core.client.variant import from_variant, to_variant
+
+
+def _legacy_to_variant(val, var):
+    if val is None:
+        var.none_state = variant_pb2.NONE_VALUE
+    elif isinstance(val, bool):
+        var.bool_state = val
+    elif isinstance(val, int):
+        var.int64_state = val
+    elif isinstance(val, float):
+        var.double_state = val
+    elif isinstance(val, str):
+        var.string_state = val
+    elif isinstance(val, (list, tuple)):
+        if len(val) == 0:
+            var.variant_vector_state.item.add()
+            var.variant_vector_state.item.pop()
+        for item in val:
+            _legacy_to_variant(item, var.variant_vector_state.item.add())
+    elif isinstance(val, dict):
+        if len(val) == 0:
+            var.variant_map_state.item["__"].none_state = variant_pb2.NONE_VALUE
+            del var.variant_map_state.item["__"]
+        for k, v in val.items():
+            _legacy_to_variant(v, var.variant_map_state.item[k])
+
+
+def _legacy_from_variant(var):
+    what = var.WhichOneof("as")
+    if what == "none_state":
+        return None
+    if not what.startswith("variant_"):
+        return getattr(var, what)
+    if what == "variant_vector_state":
+        return [_legacy_from_variant(val) for val in var.variant_vector_state.item]
+    return {k: _legacy_from_variant(v) for k, v in var.variant_map_state.item.items()}
+
+
+def _large_state(n_interfaces, n_transfers):
+    """A ``GetState``-like payload for a large setup."""
+    return {
+        f"Interface{i}": {
+            "DisplayName": f"Interface {i}",
+            "Side": {
+                side: {"CouplingParticipant": f"P{j}", "RegionList": ["r1", "r2"]}
+                for j, side in enumerate(("One", "Two"))
+            },
+            "DataTransfer": {
+                f"Transfer{t}": {
+                    "TargetSide": "One",
+                    "Option": "UsingVariable",
+                    "RelaxationFactor": 1.0,
+                    "ConvergenceTarget": 0.01,
+                    "Stabilization": {"Option": "None", "InitialIterations": 2},
+                }
+                for t in range(n_transfers)
+            },
+        }
+        for i in range(n_interfaces)
+    }
+
+
+def _cases(scale):
+    reals = np.random.default_rng(0).random(100_000 * scale)
+    return {
+        "nested state": _large_state(100 * scale, 10),
+        "real list": reals.tolist(),
+        "string list": [f"region{i}" for i in range(50_000 * scale)],
+        "expression table": reals.reshape(-1, 4).tolist(),
+    }
+
+
+def _time(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, help="payload size factor")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats")
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<18}{'legacy enc':>12}{'enc':>10}{'legacy dec':>12}{'dec':>10}"
+        f"{'legacy size':>13}{'size':>10}"
+    )
+    for name, val in _cases(args.scale).items():
+        legacy_var = variant_pb2.Variant()
+        _legacy_to_variant(val, legacy_var)
+        var = variant_pb2.Variant()
+        to_variant(val, var)
+        assert from_variant(var) == _legacy_from_variant(legacy_var)
+
+        legacy_enc = _time(
+            lambda: _legacy_to_variant(val, variant_pb2.Variant()), args.repeat
+        )
+        enc = _time(lambda: to_variant(val, variant_pb2.Variant()), args.repeat)
+        legacy_dec = _time(lambda: _legacy_from_variant(legacy_var), args.repeat)
+        dec = _time(lambda: from_variant(var), args.repeat)
+        print(
+            f"{name:<18}{legacy_enc:>11.3f}s{enc:>9.3f}s{legacy_dec:>11.3f}s"
+            f"{dec:>9.3f}s{legacy_var.ByteSize():>13}{var.ByteSize():>10}"
+        )
+
+    reals = np.random.default_rng(0).random(100_000 * args.scale)
+    enc = _time(lambda: to_variant(reals, variant_pb2.Variant()), args.repeat)
+    var = variant_pb2.Variant()
+    to_variant(reals, var)
+    dec = _time(lambda: from_variant(var, as_numpy=True), args.repeat)
+    print(f"{'ndarray (NumPy)':<18}{'':>12}{enc:>9.3f}s{'':>12}{dec:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
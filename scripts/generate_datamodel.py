@@ -32,9 +32,14 @@ The -y argument will result in various YAML files being output
 containing pre-processed metadata (both datamodel and commands)
 that is passed as input to the class generation code.
 
+The parsed injected command data in
+ansys/systemcoupling/core/adaptor/impl/injected_cmd_data_cosim.py
+is regenerated with the API classes. The -i argument regenerates
+only this module, which does not need a System Coupling server.
+
 Usage
 -----
-python <path to generate_datamodel.py> [-t] [-n] [-d] [-y]
+python <path to generate_datamodel.py> [-t] [-n] [-d] [-y] [-i]
 """
 
 import io
@@ -56,6 +61,7 @@ sys.path.append(_scriptpath.parents[1])
 
 import ansys.systemcoupling.core as pysyc
 from ansys.systemcoupling.core import LOG
+from ansys.systemcoupling.core.adaptor.impl import injected_commands_cosim
 from ansys.systemcoupling.core.adaptor.impl import root_source as adaptor_source
 from ansys.systemcoupling.core.adaptor.impl.get_syc_version import get_syc_version
 from ansys.systemcoupling.core.adaptor.impl.static_info import (
@@ -526,7 +532,7 @@ def _write_cls_helper(out, cls, indent=0):
         raise
 
 
-def write_settings_classes(out: IO, cls, obj_info):
+def write_settings_classes(out: IO, cls, obj_info, info_hash=None):
     """
     Write the settings classes in 'out' stream.
 
@@ -534,7 +540,7 @@ def write_settings_classes(out: IO, cls, obj_info):
     ----------
     out:     Stream
     """
-    hash = _gethash(obj_info)
+    hash = info_hash or _gethash(obj_info)
     out.write('"""This is an auto-generated file.  DO NOT EDIT!"""\n')
     out.write("\n")
     out.write("from ansys.systemcoupling.core.adaptor.impl.types import *\n\n")
@@ -543,7 +549,7 @@ def write_settings_classes(out: IO, cls, obj_info):
 
 
 def write_classes_to_file(
-    filepath, obj_info, root_type="SystemCoupling", want_flat=False
+    filepath, obj_info, root_type="SystemCoupling", want_flat=False, info_hash=None
 ):
     cls = adaptor_source.get_cls(root_type, obj_info[root_type])
 
@@ -555,11 +561,13 @@ def write_classes_to_file(
         parent_dir = os.path.dirname(filepath)
         # Ensure parent dir exists
         os.makedirs(parent_dir, exist_ok=True)
-        _write_flat_class_files(parent_dir, cls.__name__, _gethash(obj_info))
+        _write_flat_class_files(
+            parent_dir, cls.__name__, info_hash or _gethash(obj_info)
+        )
         return
 
     with io.StringIO() as out:
-        write_settings_classes(out, cls, obj_info)
+        write_settings_classes(out, cls, obj_info, info_hash)
         content = out.getvalue()
 
     content = _format_content(content, filepath)
@@ -656,6 +664,12 @@ def _generate_real_classes(dirname, generate_flat_classes):
     _dump_yaml(cmd_metadata_orig, "command_metadata.yml", version)
     LOG.debug("Command metadata received. Processing...")
 
+    # The hashes recorded in the classes are those that sessions compare
+    # them with. See MetadataRepository.static_info_hash.
+    metadata = syc._get_metadata()
+    _write_prebuilt_metadata(dirname, metadata)
+    _generate_injected_cmd_data(dirname)
+
     dm_metadata = make_combined_metadata(
         dm_metadata, cmd_metadata_orig, category="setup"
     )
@@ -678,7 +692,12 @@ def _generate_real_classes(dirname, generate_flat_classes):
 
     LOG.debug("Creating 'setup' classes.")
     filepath = os.path.join(filedir, "setup.py")
-    write_classes_to_file(filepath, dm_metadata, want_flat=generate_flat_classes)
+    write_classes_to_file(
+        filepath,
+        dm_metadata,
+        want_flat=generate_flat_classes,
+        info_hash=metadata.static_info_hash("setup"),
+    )
 
     for category in ("case", "solution"):
         LOG.debug(f"Processing '{category}' command data...")
@@ -689,11 +708,70 @@ def _generate_real_classes(dirname, generate_flat_classes):
         LOG.debug(f"Creating '{category}' classes...")
         filepath = os.path.join(filedir, f"{category}.py")
         write_classes_to_file(
-            filepath, cat_metadata, root_type=root_type, want_flat=generate_flat_classes
+            filepath,
+            cat_metadata,
+            root_type=root_type,
+            want_flat=generate_flat_classes,
+            info_hash=metadata.static_info_hash(category),
         )
     LOG.debug("All done.")
 
 
+def _write_prebuilt_metadata(dirname, metadata):
+    # Processed metadata shipped with the package, so that sessions connected
+    # to this server build do not need to query and process it.
+    filedir = os.path.normpath(
+        os.path.join(
+            dirname,
+            "..",
+            "src",
+            "ansys",
+            "systemcoupling",
+            "core",
+            "adaptor",
+            "metadata",
+        )
+    )
+    for path in metadata.write_prebuilt(filedir):
+        LOG.debug(f"Prebuilt metadata written to {path}.")
+
+
+def _generate_injected_cmd_data(dirname):
+    # The parsed injected command data is shipped as a Python literal, so that
+    # sessions need not parse its YAML source. It needs no server.
+    source = injected_commands_cosim.get_injected_cmd_source()
+    data = injected_commands_cosim._parse_cmd_yaml(source)
+    filepath = os.path.normpath(
+        os.path.join(
+            dirname,
+            "..",
+            "src",
+            "ansys",
+            "systemcoupling",
+            "core",
+            "adaptor",
+            "impl",
+            "injected_cmd_data_cosim.py",
+        )
+    )
+    with io.StringIO() as out:
+        out.write("#\n# This is an auto-generated file.  DO NOT EDIT!\n#\n\n")
+        out.write(
+            '"""Injected command data of the cosim mode, parsed from the YAML '
+            "source in\n``injected_commands_cosim`` by "
+            '``scripts/generate_datamodel.py``."""\n\n'
+        )
+        out.write(
+            f"SOURCE_HASH = {injected_commands_cosim.hash_cmd_source(source)!r}\n\n"
+        )
+        out.write(f"DATA = {pprint.pformat(data, sort_dicts=False)}\n")
+        content = out.getvalue()
+    content = _format_content(content, filepath)
+    with open(filepath, "w") as f:
+        f.write(content)
+    print(f"Finished generating {filepath}")
+
+
 def _set_yaml_dump(is_on):
     global dump_yaml_on
     dump_yaml_on = is_on
@@ -710,19 +788,23 @@ if __name__ == "__main__":
     use_test_data = False
     generate_flat_classes = True
     wait_for_debug = False
+    injected_data_only = False
     if len(sys.argv) > 1:
         args = sys.argv[1:]
         use_test_data = "-t" in args
         # nested classes required?
         generate_flat_classes = "-n" not in args
         wait_for_debug = "-d" in args
+        injected_data_only = "-i" in args
 
         _set_yaml_dump("-y" in args)
 
     if wait_for_debug:
         input("continue...")
 
-    if use_test_data:
+    if injected_data_only:
+        _generate_injected_cmd_data(dirname)
+    elif use_test_data:
         _generate_test_classes(dirname, generate_flat_classes)
     else:
         _generate_real_classes(dirname, generate_flat_classes)
@@ -26,12 +26,12 @@ import os
 import appdirs
 
 from ansys.systemcoupling.core.client.grpc_client import SycGrpc, ConnectionType
+from ansys.systemcoupling.core.client.async_grpc_client import AsyncSycGrpc
 from ansys.systemcoupling.core.session import Session
+from ansys.systemcoupling.core.async_session import AsyncSession
 from ansys.systemcoupling.core.types import SystemCouplingMode
 from ansys.systemcoupling.core.util.logging import LOG
 
-import ansys.platform.instancemanagement as pypim
-
 try:
     import importlib.metadata as importlib_metadata
 except ModuleNotFoundError:  # pragma: no cover
@@ -108,6 +108,9 @@ def launch(
         Session object, providing access to a set up and solve API controlling a
         remote System Coupling instance.
     """
+    # PyPIM is only imported when a launch is requested.
+    import ansys.platform.instancemanagement as pypim
+
     rpc = SycGrpc()
     version = str(version) if version is not None else None
     if pypim.is_configured():
@@ -215,6 +218,37 @@ def connect(
     return syc
 
 
+async def connect_async(
+    host: str, port: int, connection_type: ConnectionType = ConnectionType.SECURE_LOCAL
+) -> AsyncSession:  # pragma: no cover
+    """Connect asynchronously to an instance of System Coupling already running
+    in server mode.
+
+    This is the ``asyncio`` counterpart of :func:`connect<core.connect>`. It
+    allows many server instances to be driven concurrently from a single
+    event loop.
+
+    Parameters
+    ----------
+    host : str
+        IP address of the system running the System Coupling instance.
+    port : int
+        Port on which to connect to System Coupling.
+    connection_type: ConnectionType, optional
+        Specifies the type of connection to make with System Coupling.
+        See :func:`connect<core.connect>` for details.
+
+    Returns
+    -------
+    ansys.systemcoupling.core.async_session.AsyncSession
+        Session object providing an awaitable API controlling a
+        remote System Coupling instance.
+    """
+    rpc = AsyncSycGrpc()
+    await rpc.connect(host, port, connection_type)
+    return AsyncSession(rpc)
+
+
 # Set up data directory
 USER_DATA_PATH = appdirs.user_data_dir(
     appname="ansys_systemcoupling_core", appauthor="Ansys"
@@ -0,0 +1,182 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+
+from ansys.systemcoupling.core.adaptor.impl.metadata_cache import metadata_fingerprint
+from ansys.systemcoupling.core.adaptor.impl.metadata_repository import (
+    MetadataRepository,
+)
+from ansys.systemcoupling.core.adaptor.impl.syc_proxy import SycProxy
+from ansys.systemcoupling.core.adaptor.impl.syc_proxy_interface import SycProxyInterface
+from ansys.systemcoupling.core.types import SystemCouplingMode
+from ansys.systemcoupling.core.util.state_keys import (
+    adapt_client_named_object_keys,
+    adapt_native_named_object_keys,
+)
+
+
+class _PrefetchedQueries:
+    """Stands in for the *native API* in the synchronous metadata processing
+    functions, serving the results of queries that were made asynchronously.
+
+    The results are not copied. The proxy's ``MetadataRepository`` uses each
+    of them only once. Each result is held with the digest identifying it.
+    See ``SycGrpc.execute_command_with_digest``.
+    """
+
+    def __init__(self, results: dict):
+        self.__results = results
+
+    def execute_command_with_digest(self, name, **kwargs):
+        try:
+            return self.__results[name]
+        except KeyError:
+            raise RuntimeError(f"Query '{name}' has not been prefetched.") from None
+
+    def __getattr__(self, name):
+        return lambda **kwargs: self.execute_command_with_digest(name)[0]
+
+
+async def _query_with_digest(rpc, name, **kwargs) -> tuple:
+    execute = getattr(type(rpc), "execute_command_with_digest", None)
+    if execute is not None:
+        return await execute(rpc, name, **kwargs)
+    result = await rpc.execute_command(name, **kwargs)
+    return result, metadata_fingerprint(result)
+
+
+async def make_static_info_proxy(rpc, mode=SystemCouplingMode.COSIM) -> SycProxy:
+    """Run the metadata queries needed to construct the API classes
+    concurrently and return a ``SycProxy`` that provides the *static info*
+    from the results, without making any further remote calls.
+
+    The data model and command metadata are not queried if the processed
+    metadata of the server build is in the cache. Otherwise, all of it is
+    processed and cached here, so that later sessions need not query it.
+    """
+    cmd_metadata = await _query_with_digest(rpc, "GetCommandAndQueryMetadata")
+    prefetched = {"GetCommandAndQueryMetadata": cmd_metadata}
+    if any(cmd["name"] == "GetVersion" for cmd in cmd_metadata[0]):
+        prefetched["GetVersion"] = await _query_with_digest(rpc, "GetVersion")
+    queries = _PrefetchedQueries(prefetched)
+    metadata = MetadataRepository(queries, mode)
+    if not metadata.is_cached():
+        raw_queries = {
+            "GetMetadata": {"json_ret": True},
+            "GetPySycDatamodelMetadata": {},
+            "GetPySycCommandMetadata": {},
+        }
+        results = await asyncio.gather(
+            *(
+                _query_with_digest(rpc, name, **kwargs)
+                for name, kwargs in raw_queries.items()
+            )
+        )
+        prefetched.update(zip(raw_queries, results))
+        metadata.cache_session_metadata()
+    return SycProxy(queries, mode, metadata)
+
+
+class AsyncSycProxy(SycProxyInterface):
+    """Proxy for use with ``AsyncSycGrpc``.
+
+    The static information is provided synchronously by a proxy created with
+    ``make_static_info_proxy``. All other methods return coroutines.
+    """
+
+    def __init__(self, rpc, static_info_proxy: SycProxy):
+        self.__rpc = rpc
+        self.__static_info_proxy = static_info_proxy
+        self.__injected_cmds = {}
+        self.__defunct = False
+
+    def reset_rpc(self, rpc):
+        """Reset the original ``rpc`` instance. See ``SycProxy.reset_rpc``."""
+        self.__rpc = rpc
+        self.__defunct = True
+
+    def set_injected_commands(self, cmd_dict: dict) -> None:
+        """Set a dictionary of names mapped to locally defined *injected commands*.
+
+        The functions in the dictionary must be coroutine functions.
+        """
+        self.__injected_cmds = cmd_dict
+
+    def get_static_info(self, category):
+        return self.__static_info_proxy.get_static_info(category)
+
+    def get_static_info_hash(self, category):
+        return self.__static_info_proxy.get_static_info_hash(category)
+
+    def get_api_class_spec(self, category, make_spec):
+        return self.__static_info_proxy.get_api_class_spec(category, make_spec)
+
+    def get_version(self):
+        return self.__static_info_proxy.get_version()
+
+    async def set_state(self, path, state):
+        state = adapt_client_named_object_keys(
+            state,
+            self.__static_info_proxy.get_named_object_level_map(),
+            path.count("/") - 1,
+        )
+        await self.__rpc.SetState(ObjectPath=path, State=state)
+
+    async def get_state(self, path):
+        state = await self.__rpc.GetState(ObjectPath=path)
+        if isinstance(state, dict):
+            return adapt_native_named_object_keys(state)
+        return state
+
+    async def get_property_state(self, path, property):
+        return await self.__rpc.GetParameter(ObjectPath=path, Name=property)
+
+    async def delete(self, path):
+        await self.__rpc.DeleteObject(ObjectPath=path)
+
+    async def create_named_object(self, path, name):
+        await self.set_state(f"{path}:{name}", {})
+
+    async def get_object_names(self, path):
+        return await self.__rpc.GetChildNamesStr(ObjectPath=path)
+
+    async def get_property_options(self, path, name):
+        return await self.__rpc.GetParameterOptions(ObjectPath=path, Name=name)
+
+    async def execute_cmd(self, *args, **kwargs):
+        cmd_name = args[1]
+        return await self.__rpc.execute_command(cmd_name, **kwargs)
+
+    async def execute_injected_cmd(self, *args, **kwargs):
+        if self.__defunct:
+            # Force the raising of the defunct rpc's usual error.
+            self.__rpc.trigger_error
+        cmd_name = args[1]
+        cmd = self.__injected_cmds.get(cmd_name, None)
+        if cmd is None:
+            raise RuntimeError(
+                f"Injected command '{cmd_name}' is not available in an "
+                "asynchronous session."
+            )
+        return await cmd(**kwargs)
@@ -0,0 +1,166 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Awaitable view of the adaptor API types.
+
+The API classes in ``types.py`` call the *sycproxy* synchronously. When the
+proxy is an ``AsyncSycProxy``, its methods return coroutines instead, and the
+``AsyncObject`` wrapper defined here adapts the API objects so that every
+operation that requires a remote call returns an awaitable, while navigation
+through the hierarchy (attribute and index access) remains synchronous and
+local.
+
+Example
+-------
+
+setup = await session.setup
+await setup.solution_control.set_state({"time_step_size": "0.1 [s]"})
+assert await setup.solution_control.time_step_size == "0.1 [s]"
+intf = await setup.coupling_interface.create("interface-1")
+"""
+
+from ansys.systemcoupling.core.adaptor.impl.types import (
+    Base,
+    Command,
+    Container,
+    InjectedCommand,
+    NamedContainer,
+    StringList,
+)
+
+
+class AsyncObject:
+    """Wraps an adaptor API object so that remote operations return awaitables.
+
+    Child objects, named children and commands are accessed exactly as on the
+    wrapped object and are returned wrapped. Property access returns an
+    awaitable of the property value. Properties cannot be assigned directly;
+    use ``set_state`` or ``set_property_state`` and await the result.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Base):
+        object.__setattr__(self, "_obj", obj)
+
+    @property
+    def path(self) -> str:
+        """Path of the wrapped object."""
+        return self._obj.path
+
+    def __repr__(self):
+        return f"AsyncObject({self._obj.path!r})"
+
+    async def get_state(self):
+        """Get the state of the object."""
+        obj = self._obj
+        return obj.to_python_keys(await obj.sycproxy.get_state(obj.syc_path))
+
+    async def set_state(self, state):
+        """Set the state of the object."""
+        obj = self._obj
+        await obj.sycproxy.set_state(obj.syc_path, obj.to_syc_keys(state))
+
+    async def get_property_state(self, prop: str):
+        """Get the state of the ``prop`` property."""
+        obj = self._obj
+        return await obj.sycproxy.get_property_state(
+            obj.syc_path, obj.to_syc_name(prop)
+        )
+
+    async def set_property_state(self, prop: str, value):
+        """Set the state of the ``prop`` property to ``value``."""
+        await self.set_state({prop: value})
+
+    def __call__(self, **kwargs):
+        obj = self._obj
+        if isinstance(obj, (Command, InjectedCommand)):
+            # Commands return the coroutine provided by the proxy.
+            return obj(**kwargs)
+        return self.get_state()
+
+    def __getattr__(self, name: str):
+        obj = self._obj
+        if name in getattr(obj, "child_names", ()) or name in getattr(
+            obj, "command_names", ()
+        ):
+            return AsyncObject(getattr(obj, name))
+        if any(name == n for n, _, __ in getattr(obj, "property_names_types", ())):
+            return self.get_property_state(name)
+        raise AttributeError(f"'{obj.path}' has no attribute '{name}'.")
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(
+            f"Cannot assign '{name}' on an asynchronous API object. "
+            f"Use 'await obj.set_state({{'{name}': value}})' instead."
+        )
+
+    async def get_property_options(self, name: str) -> StringList:
+        """Get the currently available options for a specified property.
+
+        See ``Container.get_property_options``.
+        """
+        obj = self._obj
+        if not isinstance(obj, Container):
+            raise RuntimeError(f"'{obj.path}' has no properties.")
+        syc_prop_name, prop_type = obj._get_property_name_type(name, obj.path)
+        if prop_type not in ("str", "StringListType"):
+            raise RuntimeError(
+                f"Options are not available for non-string type '{name}'."
+            )
+        return await obj.sycproxy.get_property_options(obj.syc_path, syc_prop_name)
+
+    # Named object container API
+
+    def _named_container(self) -> NamedContainer:
+        obj = self._obj
+        if not isinstance(obj, NamedContainer):
+            raise RuntimeError(f"'{obj.path}' is not a named object container.")
+        return obj
+
+    async def get_object_names(self) -> list[str]:
+        """Get object names."""
+        obj = self._named_container()
+        return await obj.sycproxy.get_object_names(obj.syc_path)
+
+    async def contains(self, name: str) -> bool:
+        """Whether a named object exists."""
+        return name in await self.get_object_names()
+
+    async def create(self, name: str) -> "AsyncObject":
+        """Create a named object and return it."""
+        obj = self._named_container()
+        await obj.sycproxy.create_named_object(obj.syc_path, name)
+        return AsyncObject(obj._create_child_object(name))
+
+    async def delete(self, name: str) -> None:
+        """Delete a named object."""
+        obj = self._named_container()
+        await obj.sycproxy.delete(f"{obj.syc_path}:{name}")
+        obj._objects.pop(name, None)
+
+    def __getitem__(self, name: str) -> "AsyncObject":
+        # Unlike the synchronous API, existence is not checked here as that
+        # would need a remote call. An error is raised by the server when the
+        # returned object is used if the object does not exist.
+        return AsyncObject(self._named_container()._create_child_object(name))
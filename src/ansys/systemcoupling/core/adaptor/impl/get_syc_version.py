@@ -26,7 +26,7 @@
 _FALLBACK_VERSION = "23.1"
 
 
-def get_syc_version(api) -> str:
+def get_syc_version(api, cmd_metadata: list | None = None) -> str:
     """Get the System Coupling version.
 
     The version is returned in a string like ``"23.2"``.
@@ -40,6 +40,9 @@ def get_syc_version(api) -> str:
     ----------
     api : NativeApi
         Object providing access to the System Coupling *native API* .
+    cmd_metadata : list, optional
+        Result of the ``GetCommandAndQueryMetadata`` query, if already
+        available. The default is ``None``, in which case it is queried.
     """
 
     def clean_version_string(version_in: str) -> str:
@@ -58,6 +61,8 @@ def get_syc_version(api) -> str:
             f"Version string {version_in} has invalid format (expect '20yy Rn')."
         )
 
-    cmds = api.GetCommandAndQueryMetadata()
+    cmds = (
+        cmd_metadata if cmd_metadata is not None else api.GetCommandAndQueryMetadata()
+    )
     exists = any(cmd["name"] == "GetVersion" for cmd in cmds)
     return clean_version_string(api.GetVersion()) if exists else _FALLBACK_VERSION
@@ -0,0 +1,529 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# This is an auto-generated file.  DO NOT EDIT!
+#
+
+"""Injected command data of the cosim mode, parsed from the YAML source in
+``injected_commands_cosim`` by ``scripts/generate_datamodel.py``."""
+
+SOURCE_HASH = "f7821e1a33a11e948bb2bc835b259c9434a2d89c1c4f65d987c8bd28acb6aa44"
+
+DATA = [
+    {
+        "name": "Solve",
+        "pyname": "solve",
+        "isInjected": True,
+        "pysyc_internal_name": "_solve",
+    },
+    {
+        "name": "AddParticipant",
+        "pyname": "add_participant",
+        "isInjected": True,
+        "pysyc_internal_name": "_add_participant",
+        "doc_prefix": (
+            "This command operates in one of two modes, depending on how "
+            "it is called.\n"
+            "*Either* a single argument, ``participant_session``, should "
+            "be provided, *or* some\n"
+            "combination of the other optional arguments not including "
+            "``participant_session``\n"
+            "should be provided.\n"
+            "\n"
+            "In the ``participant_session`` mode, the session object is "
+            "queried to\n"
+            "extract the information needed to define a new "
+            "``coupling_participant``\n"
+            "object in the setup datamodel. A reference to the session is "
+            "also retained,\n"
+            "and this will play a further role if ``solve`` is called "
+            "later. In that case,\n"
+            "the participant solver will be driven from the Python "
+            "environment in which the\n"
+            "participant and PySystemCoupling sessions are active and "
+            "System Coupling will\n"
+            'regard the participant solver as "externally managed" (see '
+            "the `execution_control`\n"
+            "settings in `coupling_participant` for details of this "
+            "mode).\n"
+            "\n"
+            ".. note::\n"
+            "    The ``participant_session`` mode currently has limited "
+            "support in the\n"
+            "    broader Ansys Python ecosystem - at present, only "
+            "PyFluent supports\n"
+            "    the API required of the session object and product "
+            "versions of Fluent and\n"
+            "    System Coupling need to be at least 24.1. This capability "
+            "should be\n"
+            "    regarded as *Beta* as it may be subject to revision when "
+            "extended to other\n"
+            "    products.\n"
+            "\n"
+            "The remainder of the documentation describes the more usual "
+            "non-session mode."
+        ),
+        "essentialArgNames_extra": [],
+        "optionalArgNames_extra": ["participant_session"],
+        "args_extra": [
+            [
+                "participant_session",
+                {
+                    "pyname": "participant_session",
+                    "Type": "<class 'object'>",
+                    "type": "ParticipantSession",
+                    "doc": (
+                        "Participant session object conforming to the "
+                        "``ParticipantProtocol`` protocol class."
+                    ),
+                },
+            ]
+        ],
+    },
+    {
+        "name": "interrupt",
+        "pyname": "interrupt",
+        "exposure": "solution",
+        "isInjected": True,
+        "isQuery": False,
+        "isInternal": False,
+        "retType": "<class 'NoneType'>",
+        "doc": (
+            "Interrupts a solve in progress.\n"
+            "\n"
+            "See also ``abort``. The difference between an interrupted and\n"
+            "aborted solve is that an interrupted solve can be resumed."
+        ),
+        "essentialArgNames": [],
+        "optionalArgNames": ["reason_msg"],
+        "defaults": [""],
+        "args": [
+            [
+                "reason_msg",
+                {
+                    "pyname": "reason_msg",
+                    "Type": "<class 'str'>",
+                    "type": "String",
+                    "doc": (
+                        "Text to describe the reason for the interrupt.\n"
+                        "\n"
+                        "This might be used for such purposes as providing\n"
+                        "additional annotation in transcript output."
+                    ),
+                },
+            ]
+        ],
+    },
+    {
+        "name": "abort",
+        "pyname": "abort",
+        "exposure": "solution",
+        "isInjected": True,
+        "isQuery": False,
+        "isInternal": False,
+        "retType": "<class 'NoneType'>",
+        "doc": (
+            "Aborts a solve in progress.\n"
+            "\n"
+            "See also ``interrupt``. In contrast to an interrupted solve,\n"
+            "an aborted solve cannot be resumed."
+        ),
+        "essentialArgNames": [],
+        "optionalArgNames": ["reason_msg"],
+        "defaults": [""],
+        "args": [
+            [
+                "reason_msg",
+                {
+                    "pyname": "reason_msg",
+                    "Type": "<class 'str'>",
+                    "type": "String",
+                    "doc": (
+                        "Text to describe the reason for the abort.\n"
+                        "\n"
+                        "This might be used for such purposes as providing\n"
+                        "additional annotation in transcript output."
+                    ),
+                },
+            ]
+        ],
+    },
+    {
+        "name": "GetSetupSummary",
+        "pyname": "get_setup_summary",
+        "exposure": "setup",
+        "isInjected": True,
+        "isQuery": True,
+        "isInternal": True,
+        "retType": "<class 'str'>",
+        "doc": (
+            "Returns a string containing a formatted summary of the\n"
+            "coupled analysis setup.\n"
+            "\n"
+            "This summary is printed in the System Coupling transcript\n"
+            "output at the beginning of a solve. However, it is sometimes\n"
+            "useful to see the summary before starting the solve.\n"
+            "\n"
+            "The summary output is generated by System Coupling and is not\n"
+            "modified for PySystemCoupling purposes. Any ``datamodel`` type "
+            "names\n"
+            "that are referenced in the summary therefore might not\n"
+            "be fully consistent with PySystemCoupling conventions."
+        ),
+        "essentialArgNames": [],
+        "optionalArgNames": [],
+        "args": [],
+    },
+    {
+        "name": "GetErrors",
+        "pyname": "get_status_messages",
+        "exposure": "setup",
+        "isInjected": True,
+        "isQuery": True,
+        "retType": "<class 'list'>",
+        "doc": (
+            "Provides information relating to the current state of the analysis "
+            "setup.\n"
+            "\n"
+            "The return value is a list of dictionaries. Each dictionary holds a\n"
+            "single message about the setup status, along with some associated "
+            "information.\n"
+            'The dictionary has string-valued fields: ``"message"``, '
+            '``"level"``,\n'
+            'and ``"path"``.\n'
+            "\n"
+            'The ``"message"`` field is the actual text of the message.\n'
+            "\n"
+            ".. note::\n"
+            "   In the current release, generated messages have not been adapted "
+            "to\n"
+            "   the PySystemCoupling environment and may use naming and "
+            "terminology that\n"
+            "   is native to the System Coupling application and its own command "
+            "line\n"
+            "   interface.\n"
+            "\n"
+            "   Because there is generally a straightforward mapping to the "
+            "PySystemCoupling\n"
+            "   exposure of settings and so on, the messages should not be "
+            "difficult\n"
+            "   to interpret. Nevertheless, the ``get_status_messages`` method "
+            "should\n"
+            "   be regarded as *beta* functionality in the current release.\n"
+            "\n"
+            'The ``"level"`` field provides information about the severity or '
+            "nature of the\n"
+            'message. Possible values are ``"Error"``, ``"Warning"``, '
+            '``"Information"``,\n'
+            '``"Alpha"``, and ``"Beta"``. ``"Alpha"`` and ``"Beta"`` indicate '
+            "settings related\n"
+            "to activated alpha or beta features.\n"
+            "\n"
+            "It is not possible to solve an analysis that has any issues at the "
+            '``"Error"``\n'
+            "severity level. An attempt to invoke the ``solve`` command while "
+            "there are\n"
+            "any errors results in an immediate failure.\n"
+            "\n"
+            'If the ``"path"`` field is set, it contains a string representation '
+            "of the path\n"
+            "to the setting to which the message pertains. This is given in the "
+            "form of\n"
+            "chained Python attribute accesses starting from the ``setup`` "
+            "attribute.\n"
+            "\n"
+            "Thus, if an issue were detected that is specific to the "
+            "``absolute_gap_tolerance``\n"
+            'setting in a particular coupling interface, a ``"path"`` such as the '
+            "following would\n"
+            "be provided:\n"
+            "\n"
+            "``'coupling_interface[\"Interface-1\"].mapping_control.absolute_gap_tolerance'``"
+        ),
+        "essentialArgNames": [],
+        "optionalArgNames": [],
+        "args": [],
+    },
+    {
+        "name": "ClearState",
+        "pyname": "clear_state",
+        "isInjected": True,
+        "pysyc_internal_name": "_clear_state",
+    },
+    {
+        "name": "show_plot",
+        "pyname": "show_plot",
+        "exposure": "solution",
+        "isInjected": True,
+        "isQuery": False,
+        "retType": "<class 'NoneType'>",
+        "doc": (
+            "Shows plots of transfer values and convergence for data transfers\n"
+            "of a coupling interface."
+        ),
+        "essentialArgNames": ["interface_name"],
+        "optionalArgNames": [
+            "transfer_names",
+            "working_dir",
+            "show_convergence",
+            "show_transfer_values",
+        ],
+        "defaults": ["None", ".", True, True],
+        "args": [
+            [
+                "interface_name",
+                {
+                    "pyname": "interface_name",
+                    "Type": "<class 'str'>",
+                    "type": "String",
+                    "doc": "Specification of which interface to plot.",
+                },
+            ],
+            [
+                "transfer_names",
+                {
+                    "pyname": "transfer_names",
+                    "Type": "<class 'list'>",
+                    "type": "String List",
+                    "doc": (
+                        "Specification of which data transfers to plot. Defaults\n"
+                        "to ``None``, which means plot all data transfers."
+                    ),
+                },
+            ],
+            [
+                "working_dir",
+                {
+                    "pyname": "working_dir",
+                    "Type": "<class 'str'>",
+                    "type": "String",
+                    "doc": 'Working directory (defaults = ".").',
+                },
+            ],
+            [
+                "show_convergence",
+                {
+                    "pyname": "show_convergence",
+                    "Type": "<class 'bool'>",
+                    "type": "Logical",
+                    "doc": (
+                        "Whether to show convergence plots (defaults to " "``True``)."
+                    ),
+                },
+            ],
+            [
+                "show_transfer_values",
+                {
+                    "pyname": "show_transfer_values",
+                    "Type": "<class 'bool'>",
+                    "type": "Logical",
+                    "doc": (
+                        "Whether to show transfer value plots (defaults to "
+                        "``True``)."
+                    ),
+                },
+            ],
+        ],
+    },
+    {
+        "name": "solve_with_plot",
+        "pyname": "solve_with_plot",
+        "exposure": "solution",
+        "isInjected": True,
+        "isQuery": False,
+        "retType": "<class 'NoneType'>",
+        "doc": (
+            "Solves, showing a live plot of transfer values and convergence for "
+            "data transfers\n"
+            "of a coupling interface.\n"
+            "\n"
+            ".. note::\n"
+            "    This functionality is experimental and is still being developed. "
+            "The API\n"
+            "    and behavior are subject to change.\n"
+            "\n"
+            "Note that although the optional arguments are somewhat complex to "
+            "describe, the\n"
+            "common use cases are relatively straightforward to use. The "
+            "complexity exists\n"
+            "to provide flexibility for more complex use cases.\n"
+            "\n"
+            "If there is a single interface, and charts are needed on all "
+            "transfers,\n"
+            "then no arguments are needed. The transfer list can be filtered by "
+            "optionally\n"
+            "providing `transfer_names`, to specify a list of transfers to be "
+            "included.\n"
+            "\n"
+            "If there are multiple interfaces, then `interface_name` can be "
+            "provided\n"
+            "to select a single interface, and again `transfer_names` may be "
+            "provided as\n"
+            "a filter.\n"
+            "\n"
+            "There are no other situations where it is valid to provide "
+            "`interface_name`\n"
+            "and/or `transfer_names`.\n"
+            "\n"
+            "If there are multiple interfaces, and no filtering is required, no "
+            "arguments\n"
+            "are needed.\n"
+            "\n"
+            "If there are multiple interfaces, and all transfers are needed on "
+            "some\n"
+            "interfaces, then `interface_names` may be provided to select those "
+            "interfaces.\n"
+            "In this case there is no filtering of transfers.\n"
+            "\n"
+            "For full control, `interface_and_transfer_names` may be provided to "
+            "specify\n"
+            "exactly which interfaces and which transfers on those interfaces are "
+            "needed.\n"
+            "This takes the form of a dictionary, mapping an interface name "
+            "either to a list of\n"
+            "transfer names or to `None`. `None` here is a concise way to "
+            "indicate that all\n"
+            "transfers on that interface are needed."
+        ),
+        "essentialArgNames": [],
+        "optionalArgNames": [
+            "interface_name",
+            "interface_names",
+            "transfer_names",
+            "interface_and_transfer_names",
+            "working_dir",
+            "show_convergence",
+            "show_transfer_values",
+        ],
+        "defaults": ["None", ".", True, True],
+        "args": [
+            [
+                "interface_name",
+                {
+                    "pyname": "interface_name",
+                    "Type": "<class 'str'>",
+                    "type": "String",
+                    "doc": (
+                        "Specification of which interface to plot. Defaults to "
+                        "``None``.\n"
+                        "\n"
+                        "Cannot be used if `interface_names` or "
+                        "`interface_and_transfer_names`\n"
+                        "is provided."
+                    ),
+                },
+            ],
+            [
+                "interface_names",
+                {
+                    "pyname": "interface_names",
+                    "Type": "<class 'list'>",
+                    "type": "String List",
+                    "doc": (
+                        "Specification of which interfaces to plot. Defaults to "
+                        "``None``.\n"
+                        "\n"
+                        "Cannot be used if `interface_name` or "
+                        "`interface_and_transfer_names`\n"
+                        "is provided."
+                    ),
+                },
+            ],
+            [
+                "transfer_names",
+                {
+                    "pyname": "transfer_names",
+                    "Type": "<class 'list'>",
+                    "type": "String List",
+                    "doc": (
+                        "Specification of which data transfers to plot. Defaults\n"
+                        "to ``None``, which means plot all data transfers.\n"
+                        "\n"
+                        "Can only be used if there is a single interface in the "
+                        "analysis, or\n"
+                        "if a single interface is selected via `interface_name` or "
+                        "`interface_names`."
+                    ),
+                },
+            ],
+            [
+                "interface_and_transfer_names",
+                {
+                    "pyname": "interface_and_transfer_names",
+                    "Type": "<class 'dict'>",
+                    "type": "StringListOrNoneDict",
+                    "doc": (
+                        "Specification of which interfaces and data transfers to "
+                        "plot. Defaults\n"
+                        "to ``None``.\n"
+                        "\n"
+                        "Can only be used if `interface_name`, `interface_names`, "
+                        "and\n"
+                        "`transfer_names` are not provided and allows for full "
+                        "specification\n"
+                        "of which interfaces and which transfers to plot in the "
+                        "form of a dictionary\n"
+                        "mapping interface names to lists of transfer names. "
+                        "Additionally, the list\n"
+                        "of transfer names may be None to indicate that all "
+                        "transfers on that interface\n"
+                        "are to be plotted."
+                    ),
+                },
+            ],
+            [
+                "working_dir",
+                {
+                    "pyname": "working_dir",
+                    "Type": "<class 'str'>",
+                    "type": "String",
+                    "doc": 'Working directory (defaults = ".").',
+                },
+            ],
+            [
+                "show_convergence",
+                {
+                    "pyname": "show_convergence",
+                    "Type": "<class 'bool'>",
+                    "type": "Logical",
+                    "doc": (
+                        "Whether to show convergence plots (defaults to " "``True``)."
+                    ),
+                },
+            ],
+            [
+                "show_transfer_values",
+                {
+                    "pyname": "show_transfer_values",
+                    "Type": "<class 'bool'>",
+                    "type": "Logical",
+                    "doc": (
+                        "Whether to show transfer value plots (defaults to "
+                        "``True``)."
+                    ),
+                },
+            ],
+        ],
+    },
+]
@@ -22,33 +22,25 @@
 # SOFTWARE.
 
 from copy import deepcopy
+import hashlib
 import os
 import random
 import time
-from typing import Any, Callable
-
-import ansys.platform.instancemanagement as pypim
+from typing import TYPE_CHECKING, Any, Callable
 
+from ansys.systemcoupling.core.adaptor.impl.metadata_cache import get_compiled
 from ansys.systemcoupling.core.adaptor.impl.session_protocol import SessionProtocol
-from ansys.systemcoupling.core.charts.plot_functions import (
-    create_and_show_plot_csv,
-    create_and_show_plot_grpc,
-    solve_with_live_plot_csv,
-    solve_with_live_plot_grpc,
-)
-from ansys.systemcoupling.core.charts.plotdefinition_manager import (
-    DataTransferSpec,
-    InterfaceSpec,
-    PlotSpec,
-)
 from ansys.systemcoupling.core.participant.manager import ParticipantManager
 from ansys.systemcoupling.core.participant.mapdl import MapdlSystemCouplingInterface
 from ansys.systemcoupling.core.syc_version import compare_versions
-from ansys.systemcoupling.core.util.yaml_helper import yaml_load_from_string
+from ansys.systemcoupling.core.util.logging import LOG
 
 from .get_status_messages import get_status_messages
 from .types import Container
 
+if TYPE_CHECKING:
+    from ansys.systemcoupling.core.charts.plotdefinition_manager import PlotSpec
+
 
 class CosimInjectedCommandsProvider:
     def __init__(self, version: str, session: SessionProtocol, rpc):
@@ -184,6 +176,8 @@ def _ensure_file_available(session: SessionProtocol, filepath: str) -> str:
     # might want to consider integrating something like this directly into
     # the file_transfer module later so that it is more seamless.
 
+    import ansys.platform.instancemanagement as pypim
+
     if not pypim.is_configured():
         return filepath
 
@@ -207,7 +201,13 @@ def _create_plot_spec(
     session: SessionProtocol,
     interface_and_transfer_names: dict[str, list[str]],
     **kwargs,
-) -> PlotSpec:
+) -> "PlotSpec":
+    from ansys.systemcoupling.core.charts.plotdefinition_manager import (
+        DataTransferSpec,
+        InterfaceSpec,
+        PlotSpec,
+    )
+
     setup = session.setup
 
     show_convergence = kwargs.pop("show_convergence", True)
@@ -339,6 +339,12 @@ def _is_grpc_plotting_supported(version: str) -> bool:
 
 
 def _show_plot(session: SessionProtocol, version: str, **kwargs):
+    # Plotting pulls in matplotlib, so it is only imported when needed.
+    from ansys.systemcoupling.core.charts.plot_functions import (
+        create_and_show_plot_csv,
+        create_and_show_plot_grpc,
+    )
+
     working_dir = kwargs.pop("working_dir", ".")
 
     # Take copy of arguments as _get_interface_and_transfer_names
@@ -370,6 +376,11 @@ def _show_plot(session: SessionProtocol, version: str, **kwargs):
 def _solve_with_live_plot(
     session: SessionProtocol, version: str, solve_func: Callable[[], None], **kwargs
 ):
+    from ansys.systemcoupling.core.charts.plot_functions import (
+        solve_with_live_plot_csv,
+        solve_with_live_plot_grpc,
+    )
+
     working_dir = kwargs.pop("working_dir", ".")
     # Take copy as in _show_plot
     kw_dict = dict(kwargs)
@@ -402,16 +413,50 @@ def get_injected_cmd_data() -> list:
     at a convenient point in the current processing.
 
     Because the data returned data is always a new copy, it can be manipulated at will.
+
+    The data is generated from ``_cmd_yaml`` by ``scripts/generate_datamodel.py``
+    and shipped in ``injected_cmd_data_cosim``. If that is out of date, the data
+    is parsed from ``_cmd_yaml``, or taken from the metadata cache if it was
+    already parsed.
     """
     if get_injected_cmd_data.data is None:
-        data = yaml_load_from_string(_cmd_yaml)
-        get_injected_cmd_data.data = data
+        get_injected_cmd_data.data = _load_cmd_data()
     return deepcopy(get_injected_cmd_data.data)
 
 
 get_injected_cmd_data.data = None
 
 
+def get_injected_cmd_source() -> str:
+    """Get the YAML source from which the injected command data is parsed."""
+    return _cmd_yaml
+
+
+def hash_cmd_source(source: str) -> str:
+    """Get the hash of the injected command YAML source with which the
+    generated data is checked."""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _load_cmd_data() -> list:
+    from . import injected_cmd_data_cosim
+
+    if injected_cmd_data_cosim.SOURCE_HASH == hash_cmd_source(_cmd_yaml):
+        return injected_cmd_data_cosim.DATA
+    LOG.debug("Generated injected command data is out of date.")
+    return get_compiled(_CMD_DATA_NAME, _cmd_yaml, _parse_cmd_yaml)
+
+
+_CMD_DATA_NAME = "injected-commands-cosim"
+
+
+def _parse_cmd_yaml(source: str) -> list:
+    # Only needed if there is no precompiled data, so YAML is imported here.
+    from ansys.systemcoupling.core.util.yaml_helper import yaml_load_from_string
+
+    return yaml_load_from_string(source)
+
+
 # Metadata handling is a bit of a mess at the moment as it relies on blending together
 # data from multiple sources into opaque dictionaries. The data here is a further
 # source that represents locally defined *commands* that are to be injected into the
@@ -26,6 +26,7 @@ from typing import Callable, Protocol
 from ansys.systemcoupling.core.adaptor.impl.injected_commands_cosim import (
     CosimInjectedCommandsProvider,
     get_injected_cmd_data,
+    get_injected_cmd_source,
 )
 from ansys.systemcoupling.core.adaptor.impl.session_protocol import SessionProtocol
 from ansys.systemcoupling.core.types import SystemCouplingMode
@@ -62,6 +63,15 @@ def get_injected_cmd_metadata(mode: SystemCouplingMode) -> list:
         return []
 
 
+def get_injected_cmd_metadata_source(mode: SystemCouplingMode) -> str:
+    """Get the source from which the injected command metadata of ``mode`` is
+    obtained, which is empty if there are no injected commands."""
+    if mode == SystemCouplingMode.COSIM:
+        return get_injected_cmd_source()
+    else:
+        return ""
+
+
 def get_commands_for_mode(
     mode: SystemCouplingMode, version: str, session: SessionProtocol, rpc
 ) -> InjectedCommandsProvider:
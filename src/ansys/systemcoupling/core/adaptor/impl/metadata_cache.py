@@ -0,0 +1,298 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Persistent cache of the processed metadata from which the API classes are
+built.
+
+Building the API classes needs the data model and command metadata of the
+server, which are queried and then processed. As the metadata is the same
+for every session of a given server build, the processed metadata is stored
+in a user cache directory and reused by later sessions, which then skip the
+``GetMetadata``, ``GetPySycDatamodelMetadata`` and ``GetPySycCommandMetadata``
+queries. If the server does not match the API classes generated for its
+version, the classes are created from the metadata at runtime. Descriptions
+of these classes are also stored, so that later sessions can recreate them
+without processing the metadata.
+
+An entry is identified by:
+
+- the version of PySystemCoupling and the format of the cache, as the
+  processing is done on the client side,
+- the server version and the mode of the session,
+- a fingerprint of the server build. The server does not report a build
+  identifier, so this is the digest of the ``GetCommandAndQueryMetadata``
+  result, which is needed anyway to find the server version. A server build
+  that changed the data model metadata but neither its version nor any
+  command would therefore not be told apart.
+
+Any entry that does not match all of these, or that cannot be read, is
+ignored and replaced.
+
+Prebuilt entries for the server builds that the API classes are generated
+for can be shipped with the package, in the ``adaptor/metadata`` directory.
+``scripts/generate_datamodel.py`` writes them. They are used if there is no
+entry in the user cache directory.
+
+Data that is compiled from a source shipped with the package, such as the
+YAML definition of the injected commands, is stored in the same way by
+``get_compiled``, identified by a hash of the source.
+
+The cache directory can be set with the ``PYSYC_METADATA_CACHE_DIR``
+environment variable. Setting ``PYSYC_DISABLE_METADATA_CACHE`` to ``1``
+disables the use of both the cache and the prebuilt entries.
+"""
+
+from collections.abc import Mapping, Sequence
+import gzip
+import hashlib
+import importlib.metadata
+import json
+import os
+import tempfile
+
+import appdirs
+
+from ansys.systemcoupling.core.util.logging import LOG
+
+# Increment if the processing of the metadata changes in a way that makes
+# existing entries invalid.
+_CACHE_FORMAT = 1
+
+_PREBUILT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "metadata")
+
+
+def metadata_cache_dir() -> str | None:
+    """Return the directory of the metadata cache, or ``None`` if the cache
+    is disabled."""
+    if os.environ.get("PYSYC_DISABLE_METADATA_CACHE") == "1":
+        return None
+    directory = os.environ.get("PYSYC_METADATA_CACHE_DIR")
+    if directory:
+        return directory
+    return os.path.join(
+        appdirs.user_cache_dir(appname="ansys_systemcoupling_core", appauthor="Ansys"),
+        "metadata",
+    )
+
+
+def metadata_fingerprint(*raw_metadata) -> str:
+    """Return the fingerprint identifying the content of decoded raw metadata,
+    for example the result of ``GetCommandAndQueryMetadata``.
+
+    This serves where a digest of the metadata as received from the server is
+    not available. The values may hold lazily decoded ``Variant`` views.
+    """
+    dhash = hashlib.sha256()
+    for value in raw_metadata:
+        dhash.update(json.dumps(value, sort_keys=True, default=_as_json).encode())
+    return dhash.hexdigest()
+
+
+def _as_json(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Sequence):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _client_version() -> str:
+    try:
+        return importlib.metadata.version("ansys-systemcoupling-core")
+    except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+def _read(path) -> dict | None:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError) as e:
+        LOG.debug(f"Ignoring unreadable metadata cache entry {path}: {e}")
+        return None
+
+
+def _write(path, entry: dict) -> None:
+    # Written to a temporary file that is then renamed, so that concurrent
+    # sessions never read a partially written entry.
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, gzip.open(f, "wt", encoding="utf-8") as gz:
+            json.dump(entry, gz)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _compiled_path(directory, name: str, source: str) -> str:
+    dhash = hashlib.sha256()
+    dhash.update(json.dumps({"format": _CACHE_FORMAT, "name": name}).encode())
+    dhash.update(source.encode())
+    return os.path.join(directory, f"{name}-{dhash.hexdigest()[:16]}.json.gz")
+
+
+def get_compiled(name: str, source: str, compute):
+    """Return the result of ``compute(source)``, which must be serializable
+    as JSON.
+
+    The result is read from the cache if possible. Otherwise it is computed
+    and stored in the cache, so that ``source`` is only compiled once.
+    """
+    directory = metadata_cache_dir()
+    if directory is None:
+        return compute(source)
+    path = _compiled_path(directory, name, source)
+    entry = _read(path)
+    if isinstance(entry, dict) and entry.get("name") == name and "data" in entry:
+        LOG.debug(f"Using compiled '{name}' data from {path}.")
+        return entry["data"]
+    data = compute(source)
+    try:
+        _write(path, {"name": name, "data": data})
+    except (OSError, TypeError, ValueError) as e:
+        LOG.warning(f"Unable to write compiled '{name}' data to the cache: {e}")
+    return data
+
+
+class MetadataCache:
+    """Store of processed metadata for a server build.
+
+    Each kind of metadata, for example ``"datamodel"`` or ``"commands"``, is
+    stored as a separate *part* so that it is only processed when it is
+    needed.
+
+    Parameters
+    ----------
+    version : str
+        Server version, for example ``"25.2"``.
+    mode : str
+        Mode of the session.
+    fingerprint : str
+        Fingerprint of the server build. See
+        ``MetadataRepository.fingerprint``.
+    directory : str, optional
+        Cache directory. The default is ``None``, in which case the directory
+        returned by ``metadata_cache_dir`` is used.
+    prebuilt_directory : str, optional
+        Directory of the prebuilt entries. The default is ``None``, in which
+        case the prebuilt entries shipped with the package are used.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        mode: str,
+        fingerprint: str,
+        directory: str | None = None,
+        prebuilt_directory: str | None = None,
+    ):
+        self.__directory = directory or metadata_cache_dir()
+        self.__enabled = self.__directory is not None
+        self.__prebuilt_directory = prebuilt_directory or _PREBUILT_DIR
+        self.__identity = {
+            "format": _CACHE_FORMAT,
+            "client": _client_version(),
+            "version": version,
+            "mode": mode,
+            "fingerprint": fingerprint,
+        }
+
+    def _entry_path(self, part: str) -> str:
+        dhash = hashlib.sha256()
+        dhash.update(json.dumps(self.__identity, sort_keys=True).encode())
+        identity = self.__identity
+        return os.path.join(
+            self.__directory,
+            f"{identity['version']}-{identity['mode']}-{part}-"
+            f"{dhash.hexdigest()[:16]}.json.gz",
+        )
+
+    def _prebuilt_path(self, part: str) -> str:
+        identity = self.__identity
+        return os.path.join(
+            self.__prebuilt_directory,
+            f"{identity['version']}-{identity['mode']}-{part}.json.gz",
+        )
+
+    def _matches(self, entry, part: str, check_client: bool = True) -> bool:
+        if not isinstance(entry, dict) or entry.get("part") != part:
+            return False
+        return all(
+            entry.get(k) == v
+            for k, v in self.__identity.items()
+            if check_client or k != "client"
+        )
+
+    def load(self, part: str):
+        """Return the cached data of ``part``, or ``None`` if there is no
+        valid entry for it."""
+        if not self.__enabled:
+            return None
+        entry = _read(self._entry_path(part))
+        if self._matches(entry, part):
+            LOG.debug(f"Using cached '{part}' metadata.")
+            return entry["data"]
+        # Prebuilt entries are generated with the version of the package that
+        # ships them, so the client version is not checked.
+        entry = _read(self._prebuilt_path(part))
+        if self._matches(entry, part, check_client=False):
+            LOG.debug(f"Using prebuilt '{part}' metadata.")
+            return entry["data"]
+        return None
+
+    def store(self, part: str, data) -> None:
+        """Store the data of ``part`` in the cache.
+
+        Failure to write the entry is logged but otherwise ignored.
+        """
+        if not self.__enabled:
+            return
+        try:
+            _write(self._entry_path(part), self._entry(part, data))
+        except (OSError, TypeError, ValueError) as e:
+            LOG.warning(f"Unable to write '{part}' metadata to the cache: {e}")
+
+    def write_prebuilt(self, part: str, data, directory: str) -> str:
+        """Write the data of ``part`` as a prebuilt entry in ``directory`` and
+        return the path of the file."""
+        path = os.path.join(directory, os.path.basename(self._prebuilt_path(part)))
+        _write(path, self._entry(part, data))
+        return path
+
+    def _entry(self, part: str, data) -> dict:
+        return {**self.__identity, "part": part, "data": data}
+
+    def get(self, part: str, compute):
+        """Return the data of ``part`` from the cache if there is a valid
+        entry for it, or otherwise the result of ``compute()``, which is then
+        stored."""
+        data = self.load(part)
+        if data is None:
+            data = compute()
+            self.store(part, data)
+        return data
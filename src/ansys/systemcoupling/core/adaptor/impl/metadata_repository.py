@@ -0,0 +1,354 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Per-session repository of the server metadata.
+
+The API roots of a session, its native API and the version check all need
+metadata queried from the server. A ``MetadataRepository`` makes each of
+these queries at most once, and derives each view of the metadata at most
+once, when it is first needed. The processed data model and command
+metadata are also kept in the persistent ``MetadataCache``, identified by the
+server version and a fingerprint of the server build, so that later sessions
+need not query the raw metadata from which they are processed.
+
+The raw metadata is identified by a digest of each query result, taken as it
+is received and before it is decoded or modified by the processing.
+"""
+
+from functools import partial
+import hashlib
+import os
+import threading
+
+from ansys.systemcoupling.core.adaptor.impl.get_syc_version import get_syc_version
+from ansys.systemcoupling.core.adaptor.impl.injected_commands_provider import (
+    get_injected_cmd_metadata_source,
+)
+from ansys.systemcoupling.core.adaptor.impl.metadata_cache import (
+    MetadataCache,
+    metadata_cache_dir,
+    metadata_fingerprint,
+)
+from ansys.systemcoupling.core.adaptor.impl.static_info import (
+    get_dm_metadata,
+    get_extended_cmd_metadata,
+    make_cmdonly_metadata,
+    make_combined_metadata,
+    make_named_object_level_map,
+)
+from ansys.systemcoupling.core.native_api.command_metadata import CommandMetadata
+from ansys.systemcoupling.core.native_api.datamodel_metadata import (
+    Metadata,
+)
+from ansys.systemcoupling.core.native_api.datamodel_metadata import (
+    build as build_dm_meta,
+)
+from ansys.systemcoupling.core.types import SystemCouplingMode
+
+# Opt in to lazily decoded views of large query results.
+_LAZY_VIEWS_ENABLED = os.environ.get("PYSYC_LAZY_VARIANT_VIEWS") == "1"
+
+_ROOT_TYPE = "SystemCoupling"
+
+# The queries from which the command metadata is processed. The data model
+# metadata is processed from these and the data model queries.
+_CMD_METADATA_QUERIES = ("GetCommandAndQueryMetadata", "GetPySycCommandMetadata")
+
+
+class _OnceQueries:
+    """Stands in for the *native API* in the metadata processing functions,
+    making each distinct query only once.
+
+    The results are shared. The only one modified by the processing is that
+    of ``GetMetadata``. See ``MetadataRepository.datamodel_metadata``.
+    """
+
+    def __init__(self, repository: "MetadataRepository"):
+        self.__repository = repository
+
+    def __getattr__(self, name):
+        return lambda **kwargs: self.__repository.query(name, **kwargs)
+
+
+class MetadataRepository:
+    """Source of the server metadata of a session.
+
+    Parameters
+    ----------
+    rpc
+        Provider of remote command and query services.
+    mode : SystemCouplingMode, optional
+        Mode of the session. The default is ``SystemCouplingMode.COSIM``.
+    """
+
+    def __init__(self, rpc, mode: SystemCouplingMode = SystemCouplingMode.COSIM):
+        self.__rpc = rpc
+        self.__mode = mode
+        self.__lock = threading.RLock()
+        self.__values = {}
+        self.__queries = _OnceQueries(self)
+
+    def reset_rpc(self, rpc) -> None:
+        """Replace the ``rpc`` instance, for example with a defunct one when
+        the session has ended. Metadata already obtained remains available."""
+        self.__rpc = rpc
+
+    def _once(self, key, compute):
+        try:
+            return self.__values[key]
+        except KeyError:
+            pass
+        with self.__lock:
+            if key not in self.__values:
+                self.__values[key] = compute()
+            return self.__values[key]
+
+    def query(self, name: str, **kwargs):
+        """Return the result of a metadata query, making it only on first use."""
+        if name in self._raw_metadata_names():
+            return self._query_with_digest(name, **kwargs)[0]
+        return self._once(
+            ("query", name, *sorted(kwargs.items())),
+            lambda: getattr(self.__rpc, name)(**kwargs),
+        )
+
+    def _query_with_digest(self, name: str, **kwargs) -> tuple:
+        # The result of a raw metadata query and the digest of its payload.
+        return self._once(
+            ("query", name, *sorted(kwargs.items())),
+            lambda: self._fetch_with_digest(name, kwargs),
+        )
+
+    def _fetch_with_digest(self, name: str, kwargs: dict) -> tuple:
+        # The rpc of a session digests a result as it is received. Other
+        # providers, such as test doubles, are identified by a fingerprint of
+        # the decoded result.
+        execute = getattr(type(self.__rpc), "execute_command_with_digest", None)
+        if execute is not None:
+            return execute(self.__rpc, name, **kwargs)
+        result = getattr(self.__rpc, name)(**kwargs)
+        return result, metadata_fingerprint(result)
+
+    def _raw_metadata_names(self):
+        return {name for name, _ in self._raw_metadata_queries()}
+
+    def version(self) -> str:
+        """Server version, for example ``"25.2"``."""
+        return self._once(
+            "version",
+            lambda: get_syc_version(
+                self.__queries, self.query("GetCommandAndQueryMetadata")
+            ),
+        )
+
+    def _raw_metadata_queries(self) -> tuple:
+        # The queries from which the data model and command metadata are
+        # processed, with the arguments used by the processing.
+        dm_ex_kwargs = {"lazy_result": True} if _LAZY_VIEWS_ENABLED else {}
+        return (
+            ("GetMetadata", {"json_ret": True}),
+            ("GetPySycDatamodelMetadata", dm_ex_kwargs),
+            ("GetCommandAndQueryMetadata", {}),
+            ("GetPySycCommandMetadata", {}),
+        )
+
+    def _digest(self, names) -> str:
+        # Combined digest of the results of the raw metadata queries ``names``.
+        dhash = hashlib.sha256()
+        for name, kwargs in self._raw_metadata_queries():
+            if name in names:
+                dhash.update(self._query_with_digest(name, **kwargs)[1].encode())
+        return dhash.hexdigest()
+
+    def fingerprint(self) -> str:
+        """Fingerprint of the server build, by which the processed metadata is
+        cached.
+
+        It is the digest of the ``GetCommandAndQueryMetadata`` result, which
+        is also needed to find the server version. The other raw metadata is
+        only queried if the processed metadata is not in the cache.
+        """
+        return self._once(
+            "fingerprint", lambda: self._digest({"GetCommandAndQueryMetadata"})
+        )
+
+    def _cache(self) -> MetadataCache:
+        return self._once(
+            "cache",
+            lambda: MetadataCache(
+                self.version(),
+                getattr(self.__mode, "value", self.__mode),
+                self.fingerprint(),
+            ),
+        )
+
+    def _cached(self, part: str, compute):
+        if metadata_cache_dir() is None:
+            return compute()
+        return self._cache().get(part, compute)
+
+    def datamodel_metadata(self) -> dict:
+        """Data model metadata, merged with the PySystemCoupling-specific
+        data model metadata."""
+
+        # The raw GetMetadata result is merged into in place. It is otherwise
+        # only used to build the native API metadata, which ignores the
+        # merged items.
+        def make_datamodel():
+            return get_dm_metadata(self.__queries, _ROOT_TYPE, lazy=_LAZY_VIEWS_ENABLED)
+
+        return self._once(
+            "datamodel", lambda: self._cached("datamodel", make_datamodel)
+        )
+
+    def cmd_metadata(self) -> list:
+        """Metadata of the exposed commands, including injected commands."""
+        return self._once(
+            "commands",
+            lambda: self._cached(
+                "commands",
+                lambda: get_extended_cmd_metadata(self.__queries, self.__mode),
+            ),
+        )
+
+    def static_info(self, category: str) -> tuple[dict, str]:
+        """Metadata from which the API classes of ``category`` are built, and
+        the type of its root. See ``SycProxyInterface.get_static_info``."""
+
+        def make_static_info():
+            if category == "setup":
+                metadata = make_combined_metadata(
+                    self.datamodel_metadata(), self.cmd_metadata(), category
+                )
+                return metadata, _ROOT_TYPE
+            elif category in ("case", "solution"):
+                return make_cmdonly_metadata(self.cmd_metadata(), category)
+            raise RuntimeError(f"Unrecognized 'static info' category: '{category}'.")
+
+        return self._once(("static_info", category), make_static_info)
+
+    def static_info_hash(self, category: str) -> str:
+        """Hash identifying the static info of ``category``, which
+        ``scripts/generate_datamodel.py`` records in the generated API classes.
+
+        It is computed from the digests of the raw metadata from which the
+        static info is processed and from the source of the injected commands
+        of the mode, so the static info itself is neither needed nor
+        serialized to obtain it.
+        """
+
+        def make_hash():
+            if category == "setup":
+                names = self._raw_metadata_names()
+            elif category in ("case", "solution"):
+                names = _CMD_METADATA_QUERIES
+            else:
+                raise RuntimeError(
+                    f"Unrecognized 'static info' category: '{category}'."
+                )
+            dhash = hashlib.sha256(category.encode())
+            dhash.update(self._digest(names).encode())
+            dhash.update(get_injected_cmd_metadata_source(self.__mode).encode())
+            return dhash.hexdigest()
+
+        return self._once(
+            ("static_info_hash", category),
+            lambda: self._cached(f"static_info_hash-{category}", make_hash),
+        )
+
+    def _session_parts(self) -> dict:
+        # The processed metadata that a session needs, as computed when it is
+        # not in the cache.
+        parts = {
+            "datamodel": self.datamodel_metadata,
+            "commands": self.cmd_metadata,
+        }
+        for category in ("setup", "case", "solution"):
+            parts[f"static_info_hash-{category}"] = partial(
+                self.static_info_hash, category
+            )
+        return parts
+
+    def is_cached(self) -> bool:
+        """Whether the processed metadata that a session needs is in the
+        cache, in which case the raw metadata is not queried apart from
+        ``GetCommandAndQueryMetadata``."""
+        if metadata_cache_dir() is None:
+            return False
+        cache = self._cache()
+        return all(cache.load(part) is not None for part in self._session_parts())
+
+    def cache_session_metadata(self) -> None:
+        """Process and cache all the metadata that a session may need, so that
+        later sessions connected to the same server build skip the raw
+        metadata queries. See ``is_cached``."""
+        if metadata_cache_dir() is None:
+            return
+        for compute in self._session_parts().values():
+            compute()
+
+    def write_prebuilt(self, directory: str) -> list[str]:
+        """Write the processed metadata as prebuilt entries in ``directory``,
+        for the package to ship, and return the paths of the files. See
+        ``MetadataCache``."""
+        cache = self._cache()
+        return [
+            cache.write_prebuilt(part, compute(), directory)
+            for part, compute in self._session_parts().items()
+        ]
+
+    def api_class_spec(self, category: str, make_spec) -> dict:
+        """Description of the dynamically created API classes of ``category``,
+        from the persistent cache if possible, or otherwise as returned by
+        ``make_spec()``, or ``None`` if the cache is disabled. See
+        ``root_source.get_cls_spec``."""
+        if metadata_cache_dir() is None:
+            return None
+        return self._cached(f"classes-{category}", make_spec)
+
+    def named_object_level_map(self) -> dict[int, set]:
+        """Map of the level in the data model to the types of the named
+        objects at that level."""
+        return self._once(
+            "level_map",
+            lambda: make_named_object_level_map(self.datamodel_metadata(), _ROOT_TYPE),
+        )
+
+    def native_datamodel_metadata(self) -> Metadata:
+        """Data model metadata of the native API."""
+
+        def make_metadata():
+            # The merged data model metadata serves equally well, and may
+            # have been obtained without querying the server.
+            if "datamodel" in self.__values:
+                return build_dm_meta(self.__values["datamodel"])
+            return build_dm_meta(self.query("GetMetadata", json_ret=True))
+
+        return self._once("native_datamodel", make_metadata)
+
+    def native_cmd_metadata(self) -> CommandMetadata:
+        """Command metadata of the native API."""
+        return self._once(
+            "native_commands",
+            lambda: CommandMetadata(self.query("GetCommandAndQueryMetadata")),
+        )
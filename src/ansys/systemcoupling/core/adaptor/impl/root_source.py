@@ -149,15 +149,51 @@ def _indent_doc(indent, doc_str):
     return indent + sep.join(doc)
 
 
-def _get_cls(name, info, parent):
+def _make_property(prname, docstr):
+    return property(
+        # NB: the prname defaults are needed to force capture.
+        #     For information, see StackOverflow Q 2295290.
+        fget=lambda slf, prname=prname: slf.get_property_state(prname),
+        fset=lambda slf, val, prname=prname: slf.set_property_state(prname, val),
+        doc=docstr,
+    )
+
+
+def _get_pname(name, info, parent):
     if parent is None:
-        pname = info.get("category_root", "root")
+        return info.get("category_root", "root")
     elif "pysyc_name" in info:
         # Python name provided - for the case where there is a preferred
         # alternative to the default generated name.
-        pname = info["pysyc_name"]
-    else:
-        pname = to_python_name(name)
+        return info["pysyc_name"]
+    return to_python_name(name)
+
+
+def _unique_name(base_name, existing_names):
+    # TODO: this was new in Fluent; related to flattening changes, but
+    # it is not entirely clear when we would see non-unique children and
+    # whether this is really needed.
+    candidate_name = base_name
+    i = 0
+    while candidate_name in existing_names:
+        i += 1
+        candidate_name = f"{base_name}_{i}"
+    return candidate_name
+
+
+def _lazy_cls(pname, name, info, parent, instantiate=True):
+    # The member class is only created from its slice of the metadata when
+    # it is first accessed.
+    def make_cls():
+        cls = get_cls(name, info, parent)
+        cls.__name__ = pname
+        return cls
+
+    return LazyMember(pname, make_cls, instantiate)
+
+
+def _get_cls(name, info, parent):
+    pname = _get_pname(name, info, parent)
     base = _get_type(name, info)
     dct = {"syc_name": name}
     if base == InjectedCommand:
@@ -179,27 +215,15 @@ def _get_cls(name, info, parent):
     if base == NamedContainer:
         children = parameters = None
 
-    def unique_name(base_name, existing_names):
-        # TODO: this was new in Fluent; related to flattening changes, but
-        # it is not entirely clear when we would see non-unique children and
-        # whether this is really needed.
-        candidate_name = base_name
-        i = 0
-        while candidate_name in existing_names:
-            i += 1
-            candidate_name = f"{base_name}_{i}"
-        return candidate_name
-
     if children:
         child_keys = sorted(children.keys(), key=lambda c: children[c]["ordinal"])
         cls.child_names = []
         for cname in child_keys:
             cinfo = children[cname]
-            ccls = get_cls(cname, cinfo, cls)
-            ccls.__name__ = unique_name(ccls.__name__, cls.child_names)
+            ccls_name = _unique_name(_get_pname(cname, cinfo, cls), cls.child_names)
             # pylint: disable=no-member
-            cls.child_names.append(ccls.__name__)
-            setattr(cls, ccls.__name__, ccls)
+            cls.child_names.append(ccls_name)
+            setattr(cls, ccls_name, _lazy_cls(ccls_name, cname, cinfo, cls))
 
     if parameters:
         prop_keys = sorted(parameters.keys(), key=lambda p: parameters[p]["ordinal"])
@@ -209,36 +233,27 @@ def _get_cls(name, info, parent):
             prinfo = parameters[sycname]
             prname = prinfo.get("py_sycname") or to_python_name(prname)
             prtype = _get_property_type(prname, prinfo)
-            docstr_default = f"'{prname}' property of '{parent.__name__}' object"
+            # The qualified name is the name the parent was created with,
+            # whether or not it has since been made unique.
+            docstr_default = f"'{prname}' property of '{parent.__qualname__}' object"
             docstr = prinfo.get("help", docstr_default)
-            setattr(
-                cls,
-                prname,
-                property(
-                    # NB: the prname defaults are needed to force capture.
-                    #     For information, see StackOverflow Q 2295290.
-                    fget=lambda slf, prname=prname: slf.get_property_state(prname),
-                    fset=lambda slf, val, prname=prname: slf.set_property_state(
-                        prname, val
-                    ),
-                    doc=docstr,
-                ),
-            )
+            setattr(cls, prname, _make_property(prname, docstr))
             cls.property_names_types.append((prname, sycname, prtype))
 
     commands = info.get("__commands")
     if commands:
         cls.command_names = []
         for cname, cinfo in commands.items():
-            ccls = get_cls(cname, cinfo, cls)
-            ccls.__name__ = unique_name(ccls.__name__, cls.command_names)
+            ccls_name = _unique_name(_get_pname(cname, cinfo, cls), cls.command_names)
             # pylint: disable=no-member
-            cls.command_names.append(ccls.__name__)
-            setattr(cls, ccls.__name__, ccls)
+            cls.command_names.append(ccls_name)
+            setattr(cls, ccls_name, _lazy_cls(ccls_name, cname, cinfo, cls))
         cls.command_names.sort()
 
     arguments = info.get("args")
     if arguments:
+        # The arguments are needed for the documentation of the command, so
+        # they are not created lazily.
         doc = cls.__doc__
         doc += "\n\n"
         doc += "Parameters\n"
@@ -256,7 +271,7 @@ def _get_cls(name, info, parent):
             arg_indent = "    "
             doc += f"{ccls.__name__} : {th}{optional_sfx}\n"
             doc += f"{_indent_doc(arg_indent, ccls.__doc__)}\n"
-            ccls.__name__ = unique_name(ccls.__name__, cls.argument_names)
+            ccls.__name__ = _unique_name(ccls.__name__, cls.argument_names)
             # pylint: disable=no-member
             cls.argument_names.append(ccls.__name__)
             setattr(cls, ccls.__name__, ccls)
@@ -268,11 +283,96 @@ def _get_cls(name, info, parent):
     # object_type = info.get('object-type')
     object_type = Container if base == NamedContainer else None
     if object_type:
-        cls.child_object_type = get_cls("child_object_type", info, cls)
+        cls.child_object_type = _lazy_cls(
+            "child_object_type", "child_object_type", info, cls, instantiate=False
+        )
 
     return cls
 
 
+# Base classes of the classes created by ``get_cls``.
+_base_types = {
+    cls.__name__: cls
+    for cls in (
+        Container,
+        NamedContainer,
+        Command,
+        PathCommand,
+        InjectedCommand,
+        *_arg_types.values(),
+    )
+}
+
+# Plain attributes of the classes created by ``get_cls``.
+_spec_attrs = (
+    "syc_name",
+    "cmd_name",
+    "__doc__",
+    "child_names",
+    "command_names",
+    "argument_names",
+    "essential_arguments",
+)
+
+
+def get_cls_spec(cls) -> dict:
+    """Get a JSON-serializable description of a class created by ``get_cls``,
+    from which ``get_cls_from_spec`` recreates the class.
+
+    Recreating the class from its description is cheaper than creating it
+    from the metadata, which does not need to be available. All the member
+    classes are created to describe them.
+    """
+    dct = cls.__dict__
+    spec = {
+        "name": cls.__name__,
+        "base": cls.__bases__[0].__name__,
+        "attrs": {k: dct[k] for k in _spec_attrs if k in dct},
+    }
+    for key in ("child_names", "command_names", "argument_names"):
+        if key in dct:
+            spec[key] = [get_cls_spec(getattr(cls, name)) for name in dct[key]]
+    if "property_names_types" in dct:
+        spec["properties"] = [
+            [prname, sycname, prtype, dct[prname].__doc__]
+            for prname, sycname, prtype in dct["property_names_types"]
+        ]
+    if "child_object_type" in dct:
+        spec["child_object_type"] = get_cls_spec(cls.child_object_type)
+    return spec
+
+
+def _lazy_cls_from_spec(spec, instantiate=True):
+    return LazyMember(spec["name"], lambda: get_cls_from_spec(spec), instantiate)
+
+
+def get_cls_from_spec(spec: dict):
+    """Create a class from its description, as returned by ``get_cls_spec``.
+
+    As with ``get_cls``, child object and command classes are only created
+    when they are first accessed.
+    """
+    dct = dict(spec["attrs"])
+    # Members are added in the same order as by ``get_cls``.
+    for cspec in spec.get("child_names", ()):
+        dct[cspec["name"]] = _lazy_cls_from_spec(cspec)
+    properties = spec.get("properties")
+    if properties is not None:
+        dct["property_names_types"] = []
+        for prname, sycname, prtype, docstr in properties:
+            dct[prname] = _make_property(prname, docstr)
+            dct["property_names_types"].append((prname, sycname, prtype))
+    for cspec in spec.get("command_names", ()):
+        dct[cspec["name"]] = _lazy_cls_from_spec(cspec)
+    for cspec in spec.get("argument_names", ()):
+        dct[cspec["name"]] = get_cls_from_spec(cspec)
+    if "child_object_type" in spec:
+        dct["child_object_type"] = _lazy_cls_from_spec(
+            spec["child_object_type"], instantiate=False
+        )
+    return type(spec["name"], (_base_types[spec["base"]],), dct)
+
+
 def get_hash(obj_info):
     """Get hash for the metadata dictionary that is used in class generation."""
     dhash = hashlib.sha256()
@@ -313,7 +413,6 @@ def get_root(
     -------
     Root ``Container`` object.
     """
-    obj_info, root_type = sycproxy.get_static_info(category)
     try:
         if generated_module is None:
             api_ver = f"api_{version}" if version else "api"
@@ -321,7 +420,11 @@ def get_root(
                 f"ansys.systemcoupling.core.adaptor.{api_ver}.{category}_root"
             )
 
-        info_hash = get_hash(obj_info)
+        # The static info is only needed here if the proxy cannot provide
+        # its hash directly.
+        info_hash = sycproxy.get_static_info_hash(category)
+        if info_hash is None:
+            info_hash = get_hash(sycproxy.get_static_info(category)[0])
         if generated_module.SHASH == info_hash:
             LOG.debug("Using pre-generated datamodel classes.")
         else:
@@ -334,8 +437,24 @@ def get_root(
         cls = getattr(generated_module, f"{category}_root")
         report_whether_dynamic_classes_created(False)
     except Exception:
-        cls = get_cls(root_type, obj_info[root_type])
+        cls = _get_dynamic_cls(sycproxy, category)
         report_whether_dynamic_classes_created(True)
     # pylint: disable=no-member
     cls.set_sycproxy(sycproxy)
     return cls()
+
+
+def _get_dynamic_cls(sycproxy: SycProxyInterface, category: str):
+    # The proxy may keep the description of the classes in a persistent
+    # cache, in which case the classes are recreated from it.
+    created = []
+
+    def make_cls():
+        obj_info, root_type = sycproxy.get_static_info(category)
+        created.append(get_cls(root_type, obj_info[root_type]))
+        return created[0]
+
+    spec = sycproxy.get_api_class_spec(category, lambda: get_cls_spec(make_cls()))
+    if created:
+        return created[0]
+    return make_cls() if spec is None else get_cls_from_spec(spec)
@@ -21,15 +21,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Optional, Protocol
+from typing import TYPE_CHECKING, Optional, Protocol
 
-from ansys.systemcoupling.core.charts.plot_functions import (
-    GrpcDataSourceProtocol,
-)
 from ansys.systemcoupling.core.native_api import NativeApi
 
 from .types import Container
 
+if TYPE_CHECKING:
+    # The charts package is only imported when plotting is used.
+    from ansys.systemcoupling.core.charts.grpc_chartdata import (
+        GrpcDataSourceProtocol,
+    )
+
 
 class SessionProtocol(Protocol):
     """For use when we cannot import Session directly because of potential
@@ -54,4 +57,4 @@ class SessionProtocol(Protocol):
         overwrite: bool = False,
     ) -> None: ...
 
-    def _grpc(self) -> GrpcDataSourceProtocol: ...
+    def _grpc(self) -> "GrpcDataSourceProtocol": ...
@@ -21,13 +21,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from copy import deepcopy
-from typing import Dict, List, Tuple
+from typing import Tuple
 
 from ansys.systemcoupling.core.adaptor.impl.get_syc_version import get_syc_version
 from ansys.systemcoupling.core.adaptor.impl.injected_commands_provider import (
     get_injected_cmd_metadata,
 )
+from ansys.systemcoupling.core.client.variant import materialize
 from ansys.systemcoupling.core.types import SystemCouplingMode
 from ansys.systemcoupling.core.util.name_util import to_python_name
 
@@ -128,14 +128,19 @@ def make_combined_metadata(
     -------
     dict
         Metadata dictionary in which the command data is rooted under the root
-        ``SystemCoupling`` element.
+        ``SystemCoupling`` element. Apart from the root element, it shares its
+        content with ``dm_metadata``.
 
     """
     root_type = "SystemCoupling"
-    metadata = deepcopy(dm_metadata)
-    cmd_meta = process_cmd_data(cmd_metadata, category=category)
-    metadata[root_type]["__commands"] = cmd_meta
-    metadata[root_type]["category_root"] = f"{category}_root"
+    # Only the root item is copied. The rest of the data model metadata is
+    # shared, so it must not be modified.
+    metadata = dict(dm_metadata)
+    metadata[root_type] = {
+        **dm_metadata[root_type],
+        "__commands": process_cmd_data(cmd_metadata, category=category),
+        "category_root": f"{category}_root",
+    }
     return metadata
 
 
@@ -177,7 +182,7 @@ def make_cmdonly_metadata(cmd_metadata: dict, category: str) -> Tuple[dict, str]
     return metadata, root_type
 
 
-def get_dm_metadata(api, root_type: str) -> dict:
+def get_dm_metadata(api, root_type: str, lazy: bool = False) -> dict:
     """Get sources of metadata defining the data model from the System
     Coupling server and combine into a single structure.
 
@@ -198,19 +203,27 @@ def get_dm_metadata(api, root_type: str) -> dict:
         command-line app.
     root_type : str
         Root object type accessed in the queried metadata.
+    lazy : bool, optional
+        Whether to request the extended data as a lazily decoded view. It is
+        only read from, so only the parts that are used need to be decoded.
     """
 
     dm_metadata = api.GetMetadata(json_ret=True)
-    dm_metadata_ex = api.GetPySycDatamodelMetadata()
+    if lazy:
+        dm_metadata_ex = api.GetPySycDatamodelMetadata(lazy_result=True)
+    else:
+        dm_metadata_ex = api.GetPySycDatamodelMetadata()
 
     def get_update(name, data_ex):
         # Adapt extended data to expected form
         if name not in data_ex:
             return None
         item_ex = data_ex[name]
-        ret = {"help": item_ex["doc"]}
+        # Values are copied out of any lazy view, so that the merged
+        # metadata can be cached.
+        ret = {"help": materialize(item_ex["doc"])}
         if "pyname" in item_ex:
-            ret["py_sycname"] = item_ex["pyname"]
+            ret["py_sycname"] = materialize(item_ex["pyname"])
         return ret
 
     def merge_metadata(data, data_ex):
@@ -267,6 +280,9 @@ def get_cmd_metadata(api) -> list:
         if not info_ex:
             continue
 
+        # The queried data is left unmodified as it may be shared.
+        info = dict(info)
+
         exposure = info_ex.get("exposure")
         if not exposure or exposure == "unexposed":
             continue
@@ -285,6 +301,7 @@ def get_cmd_metadata(api) -> list:
             arg_exposure = arg_info_ex.get("exposure")
             if arg_exposure == "unexposed":
                 continue
+            arg_info = dict(arg_info)
             arg_info["type"] = arg_info_ex["type"]
             arg_info["doc"] = arg_info_ex["doc"]
             pyname = arg_info_ex.get("pyname")
@@ -321,103 +338,98 @@ def get_extended_cmd_metadata(api, mode: SystemCouplingMode) -> list:
         the details of a command to be exposed.
     """
 
-    def find_item_by_name(items: List[Dict], name: str) -> dict:
-        for item in items:
-            if item["name"] == name:
-                return item
-        raise RuntimeError(f"Did not find dict element of list with 'name' == {name}")
-
-    def merge_data(target: list, source: list) -> None:
-        target_names = set(d["name"] for d in target)
-        source_names = set(d["name"] for d in source)
-        new_names = source_names - target_names
-        common_names = source_names & target_names
-
-        # Injected commands can either be completely new commands injected into
-        # the set of available commands, or can be "overrides" that replace the
-        # SyC command that would have been generated. Occasionally, we still
-        # want to generate the command that is being replaced so that we can
-        # call it internally. This is identified by a "pysyc_internal_name"
-        # field. In this case we split the command data into an injected command
-        # and a "normal" command but with the internal name as the pysyc name
-        # for the latter.
-
-        special_injected_commands = [
-            name
-            for name in common_names
-            if "pysyc_internal_name" in find_item_by_name(source, name)
-        ]
-
-        for name in special_injected_commands:
-            src_item = find_item_by_name(source, name)
-            tgt_item = find_item_by_name(target, name)
-
-            # Target item becomes a "normally" exposed SyC command except that
-            # it is "internal" on the PySyC side - only intended for internal
-            # PySyC use.  It will be given a special internal name rather than
-            # the one derived from its SyC name. It will also have its doc
-            # info removed.
-
-            # - Take a copy of tgt before we remove doc.
-            tgt_copy = deepcopy(tgt_item)
-            if "doc" in tgt_item:
-                tgt_item["doc"] = "For internal use only."
-
-            for arg in tgt_item.get("args", []):
-                _, arg_info = arg
-                if "doc" in arg_info:
-                    arg_info["doc"] = "..."
-
-            # - Name for PySyC exposure is the "pysyc_internal_name" from the source item
-            tgt_item["pyname"] = src_item["pysyc_internal_name"]
-
-            # Source item becomes a normal injected command. It is processed like the
-            # items in the common_names later but has special treatment for its
-            # doc and arguments. That is done here, so it will be removed from
-            # common_names and added to new_names.
-            for k, v in tgt_copy.items():
-                if k in ("essentialArgNames", "optionalArgNames", "args"):
-                    src_item[k] = src_item.get(f"{k}_extra", []) + v
-                elif k == "doc":
-                    prefix = src_item.get(f"{k}_prefix", "")
-                    if prefix:
-                        prefix += "\n\n"
-                    suffix = src_item.get(f"{k}_suffix", "")
-                    if suffix:
-                        suffix = "\n" + suffix
-                    src_item[k] = prefix + v + suffix
-                else:
-                    src_item[k] = v
-
-            src_item["name"] = src_item["pyname"]
-
-            common_names.remove(name)
-            new_names.add(src_item["name"])
-
-        for src_item in source:
-            name = src_item["name"]
-            if name in new_names:
-                target.append(src_item)
-            elif name in common_names:
-                tgt_item = find_item_by_name(target, name)
-
-                # Single-level merge of source item dictionary into
-                # target item dictionary. If any aspect of the arguments
-                # is different, then they must be fully redefined. (This
-                # should suffice for now.)
-                for k, v in src_item.items():
-                    tgt_item[k] = v
-
     cmd_metadata = get_cmd_metadata(api)
 
     # Check for cosim mode for injected commands
 
     injected_data = get_injected_cmd_metadata(mode)
-    merge_data(cmd_metadata, injected_data)
+    _merge_cmd_data(cmd_metadata, injected_data)
     cmd_metadata = _fix_up_doc(api, cmd_metadata)
     return cmd_metadata
 
 
+def _merge_cmd_data(target: list, source: list) -> None:
+    """Merge the injected command data ``source`` into the command data
+    ``target``."""
+    # Items are looked up by name in these indexes.
+    target_items = {item["name"]: item for item in target}
+    source_items = {item["name"]: item for item in source}
+    new_names = source_items.keys() - target_items.keys()
+    common_names = source_items.keys() & target_items.keys()
+
+    # Injected commands can either be completely new commands injected into
+    # the set of available commands, or can be "overrides" that replace the
+    # SyC command that would have been generated. Occasionally, we still
+    # want to generate the command that is being replaced so that we can
+    # call it internally. This is identified by a "pysyc_internal_name"
+    # field. In this case we split the command data into an injected command
+    # and a "normal" command but with the internal name as the pysyc name
+    # for the latter.
+
+    special_injected_commands = [
+        name for name in common_names if "pysyc_internal_name" in source_items[name]
+    ]
+
+    for name in special_injected_commands:
+        src_item = source_items[name]
+        tgt_item = target_items[name]
+
+        # Target item becomes a "normally" exposed SyC command except that
+        # it is "internal" on the PySyC side - only intended for internal
+        # PySyC use.  It will be given a special internal name rather than
+        # the one derived from its SyC name. It will also have its doc
+        # info removed.
+
+        # - Keep the original items, which go to the source item. The
+        #   target item is given new items where they differ.
+        tgt_orig = dict(tgt_item)
+        if "doc" in tgt_item:
+            tgt_item["doc"] = "For internal use only."
+
+        if "args" in tgt_item:
+            tgt_item["args"] = [
+                (arg, {**arg_info, "doc": "..."} if "doc" in arg_info else arg_info)
+                for arg, arg_info in tgt_item["args"]
+            ]
+
+        # - Name for PySyC exposure is the "pysyc_internal_name" from the source item
+        tgt_item["pyname"] = src_item["pysyc_internal_name"]
+
+        # Source item becomes a normal injected command. It is processed like the
+        # items in the common_names later but has special treatment for its
+        # doc and arguments. That is done here, so it will be removed from
+        # common_names and added to new_names.
+        for k, v in tgt_orig.items():
+            if k in ("essentialArgNames", "optionalArgNames", "args"):
+                src_item[k] = src_item.get(f"{k}_extra", []) + v
+            elif k == "doc":
+                prefix = src_item.get(f"{k}_prefix", "")
+                if prefix:
+                    prefix += "\n\n"
+                suffix = src_item.get(f"{k}_suffix", "")
+                if suffix:
+                    suffix = "\n" + suffix
+                src_item[k] = prefix + v + suffix
+            else:
+                src_item[k] = v
+
+        src_item["name"] = src_item["pyname"]
+
+        common_names.remove(name)
+        new_names.add(src_item["name"])
+
+    for src_item in source:
+        name = src_item["name"]
+        if name in new_names:
+            target.append(src_item)
+        elif name in common_names:
+            # Single-level merge of source item dictionary into
+            # target item dictionary. If any aspect of the arguments
+            # is different, then they must be fully redefined. (This
+            # should suffice for now.)
+            target_items[name].update(src_item)
+
+
 def make_named_object_level_map(dm_metadata, root_type) -> dict[int, str]:
     level_map = {}
 
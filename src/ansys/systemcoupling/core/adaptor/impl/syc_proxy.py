@@ -21,31 +21,73 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from ansys.systemcoupling.core.adaptor.impl.get_syc_version import get_syc_version
-from ansys.systemcoupling.core.adaptor.impl.static_info import (
-    get_dm_metadata,
-    get_extended_cmd_metadata,
-    make_cmdonly_metadata,
-    make_combined_metadata,
-    make_named_object_level_map,
+from collections.abc import Mapping
+from copy import deepcopy
+import os
+import threading
+
+from ansys.systemcoupling.core.adaptor.impl.metadata_repository import (
+    MetadataRepository,
 )
 from ansys.systemcoupling.core.adaptor.impl.syc_proxy_interface import SycProxyInterface
+from ansys.systemcoupling.core.client.variant import materialize
 from ansys.systemcoupling.core.types import SystemCouplingMode
 from ansys.systemcoupling.core.util.state_keys import (
     adapt_client_named_object_keys,
     adapt_native_named_object_keys,
 )
 
+_STATE_CACHE_ENABLED = os.environ.get("PYSYC_DISABLE_STATE_CACHE") != "1"
+
+# Opt in to lazily decoded views of large query results.
+_LAZY_VIEWS_ENABLED = os.environ.get("PYSYC_LAZY_VARIANT_VIEWS") == "1"
+
+# Queries for which concurrent identical requests share a single call.
+_SINGLE_FLIGHT_QUERIES = frozenset(("GetState", "GetChildNamesStr"))
+
+
+class _Flight:
+    """A query in progress, the result of which is shared with any identical
+    queries made while it is in progress."""
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.__done = threading.Event()
+        self.__result = None
+        self.__error = None
+
+    def set_result(self, result):
+        self.__result = result
+        self.__done.set()
+
+    def set_error(self, error: BaseException):
+        self.__error = error
+        self.__done.set()
+
+    def result(self):
+        self.__done.wait()
+        if self.__error is not None:
+            raise self.__error
+        return self.__result
+
 
 class SycProxy(SycProxyInterface):
-    def __init__(self, rpc, mode=SystemCouplingMode.COSIM):
+    def __init__(self, rpc, mode=SystemCouplingMode.COSIM, metadata=None):
+        """Create a proxy for ``rpc``.
+
+        The metadata is obtained from ``metadata``, a ``MetadataRepository``
+        that may be shared with other proxies of the same session. By
+        default, the proxy has its own repository.
+        """
         self.__rpc = rpc
+        self.__metadata = metadata or MetadataRepository(rpc, mode)
+        # Guards the query cache and the queries in progress.
+        self.__lock = threading.Lock()
+        self.__query_cache = {}
+        self.__query_cache_generation = None
+        self.__flights = {}
         self.__injected_cmds = {}
-        self.__version = None
         self.__defunct = False
-        self.__named_obj_level_map: Dict = {}
-        self.__datamodel_metadata = None
-        self.__mode = mode
 
     def reset_rpc(self, rpc):
         """Reset the original ``rpc`` instance with a new one if the remote connection is lost.
@@ -59,6 +101,7 @@ class SycProxy(SycProxyInterface):
         objects after the current session has ended.
         """
         self.__rpc = rpc
+        self.__metadata.reset_rpc(rpc)
         # We rely on attempted attribute access on self.__rpc to catch
         # most cases, but this *defunct* flag can be used to mop up
         # other cases.
@@ -73,38 +116,49 @@ class SycProxy(SycProxyInterface):
         self.__injected_cmds = cmd_dict
 
     def get_static_info(self, category):
-        if category == "setup":
-            cmd_metadata = get_extended_cmd_metadata(self.__rpc, self.__mode)
-            root_type = "SystemCoupling"
-            metadata = make_combined_metadata(
-                self._get_datamodel_metadata(root_type), cmd_metadata, category
-            )
-        elif category in ("case", "solution"):
-            cmd_metadata = get_extended_cmd_metadata(self.__rpc, self.__mode)
-            metadata, root_type = make_cmdonly_metadata(cmd_metadata, category)
-        else:
-            raise RuntimeError(f"Unrecognized 'static info' category: '{category}'.")
-        return metadata, root_type
+        return self.__metadata.static_info(category)
+
+    def get_static_info_hash(self, category):
+        return self.__metadata.static_info_hash(category)
+
+    def get_api_class_spec(self, category, make_spec):
+        return self.__metadata.api_class_spec(category, make_spec)
 
     def get_version(self):
-        if self.__version is None:
-            self.__version = get_syc_version(self.__rpc)
-        return self.__version
+        return self.__metadata.version()
+
+    def get_named_object_level_map(self) -> dict[int, set]:
+        """Map of the level in the data model to the types of the named
+        objects at that level."""
+        return self.__metadata.named_object_level_map()
 
     def set_state(self, path, state):
         state = adapt_client_named_object_keys(
-            state, self._get_named_object_level_map(), path.count("/") - 1
+            state, self.get_named_object_level_map(), path.count("/") - 1
         )
         self.__rpc.SetState(ObjectPath=path, State=state)
 
     def get_state(self, path):
-        state = self.__rpc.GetState(ObjectPath=path)
-        if isinstance(state, dict):
+        # Adapting the keys creates a new dictionary, so the cached
+        # value is not exposed and does not need to be copied.
+        if _LAZY_VIEWS_ENABLED:
+            # The adapted state is built directly from the view, avoiding an
+            # intermediate fully decoded copy. Any nested views left by the
+            # adaptation are converted, so that only plain dictionaries and
+            # lists are returned.
+            state = self._cached_query(
+                "GetState", copy_result=False, ObjectPath=path, lazy_result=True
+            )
+            if isinstance(state, Mapping):
+                return materialize(adapt_native_named_object_keys(state))
+        else:
+            state = self._cached_query("GetState", copy_result=False, ObjectPath=path)
+        if isinstance(state, Mapping):
             return adapt_native_named_object_keys(state)
-        return state
+        return deepcopy(state)
 
     def get_property_state(self, path, property):
-        return self.__rpc.GetParameter(ObjectPath=path, Name=property)
+        return self._cached_query("GetParameter", ObjectPath=path, Name=property)
 
     def delete(self, path):
         self.__rpc.DeleteObject(ObjectPath=path)
@@ -113,10 +167,10 @@ class SycProxy(SycProxyInterface):
         self.set_state(f"{path}:{name}", {})
 
     def get_object_names(self, path):
-        return self.__rpc.GetChildNamesStr(ObjectPath=path)
+        return self._cached_query("GetChildNamesStr", ObjectPath=path)
 
     def get_property_options(self, path, name):
-        return self.__rpc.GetParameterOptions(ObjectPath=path, Name=name)
+        return self._cached_query("GetParameterOptions", ObjectPath=path, Name=name)
 
     def execute_cmd(self, *args, **kwargs):
         cmd_name = args[1]
@@ -136,18 +190,82 @@ class SycProxy(SycProxyInterface):
             raise RuntimeError(f"Injected command '{cmd_name}' not found.")
         return cmd(**kwargs)
 
-    def _get_datamodel_metadata(self, root_type):
-        if self.__datamodel_metadata is None:
-            self.__datamodel_metadata = get_dm_metadata(self.__rpc, root_type)
-        return self.__datamodel_metadata
+    def _state_generation(self):
+        # Generation counter of the server state, or None if it is not
+        # available, in which case no caching is done.
+        if not _STATE_CACHE_ENABLED:
+            return None
+        try:
+            generation = self.__rpc.state_generation
+        except AttributeError:
+            return None
+        return generation if isinstance(generation, int) else None
 
-    def _get_named_object_level_map(self):
-        if not self.__named_obj_level_map:
-            self.__named_obj_level_map = self._make_named_object_level_map(
-                root_type="SystemCoupling"
-            )
-        return self.__named_obj_level_map
+    def _last_state_generation(self):
+        # Generation counter disregarding calls in progress, or None if it is
+        # not available, in which case queries are not shared.
+        try:
+            generation = self.__rpc.last_state_generation
+        except AttributeError:
+            return None
+        return generation if isinstance(generation, int) else None
+
+    def _cached_query(self, query, copy_result=True, **kwargs):
+        """Run a state query, reusing the result of an identical earlier query
+        if the server has reported no state changes since it was made.
+
+        Identical ``GetState`` and ``GetChildNamesStr`` queries made from
+        several threads at the same time share a single call, provided that
+        no state changing call completed in the meantime.
+        """
+        key = (query, *kwargs.values())
+        flight = None
+        with self.__lock:
+            generation = self._state_generation()
+            if generation is not None:
+                if generation != self.__query_cache_generation:
+                    self.__query_cache = {}
+                    self.__query_cache_generation = generation
+                if key in self.__query_cache:
+                    result = self.__query_cache[key]
+                    return deepcopy(result) if copy_result else result
+
+            if query in _SINGLE_FLIGHT_QUERIES:
+                flight_generation = self._last_state_generation()
+                if flight_generation is not None:
+                    flight = self.__flights.get(key)
+                    if flight is not None and flight.generation == flight_generation:
+                        is_leader = False
+                    else:
+                        flight = self.__flights[key] = _Flight(flight_generation)
+                        is_leader = True
+
+        if flight is not None and not is_leader:
+            result = flight.result()
+            return deepcopy(result) if copy_result else result
+
+        try:
+            result = getattr(self.__rpc, query)(**kwargs)
+        except BaseException as e:
+            if flight is not None:
+                self._end_flight(key, flight)
+                flight.set_error(e)
+            raise
+        if flight is not None:
+            self._end_flight(key, flight)
+            flight.set_result(result)
+
+        # Only cache if nothing changed while the query was in progress.
+        if generation is not None:
+            with self.__lock:
+                if (
+                    self._state_generation() == generation
+                    and self.__query_cache_generation == generation
+                ):
+                    self.__query_cache[key] = result
+        return deepcopy(result) if copy_result else result
 
-    def _make_named_object_level_map(self, root_type):
-        dm_metadata = self._get_datamodel_metadata(root_type)
-        return make_named_object_level_map(dm_metadata, root_type)
+    def _end_flight(self, key, flight):
+        with self.__lock:
+            if self.__flights.get(key) is flight:
+                del self.__flights[key]
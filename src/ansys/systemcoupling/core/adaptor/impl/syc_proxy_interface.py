@@ -37,6 +37,18 @@ class SycProxyInterface(ABC):  # pragma: no cover
     def get_static_info(self, category):
         pass
 
+    def get_static_info_hash(self, category):
+        """Return the hash identifying the static info of ``category``, or
+        ``None``, in which case it is computed from the static info."""
+        return None
+
+    def get_api_class_spec(self, category, make_spec):
+        """Return the description of the dynamically created API classes of
+        ``category`` from a persistent cache, where it is stored from
+        ``make_spec()`` if it is not found, or ``None`` if the proxy has no
+        such cache."""
+        return None
+
     @abstractmethod
     def get_version(self):
         pass
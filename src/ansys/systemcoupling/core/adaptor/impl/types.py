@@ -50,6 +50,7 @@ assert setup.solution_control.time_step_size == "0.1 [s]"
 import collections
 import keyword
 import sys
+import threading
 from typing import Dict, Generic, List, NewType, Tuple, TypeVar, Union
 import weakref
 
@@ -93,6 +94,55 @@ def to_python_name(syc_name: str) -> str:
     return name
 
 
+# Guards the creation of the classes of ``LazyMember`` descriptors.
+_lazy_member_lock = threading.RLock()
+
+
+class LazyMember:
+    """Provides a member class of a dynamically created class, which is only
+    created when it is first accessed.
+
+    Accessed from an instance of the owning class, a child object or command
+    member is an instance of the member class, created on first access and
+    kept in the instance. Other members, such as ``child_object_type``, are
+    the member class itself.
+    """
+
+    def __init__(self, name: str, make_cls, instantiate: bool):
+        """Initialize an instance of the ``LazyMember`` class.
+
+        Parameters
+        ----------
+        name : str
+            Name of the member.
+        make_cls : Callable
+            Function creating the member class.
+        instantiate : bool
+            Whether access from an instance provides an instance.
+        """
+        self.__name = name
+        self.__make_cls = make_cls
+        self.__instantiate = instantiate
+        self.__cls = None
+
+    def __get__(self, obj, objtype=None):
+        cls = self.__cls
+        if cls is None:
+            with _lazy_member_lock:
+                if self.__cls is None:
+                    self.__cls = self.__make_cls()
+                    self.__make_cls = None
+                cls = self.__cls
+        if obj is None or not self.__instantiate:
+            return cls
+        # The instance shadows this (non-data) descriptor from now on.
+        return obj.__dict__.setdefault(self.__name, cls(None, obj))
+
+
+def _is_lazy_member(cls, name: str) -> bool:
+    return isinstance(cls.__dict__.get(name), LazyMember)
+
+
 class Base:
     """
     Provides the base class for settings and command objects.
@@ -416,9 +466,13 @@ class Container(SettingsBase[DictStateType]):
         """
         super().__init__(name, parent)
         for child in self.child_names:
+            if _is_lazy_member(self.__class__, child):
+                continue
             cls = getattr(self.__class__, child)
             setattr(self, child, cls(None, self))
         for cmd in self.command_names:
+            if _is_lazy_member(self.__class__, cmd):
+                continue
             cls = getattr(self.__class__, cmd)
             setattr(self, cmd, cls(None, self))
         self._initialized = True
@@ -589,7 +643,11 @@ class NamedContainer(SettingsBase[DictStateType], Generic[ChildTypeT]):
         """
         super().__init__(name, parent)
         self._objects = {}
+        # Guards self._objects, which may be updated from several threads.
+        self._objects_lock = threading.RLock()
         for cmd in self.command_names:
+            if _is_lazy_member(self.__class__, cmd):
+                continue
             cls = getattr(self.__class__, cmd)
             setattr(self, cmd, cls(None, self))
 
@@ -618,26 +676,31 @@ class NamedContainer(SettingsBase[DictStateType], Generic[ChildTypeT]):
     command_names = []
 
     def _create_child_object(self, cname: str):
-        ret = self._objects.get(cname)
-        if not ret:
-            # pylint: disable=no-member
-            cls = self.__class__.child_object_type
-            ret = self._objects[cname] = cls(cname, self)
-        return ret
-
-    def _update_objects(self):
+        with self._objects_lock:
+            ret = self._objects.get(cname)
+            if not ret:
+                # pylint: disable=no-member
+                cls = self.__class__.child_object_type
+                ret = self._objects[cname] = cls(cname, self)
+            return ret
+
+    def _update_objects(self) -> dict:
+        # Returns a snapshot of the updated objects that is safe to iterate
+        # while other threads update them.
         names = self.get_object_names()
-        for name in list(self._objects.keys()):
-            if name not in names:
-                del self._objects[name]
-        for name in names:
-            if name not in self._objects:
-                self._create_child_object(name)
+        with self._objects_lock:
+            for name in list(self._objects.keys()):
+                if name not in names:
+                    del self._objects[name]
+            for name in names:
+                if name not in self._objects:
+                    self._create_child_object(name)
+            return dict(self._objects)
 
     def __delitem__(self, name: str):
         self.sycproxy.delete(f"{self.syc_path}:{name}")
-        if name in self._objects:
-            del self._objects[name]
+        with self._objects_lock:
+            self._objects.pop(name, None)
 
     def __contains__(self, name: str):
         return name in self.get_object_names()
@@ -646,23 +709,19 @@ class NamedContainer(SettingsBase[DictStateType], Generic[ChildTypeT]):
         return len(self.keys())
 
     def __iter__(self):
-        self._update_objects()
-        return iter(self._objects)
+        return iter(self._update_objects())
 
     def keys(self):
         """Object names."""
-        self._update_objects()
-        return self._objects.keys()
+        return self._update_objects().keys()
 
     def values(self):
         """Object values."""
-        self._update_objects()
-        return self._objects.values()
+        return self._update_objects().values()
 
     def items(self):
         """Items."""
-        self._update_objects()
-        return self._objects.items()
+        return self._update_objects().items()
 
     def create(self, name: str):
         """Create a named object.
@@ -687,17 +746,12 @@ class NamedContainer(SettingsBase[DictStateType], Generic[ChildTypeT]):
     def __getitem__(self, name: str) -> ChildTypeT:
         if name not in self.get_object_names():
             raise KeyError(name)
-        obj = self._objects.get(name)
-        if not obj:
-            obj = self._create_child_object(name)
-        return obj
+        return self._create_child_object(name)
 
     def __setitem__(self, name: str, value):
         if name not in self.get_object_names():
             self.sycproxy.create_named_object(self.syc_path, name)
-        child = self._objects.get(name)
-        if not child:
-            child = self._create_child_object(name)
+        child = self._create_child_object(name)
         child.set_state(value)
 
 
@@ -0,0 +1,189 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from typing import Awaitable, Callable
+
+from ansys.systemcoupling.core.adaptor.impl.async_syc_proxy import (
+    AsyncSycProxy,
+    make_static_info_proxy,
+)
+from ansys.systemcoupling.core.adaptor.impl.async_types import AsyncObject
+from ansys.systemcoupling.core.adaptor.impl.root_source import get_root
+from ansys.systemcoupling.core.session import _DefunctRpcImpl
+from ansys.systemcoupling.core.types import SystemCouplingMode
+
+
+class AsyncSession:
+    """Asynchronous client interface to a System Coupling server instance.
+
+    This is the ``asyncio`` counterpart of ``Session``, for use with an
+    ``AsyncSycGrpc`` connection. The API roots are obtained by awaiting the
+    ``case``, ``setup`` and ``solution`` properties. The roots, and the objects
+    reached from them, are ``AsyncObject`` wrappers whose remote operations
+    return awaitables::
+
+        session = await connect_async(host, port)
+        setup = await session.setup
+        names = await setup.coupling_participant.get_object_names()
+        solution = await session.solution
+        await solution.solve()
+
+    Injected commands that depend on local resources, such as plotting and
+    adding a participant from a participant session object, are not available
+    in an asynchronous session.
+    """
+
+    def __init__(self, rpc, mode: SystemCouplingMode = SystemCouplingMode.COSIM):
+        """Initializes an ``AsyncSession`` instance.
+
+        Parameters
+        ----------
+        rpc
+            Provider of remote command and query services, for example
+            a connected ``AsyncSycGrpc`` instance.
+        mode : SystemCouplingMode, optional
+            Mode for the session. The default is ``SystemCouplingMode.COSIM``.
+        """
+        self.__rpc = rpc
+        self.__mode = mode
+        self.__roots = {}
+        self.__proxies = {}
+        self.__static_info_proxy = None
+        self.__lock = asyncio.Lock()
+
+    async def exit(self) -> None:
+        """Close the System Coupling server instance.
+
+        After the server instance is closed, the current instance of
+        this class is not usable.
+        """
+        await self.__rpc.exit()
+        self.__rpc = _DefunctRpcImpl()
+        for proxy in self.__proxies.values():
+            proxy.reset_rpc(self.__rpc)
+        self.__roots = {}
+        self.__proxies = {}
+
+    def start_output(self, handle_output: Callable[[str], None] | None = None) -> None:
+        """Start streaming the standard output written by the System Coupling server.
+
+        See ``Session.start_output``. The stream is read by a task on the
+        running event loop.
+        """
+        self.__rpc.start_output(handle_output)
+
+    async def end_output(self) -> None:
+        """Cancel output streaming previously started by the ``start_output`` method."""
+        await self.__rpc.end_output()
+
+    async def ping(self) -> bool:
+        """Simple test that the server is alive and responding."""
+        return await self.__rpc.ping()
+
+    async def get_version(self) -> str:
+        """Return the server version as a string, for example, "24.2"."""
+        return (await self._get_static_info_proxy()).get_version()
+
+    @property
+    def case(self) -> Awaitable[AsyncObject]:
+        """Awaitable of the case persistence API root."""
+        return self._get_api_root("case")
+
+    @property
+    def setup(self) -> Awaitable[AsyncObject]:
+        """Awaitable of the setup API and data model root."""
+        return self._get_api_root("setup")
+
+    @property
+    def solution(self) -> Awaitable[AsyncObject]:
+        """Awaitable of the solution API root."""
+        return self._get_api_root("solution")
+
+    @property
+    def _grpc(self):
+        """The gRPC connection object, exposed for internal and testing purposes only."""
+        return self.__rpc
+
+    async def _get_static_info_proxy(self):
+        if self.__static_info_proxy is None:
+            self.__static_info_proxy = await make_static_info_proxy(
+                self.__rpc, self.__mode
+            )
+        return self.__static_info_proxy
+
+    async def _get_api_root(self, category: str) -> AsyncObject:
+        if isinstance(self.__rpc, _DefunctRpcImpl):
+            self.__rpc.trigger_error
+        async with self.__lock:
+            if category not in self.__roots:
+                static_info_proxy = await self._get_static_info_proxy()
+                proxy = AsyncSycProxy(self.__rpc, static_info_proxy)
+                version = static_info_proxy.get_version().replace(".", "_")
+                root = get_root(proxy, category=category, version=version)
+                if self.__mode == SystemCouplingMode.COSIM:
+                    proxy.set_injected_commands(self._get_injected_cmd_map(category))
+                self.__proxies[category] = proxy
+                self.__roots[category] = AsyncObject(root)
+            return self.__roots[category]
+
+    def _get_injected_cmd_map(self, category: str) -> dict:
+        rpc = self.__rpc
+        if category == "setup":
+
+            async def add_participant(**kwargs):
+                if "participant_session" in kwargs:
+                    raise RuntimeError(
+                        "'add_participant' with a 'participant_session' argument "
+                        "is not available in an asynchronous session."
+                    )
+                setup = await self.setup
+                return await setup._add_participant(**kwargs)
+
+            return {
+                "get_setup_summary": lambda **kwargs: rpc.GetSetupSummary(**kwargs),
+                "add_participant": add_participant,
+            }
+
+        if category == "solution":
+            return {
+                "solve": lambda **kwargs: rpc.solve(**kwargs),
+                "interrupt": lambda **kwargs: rpc.interrupt(**kwargs),
+                "abort": lambda **kwargs: rpc.abort(**kwargs),
+            }
+
+        if category == "case":
+
+            async def clear_state(**kwargs):
+                case = await self.case
+                return await case._clear_state(**kwargs)
+
+            return {"clear_state": clear_state}
+
+        return {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.exit()
@@ -0,0 +1,253 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asynchronous counterpart of the ``SycGrpc`` client.
+
+``AsyncSycGrpc`` provides the same command and query API as ``SycGrpc``, but
+is built on a ``grpc.aio`` channel so that every call returns an awaitable.
+This allows a single event loop to drive many System Coupling servers
+concurrently, without dedicating an operating system thread to each
+blocking call.
+
+Launching a server is not handled here. Use the synchronous launch functions
+or start the server independently, and then connect to it with the ``connect``
+method.
+"""
+
+import asyncio
+from typing import AsyncGenerator, Callable, Optional
+
+import grpc
+
+from ansys.systemcoupling.core.client.grpc_client import (
+    _CHANNEL_READY_TOTAL_TIMEOUT_SEC,
+    _OUTPUT_DRAIN_TIMEOUT,
+    _command_result,
+    _make_command_request,
+    _payload_digest,
+)
+from ansys.systemcoupling.core.client.grpc_transport import (
+    ConnectionType,
+    StartupAndConnectionInfo,
+)
+from ansys.systemcoupling.core.client.output_pipeline import LineAssembler
+from ansys.systemcoupling.core.client.services.chart import AsyncChartService
+from ansys.systemcoupling.core.client.services.command_query import (
+    AsyncCommandQueryService,
+)
+from ansys.systemcoupling.core.client.services.output_stream import (
+    AsyncOutputStreamService,
+)
+from ansys.systemcoupling.core.client.services.process import AsyncSycProcessService
+from ansys.systemcoupling.core.client.services.solution import AsyncSolutionService
+from ansys.systemcoupling.core.util.logging import LOG
+
+
+class AsyncSycGrpc:
+    """Provides an ``asyncio`` remote proxy API to System Coupling's command and
+    query external interface.
+
+    The API mirrors that of ``SycGrpc``. Commands and queries may be run
+    using the ``execute_command`` method, or called as if they were direct
+    methods of this class. In either case, the call returns a coroutine that
+    must be awaited::
+
+        rpc = AsyncSycGrpc()
+        await rpc.connect("127.0.0.1", 50052, ConnectionType.INSECURE_LOCAL)
+        state = await rpc.GetState(ObjectPath="/SystemCoupling")
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.__channel = None
+        self.__command_service = None
+        self.__ostream_service = None
+        self.__process_service = None
+        self.__solution_service = None
+        self.__chart_service = None
+        self.__output_task = None
+
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        connection_type: ConnectionType = ConnectionType.SECURE_LOCAL,
+        timeout: float = _CHANNEL_READY_TOTAL_TIMEOUT_SEC,
+    ):
+        """Connect to an already running System Coupling server running on a known
+        host and port.
+        """
+        connection_info = StartupAndConnectionInfo(
+            launching=False, connection_type=connection_type, host=host, port=port
+        )
+        await self.connect_channel(connection_info.get_server_aio_channel(), timeout)
+
+    async def connect_channel(
+        self,
+        channel: grpc.aio.Channel,
+        timeout: Optional[float] = _CHANNEL_READY_TOTAL_TIMEOUT_SEC,
+    ):
+        """Connect using an existing ``grpc.aio`` channel.
+
+        The call completes when the channel is ready, or raises a ``RuntimeError``
+        if this does not happen within ``timeout`` seconds.
+        """
+        LOG.debug("Connecting (asyncio)...")
+        try:
+            await asyncio.wait_for(channel.channel_ready(), timeout)
+        except asyncio.TimeoutError:
+            await channel.close()
+            raise RuntimeError(
+                f"Stopping attempt to connect to gRPC channel after {timeout} seconds."
+            ) from None
+        LOG.debug("...connected")
+
+        self.__channel = channel
+        self.__command_service = AsyncCommandQueryService(channel)
+        self.__ostream_service = AsyncOutputStreamService(channel)
+        self.__process_service = AsyncSycProcessService(channel)
+        self.__solution_service = AsyncSolutionService(channel)
+        self.__chart_service = AsyncChartService(channel)
+
+    @property
+    def _channel(self) -> grpc.aio.Channel:
+        """Access the ``grpc.aio`` Channel object
+
+        Provided for testing purposes.
+        """
+        return self.__channel
+
+    async def exit(self):
+        """Shut down the remote System Coupling server and close the channel.
+
+        Reset this object so it is ready to connect to a new server if needed.
+        """
+        if self.__channel is not None:
+            await self.end_output()
+            try:
+                await self.__process_service.quit()
+            except Exception as e:
+                LOG.debug(f"Exception on Process.Quit(): {e}")
+            await self.__channel.close()
+        self._reset()
+
+    def start_output(self, handle_output: Callable[[str], None] | None = None):
+        """Start streaming of standard streams from System Coupling
+        and print to the console by default.
+
+        The stream is read by a task on the running event loop.
+        """
+
+        def default_handler(text):
+            print(text)
+
+        handle_output = handle_output or default_handler
+        self.__output_task = asyncio.get_running_loop().create_task(
+            self._read_stdstreams(handle_output)
+        )
+
+    async def end_output(self):
+        """Stop streaming standard streams.
+
+        Completes once the task reading the stream has delivered any
+        remaining output, or has been cancelled if it does not end promptly.
+        """
+        task, self.__output_task = self.__output_task, None
+        if self.__ostream_service is not None:
+            self.__ostream_service.end_streaming()
+        if task is None:
+            return
+        done, _ = await asyncio.wait({task}, timeout=_OUTPUT_DRAIN_TIMEOUT)
+        if not done:
+            task.cancel()
+            await asyncio.wait({task})
+        if not task.cancelled() and task.exception() is not None:
+            LOG.error(f"Exception reading output stream: {task.exception()}")
+
+    async def _read_stdstreams(self, handle_output):
+        assembler = LineAssembler()
+        async for response in self.__ostream_service.begin_streaming():
+            for line in assembler.feed(response.text):
+                handle_output(line)
+        # Flush any trailing text
+        for line in assembler.flush():
+            handle_output(line)
+
+    def __getattr__(self, name):
+        """Support command and query interfaces as method attributes.
+
+        This is the asynchronous equivalent of ``SycGrpc.__getattr__``.
+        """
+
+        async def f(**kwargs):
+            return await self.execute_command(name, **kwargs)
+
+        return f
+
+    async def execute_command(self, cmd_name, **kwargs):
+        """Run a System Coupling *external interface* command or query,
+        specified by its name and keyword arguments.
+        """
+        request = _make_command_request(cmd_name, **kwargs)
+        response, meta = await self.__command_service.execute_command(request)
+        return _command_result(response, **kwargs)
+
+    async def execute_command_with_digest(self, cmd_name, **kwargs):
+        """Run a query, returning its result together with a SHA-256 digest of
+        the result as received.
+
+        This is the asynchronous equivalent of
+        ``SycGrpc.execute_command_with_digest``.
+        """
+        request = _make_command_request(cmd_name, **kwargs)
+        response, meta = await self.__command_service.execute_command(request)
+        return _command_result(response, **kwargs), _payload_digest(response)
+
+    async def solve(self):
+        await self.__solution_service.solve()
+
+    async def interrupt(self, reason_msg=""):
+        await self.__solution_service.interrupt(reason=reason_msg)
+
+    async def abort(self, reason_msg=""):
+        await self.__solution_service.abort(reason=reason_msg)
+
+    async def ping(self):
+        return await self.__process_service.ping()
+
+    async def get_chart_metadata(self):
+        return await self.__chart_service.get_chart_metadata()
+
+    async def get_chart_series_data(self):
+        return await self.__chart_service.get_chart_series_data()
+
+    async def get_chart_timestep_data(self):
+        return await self.__chart_service.get_chart_timestep_data()
+
+    def stream_chart_data(self) -> AsyncGenerator:
+        return self.__chart_service.stream_chart_data()
+
+    def cancel_stream(self):
+        return self.__chart_service.cancel_stream()
@@ -0,0 +1,258 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Recording of command sequences for execution on the server in one call.
+
+See ``SycGrpc.batch``.
+
+Batched execution relies on the server's ``ExecuteCommandString`` command
+evaluating its ``CommandString`` as a Python expression in the server's
+command namespace, with the commands available as globals, and returning the
+value of that expression. A server that rejects the compiled batch
+expression, reporting a syntax or name error before running any of it, is
+handled by executing the recorded commands one by one.
+"""
+
+import json
+import re
+from typing import Any, Callable, Optional
+
+from ansys.systemcoupling.core.util.logging import LOG
+
+# Executed on the server in a namespace holding the recorded statements as a
+# JSON string, ``_BATCH``. The server-side command namespace is the global
+# namespace. Execution stops at the first failure. The result of each
+# executed statement is recorded as a ``[succeeded, value or error]`` pair.
+_SERVER_SCRIPT = """\
+import json as _json
+_results = []
+for _name, _kwargs in _json.loads(_BATCH):
+    try:
+        _results.append([True, globals()[_name](**_kwargs)])
+    except Exception as _e:
+        _results.append([False, f"{type(_e).__name__}: {_e}"])
+        break
+_results = _json.dumps(_results, default=str)
+"""
+
+_NOT_SET = object()
+
+# Matches the error reported by a server that rejects the batch expression
+# before running it: a syntax error, or a name error if ``exec`` or
+# ``globals`` are not available to it.
+_REJECTED_PATTERN = re.compile(r"SyntaxError|NameError|invalid syntax|is not defined")
+
+
+def compile_batch(statements: list[tuple[str, dict]]) -> str:
+    """Compile a sequence of ``(command name, keyword arguments)`` pairs into
+    a single expression for execution via ``ExecuteCommandString``.
+
+    The expression evaluates to a JSON string holding the list of
+    ``[succeeded, value or error]`` pairs for the executed statements. It
+    uses ``exec`` and ``globals`` on the server, so it requires the server's
+    ``ExecuteCommandString`` to evaluate expressions in the command namespace
+    and return their value.
+    """
+    batch = json.dumps([[name, kwargs] for name, kwargs in statements])
+    return (
+        "(lambda _ns: (exec(_ns['_SCRIPT'], globals(), _ns), _ns['_results'])[1])"
+        f"({{'_SCRIPT': {_SERVER_SCRIPT!r}, '_BATCH': {batch!r}}})"
+    )
+
+
+class BatchResult:
+    """Handle to the result of a command recorded in a ``CommandBatch``.
+
+    The result is available once the batch has been executed.
+    """
+
+    def __init__(self, cmd_name: str, json_ret: bool = False):
+        self.__cmd_name = cmd_name
+        self.__json_ret = json_ret
+        self.__result = _NOT_SET
+        self.__error = None
+
+    @property
+    def command(self) -> str:
+        """Name of the command."""
+        return self.__cmd_name
+
+    def done(self) -> bool:
+        """Whether the batch holding the command has been executed."""
+        return self.__result is not _NOT_SET or self.__error is not None
+
+    def result(self):
+        """Return the result of the command.
+
+        Raises a ``RuntimeError`` if the command failed or was not executed.
+        """
+        if self.__error is not None:
+            raise RuntimeError(self.__error)
+        if self.__result is _NOT_SET:
+            raise RuntimeError(
+                f"The batch holding command '{self.__cmd_name}' has not been executed."
+            )
+        return self.__result
+
+    def _set_result(self, value, decoded: bool = False):
+        if self.__json_ret and not decoded and isinstance(value, str):
+            value = json.loads(value)
+        self.__result = value
+
+    def _set_error(self, error: str):
+        self.__error = error
+
+
+class CommandBatch:
+    """Records commands to be executed on the server in a single call.
+
+    Recording a command returns a ``BatchResult`` handle. When the batch is
+    flushed, the recorded commands are compiled into one script, which is run
+    on the server by ``ExecuteCommandString``, so the whole sequence costs one
+    round trip. Execution stops at the first command that fails.
+
+    Commands are recorded via ``execute_command`` or called as if they were
+    methods of this class, in the same way as on ``SycGrpc``. As values
+    are transferred as JSON, command arguments must be JSON-serializable, and
+    any result that is not is returned as its string representation.
+
+    If ``execute_command`` is provided, it is used to execute the recorded
+    commands one by one, with the same stop-at-first-failure behavior, when
+    the server rejects the compiled batch before running it. Any other
+    failure of the batch call leaves the outcome of the commands unknown, so
+    they are not executed again.
+    """
+
+    def __init__(
+        self,
+        execute_command_string: Callable[[str], Any],
+        execute_command: Optional[Callable[..., Any]] = None,
+    ):
+        self.__execute = execute_command_string
+        self.__execute_single = execute_command
+        self.__statements: list[tuple[str, dict]] = []
+        self.__results: list[BatchResult] = []
+
+    def execute_command(self, cmd_name: str, **kwargs) -> BatchResult:
+        """Record a command, specified by its name and keyword arguments."""
+        result = BatchResult(cmd_name, json_ret="json_ret" in kwargs)
+        self.__statements.append((cmd_name, kwargs))
+        self.__results.append(result)
+        return result
+
+    def __getattr__(self, name):
+        def f(**kwargs):
+            return self.execute_command(name, **kwargs)
+
+        return f
+
+    def __len__(self):
+        return len(self.__statements)
+
+    def discard(self) -> None:
+        """Discard all recorded commands without executing them."""
+        for result in self.__results:
+            result._set_error(
+                f"Command '{result.command}' was discarded without being executed."
+            )
+        self.__statements, self.__results = [], []
+
+    def flush(self) -> list:
+        """Execute all recorded commands and return their results in
+        recording order.
+
+        If a command fails, the commands that follow it are not executed and
+        a ``RuntimeError`` is raised.
+        """
+        statements, self.__statements = self.__statements, []
+        results, self.__results = self.__results, []
+        if not statements:
+            return []
+
+        try:
+            reply = self.__execute(compile_batch(statements))
+        except Exception as e:
+            if self.__execute_single is not None and _REJECTED_PATTERN.search(str(e)):
+                LOG.warning(
+                    f"Server rejected the command batch ({e}). "
+                    "Executing the commands individually."
+                )
+                return self.__flush_unbatched(statements, results)
+            for result in results:
+                result._set_error(
+                    f"Batch execution failed: {e}. Whether command "
+                    f"'{result.command}' was executed is unknown."
+                )
+            raise
+
+        try:
+            outcomes = json.loads(reply)
+            if not isinstance(outcomes, list):
+                raise ValueError(f"expected a list, got {type(outcomes).__name__}")
+        except (TypeError, ValueError) as e:
+            # The server ran the batch, so the commands must not be executed
+            # again.
+            error = f"The result of the command batch could not be decoded: {e}"
+            for result in results:
+                result._set_error(
+                    f"{error}. Whether command '{result.command}' was executed "
+                    "is unknown."
+                )
+            raise RuntimeError(error) from e
+
+        first_error = None
+        for i, result in enumerate(results):
+            if i < len(outcomes):
+                succeeded, value = outcomes[i]
+                if succeeded:
+                    result._set_result(value)
+                    continue
+                error = f"Command '{result.command}' failed: {value}"
+                first_error = first_error or error
+            else:
+                error = (
+                    f"Command '{result.command}' was not executed because an "
+                    "earlier command in the batch failed."
+                )
+            result._set_error(error)
+
+        if first_error is not None:
+            raise RuntimeError(first_error)
+        return [result.result() for result in results]
+
+    def __flush_unbatched(self, statements, results) -> list:
+        for i, ((cmd_name, kwargs), result) in enumerate(zip(statements, results)):
+            try:
+                result._set_result(
+                    self.__execute_single(cmd_name, **kwargs), decoded=True
+                )
+            except Exception as e:
+                error = f"Command '{cmd_name}' failed: {type(e).__name__}: {e}"
+                result._set_error(error)
+                for skipped in results[i + 1 :]:
+                    skipped._set_error(
+                        f"Command '{skipped.command}' was not executed because an "
+                        "earlier command in the batch failed."
+                    )
+                raise RuntimeError(error) from e
+        return [result.result() for result in results]
@@ -0,0 +1,129 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pipelined submission of commands and queries.
+
+See ``SycGrpc.pipeline``.
+"""
+
+from typing import Any, Callable
+
+import grpc
+
+from ansys.systemcoupling.core.client.services.handle_rpc_error import handle_rpc_error
+
+_NOT_SET = object()
+
+
+class PendingResult:
+    """Lazy handle to the result of a command submitted to a ``CommandPipeline``.
+
+    The result is decoded on first access and retained.
+    """
+
+    def __init__(
+        self, cmd_name: str, future: grpc.Future, decode: Callable[[Any], Any]
+    ):
+        self.__cmd_name = cmd_name
+        self.__future = future
+        self.__decode = decode
+        self.__result = _NOT_SET
+
+    @property
+    def command(self) -> str:
+        """Name of the command."""
+        return self.__cmd_name
+
+    def done(self) -> bool:
+        """Whether the response to the command has been received."""
+        return self.__future.done()
+
+    def result(self):
+        """Return the result of the command, waiting for it if necessary.
+
+        Raises a ``RuntimeError`` if the command failed.
+        """
+        if self.__result is _NOT_SET:
+            try:
+                response = self.__future.result()
+            except grpc.RpcError as rpc_error:
+                msg = handle_rpc_error(
+                    rpc_error, operation=f"InvokeCommand({self.__cmd_name})"
+                )
+                raise RuntimeError(msg) from None
+            self.__result = self.__decode(response)
+        return self.__result
+
+
+class CommandPipeline:
+    """Submits commands and queries without waiting for each response.
+
+    Each command is sent as soon as it is submitted, so network latency is
+    overlapped across the commands in the pipeline. Submission returns a
+    ``PendingResult`` handle. Commands may be submitted via
+    ``execute_command`` or called as if they were methods of this class, in
+    the same way as on ``SycGrpc``.
+
+    Because a command is sent before the outcome of the preceding ones is
+    known, a pipeline is only suitable for sequences of commands that do not
+    depend on each other's results or success.
+    """
+
+    def __init__(self, submit: Callable[..., PendingResult]):
+        self.__submit = submit
+        self.__pending: list[PendingResult] = []
+
+    def execute_command(self, cmd_name: str, **kwargs) -> PendingResult:
+        """Submit a command or query, specified by its name and keyword arguments."""
+        pending = self.__submit(cmd_name, **kwargs)
+        self.__pending.append(pending)
+        return pending
+
+    def __getattr__(self, name):
+        def f(**kwargs):
+            return self.execute_command(name, **kwargs)
+
+        return f
+
+    def __len__(self):
+        return len(self.__pending)
+
+    def flush(self) -> list:
+        """Wait for all submitted commands to complete and return their results
+        in submission order.
+
+        If any commands failed, the error of the first one to fail is raised
+        after all commands have completed.
+        """
+        pending, self.__pending = self.__pending, []
+        results = []
+        first_error = None
+        for item in pending:
+            try:
+                results.append(item.result())
+            except RuntimeError as e:
+                results.append(None)
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return results
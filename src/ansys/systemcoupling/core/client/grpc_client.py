@@ -22,23 +22,46 @@
 # SOFTWARE.
 
 import atexit
+from contextlib import contextmanager
+import hashlib
 import itertools
 import json
 import os
 import socket
 import threading
 import time
-from typing import Optional
+from typing import Callable, ContextManager, Optional
 
 import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
-import ansys.platform.instancemanagement as pypim
 import grpc
 
+from ansys.systemcoupling.core.client.command_batch import CommandBatch
+from ansys.systemcoupling.core.client.command_pipeline import (
+    CommandPipeline,
+    PendingResult,
+)
 from ansys.systemcoupling.core.client.grpc_transport import (
     ConnectionType,
     StartupAndConnectionInfo,
     StartupArgumentCategory,
 )
+from ansys.systemcoupling.core.client.health_monitor import HealthMonitor
+from ansys.systemcoupling.core.client.output_pipeline import (
+    DEFAULT_MAX_QUEUED_LINES,
+    OutputPipeline,
+)
+from ansys.systemcoupling.core.client.rpc_compression import (
+    CompressionInterceptor,
+    CompressionPolicy,
+)
+from ansys.systemcoupling.core.client.rpc_metrics import (
+    RPC_METRICS_ENABLED,
+    MetricsInterceptor,
+    RpcMetrics,
+)
+from ansys.systemcoupling.core.client.rpc_replay import ReplayChannel, RpcRecorder
+from ansys.systemcoupling.core.client.rpc_trace import RPC_TRACE_ENABLED, RpcTrace
+from ansys.systemcoupling.core.client.server_readiness import ServerReadiness
 from ansys.systemcoupling.core.client.services.chart import ChartService
 from ansys.systemcoupling.core.client.services.command_query import CommandQueryService
 from ansys.systemcoupling.core.client.services.output_stream import OutputStreamService
@@ -51,6 +74,8 @@ from ansys.systemcoupling.core.syc_version import normalize_version
 from ansys.systemcoupling.core.util.file_transfer import file_transfer_service
 from ansys.systemcoupling.core.util.logging import LOG
 
+_RPC_RECORD_FILE = os.environ.get("PYSYC_RPC_RECORD_FILE")
+
 _CHANNEL_READY_TIMEOUT_SEC = int(os.environ.get("PYSYC_GRPC_INITIAL_TIMEOUT_SEC", 5))
 _CHANNEL_READY_RETRIES = int(os.environ.get("PYSYC_GRPC_N_TIMEOUT_RETRY", 5))
 _CHANNEL_READY_TIMEOUT_FACTOR = float(
@@ -82,6 +107,25 @@ _CHANNEL_READY_TOTAL_TIMEOUT_SEC = float(
 
 _LOCALHOST_IP = "127.0.0.1"
 
+# Optional dedicated channel for interrupt, abort and ping calls, and the
+# deadline applied to those calls when it is used.
+_CONTROL_CHANNEL_ENABLED = os.environ.get("PYSYC_GRPC_CONTROL_CHANNEL") == "1"
+_CONTROL_TIMEOUT_SEC = float(os.environ.get("PYSYC_GRPC_CONTROL_TIMEOUT_SEC", 10))
+
+# Time allowed on exit for streamed output to be delivered to the handler.
+_OUTPUT_DRAIN_TIMEOUT = 5.0
+
+# Prefixes of command names that are never recorded in a batch, because they
+# are queries whatever the server metadata says.
+_QUERY_PREFIXES = ("Get", "Is", "Has", "Query")
+
+# Interval at which channels replaced by ``rebuild_channel`` are checked for
+# the calls still using them.
+_RETIRED_CHANNEL_POLL_SEC = 0.5
+
+# Interval in seconds of a connection health monitor started on connection.
+_HEALTH_MONITOR_SEC = os.environ.get("PYSYC_HEALTH_MONITOR_SEC")
+
 
 def _find_port() -> int:
     with socket.socket() as s:
@@ -89,6 +133,47 @@ def _find_port() -> int:
         return s.getsockname()[1]
 
 
+def _make_command_request(cmd_name, **kwargs) -> command_pb2.CommandRequest:
+    def make_arg(name, val):
+        arg = command_pb2.CommandRequest.Argument()
+        arg.name = name
+        to_variant(val, arg.val)
+        return arg
+
+    request = command_pb2.CommandRequest(command=cmd_name)
+    request.args.extend([make_arg(name, val) for name, val in kwargs.items()])
+    return request
+
+
+def _is_state_changing(meta) -> bool:
+    """Whether the trailing metadata of a command response indicates that the
+    command may have changed the server state.
+
+    The metadata comprises a ``('nosync', 'True'|'False')`` pair. If this is
+    absent, the command is conservatively assumed to be state changing.
+    """
+    for key, value in meta or ():
+        if key == "nosync":
+            return value != "True"
+    return True
+
+
+def _command_result(response, lazy_result=False, **kwargs):
+    ret = from_variant(response.result, lazy=lazy_result)
+    if "json_ret" in kwargs:
+        # Expect the result to decode as a (JSON) string
+        return json.loads(ret)
+    return ret
+
+
+def _payload_digest(response) -> str:
+    # The digest is of the serialized result, so the result is neither
+    # decoded nor encoded again as JSON. Maps are serialized in key order.
+    return hashlib.sha256(
+        response.result.SerializeToString(deterministic=True)
+    ).hexdigest()
+
+
 class SycGrpc(object):
     """Provides a remote proxy API to System Coupling's command and
     query external interface, built on a basic gRPC interface.
@@ -117,26 +202,46 @@ class SycGrpc(object):
        client to connect after start up and which becomes the only
        means of controlling the server during its lifetime.
 
-    TODO:
-
-    - All calls are synchronous at the moment. We might want to do something
-    different with the Solve() command.
+    All calls made through this class are synchronous. See ``AsyncSycGrpc``
+    for an ``asyncio`` counterpart.
     """
 
     _id_iter = itertools.count()
     _instances = {-1: None}
 
     def __init__(self):
+        self.__state_lock = threading.Lock()
+        self.__state_generation = 0
+        self.__calls_in_flight = 0
+        # The batch being recorded by each thread. See ``batch``.
+        self.__local = threading.local()
+        self.__batchable_names = None
+        self.__rpc_metrics = RpcMetrics() if RPC_METRICS_ENABLED else None
+        self.__rpc_trace = RpcTrace() if RPC_TRACE_ENABLED else None
+        self.__rpc_record_file = _RPC_RECORD_FILE
+        self.__rpc_recorder = RpcRecorder() if self.__rpc_record_file else None
+        self.__compression = CompressionPolicy.from_env()
         self._reset()
         self.__id = next(SycGrpc._id_iter)
 
     def _reset(self):
+        with self.__state_lock:
+            # Anything cached from a previous connection is invalid.
+            self.__state_generation += 1
         self.__process = None
         self.__channel = None
+        self.__retired_channels = []
         self.__output_thread = None
+        self.__output_streaming = False
+        self.__output_from_pipe = False
         self.__pim_instance = None
         self.__skip_exit = False
         self.__container = None
+        self.__batchable_names = None
+        self.__control_channel = None
+        self.__control_timeout = None
+        self.__connection_info = None
+        self.__health_monitor = None
 
     @classmethod
     def _cleanup(cls):
@@ -191,11 +296,14 @@ class SycGrpc(object):
 
             LOG.debug("Starting process...")
             process_start_t = time.monotonic()
+            readiness = ServerReadiness()
             self.__process = SycProcess(
                 connection_info.executable_path(),
                 args,
                 fallback_args,
                 working_dir,
+                on_listening=readiness.notify_listening,
+                on_exit=readiness.notify_process_exited,
                 **kwargs,
             )
             LOG.debug(
@@ -231,6 +339,7 @@ class SycGrpc(object):
             self._connect(
                 connection_info=connection_info,
                 check_process=check_process_running,
+                readiness=readiness,
             )
 
         if start_output:
@@ -273,6 +382,8 @@ class SycGrpc(object):
 
         Currently for internal use only.
         """
+        import ansys.platform.instancemanagement as pypim
+
         product_version = "latest"
         if version is not None:
             maj_v, min_v = normalize_version(version)
@@ -325,6 +436,8 @@ class SycGrpc(object):
         connection_info: StartupAndConnectionInfo = None,
         channel: Optional[grpc.Channel] = None,
         check_process=None,
+        control_channel: Optional[grpc.Channel] = None,
+        readiness: Optional[ServerReadiness] = None,
     ):
         if (channel is None and connection_info is None) or (
             channel is not None and connection_info is not None
@@ -347,7 +460,9 @@ class SycGrpc(object):
                 time.monotonic() - connect_start_t,
             )
             self._wait_for_grpc(
-                connection_info=connection_info, check_process=check_process
+                connection_info=connection_info,
+                check_process=check_process,
+                readiness=readiness,
             )
         else:
             self.__channel = channel
@@ -357,16 +472,237 @@ class SycGrpc(object):
             time.monotonic() - connect_start_t,
         )
 
-        self.__command_service = CommandQueryService(self.__channel)
-        self.__ostream_service = OutputStreamService(self.__channel)
-        self.__process_service = SycProcessService(self.__channel)
-        self.__solution_service = SolutionService(self.__channel)
-        self.__chart_service = ChartService(self.__channel)
+        self.__connection_info = connection_info
+        self._create_services(self.__channel)
+
+        if control_channel is None and connection_info and _CONTROL_CHANNEL_ENABLED:
+            control_channel = connection_info.get_server_channel(control=True)
+        self._connect_control_channel(control_channel)
+
+        if _HEALTH_MONITOR_SEC and connection_info is not None:
+            self.start_health_monitor(interval=float(_HEALTH_MONITOR_SEC))
+
+    def _create_services(self, channel: grpc.Channel):
+        stub_channel = self._instrument_channel(channel)
+        self.__command_service = CommandQueryService(stub_channel)
+        self.__ostream_service = OutputStreamService(stub_channel)
+        self.__process_service = SycProcessService(stub_channel)
+        self.__solution_service = SolutionService(stub_channel)
+        self.__chart_service = ChartService(stub_channel)
+
+    def _connect_control_channel(self, control_channel: Optional[grpc.Channel]):
+        """Set up the services used for interrupt, abort and ping calls.
+
+        If a control channel is provided, these calls are made on it, with a
+        deadline, so that they are not held up by heavy traffic on the main
+        channel. Otherwise they share the main channel.
+        """
+        self.__control_channel = control_channel
+        if control_channel is None:
+            self.__control_solution_service = self.__solution_service
+            self.__control_process_service = self.__process_service
+            self.__control_timeout = None
+        else:
+            LOG.debug("Using dedicated control channel")
+            stub_channel = self._instrument_channel(control_channel)
+            self.__control_solution_service = SolutionService(stub_channel)
+            self.__control_process_service = SycProcessService(stub_channel)
+            self.__control_timeout = _CONTROL_TIMEOUT_SEC
+
+    def _instrument_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Return ``channel`` with the compression interceptor, and the metrics
+        and recording interceptors if they are enabled, installed."""
+        # Compression is applied last so that the other interceptors see the
+        # call details as made by the services.
+        interceptors = []
+        if self.__rpc_metrics is not None:
+            interceptors.append(MetricsInterceptor(self.__rpc_metrics))
+        if self.__rpc_recorder is not None:
+            interceptors.append(self.__rpc_recorder)
+        interceptors.append(CompressionInterceptor(self.__compression))
+        return grpc.intercept_channel(channel, *interceptors)
+
+    def rebuild_channel(self):
+        """Replace the channel with a new one to the same server.
+
+        This recovers from a transient failure of the connection, from which a
+        channel might not recover by itself. The services are recreated on the
+        new channel, so that anything holding this object, such as the API
+        objects of a session and their caches, is unaffected.
+
+        Calls in progress, such as a solve, continue on the old channels,
+        which are closed once no calls are in progress and any chart data
+        stream on them has ended. Streaming of output is restarted on the new
+        channel.
+        """
+        connection_info = self.__connection_info
+        if connection_info is None:
+            raise RuntimeError(
+                "The channel cannot be rebuilt as it was not created from "
+                "connection information."
+            )
+        LOG.info("Rebuilding gRPC channel")
+        old_channels = [
+            c for c in (self.__channel, self.__control_channel) if c is not None
+        ]
+        old_ostream_service = self.__ostream_service
+        old_chart_service = self.__chart_service
+        self.__channel = connection_info.get_server_channel()
+        self._create_services(self.__channel)
+        control_channel = None
+        if self.__control_channel is not None:
+            control_channel = connection_info.get_server_channel(control=True)
+        self._connect_control_channel(control_channel)
+        with self.__state_lock:
+            # Calls in progress on the old channel might have changed the state.
+            self.__state_generation += 1
+            self.__retired_channels.extend(old_channels)
+        # The output reader continues on the new channel. See _read_stdstreams.
+        old_ostream_service.end_streaming()
+
+        def close_old_channels():
+            # Any call that started before the services were replaced is
+            # counted as in flight, so it has finished once none are.
+            while True:
+                with self.__state_lock:
+                    if not self.__calls_in_flight:
+                        break
+                time.sleep(_RETIRED_CHANNEL_POLL_SEC)
+            while old_chart_service.is_streaming:
+                time.sleep(_RETIRED_CHANNEL_POLL_SEC)
+            self._close_retired(old_channels)
+
+        threading.Thread(target=close_old_channels, daemon=True).start()
+
+    def _close_retired(self, channels):
+        with self.__state_lock:
+            channels = [c for c in channels if c in self.__retired_channels]
+            for channel in channels:
+                self.__retired_channels.remove(channel)
+        for channel in channels:
+            try:
+                channel.close()
+            except Exception as e:
+                LOG.debug(f"Exception closing old channel: {e}")
+
+    def start_health_monitor(
+        self,
+        interval: float = 5.0,
+        timeout: float | None = None,
+        stall_after: int = 2,
+        on_stall: Callable[[Exception], None] | None = None,
+        on_recover: Callable[[], None] | None = None,
+        reconnect: bool = True,
+    ) -> HealthMonitor:
+        """Start a thread that pings the server periodically to monitor the
+        health of the connection.
+
+        See ``HealthMonitor`` for a description of the parameters. If
+        ``reconnect`` is ``True``, the channel is rebuilt while the connection
+        is stalled. Any monitor already running is stopped first.
+        """
+        self.stop_health_monitor()
+        rebuild = None
+        if reconnect and self.__connection_info is not None:
+            rebuild = self.rebuild_channel
+        monitor = HealthMonitor(
+            lambda deadline: self.__control_process_service.ping(timeout=deadline),
+            interval=interval,
+            timeout=timeout,
+            stall_after=stall_after,
+            reconnect=rebuild,
+        )
+        if on_stall:
+            monitor.add_stall_callback(on_stall)
+        if on_recover:
+            monitor.add_recovery_callback(on_recover)
+        monitor.start()
+        self.__health_monitor = monitor
+        return monitor
+
+    def stop_health_monitor(self):
+        """Stop the connection health monitor, if running."""
+        if self.__health_monitor is not None:
+            self.__health_monitor.stop()
+            self.__health_monitor = None
+
+    @property
+    def health_monitor(self) -> HealthMonitor | None:
+        """The running connection health monitor, if any."""
+        return self.__health_monitor
+
+    def set_compression(self, mode: str, threshold: int | None = None):
+        """Set the compression of the requests sent by this session, and of
+        the responses if the server honours it.
+
+        ``mode`` is one of ``"none"``, ``"gzip"``, ``"deflate"`` or
+        ``"auto"``. In ``"auto"`` mode, only messages of at least
+        ``threshold`` bytes are compressed. See ``rpc_compression`` for
+        details. The change applies to calls made from then on.
+        """
+        self.__compression.set(mode, threshold)
+
+    @property
+    def compression(self) -> CompressionPolicy:
+        """The compression settings of this session."""
+        return self.__compression
+
+    def call_compression(self, mode: str) -> ContextManager:
+        """Context manager applying the compression ``mode`` to the calls made
+        by the current thread within its scope, in place of the mode of the
+        session."""
+        return self.__compression.override(mode)
+
+    def connect_replay(
+        self, trace, time_scale: float = 0.0, strict: bool = False
+    ) -> ReplayChannel:
+        """Connect to a ``ReplayChannel`` serving the calls recorded in a
+        trace file, in place of a server.
+
+        See ``ReplayChannel`` for a description of the parameters. The trace
+        file of a session is recorded by setting the ``PYSYC_RPC_RECORD_FILE``
+        environment variable to its path.
+        """
+        channel = ReplayChannel(trace, time_scale, strict)
+        self._connect(channel=channel)
+        # There is no server to shut down.
+        self.__skip_exit = True
+        return channel
+
+    @property
+    def rpc_metrics(self) -> RpcMetrics | None:
+        """Registry of per-RPC metrics, or ``None`` if they are not enabled.
+
+        Metrics are enabled by setting the ``PYSYC_RPC_METRICS`` environment
+        variable to ``1``.
+        """
+        return self.__rpc_metrics
+
+    @property
+    def rpc_recorder(self) -> RpcRecorder | None:
+        """Recorder of the calls made, or ``None`` if recording is not enabled.
+
+        Recording is enabled by setting the ``PYSYC_RPC_RECORD_FILE``
+        environment variable to the path of the trace file to be written on
+        exit.
+        """
+        return self.__rpc_recorder
+
+    def _wait_for_grpc(self, connection_info=None, check_process=None, readiness=None):
+        """Wait for the channel to become ready.
 
-    def _wait_for_grpc(self, connection_info=None, check_process=None):
+        Readiness is detected as soon as it is signalled, either by a change in
+        the channel connectivity or by ``readiness`` having been notified by a
+        locally launched server process. If the channel is not ready within the
+        time allowed for an attempt, the process is checked and, if connection
+        info is available, the channel is recreated before the next attempt.
+        """
+        readiness = readiness or ServerReadiness()
         timeout = _CHANNEL_READY_TIMEOUT_SEC
         wait_start_t = time.monotonic()
-        attempt = 0
+        attempt = 1
+        attempt_t = wait_start_t
+        recreated_on_listening = False
         LOG.debug(
             "gRPC readiness policy: initial timeout=%.3f sec, timeout factor=%.3f, "
             "max timeout per attempt=%.3f sec, total timeout=%.3f sec, "
@@ -377,63 +713,91 @@ class SycGrpc(object):
             _CHANNEL_READY_TOTAL_TIMEOUT_SEC,
             _CHANNEL_READY_RETRIES,
         )
-        while True:
-            elapsed = time.monotonic() - wait_start_t
-            if elapsed >= _CHANNEL_READY_TOTAL_TIMEOUT_SEC:
-                break
-
-            attempt += 1
-            attempt_timeout = min(
-                timeout,
-                _CHANNEL_READY_TOTAL_TIMEOUT_SEC - elapsed,
-            )
-            attempt_t = time.monotonic()
-            try:
-                grpc.channel_ready_future(self.__channel).result(
-                    timeout=attempt_timeout
-                )
-                # OK
-                LOG.debug(
-                    "gRPC ready on attempt %d in %.3f sec (wait total %.3f sec)",
-                    attempt,
-                    time.monotonic() - attempt_t,
-                    time.monotonic() - wait_start_t,
+
+        def recreate_channel():
+            # In newer grpcio versions (>=1.66), a channel that times out
+            # entering TRANSIENT_FAILURE will not self-recover on the same
+            # object. It might also be waiting out a reconnection backoff.
+            # Closing and recreating the channel resets the state machine.
+            old_channel = self.__channel
+            self.__channel = connection_info.get_server_channel()
+            readiness.watch_channel(self.__channel)
+
+            def close_old_channel():
+                try:
+                    old_channel.close()
+                except Exception as e:
+                    LOG.debug(f"Exception closing channel before retry: {e}")
+
+            # Closing a channel waits for its connectivity polling to stop, so
+            # do it in the background to avoid delaying the new connection.
+            threading.Thread(target=close_old_channel, daemon=True).start()
+
+        readiness.watch_channel(self.__channel)
+        try:
+            while True:
+                now = time.monotonic()
+                elapsed = now - wait_start_t
+                if elapsed >= _CHANNEL_READY_TOTAL_TIMEOUT_SEC:
+                    break
+
+                readiness.wait(
+                    min(
+                        attempt_t + timeout - now,
+                        _CHANNEL_READY_TOTAL_TIMEOUT_SEC - elapsed,
+                    )
                 )
-                return
-            except grpc.FutureTimeoutError:
+
+                if readiness.channel_ready:
+                    LOG.debug(
+                        "gRPC ready on attempt %d in %.3f sec (wait total %.3f sec)",
+                        attempt,
+                        time.monotonic() - attempt_t,
+                        time.monotonic() - wait_start_t,
+                    )
+                    return
+
+                if readiness.take_process_exited() and check_process:
+                    check_process()
+
+                if (
+                    readiness.server_listening
+                    and not recreated_on_listening
+                    and connection_info is not None
+                ):
+                    # The server is up, so connect now rather than waiting for
+                    # the channel's next reconnection attempt.
+                    LOG.debug("Server reports it is listening - reconnecting")
+                    recreated_on_listening = True
+                    recreate_channel()
+                    continue
+
+                attempt_elapsed = time.monotonic() - attempt_t
+                if attempt_elapsed < timeout:
+                    continue
+
                 LOG.warning(
                     "Failed to connect to gRPC channel after %.3f secs. "
                     "(Attempt number %d; elapsed %.3f/%.3f secs.)",
-                    attempt_timeout,
+                    timeout,
                     attempt,
                     time.monotonic() - wait_start_t,
                     _CHANNEL_READY_TOTAL_TIMEOUT_SEC,
                 )
-                LOG.debug(
-                    "gRPC readiness attempt %d timed out after %.3f sec "
-                    "(wall-clock %.3f sec)",
-                    attempt,
-                    attempt_timeout,
-                    time.monotonic() - attempt_t,
-                )
                 timeout = min(
                     timeout * _CHANNEL_READY_TIMEOUT_FACTOR,
                     _CHANNEL_READY_MAX_TIMEOUT_SEC,
                 )
+                attempt += 1
+                attempt_t = time.monotonic()
 
                 if check_process:
                     check_process()
 
-                # In newer grpcio versions (>=1.66), a channel that times out
-                # entering TRANSIENT_FAILURE will not self-recover on a
-                # subsequent channel_ready_future call on the same object.
-                # Closing and recreating the channel resets the state machine.
                 if connection_info is not None:
-                    try:
-                        self.__channel.close()
-                    except Exception as e:
-                        LOG.debug(f"Exception closing channel before retry: {e}")
-                    self.__channel = connection_info.get_server_channel()
+                    recreate_channel()
+        finally:
+            readiness.close()
 
         raise RuntimeError(
             "Stopping attempt to connect to gRPC channel after "
@@ -494,14 +858,30 @@ class SycGrpc(object):
             # Remove from atexit cleanup list
             del SycGrpc._instances[self.__id]
 
+        self.stop_health_monitor()
+
+        if RPC_TRACE_ENABLED and self.__rpc_trace is not None:
+            self.__rpc_trace.print_report()
+            self.__rpc_trace.clear()
+
+        self.__output_streaming = False
         if self.__channel is not None and not self.__skip_exit:
             try:
                 self.__ostream_service.end_streaming()
             except Exception as e:
                 LOG.debug(f"Exception on OutputStreamService.end_straming(): {e}")
+            if self.__output_thread is not None:
+                # Allow the remaining output to be delivered.
+                self.__output_thread.join(_OUTPUT_DRAIN_TIMEOUT)
             if self.__process_service:
                 self.__process_service.quit()
+            # Left to garbage collection, a channel to a server that has gone
+            # can block interpreter shutdown.
+            self.__channel.close()
             self.__channel = None
+        if self.__control_channel is not None:
+            self.__control_channel.close()
+        self._close_retired(list(self.__retired_channels))
         if self.__process:
             self.__process.end()
             self.__process = None
@@ -511,48 +891,83 @@ class SycGrpc(object):
             except Exception as e:
                 LOG.debug(f"Exception from container.stop(): {e}")
             self.__container = None
+        if self.__rpc_recorder is not None and self.__rpc_recorder.calls:
+            self.__rpc_recorder.save(self.__rpc_record_file)
+            self.__rpc_recorder.clear()
         if self.__pim_instance is not None:
             self.__pim_instance.delete()
             self.__pim_instance = None
         self._reset()
 
-    def start_output(self, handle_output=None):
+    def start_output(
+        self,
+        handle_output=None,
+        *,
+        batch=False,
+        max_queued_lines=DEFAULT_MAX_QUEUED_LINES,
+        overflow="block",
+        source="stream",
+    ):
         """Start streaming of standard streams from System Coupling
         and print to the console be default.
 
         Standard output and error streams are combined in the output
-        streamed to this client.
+        streamed to this client. The output is delivered to the handler
+        by an ``OutputPipeline``, which is configured by the ``batch``,
+        ``max_queued_lines`` and ``overflow`` arguments.
+
+        If ``source`` is ``"pipe"``, the output of a locally launched server
+        is read directly from the output pipe of its process rather than from
+        the gRPC output stream.
         """
+        if source not in ("stream", "pipe"):
+            raise ValueError(
+                f"Unrecognized output source '{source}'. Expected 'stream' or 'pipe'."
+            )
+        if source == "pipe" and self.__process is None:
+            raise RuntimeError(
+                "Output can only be read from the process of a locally launched "
+                "System Coupling server."
+            )
 
         def default_handler(text):
-            print(text)
+            print("\n".join(text) if batch else text)
 
         handle_output = handle_output or default_handler
+        pipeline = OutputPipeline(handle_output, batch, max_queued_lines, overflow)
+        if source == "pipe":
+            self.__process.set_output(pipeline)
+            self.__output_from_pipe = True
+            return
+        self.__output_streaming = True
         self.__output_thread = threading.Thread(
-            target=self._read_stdstreams, args=(handle_output,)
+            target=self._read_stdstreams, args=(pipeline,)
         )
         self.__output_thread.daemon = True
         self.__output_thread.start()
 
     def end_output(self):
         """Stop streaming standard streams."""
+        if self.__output_from_pipe:
+            self.__output_from_pipe = False
+            if self.__process:
+                self.__process.set_output(None)
+            return
+        self.__output_streaming = False
         self.__ostream_service.end_streaming()
 
-    def _read_stdstreams(self, handle_output):
-        output_iter = self.__ostream_service.begin_streaming()
-        text = ""
-        while True:
-            try:
-                response = next(output_iter)
-                text += response.text
-                if text and text[-1] == "\n":
-                    handle_output(text[0:-1])
-                    text = ""
-            except StopIteration:
-                # Flush any trailing text
-                if text:
-                    handle_output(text)
-                break
+    def _read_stdstreams(self, pipeline):
+        try:
+            while True:
+                service = self.__ostream_service
+                for response in service.begin_streaming():
+                    pipeline.put_text(response.text)
+                # Unless the channel has been rebuilt, the stream has ended.
+                if not self.__output_streaming or service is self.__ostream_service:
+                    break
+        finally:
+            # Delivers any trailing text
+            pipeline.close()
 
     def __getattr__(self, name):
         """Support command and query interfaces as method attributes, mainly to provide an
@@ -571,50 +986,293 @@ class SycGrpc(object):
 
         return f
 
-    def execute_command(self, cmd_name, **kwargs):
+    def execute_command(self, cmd_name, lazy_result=False, **kwargs):
         """Run a System Coupling *external interface* command or query,
         specified by its name and keyword arguments.
 
-        All commands and queries are currently run synchronously.
+        If ``lazy_result`` is ``True``, a result holding a dictionary or list
+        is returned as a read-only view that is only decoded as it is
+        accessed. See ``from_variant``.
+
+        All commands and queries are currently run synchronously, unless a
+        batch is being recorded. In that case, commands are recorded and a
+        ``BatchResult`` handle is returned, while queries first execute the
+        commands recorded so far. See ``batch``.
 
         See also ``__getattr__``.
         """
+        batch = self._active_batch()
+        if batch is not None:
+            if cmd_name in self.__batchable_names:
+                return batch.execute_command(cmd_name, **kwargs)
+            batch.flush()
+
+        response = self._invoke_command(cmd_name, **kwargs)
+        return _command_result(response, lazy_result, **kwargs)
+
+    def execute_command_with_digest(self, cmd_name, lazy_result=False, **kwargs):
+        """Run a query as ``execute_command`` does, returning its result
+        together with a SHA-256 digest of the result as received.
+
+        The digest identifies the content of a result, such as the metadata
+        of a server build, without the result being serialized again.
+        """
+        batch = self._active_batch()
+        if batch is not None:
+            batch.flush()
+        response = self._invoke_command(cmd_name, **kwargs)
+        return (
+            _command_result(response, lazy_result, **kwargs),
+            _payload_digest(response),
+        )
+
+    def _invoke_command(self, cmd_name, **kwargs):
+        request = _make_command_request(cmd_name, **kwargs)
+
+        # The second element of the returned tuple is the gRPC trailing
+        # metadata. This tells us whether the command was state changing,
+        # which is tracked to support client-side state caching.
+        state_changed = True
+        start = time.perf_counter()
+        self._begin_call()
+        try:
+            response, meta = self.__command_service.execute_command(request)
+            state_changed = _is_state_changing(meta)
+        finally:
+            self._end_call(state_changed)
+            if self.__rpc_trace is not None:
+                self.__rpc_trace.record(cmd_name, kwargs, time.perf_counter() - start)
+        return response
+
+    @contextmanager
+    def batch(self):
+        """Context manager within which commands are recorded and then
+        executed on the server in a single call on leaving the context.
+
+        While recording, each command made through this instance, including
+        those made via the ``Session`` API, returns a ``BatchResult`` handle.
+        The handle's result is available once the batch has been executed.
+        The recorded commands are compiled into one script that is executed by
+        the server's ``ExecuteCommandString`` command, so the whole sequence
+        costs a single round trip. If a command fails, the following commands
+        are not executed and the error is raised.
+
+        A query made while recording needs the preceding commands to have
+        taken effect, so the commands recorded so far are executed before it.
+        Only commands that the server's metadata lists as non-queries, and
+        whose names do not mark them as queries, are recorded. Any other
+        command, including one unknown to the metadata, is treated as a query.
+
+        Batching requires the server's ``ExecuteCommandString`` to evaluate a
+        Python expression in its command namespace and return the value. If
+        the server fails to run the batch, the recorded commands are executed
+        one by one instead.
+
+        If the body of the context raises an exception, any commands
+        recorded since the last execution are discarded. Nested uses of this
+        method join the outermost batch.
+
+        A batch only records the commands made by the thread that entered the
+        context. Commands made by other threads meanwhile run immediately.
+
+        Building a large setup in a batch avoids a round trip per call::
+
+            interface = setup.coupling_interface["intf"]
+            with rpc.batch():
+                for source, target in variable_pairs:
+                    interface.add_data_transfer(...)
+        """
+        active_batch = self._active_batch()
+        if active_batch is not None:
+            yield active_batch
+            return
+
+        if self.__batchable_names is None:
+            self.__batchable_names = {
+                cmd["name"]
+                for cmd in self.execute_command("GetCommandAndQueryMetadata")
+                if not cmd["isQuery"] and not cmd["name"].startswith(_QUERY_PREFIXES)
+            }
+        batch = CommandBatch(
+            lambda command_string: self._execute_unbatched(
+                "ExecuteCommandString", CommandString=command_string
+            ),
+            self._execute_unbatched,
+        )
+        self.__local.batch = batch
+        try:
+            yield batch
+        except BaseException:
+            batch.discard()
+            raise
+        finally:
+            self.__local.batch = None
+        batch.flush()
+
+    def _active_batch(self) -> CommandBatch | None:
+        # The batch being recorded by the current thread, if any.
+        return getattr(self.__local, "batch", None)
+
+    def _execute_unbatched(self, cmd_name, **kwargs):
+        batch, self.__local.batch = self._active_batch(), None
+        try:
+            return self.execute_command(cmd_name, **kwargs)
+        finally:
+            self.__local.batch = batch
+
+    @contextmanager
+    def trace_rpcs(self):
+        """Context manager providing an ``RpcTrace`` that records the
+        commands and queries made through this instance while in the context.
+
+        The trace may be used after leaving the context to report chatty
+        access patterns and their bulk alternatives::
+
+            with rpc.trace_rpcs() as trace:
+                run_script()
+            trace.print_report()
+
+        Nested uses of this method provide the same trace, as does any use
+        while tracing has been enabled by the ``PYSYC_RPC_TRACE`` environment
+        variable.
+        """
+        if self.__rpc_trace is not None:
+            yield self.__rpc_trace
+            return
+        trace = self.__rpc_trace = RpcTrace()
+        try:
+            yield trace
+        finally:
+            self.__rpc_trace = None
+
+    @contextmanager
+    def pipeline(self):
+        """Context manager providing a ``CommandPipeline`` through which
+        commands and queries are submitted without waiting for each response.
+
+        Each submission returns a lazy ``PendingResult`` handle immediately.
+        On leaving the context, the pipeline is flushed, waiting for all
+        outstanding responses. The error of the first failed command, if any,
+        is raised at this point.
+
+        Requests are issued in submission order but, as they are in flight
+        concurrently, the server is not guaranteed to process them in that
+        order. Only independent commands should therefore be submitted through
+        the same pipeline. This is useful to overlap network latency across a
+        long sequence of independent setup commands or queries::
+
+            with rpc.pipeline() as p:
+                for name, value in settings.items():
+                    p.SetState(ObjectPath=f"/SystemCoupling/{name}", State=value)
+        """
+        pipeline = CommandPipeline(self._submit_command)
+        try:
+            yield pipeline
+        except BaseException:
+            # Ensure nothing is left in flight but report the original error.
+            try:
+                pipeline.flush()
+            except RuntimeError:
+                pass
+            raise
+        pipeline.flush()
 
-        def make_arg(name, val):
-            arg = command_pb2.CommandRequest.Argument()
-            arg.name = name
-            to_variant(val, arg.val)
-            return arg
-
-        request = command_pb2.CommandRequest(command=cmd_name)
-        request.args.extend([make_arg(name, val) for name, val in kwargs.items()])
-        response, meta = self.__command_service.execute_command(request)
-
-        # The second element of the above tuple (which is actually gRPC
-        # trailing metadata) is currently unused, but it comprises a 1-tuple
-        # containing a pair value, ('nosync', 'True'|'False').
-        #     is_nosync = bool(meta[0][1])
-        # This tells us whether the command was state changing. This will
-        # be useful if, as is likely, we implement incremental updating to
-        # optimize client-side state caching.
-
-        ret = from_variant(response.result)
-        if "json_ret" in kwargs:
-            # Expect the result to decode as a (JSON) string
-            return json.loads(ret)
-        return ret
+    def _submit_command(self, cmd_name, lazy_result=False, **kwargs) -> PendingResult:
+        request = _make_command_request(cmd_name, **kwargs)
+
+        def on_done(future):
+            try:
+                state_changed = _is_state_changing(future.trailing_metadata())
+            except Exception:
+                state_changed = True
+            self._end_call(state_changed)
+
+        self._begin_call()
+        try:
+            future = self.__command_service.execute_command_future(request)
+        except BaseException:
+            self._end_call()
+            raise
+        if self.__rpc_trace is not None:
+            self.__rpc_trace.record(cmd_name, kwargs)
+        future.add_done_callback(on_done)
+        return PendingResult(
+            cmd_name,
+            future,
+            lambda response: _command_result(response, lazy_result, **kwargs),
+        )
+
+    @property
+    def state_generation(self) -> int | None:
+        """Counter that is incremented whenever a call might have changed the
+        server state.
+
+        Client-side caches of queried state remain valid for as long as this
+        value is unchanged. The value is ``None`` while any call is in progress,
+        as the state might then change at any time, and, for the thread
+        recording a batch, while the batch holds commands that are yet to be
+        executed.
+        """
+        if self._active_batch():
+            return None
+        with self.__state_lock:
+            if self.__calls_in_flight:
+                return None
+            return self.__state_generation
+
+    @property
+    def last_state_generation(self) -> int | None:
+        """Value of the ``state_generation`` counter, disregarding any calls in
+        progress.
+
+        Unlike ``state_generation``, this cannot be used to validate cached
+        state. It only shows whether a call that might have changed the server
+        state has completed between two points in time. For the thread
+        recording a batch, the value is ``None`` while the batch holds
+        commands that are yet to be executed.
+        """
+        if self._active_batch():
+            return None
+        with self.__state_lock:
+            return self.__state_generation
+
+    def _begin_call(self):
+        with self.__state_lock:
+            self.__calls_in_flight += 1
+
+    def _end_call(self, state_changed: bool = True):
+        with self.__state_lock:
+            self.__calls_in_flight -= 1
+            if state_changed:
+                self.__state_generation += 1
 
     def solve(self):
-        self.__solution_service.solve()
+        self._begin_call()
+        try:
+            self.__solution_service.solve()
+        finally:
+            self._end_call()
 
     def interrupt(self, reason_msg=""):
-        self.__solution_service.interrupt(reason=reason_msg)
+        self._begin_call()
+        try:
+            self.__control_solution_service.interrupt(
+                reason=reason_msg, timeout=self.__control_timeout
+            )
+        finally:
+            self._end_call()
 
     def abort(self, reason_msg=""):
-        self.__solution_service.abort(reason=reason_msg)
+        self._begin_call()
+        try:
+            self.__control_solution_service.abort(
+                reason=reason_msg, timeout=self.__control_timeout
+            )
+        finally:
+            self._end_call()
 
     def ping(self):
-        return self.__process_service.ping()
+        return self.__control_process_service.ping(timeout=self.__control_timeout)
 
     def get_chart_metadata(self):
         return self.__chart_service.get_chart_metadata()
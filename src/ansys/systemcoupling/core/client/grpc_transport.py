@@ -61,6 +61,18 @@ _GRPC_CHANNEL_OPTIONS_INT_ENV = {
 _GRPC_CHANNEL_OPTIONS_BOOL_ENV = {
     "PYSYC_GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS": "grpc.keepalive_permit_without_calls",
 }
+# Overrides of the above, applied to the control channel only.
+_GRPC_CONTROL_CHANNEL_OPTIONS_INT_ENV = {
+    "PYSYC_GRPC_CONTROL_KEEPALIVE_TIME_MS": "grpc.keepalive_time_ms",
+    "PYSYC_GRPC_CONTROL_KEEPALIVE_TIMEOUT_MS": "grpc.keepalive_timeout_ms",
+}
+# Defaults that may be overridden by any of the above. The reconnection backoff is
+# capped so that a channel that was created before the server started
+# listening connects soon after it does.
+_RECONNECT_BACKOFF_OPTIONS = {
+    "grpc.initial_reconnect_backoff_ms": 250,
+    "grpc.max_reconnect_backoff_ms": 1000,
+}
 
 
 class ConnectionType(Enum):
@@ -235,10 +247,28 @@ class StartupAndConnectionInfo:
             )
         return [f"--grpcport={opt.host}:{self._get_port()}"]
 
-    def get_server_channel(self) -> grpc.Channel:
+    def get_server_channel(self, control: bool = False) -> grpc.Channel:
         """Return the gRPC server channel object appropriate for the
         requested connection type.
+
+        If ``control`` is ``True``, the channel is intended as a dedicated
+        channel for lightweight control calls. It does not share its transport
+        connection with other channels and has its own keepalive settings.
+        """
+        return create_channel(**self._channel_args(control))
+
+    def get_server_aio_channel(self) -> grpc.aio.Channel:
+        """Return a ``grpc.aio`` channel object appropriate for the requested
+        connection type.
+
+        This is the asynchronous counterpart of ``get_server_channel``, used by
+        ``AsyncSycGrpc``. The channel is created from the same arguments.
         """
+        return _create_aio_channel(**self._channel_args(control=False))
+
+    def _channel_args(self, control: bool) -> dict:
+        # Arguments of ``create_channel``, shared by the synchronous and
+        # asyncio channels.
         opt = self._options
         if opt.transport_mode == _TransportMode.INSECURE:
             LOG.warning(
@@ -248,18 +278,26 @@ class StartupAndConnectionInfo:
             )
 
         LOG.info(f"Creating gRPC channel with transport mode: {opt.transport_mode}")
-        grpc_options = _grpc_channel_options_from_env()
-        if grpc_options:
-            LOG.info(f"Applying gRPC channel options from environment: {grpc_options}")
-        return create_channel(
-            opt.transport_mode.value,
+        if control:
+            grpc_options = _grpc_control_channel_options_from_env()
+            LOG.info(f"Applying gRPC control channel options: {grpc_options}")
+        else:
+            grpc_options = _grpc_channel_options_from_env()
+            if grpc_options:
+                LOG.info(
+                    f"Applying gRPC channel options from environment: {grpc_options}"
+                )
+        return dict(
+            transport_mode=opt.transport_mode.value,
             host=opt.host,
             port=opt.port,
             uds_service=opt.uds_service,
             uds_dir=opt.uds_dir,
             uds_id=opt.uds_id,
             certs_dir=opt.certs_folder,
-            grpc_options=grpc_options,
+            grpc_options=list(
+                {**_RECONNECT_BACKOFF_OPTIONS, **dict(grpc_options or [])}.items()
+            ),
         )
 
     def _make_options(
@@ -362,6 +400,61 @@ class StartupAndConnectionInfo:
         return self._options.port
 
 
+def _create_aio_channel(
+    transport_mode: str,
+    host: str,
+    port: int | None,
+    uds_service: str,
+    uds_dir: str | None,
+    uds_id: str | None,
+    certs_dir: str | None,
+    grpc_options: list[tuple[str, object]],
+) -> grpc.aio.Channel:
+    """Counterpart of ``cyberchannel.create_channel`` for ``grpc.aio``.
+
+    The target, credentials and options, including the checks of the
+    transport mode, are as for the synchronous channel created from the
+    same arguments.
+    """
+    # See cyberchannel.create_uds_channel for the authority option
+    local_options = [("grpc.default_authority", "localhost")] + grpc_options
+    match transport_mode:
+        case _TransportMode.UDS.value:
+            uds_folder = determine_uds_folder(uds_dir)
+            uds_folder.mkdir(parents=True, exist_ok=True)
+            socket_name = (
+                f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
+            )
+            return grpc.aio.insecure_channel(
+                f"unix:{uds_folder / socket_name}", options=local_options
+            )
+        case _TransportMode.WNUA.value:
+            # The server authenticates the Windows user of the local
+            # connection, so there are no client credentials. See
+            # cyberchannel.create_wnua_channel.
+            if not _IS_WINDOWS:
+                raise ValueError(
+                    "Windows Named User Authentication (WNUA) is only supported on Windows."
+                )
+            if host not in LOOPBACK_HOSTS:
+                raise ValueError("Remote host connections are not supported with WNUA.")
+            return grpc.aio.insecure_channel(f"{host}:{port}", options=local_options)
+        case _TransportMode.MTLS.value:
+            certs_folder = pathlib.Path(
+                certs_dir or os.environ.get("ANSYS_GRPC_CERTIFICATES") or "certs"
+            )
+            credentials = grpc.ssl_channel_credentials(
+                root_certificates=(certs_folder / "ca.crt").read_bytes(),
+                private_key=(certs_folder / "client.key").read_bytes(),
+                certificate_chain=(certs_folder / "client.crt").read_bytes(),
+            )
+            return grpc.aio.secure_channel(
+                f"{host}:{port}", credentials, options=grpc_options
+            )
+        case _:
+            return grpc.aio.insecure_channel(f"{host}:{port}", options=grpc_options)
+
+
 def _grpc_channel_options_from_env() -> list[tuple[str, object]] | None:
     options: dict[str, object] = {}
 
@@ -393,14 +486,7 @@ def _grpc_channel_options_from_env() -> list[tuple[str, object]] | None:
                 f"Ignoring invalid {_GRPC_CHANNEL_OPTIONS_JSON_ENV} value: {exc}"
             )
 
-    for env_var, grpc_key in _GRPC_CHANNEL_OPTIONS_INT_ENV.items():
-        value = os.environ.get(env_var)
-        if value is None:
-            continue
-        try:
-            options[grpc_key] = int(value)
-        except ValueError:
-            LOG.warning(f"Ignoring invalid integer value for {env_var}: '{value}'")
+    _int_channel_options_from_env(_GRPC_CHANNEL_OPTIONS_INT_ENV, options)
 
     for env_var, grpc_key in _GRPC_CHANNEL_OPTIONS_BOOL_ENV.items():
         value = os.environ.get(env_var)
@@ -419,6 +505,28 @@ def _grpc_channel_options_from_env() -> list[tuple[str, object]] | None:
     return list(options.items())
 
 
+def _grpc_control_channel_options_from_env() -> list[tuple[str, object]]:
+    options = dict(_grpc_channel_options_from_env() or [])
+    _int_channel_options_from_env(_GRPC_CONTROL_CHANNEL_OPTIONS_INT_ENV, options)
+    # Without this, channels with the same target and options share
+    # a connection via the global subchannel pool.
+    options["grpc.use_local_subchannel_pool"] = 1
+    return list(options.items())
+
+
+def _int_channel_options_from_env(
+    env_map: dict[str, str], options: dict[str, object]
+) -> None:
+    for env_var, grpc_key in env_map.items():
+        value = os.environ.get(env_var)
+        if value is None:
+            continue
+        try:
+            options[grpc_key] = int(value)
+        except ValueError:
+            LOG.warning(f"Ignoring invalid integer value for {env_var}: '{value}'")
+
+
 def _grpc_argument_category(version: tuple[int, int]) -> StartupArgumentCategory:
     """Categorise version into `StartupArgumentCategory`."""
     if version < (24, 2):
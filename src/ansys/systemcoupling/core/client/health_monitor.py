@@ -0,0 +1,232 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Background monitoring of the health of the connection to a server.
+
+A ``HealthMonitor`` pings the server periodically, with a deadline, recording
+the round trip times in a histogram. After a number of consecutive failed
+pings, the connection is considered to be stalled. The stall callbacks are
+then called and, if a ``reconnect`` function is provided, it is called to
+rebuild the connection. The recovery callbacks are called once a ping
+succeeds again.
+
+A monitor is started on a ``SycGrpc`` instance by its
+``start_health_monitor`` method, or automatically on connection if the
+``PYSYC_HEALTH_MONITOR_SEC`` environment variable is set to the interval
+between pings, in seconds.
+"""
+
+import threading
+import time
+from typing import Callable
+
+from ansys.systemcoupling.core.client.rpc_metrics import LATENCY_BUCKETS, _format_bound
+from ansys.systemcoupling.core.util.logging import LOG
+
+
+class HealthMonitor:
+    """Thread pinging a server periodically to check the connection.
+
+    Parameters
+    ----------
+    ping : Callable[[float], object]
+        Pings the server, taking the deadline in seconds. Failure is
+        indicated by raising an exception.
+    interval : float, optional
+        Time in seconds between the start of successive pings.
+    timeout : float, optional
+        Deadline in seconds of each ping. The default is ``interval``.
+    stall_after : int, optional
+        Number of consecutive failed pings after which the connection is
+        considered to be stalled.
+    reconnect : Callable[[], None], optional
+        Called to rebuild the connection while it is stalled, at most once per
+        ``stall_after`` failed pings.
+    """
+
+    def __init__(
+        self,
+        ping: Callable[[float], object],
+        interval: float = 5.0,
+        timeout: float | None = None,
+        stall_after: int = 2,
+        reconnect: Callable[[], None] | None = None,
+    ):
+        if interval <= 0:
+            raise ValueError("The health monitor interval must be positive.")
+        if stall_after < 1:
+            raise ValueError("stall_after must be at least 1.")
+        self.__ping = ping
+        self.__interval = interval
+        self.__timeout = interval if timeout is None else timeout
+        self.__stall_after = stall_after
+        self.__reconnect = reconnect
+        self.__stall_callbacks = []
+        self.__recovery_callbacks = []
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.__pings = 0
+        self.__failures = 0
+        self.__consecutive_failures = 0
+        self.__stalls = 0
+        self.__reconnects = 0
+        self.__last_rtt = None
+        self.__total_rtt = 0.0
+        self.__stalled = False
+
+    def add_stall_callback(self, callback: Callable[[Exception], None]) -> None:
+        """Add a function to be called, with the last ping error, when the
+        connection becomes stalled."""
+        self.__stall_callbacks.append(callback)
+
+    def add_recovery_callback(self, callback: Callable[[], None]) -> None:
+        """Add a function to be called when a stalled connection recovers."""
+        self.__recovery_callbacks.append(callback)
+
+    @property
+    def stalled(self) -> bool:
+        """Whether the connection is currently considered to be stalled."""
+        return self.__stalled
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self) -> None:
+        """Start the monitoring thread."""
+        if self.is_running:
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self._run, daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the monitoring thread."""
+        self.__stop.set()
+        thread = self.__thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.__thread = None
+
+    def check(self) -> bool:
+        """Ping the server once, updating the statistics and the stall state,
+        and return whether the ping succeeded."""
+        start = time.perf_counter()
+        try:
+            self.__ping(self.__timeout)
+        except Exception as e:
+            self._on_failure(e)
+            return False
+        self._on_success(time.perf_counter() - start)
+        return True
+
+    def snapshot(self) -> dict:
+        """Return the monitoring statistics.
+
+        The dictionary holds the numbers of ``pings``, ``failures``,
+        ``stalls`` and ``reconnects``, whether the connection is ``stalled``,
+        the ``last_rtt`` and ``total_rtt`` of successful pings, in seconds, and
+        an ``rtt`` histogram mapping each bucket's upper bound, in seconds, to
+        the cumulative count of successful pings within it.
+        """
+        with self.__lock:
+            cumulative = 0
+            histogram = {}
+            for bound, n in zip(LATENCY_BUCKETS, self.__bucket_counts):
+                cumulative += n
+                histogram[_format_bound(bound)] = cumulative
+            return {
+                "pings": self.__pings,
+                "failures": self.__failures,
+                "stalls": self.__stalls,
+                "reconnects": self.__reconnects,
+                "stalled": self.__stalled,
+                "last_rtt": self.__last_rtt,
+                "total_rtt": self.__total_rtt,
+                "rtt": histogram,
+            }
+
+    def _run(self):
+        next_t = time.monotonic()
+        while not self.__stop.is_set():
+            self.check()
+            next_t += self.__interval
+            # Don't try to catch up on pings missed while a ping was blocked.
+            next_t = max(next_t, time.monotonic())
+            self.__stop.wait(next_t - time.monotonic())
+
+    def _on_success(self, rtt: float):
+        with self.__lock:
+            self.__pings += 1
+            self.__last_rtt = rtt
+            self.__total_rtt += rtt
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if rtt <= bound:
+                    self.__bucket_counts[i] += 1
+                    break
+            self.__consecutive_failures = 0
+            recovered = self.__stalled
+            self.__stalled = False
+        if recovered:
+            LOG.info("Connection to System Coupling has recovered")
+            for callback in list(self.__recovery_callbacks):
+                self._call(callback)
+
+    def _on_failure(self, error: Exception):
+        with self.__lock:
+            self.__pings += 1
+            self.__failures += 1
+            self.__consecutive_failures += 1
+            failures = self.__consecutive_failures
+            newly_stalled = not self.__stalled and failures >= self.__stall_after
+            if newly_stalled:
+                self.__stalled = True
+                self.__stalls += 1
+        LOG.debug(f"Health monitor ping failed: {error}")
+        if newly_stalled:
+            LOG.warning(
+                f"Connection to System Coupling is stalled after {failures} "
+                f"failed pings: {error}"
+            )
+            for callback in list(self.__stall_callbacks):
+                self._call(callback, error)
+        if (
+            self.__reconnect is not None
+            and self.__stalled
+            and failures % self.__stall_after == 0
+        ):
+            try:
+                self.__reconnect()
+            except Exception as e:
+                LOG.warning(f"Failed to rebuild connection to System Coupling: {e}")
+            else:
+                with self.__lock:
+                    self.__reconnects += 1
+
+    def _call(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            LOG.error(f"Exception in health monitor callback: {e}")
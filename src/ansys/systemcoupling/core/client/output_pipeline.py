@@ -0,0 +1,350 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pipeline delivering the streamed output of System Coupling to handlers.
+
+Text received from the output stream is assembled into lines, which are
+placed in a bounded queue and delivered to the output handler by a separate
+thread. A slow handler therefore does not hold up reading of the stream
+until the queue is full, at which point the ``overflow`` policy applies:
+
+- ``"block"``: Reading of the stream waits for space in the queue. This
+  applies backpressure to the server without losing any output.
+- ``"drop_oldest"``: The oldest queued lines are discarded.
+- ``"drop_newest"``: The newly received lines are discarded.
+
+A handler may process lines one at a time or, if ``batch`` is ``True``, a list
+of all lines queued at the time of the call.
+
+``FileSink``, ``RotatingFileSink`` and ``RingBufferSink`` are batch handlers
+writing the output to a file, a set of rotated files, and an in-memory buffer
+of the most recent lines. Handlers derived from ``OutputSink`` are always
+treated as batch handlers, and are closed once the pipeline has delivered all
+output.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+import os
+import threading
+from typing import Callable
+
+from ansys.systemcoupling.core.util.logging import LOG
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+DEFAULT_MAX_QUEUED_LINES = 10000
+
+
+class LineAssembler:
+    """Assembles chunks of streamed text into lines.
+
+    Incomplete lines are held as a list of fragments that is joined only once
+    the end of the line arrives. This avoids repeated copying of partial lines
+    that are built up from many small chunks.
+    """
+
+    def __init__(self):
+        self.__fragments = []
+
+    def feed(self, text: str) -> list[str]:
+        """Add a chunk of text, returning any lines that it completes, without
+        their newline characters."""
+        if "\n" not in text:
+            if text:
+                self.__fragments.append(text)
+            return []
+        lines = text.split("\n")
+        if self.__fragments:
+            self.__fragments.append(lines[0])
+            lines[0] = "".join(self.__fragments)
+            self.__fragments = []
+        last = lines.pop()
+        if last:
+            self.__fragments.append(last)
+        return lines
+
+    def flush(self) -> list[str]:
+        """Return any incomplete final line."""
+        if not self.__fragments:
+            return []
+        line = "".join(self.__fragments)
+        self.__fragments = []
+        return [line]
+
+
+class OutputPipeline:
+    """Bounded queue of output lines, delivered to a handler by a dedicated
+    thread.
+
+    Parameters
+    ----------
+    handler : Callable
+        Called with each line of output or, if ``batch`` is ``True``, with a
+        list of lines.
+    batch : bool, optional
+        Whether the handler takes a list of lines. A handler derived from
+        ``OutputSink`` always does.
+    max_queued_lines : int, optional
+        Maximum number of lines held in the queue.
+    overflow : str, optional
+        Policy applied when the queue is full. One of ``"block"``,
+        ``"drop_oldest"`` and ``"drop_newest"``.
+    max_batch_size : int, optional
+        Maximum number of lines passed in one call of a batch handler.
+    """
+
+    def __init__(
+        self,
+        handler: Callable,
+        batch: bool = False,
+        max_queued_lines: int = DEFAULT_MAX_QUEUED_LINES,
+        overflow: str = "block",
+        max_batch_size: int = 1000,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unrecognized overflow policy '{overflow}'. "
+                f"Expected one of {', '.join(OVERFLOW_POLICIES)}."
+            )
+        if max_queued_lines < 1:
+            raise ValueError("max_queued_lines must be at least 1.")
+        self.__handler = handler
+        self.__batch = batch or isinstance(handler, OutputSink)
+        self.__max_queued_lines = max_queued_lines
+        self.__overflow = overflow
+        self.__max_batch_size = max_batch_size
+        self.__assembler = LineAssembler()
+        self.__queue = deque()
+        self.__cond = threading.Condition()
+        self.__closed = False
+        self.__dropped = 0
+        self.__thread = threading.Thread(target=self._dispatch, daemon=True)
+        self.__thread.start()
+
+    @property
+    def dropped(self) -> int:
+        """Number of lines discarded because the queue was full."""
+        return self.__dropped
+
+    def put_text(self, text: str) -> None:
+        """Add a chunk of streamed text."""
+        lines = self.__assembler.feed(text)
+        if lines:
+            self.put_lines(lines)
+
+    def put_lines(self, lines: list[str]) -> None:
+        """Add complete lines of output."""
+        with self.__cond:
+            if self.__closed:
+                return
+            space = self.__max_queued_lines - len(self.__queue)
+            if len(lines) > space:
+                if self.__overflow == "drop_newest":
+                    self.__dropped += len(lines) - space
+                    lines = lines[:space]
+                elif self.__overflow == "drop_oldest":
+                    excess = len(lines) - space
+                    if excess >= len(self.__queue):
+                        self.__dropped += len(self.__queue)
+                        self.__queue.clear()
+                        skip = len(lines) - self.__max_queued_lines
+                        if skip > 0:
+                            self.__dropped += skip
+                            lines = lines[skip:]
+                    else:
+                        self.__dropped += excess
+                        for _ in range(excess):
+                            self.__queue.popleft()
+                else:
+                    for line in lines:
+                        while (
+                            len(self.__queue) >= self.__max_queued_lines
+                            and not self.__closed
+                        ):
+                            self.__cond.wait()
+                        if self.__closed:
+                            # The dispatching thread may have stopped.
+                            return
+                        self.__queue.append(line)
+                        self.__cond.notify_all()
+                    return
+            self.__queue.extend(lines)
+            self.__cond.notify_all()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver any remaining output and stop the dispatching thread."""
+        lines = self.__assembler.flush()
+        if lines:
+            self.put_lines(lines)
+        with self.__cond:
+            self.__closed = True
+            self.__cond.notify_all()
+        if threading.current_thread() is not self.__thread:
+            self.__thread.join(timeout)
+
+    def _dispatch(self):
+        while True:
+            with self.__cond:
+                while not self.__queue and not self.__closed:
+                    self.__cond.wait()
+                if not self.__queue:
+                    break
+                n = min(len(self.__queue), self.__max_batch_size)
+                lines = [self.__queue.popleft() for _ in range(n)]
+                self.__cond.notify_all()
+            if self.__batch:
+                self._handle(lines)
+            else:
+                for line in lines:
+                    self._handle(line)
+
+        if isinstance(self.__handler, OutputSink):
+            try:
+                self.__handler.close()
+            except Exception as e:
+                LOG.error(f"Exception closing output sink: {e}")
+
+    def _handle(self, output):
+        try:
+            self.__handler(output)
+        except Exception as e:
+            LOG.error(f"Exception in output handler: {e}")
+
+
+class OutputSink(ABC):
+    """Base class of batch output handlers that hold resources, which are
+    released by ``close``."""
+
+    @abstractmethod
+    def __call__(self, lines: list[str]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink(OutputSink):
+    """Batch output handler appending lines to a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    mode : str, optional
+        Mode in which the file is opened. Use ``"w"`` to overwrite an
+        existing file.
+    encoding : str, optional
+        Encoding of the file.
+    """
+
+    def __init__(self, path: str, mode: str = "a", encoding: str = "utf-8"):
+        self._path = path
+        self._encoding = encoding
+        self._file = open(path, mode, encoding=encoding)
+
+    def __call__(self, lines: list[str]) -> None:
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class RotatingFileSink(FileSink):
+    """Batch output handler writing lines to a file that is rotated when it
+    exceeds a given size.
+
+    On rotation, ``path`` is renamed to ``path.1``, ``path.1`` to ``path.2``,
+    and so on, up to ``path.<backup_count>``, the oldest file being deleted.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    max_bytes : int
+        Size, in bytes, that the file may reach before it is rotated.
+    backup_count : int, optional
+        Number of rotated files to keep.
+    encoding : str, optional
+        Encoding of the files.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        backup_count: int = 5,
+        encoding: str = "utf-8",
+    ):
+        super().__init__(path, "a", encoding)
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__size = self._file.tell()
+
+    def __call__(self, lines: list[str]) -> None:
+        text = "\n".join(lines) + "\n"
+        size = len(text.encode(self._encoding))
+        if self.__size and self.__size + size > self.__max_bytes:
+            self._rotate()
+        self._file.write(text)
+        self._file.flush()
+        self.__size = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.__backup_count - 1, 0, -1):
+            source = f"{self._path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._path}.{i + 1}")
+        if self.__backup_count > 0:
+            os.replace(self._path, f"{self._path}.1")
+        self._file = open(self._path, "w", encoding=self._encoding)
+        self.__size = 0
+
+
+class RingBufferSink(OutputSink):
+    """Batch output handler retaining the most recent lines in memory.
+
+    Parameters
+    ----------
+    max_lines : int
+        Number of lines to retain.
+    """
+
+    def __init__(self, max_lines: int):
+        self.__lines = deque(maxlen=max_lines)
+        self.__lock = threading.Lock()
+
+    def __call__(self, lines: list[str]) -> None:
+        with self.__lock:
+            self.__lines.extend(lines)
+
+    def lines(self) -> list[str]:
+        """Return the retained lines, oldest first."""
+        with self.__lock:
+            return list(self.__lines)
+
+    def text(self) -> str:
+        """Return the retained lines as a single string."""
+        return "\n".join(self.lines())
@@ -0,0 +1,242 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Configurable compression of gRPC messages.
+
+Requests such as a ``SetState`` of a large part of the data model, or a batch
+of commands, can be large and are highly compressible. Compressing them pays
+off on a link of limited bandwidth, but on a local connection the time spent
+compressing usually exceeds the transfer time saved. Compression is
+therefore disabled by default and can be enabled per session, with the
+``PYSYC_GRPC_COMPRESSION`` environment variable or ``SycGrpc.set_compression``,
+and overridden for the calls made within a scope with
+``SycGrpc.call_compression``.
+
+The supported modes are:
+
+- ``"none"``: requests are not compressed.
+- ``"gzip"`` or ``"deflate"``: every request is compressed with the given
+  algorithm.
+- ``"auto"``: a request is gzip compressed if its serialized size is at least
+  the threshold, set with ``PYSYC_GRPC_COMPRESSION_THRESHOLD``.
+
+Responses, such as the result of a ``GetState`` of the whole data model, the
+metadata or chart series data, are often larger than the requests. In gRPC,
+the compression of a message is chosen by its sender, so the client cannot
+compress them itself. Unless the mode is ``"none"``, unary calls therefore
+carry the ``syc-response-compression`` metadata, whose value is the mode, and
+in ``"auto"`` mode the ``syc-response-compression-threshold`` metadata. A
+server honouring them compresses its responses with
+``grpc.ServicerContext.set_compression``; other servers ignore them and may
+still compress responses by their own configuration, as the client accepts
+gzip and deflate compressed responses.
+
+Run ``benchmarks/bench_compression.py`` to compare the modes for a range of
+payload sizes and link characteristics, for requests and responses.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import os
+import threading
+
+import grpc
+
+COMPRESSION_MODES = ("none", "gzip", "deflate", "auto")
+
+# Size in bytes from which a request is compressed in "auto" mode.
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+
+_ALGORITHMS = {"gzip": grpc.Compression.Gzip, "deflate": grpc.Compression.Deflate}
+
+# Call metadata asking the server to compress the response.
+RESPONSE_COMPRESSION_KEY = "syc-response-compression"
+RESPONSE_THRESHOLD_KEY = "syc-response-compression-threshold"
+
+
+def _check_mode(mode: str) -> str:
+    if mode not in COMPRESSION_MODES:
+        raise ValueError(
+            f"Invalid compression mode '{mode}'. "
+            f"Expected one of {', '.join(COMPRESSION_MODES)}."
+        )
+    return mode
+
+
+def _may_reach(request, threshold: int) -> bool:
+    """Return whether ``request`` may be ``threshold`` bytes or larger, without
+    serializing it.
+
+    Only commands with a container argument, such as the state of a
+    ``SetState``, or a long string argument, such as the commands of a batch,
+    can be large. Finding the exact size of a request costs nearly as much as
+    serializing it, so the size of other requests is not computed.
+    """
+    for arg in getattr(request, "args", ()):
+        kind = arg.val.WhichOneof("as")
+        if kind is None:
+            continue
+        if kind == "string_state":
+            # A character takes at most 4 bytes in UTF-8.
+            if 4 * len(arg.val.string_state) >= threshold:
+                return True
+        elif kind.endswith(("_vector_state", "_map_state")):
+            return True
+    return False
+
+
+class _CallDetails(
+    namedtuple(
+        "_CallDetails",
+        (
+            "method",
+            "timeout",
+            "metadata",
+            "credentials",
+            "wait_for_ready",
+            "compression",
+        ),
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+class CompressionPolicy:
+    """Thread-safe compression settings of a session.
+
+    Parameters
+    ----------
+    mode : str, optional
+        One of ``"none"``, ``"gzip"``, ``"deflate"`` or ``"auto"``. The
+        default is ``"none"``.
+    threshold : int, optional
+        Size in bytes from which a request is compressed in ``"auto"`` mode.
+        The default is ``DEFAULT_COMPRESSION_THRESHOLD``.
+    """
+
+    def __init__(
+        self, mode: str = "none", threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    ):
+        self.__lock = threading.Lock()
+        self.__mode = _check_mode(mode)
+        self.__threshold = threshold
+        self.__local = threading.local()
+
+    @classmethod
+    def from_env(cls) -> "CompressionPolicy":
+        """Return a policy configured by the ``PYSYC_GRPC_COMPRESSION`` and
+        ``PYSYC_GRPC_COMPRESSION_THRESHOLD`` environment variables."""
+        return cls(
+            os.environ.get("PYSYC_GRPC_COMPRESSION", "none"),
+            int(
+                os.environ.get(
+                    "PYSYC_GRPC_COMPRESSION_THRESHOLD", DEFAULT_COMPRESSION_THRESHOLD
+                )
+            ),
+        )
+
+    @property
+    def mode(self) -> str:
+        """Compression mode of the session."""
+        return self.__mode
+
+    @property
+    def threshold(self) -> int:
+        """Size in bytes from which a request is compressed in ``"auto"`` mode."""
+        return self.__threshold
+
+    def set(self, mode: str, threshold: int | None = None) -> None:
+        """Change the compression mode and, optionally, the threshold."""
+        with self.__lock:
+            self.__mode = _check_mode(mode)
+            if threshold is not None:
+                self.__threshold = threshold
+
+    @contextmanager
+    def override(self, mode: str):
+        """Context manager applying ``mode`` to the calls made by the current
+        thread within its scope."""
+        _check_mode(mode)
+        previous = getattr(self.__local, "mode", None)
+        self.__local.mode = mode
+        try:
+            yield
+        finally:
+            self.__local.mode = previous
+
+    def current_mode(self) -> str:
+        """Return the mode applying to a call made by the current thread."""
+        return getattr(self.__local, "mode", None) or self.__mode
+
+    def algorithm(self, request) -> grpc.Compression | None:
+        """Return the compression to apply to ``request`` if it is sent by the
+        current thread, or ``None`` if the channel default applies."""
+        mode = self.current_mode()
+        if mode == "none":
+            return None
+        if mode == "auto":
+            threshold = self.__threshold
+            if not _may_reach(request, threshold) or request.ByteSize() < threshold:
+                return None
+            mode = "gzip"
+        return _ALGORITHMS[mode]
+
+    def response_metadata(self) -> tuple:
+        """Return the call metadata asking the server to compress the
+        response to a call made by the current thread."""
+        mode = self.current_mode()
+        if mode == "none":
+            return ()
+        if mode == "auto":
+            return (
+                (RESPONSE_COMPRESSION_KEY, mode),
+                (RESPONSE_THRESHOLD_KEY, str(self.__threshold)),
+            )
+        return ((RESPONSE_COMPRESSION_KEY, mode),)
+
+
+class CompressionInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Client interceptor applying a ``CompressionPolicy`` to unary calls,
+    both to their request and, if the server honours it, their response.
+
+    The requests of response-streaming calls are small and their responses are
+    sent as they are produced, so those calls are left unchanged.
+    """
+
+    def __init__(self, policy: CompressionPolicy):
+        self.__policy = policy
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        response_metadata = self.__policy.response_metadata()
+        if not response_metadata:
+            return continuation(client_call_details, request)
+        details = _CallDetails(
+            client_call_details.method,
+            client_call_details.timeout,
+            tuple(client_call_details.metadata or ()) + response_metadata,
+            client_call_details.credentials,
+            client_call_details.wait_for_ready,
+            self.__policy.algorithm(request),
+        )
+        return continuation(details, request)
@@ -0,0 +1,299 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Opt-in collection of per-RPC metrics.
+
+Metrics are collected by a gRPC client interceptor installed on the channels
+of ``SycGrpc`` if the ``PYSYC_RPC_METRICS`` environment variable is set to
+``1``. For each RPC method, and for each command in the case of
+``InvokeCommand``, the number of calls and errors, a latency histogram, and
+the request and response payload sizes are recorded.
+
+The collected statistics, as returned by ``RpcMetrics.snapshot`` or
+``Session.rpc_stats``, can be exported as JSON or in the Prometheus text
+exposition format. The latter can be written to a file for collection by the
+Prometheus node exporter's *textfile* collector.
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+
+import grpc
+
+RPC_METRICS_ENABLED = os.environ.get("PYSYC_RPC_METRICS") == "1"
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    math.inf,
+)
+
+_COMMAND_METHOD = "/ansys.api.systemcoupling.v0.Command/InvokeCommand"
+
+
+def _metric_key(method: str, request) -> str:
+    """Return the key under which a call is recorded.
+
+    For example, ``"Solution.Solve"`` or, for ``InvokeCommand``,
+    ``"InvokeCommand.GetState"``.
+    """
+    if method == _COMMAND_METHOD:
+        return f"InvokeCommand.{request.command}"
+    service, _, name = method.rpartition("/")
+    return f"{service.rpartition('.')[2]}.{name}"
+
+
+class _MethodStats:
+    __slots__ = (
+        "count",
+        "errors",
+        "total_seconds",
+        "bucket_counts",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class RpcMetrics:
+    """Thread-safe registry of per-RPC metrics."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__stats: dict[str, _MethodStats] = {}
+
+    def record(
+        self,
+        key: str,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+        ok: bool = True,
+    ) -> None:
+        """Record a completed call."""
+        with self.__lock:
+            stats = self.__stats.get(key)
+            if stats is None:
+                stats = self.__stats[key] = _MethodStats()
+            stats.count += 1
+            if not ok:
+                stats.errors += 1
+            stats.total_seconds += seconds
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats.bucket_counts[i] += 1
+                    break
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self.__lock:
+            self.__stats = {}
+
+    def snapshot(self) -> dict:
+        """Return the recorded metrics as a dictionary keyed by call name.
+
+        Each value holds ``count``, ``errors``, ``total_seconds``,
+        ``request_bytes`` and ``response_bytes`` totals, and a ``latency``
+        histogram mapping each bucket's upper bound, in seconds, to the
+        cumulative count of calls completed within it.
+        """
+        with self.__lock:
+            snapshot = {}
+            for key, stats in sorted(self.__stats.items()):
+                cumulative = 0
+                histogram = {}
+                for bound, n in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                    cumulative += n
+                    histogram[_format_bound(bound)] = cumulative
+                snapshot[key] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "total_seconds": stats.total_seconds,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "latency": histogram,
+                }
+            return snapshot
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(bound)
+
+
+def stats_to_json(stats: dict, **kwargs) -> str:
+    """Return statistics, as returned by ``Session.rpc_stats``, as a JSON string.
+
+    Keyword arguments are passed to ``json.dumps``.
+    """
+    return json.dumps(stats, **kwargs)
+
+
+def stats_to_prometheus(stats: dict, prefix: str = "pysyc_rpc") -> str:
+    """Return statistics, as returned by ``Session.rpc_stats``, in the
+    Prometheus text exposition format."""
+    metrics = [
+        (f"{prefix}_calls_total", "counter", "Number of calls.", "count"),
+        (f"{prefix}_errors_total", "counter", "Number of failed calls.", "errors"),
+        (
+            f"{prefix}_request_bytes_total",
+            "counter",
+            "Total serialized size of requests.",
+            "request_bytes",
+        ),
+        (
+            f"{prefix}_response_bytes_total",
+            "counter",
+            "Total serialized size of responses.",
+            "response_bytes",
+        ),
+    ]
+    lines = []
+    for name, metric_type, help_text, field in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for key, item in stats.items():
+            lines.append(f'{name}{{method="{key}"}} {item[field]}')
+
+    name = f"{prefix}_latency_seconds"
+    lines.append(f"# HELP {name} Call latency.")
+    lines.append(f"# TYPE {name} histogram")
+    for key, item in stats.items():
+        for bound, count in item["latency"].items():
+            lines.append(f'{name}_bucket{{method="{key}",le="{bound}"}} {count}')
+        lines.append(f'{name}_sum{{method="{key}"}} {item["total_seconds"]}')
+        lines.append(f'{name}_count{{method="{key}"}} {item["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(stats: dict, path: str, prefix: str = "pysyc_rpc"):
+    """Write statistics, as returned by ``Session.rpc_stats``, to a file in the
+    Prometheus text exposition format.
+
+    The file is replaced atomically so that a scraper never reads a partially
+    written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(stats_to_prometheus(stats, prefix))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class _MeteredStream:
+    """Wraps the call object of a response-streaming RPC, recording the call
+    when the stream ends."""
+
+    def __init__(self, call, on_end):
+        self.__call = call
+        self.__on_end = on_end
+        self.__response_bytes = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self.__call)
+        except StopIteration:
+            self._end(ok=True)
+            raise
+        except grpc.RpcError:
+            self._end(ok=self.__call.cancelled())
+            raise
+        self.__response_bytes += response.ByteSize()
+        return response
+
+    def _end(self, ok):
+        if self.__on_end is not None:
+            self.__on_end(self.__response_bytes, ok)
+            self.__on_end = None
+
+    def __getattr__(self, name):
+        return getattr(self.__call, name)
+
+
+class MetricsInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """Client interceptor recording calls in an ``RpcMetrics`` registry."""
+
+    def __init__(self, metrics: RpcMetrics):
+        self.__metrics = metrics
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        key = _metric_key(client_call_details.method, request)
+        request_bytes = request.ByteSize()
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+
+        def on_done(future):
+            seconds = time.perf_counter() - start
+            try:
+                response_bytes = future.result().ByteSize()
+            except Exception:
+                self.__metrics.record(key, seconds, request_bytes, 0, ok=False)
+            else:
+                self.__metrics.record(key, seconds, request_bytes, response_bytes)
+
+        outcome.add_done_callback(on_done)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        key = _metric_key(client_call_details.method, request)
+        request_bytes = request.ByteSize()
+        start = time.perf_counter()
+
+        def on_end(response_bytes, ok):
+            seconds = time.perf_counter() - start
+            self.__metrics.record(key, seconds, request_bytes, response_bytes, ok)
+
+        return _MeteredStream(continuation(client_call_details, request), on_end)
@@ -0,0 +1,494 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Recording of RPC traffic and its replay without a server.
+
+An ``RpcRecorder`` is a gRPC client interceptor that records each call made on
+the channels of ``SycGrpc``: the request, the responses and their timing, the
+trailing metadata, and the status. Recording is enabled by setting the
+``PYSYC_RPC_RECORD_FILE`` environment variable to the path of the trace file,
+which is written when the session exits.
+
+A ``ReplayChannel`` serves the calls of a trace file back to the client, so a
+session can be run with no server. Each call is matched to an unused recorded
+call of the same method with an identical request, falling back to the next
+unused recorded call of the method if there is none. Optionally, the recorded
+latency of the calls is reproduced. This allows client-side code to be
+profiled and benchmarked deterministically, with realistic payloads::
+
+    rpc = SycGrpc()
+    rpc.connect_replay("session.pysyctrace")
+    session = Session(rpc)
+
+The trace file is a gzip-compressed sequence of JSON lines. The first line is
+a header and each following line holds one call, with the protobuf messages
+serialized and base64-encoded.
+"""
+
+import base64
+import gzip
+import itertools
+import json
+import threading
+import time
+from typing import List, Optional
+
+import grpc
+
+from ansys.systemcoupling.core.util.logging import LOG
+
+_FORMAT = "pysyc-rpc-trace"
+_VERSION = 1
+
+
+def _encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _decode(text: str) -> bytes:
+    return base64.b64decode(text)
+
+
+def _encode_metadata(metadata) -> list:
+    # Values of "-bin" keys are bytes, and other values are strings.
+    return [
+        [key, _encode(value), True] if isinstance(value, bytes) else [key, value, False]
+        for key, value in metadata or ()
+    ]
+
+
+def _decode_metadata(metadata: list) -> tuple:
+    return tuple(
+        (key, _decode(value) if is_bytes else value)
+        for key, value, is_bytes in metadata
+    )
+
+
+def save_trace(calls: List[dict], path: str) -> None:
+    """Write the recorded ``calls`` to a trace file at ``path``."""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"format": _FORMAT, "version": _VERSION}) + "\n")
+        for call in calls:
+            f.write(json.dumps(call, separators=(",", ":")) + "\n")
+
+
+def load_trace(path: str) -> List[dict]:
+    """Read the recorded calls from the trace file at ``path``."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != _FORMAT or header.get("version") != _VERSION:
+            raise RuntimeError(f"'{path}' is not a supported RPC trace file.")
+        return [json.loads(line) for line in f]
+
+
+class RpcRecorder(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """Client interceptor recording the calls made through a channel.
+
+    Each recorded call is a dictionary holding:
+
+    - ``method``: the full RPC method name.
+    - ``request``: the serialized request.
+    - ``responses``: a list of ``[seconds, response]`` pairs, giving the
+      serialized responses and the time of each since the start of the call.
+    - ``trailing_metadata``: the trailing metadata, if the call completed.
+    - ``code`` and ``details``: the status of the call, or ``None`` if a
+      response stream was still active when the calls were retrieved.
+    - ``seconds``: the duration of the call.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__seq = itertools.count()
+        self.__calls = {}
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        call = self._begin(client_call_details.method, request)
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+
+        def on_done(future):
+            seconds = time.perf_counter() - start
+            try:
+                call["responses"].append(
+                    [seconds, _encode(future.result().SerializeToString())]
+                )
+            except Exception:
+                pass
+            self._end(call, future, seconds)
+
+        outcome.add_done_callback(on_done)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        call = self._begin(client_call_details.method, request)
+        return _RecordedStream(
+            continuation(client_call_details, request), call, self._end
+        )
+
+    def _begin(self, method: str, request) -> dict:
+        call = {
+            "method": method,
+            "request": _encode(request.SerializeToString()),
+            "responses": [],
+            "trailing_metadata": [],
+            "code": None,
+            "details": None,
+            "seconds": None,
+        }
+        with self.__lock:
+            self.__calls[next(self.__seq)] = call
+        return call
+
+    def _end(self, call: dict, outcome, seconds: float):
+        try:
+            call["trailing_metadata"] = _encode_metadata(outcome.trailing_metadata())
+            call["code"] = outcome.code().name
+            call["details"] = outcome.details()
+        except Exception as e:
+            LOG.debug(f"Unable to record status of {call['method']}: {e}")
+            call["code"] = grpc.StatusCode.UNKNOWN.name
+        call["seconds"] = seconds
+
+    @property
+    def calls(self) -> List[dict]:
+        """The calls recorded so far, in the order in which they were made."""
+        with self.__lock:
+            return [self.__calls[seq] for seq in sorted(self.__calls)]
+
+    def clear(self) -> None:
+        """Discard the calls recorded so far."""
+        with self.__lock:
+            self.__calls.clear()
+
+    def save(self, path: str) -> None:
+        """Write the calls recorded so far to a trace file at ``path``."""
+        save_trace(self.calls, path)
+
+
+class _RecordedStream:
+    """Wraps the call object of a response-streaming RPC, recording each
+    response as it is read."""
+
+    def __init__(self, call, record: dict, on_end):
+        self.__call = call
+        self.__record = record
+        self.__on_end = on_end
+        self.__start = time.perf_counter()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self.__call)
+        except (StopIteration, grpc.RpcError):
+            self._end()
+            raise
+        self.__record["responses"].append(
+            [time.perf_counter() - self.__start, _encode(response.SerializeToString())]
+        )
+        return response
+
+    def _end(self):
+        if self.__on_end is not None:
+            self.__on_end(
+                self.__record, self.__call, time.perf_counter() - self.__start
+            )
+            self.__on_end = None
+
+    def __getattr__(self, name):
+        return getattr(self.__call, name)
+
+
+class ReplayMismatchError(RuntimeError):
+    """Raised by a strict ``ReplayChannel`` if a request does not match any
+    recorded call."""
+
+
+class _ReplayOutcome(grpc.RpcError, grpc.Call, grpc.Future):
+    """Completed call, acting as the call, future and, if the recorded call
+    failed, error objects of the gRPC API."""
+
+    def __init__(self, response, record: dict):
+        self.__response = response
+        self.__code = grpc.StatusCode[record["code"] or "OK"]
+        self.__details = record["details"]
+        self.__trailing_metadata = _decode_metadata(record["trailing_metadata"])
+
+    @property
+    def ok(self) -> bool:
+        return self.__code == grpc.StatusCode.OK
+
+    def initial_metadata(self):
+        return ()
+
+    def trailing_metadata(self):
+        return self.__trailing_metadata
+
+    def code(self):
+        return self.__code
+
+    def details(self):
+        return self.__details
+
+    def debug_error_string(self):
+        return None
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return self.__code == grpc.StatusCode.CANCELLED
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def result(self, timeout=None):
+        if not self.ok:
+            raise self
+        return self.__response
+
+    def exception(self, timeout=None):
+        return None if self.ok else self
+
+    def traceback(self, timeout=None):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+class _ReplayUnaryUnary(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, channel, method, request_serializer, response_deserializer):
+        self.__channel = channel
+        self.__method = method
+        self.__serialize = request_serializer
+        self.__deserialize = response_deserializer
+
+    def _outcome(self, request) -> _ReplayOutcome:
+        record = self.__channel._take(self.__method, self.__serialize(request))
+        self.__channel._think(record["seconds"])
+        response = None
+        if record["responses"]:
+            response = self.__deserialize(_decode(record["responses"][-1][1]))
+        return _ReplayOutcome(response, record)
+
+    def __call__(self, request, *args, **kwargs):
+        return self._outcome(request).result()
+
+    def with_call(self, request, *args, **kwargs):
+        outcome = self._outcome(request)
+        return outcome.result(), outcome
+
+    def future(self, request, *args, **kwargs):
+        return self._outcome(request)
+
+
+class _ReplayStream(grpc.Call):
+    """Response stream replaying the recorded responses of a call."""
+
+    def __init__(self, channel, record: dict, deserialize):
+        self.__channel = channel
+        self.__responses = iter(record["responses"])
+        self.__deserialize = deserialize
+        self.__outcome = _ReplayOutcome(None, record)
+        self.__elapsed = 0.0
+        self.__cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.__cancelled:
+            raise self.__outcome
+        try:
+            seconds, response = next(self.__responses)
+        except StopIteration:
+            if self.__outcome.ok:
+                raise
+            raise self.__outcome from None
+        self.__channel._think(seconds - self.__elapsed)
+        self.__elapsed = seconds
+        return self.__deserialize(_decode(response))
+
+    def initial_metadata(self):
+        return ()
+
+    def trailing_metadata(self):
+        return self.__outcome.trailing_metadata()
+
+    def code(self):
+        return self.__outcome.code()
+
+    def details(self):
+        return self.__outcome.details()
+
+    def is_active(self):
+        return not self.__cancelled
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        self.__cancelled = True
+        return True
+
+    def cancelled(self):
+        return self.__cancelled
+
+    def add_callback(self, callback):
+        return False
+
+
+class _ReplayUnaryStream(grpc.UnaryStreamMultiCallable):
+    def __init__(self, channel, method, request_serializer, response_deserializer):
+        self.__channel = channel
+        self.__method = method
+        self.__serialize = request_serializer
+        self.__deserialize = response_deserializer
+
+    def __call__(self, request, *args, **kwargs):
+        record = self.__channel._take(self.__method, self.__serialize(request))
+        return _ReplayStream(self.__channel, record, self.__deserialize)
+
+
+class ReplayChannel(grpc.Channel):
+    """Channel serving the calls recorded in a trace file, in place of a server.
+
+    Parameters
+    ----------
+    trace : str or list[dict]
+        Path of the trace file, or the calls as provided by
+        ``RpcRecorder.calls``.
+    time_scale : float, optional
+        Factor applied to the recorded latency of each call, and to the
+        recorded time between the responses of a stream, to reproduce the
+        server's think time. The default is ``0.0``, in which case calls
+        complete immediately.
+    strict : bool, optional
+        Whether to raise a ``ReplayMismatchError`` if a request does not match
+        a recorded call exactly, rather than using the next unused recorded
+        call of the same method. The default is ``False``.
+    """
+
+    def __init__(self, trace, time_scale: float = 0.0, strict: bool = False):
+        calls = load_trace(trace) if isinstance(trace, str) else trace
+        self.__lock = threading.Lock()
+        self.__time_scale = time_scale
+        self.__strict = strict
+        self.__by_request = {}
+        self.__by_method = {}
+        for call in calls:
+            if call["code"] is None and not call["responses"]:
+                continue
+            self.__by_request.setdefault((call["method"], call["request"]), []).append(
+                call
+            )
+            self.__by_method.setdefault(call["method"], []).append(call)
+        self.__used = set()
+        self.__mismatches = 0
+
+    @property
+    def mismatches(self) -> int:
+        """Number of requests that were served by a recorded call with a
+        different request."""
+        return self.__mismatches
+
+    def _take(self, method: str, request: bytes) -> dict:
+        key = (method, _encode(request))
+        with self.__lock:
+            for call in self.__by_request.get(key, ()):
+                if id(call) not in self.__used:
+                    self.__used.add(id(call))
+                    return call
+            if self.__strict:
+                raise ReplayMismatchError(
+                    f"No recorded call of {method} matches the request."
+                )
+            for call in self.__by_method.get(method, ()):
+                if id(call) not in self.__used:
+                    self.__used.add(id(call))
+                    self.__mismatches += 1
+                    return call
+        raise ReplayMismatchError(f"No more recorded calls of {method}.")
+
+    def _think(self, seconds: Optional[float]):
+        if self.__time_scale and seconds:
+            time.sleep(seconds * self.__time_scale)
+
+    def unary_unary(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        *args,
+        **kwargs,
+    ):
+        return _ReplayUnaryUnary(
+            self, method, request_serializer, response_deserializer
+        )
+
+    def unary_stream(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        *args,
+        **kwargs,
+    ):
+        return _ReplayUnaryStream(
+            self, method, request_serializer, response_deserializer
+        )
+
+    def stream_unary(self, method, *args, **kwargs):
+        raise NotImplementedError("Client-streaming calls cannot be replayed.")
+
+    def stream_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("Bidirectional streaming calls cannot be replayed.")
+
+    def subscribe(self, callback, try_to_connect=False):
+        callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -0,0 +1,295 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tracing of RPCs to find chatty access patterns in client scripts.
+
+While a trace is active, each command or query sent to the server is recorded
+along with the data model path it accesses and its *call site*, which is the
+innermost calling frame outside of the PySystemCoupling API machinery. This is
+normally a line of a user script.
+
+``RpcTrace.hot_spots`` analyzes the records for *N+1* access patterns, where
+one call is made per child object, or per property of an object, from the
+same call site. These patterns are typically caused by loops over the API
+objects and can usually be replaced by a single bulk ``get_state`` or
+``set_state`` call. ``RpcTrace.report`` formats the hot spots, ranked by the
+number of calls involved, along with the suggested alternatives.
+
+A trace is started with the ``Session.trace_rpcs`` context manager::
+
+    with session.trace_rpcs() as trace:
+        for name in transfer_names:
+            print(interface.data_transfer[name].display_name)
+    trace.print_report()
+
+Alternatively, setting the ``PYSYC_RPC_TRACE`` environment variable to ``1``
+traces all calls made in a session and prints the report when the session
+exits.
+"""
+
+from collections import defaultdict
+import os
+import sys
+import threading
+from typing import List, NamedTuple, Optional
+
+RPC_TRACE_ENABLED = os.environ.get("PYSYC_RPC_TRACE") == "1"
+
+# Queries and commands that access the data model, for which access patterns
+# are analyzed.
+_READS = {"GetState", "GetParameter", "GetChildNamesStr", "GetParameterOptions"}
+_WRITES = {"SetState"}
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules in the package that use the API in the same way as a user script
+# would. Their frames are reported as call sites.
+_API_CLIENT_PATHS = (
+    os.path.join(_PACKAGE_DIR, "adaptor", "impl", "injected_commands_"),
+    os.path.join(_PACKAGE_DIR, "participant") + os.sep,
+)
+
+
+class CallSite(NamedTuple):
+    """Location in the Python source from which an RPC was made."""
+
+    filename: str
+    lineno: int
+    function: str
+
+    def __str__(self):
+        return f"{self.filename}:{self.lineno} in {self.function}"
+
+
+class RpcRecord(NamedTuple):
+    """Record of a traced RPC."""
+
+    command: str
+    object_path: Optional[str]
+    name: Optional[str]
+    call_site: CallSite
+    seconds: Optional[float]
+
+
+class HotSpot(NamedTuple):
+    """Set of calls forming a chatty access pattern.
+
+    ``kind`` is one of:
+
+    - ``"per_child"``: the same access made for each child of a named
+      object container, identified by ``path``.
+    - ``"per_property"``: a property access made for each of several
+      properties of the object identified by ``path``.
+    - ``"repeated"``: the same call made repeatedly.
+    """
+
+    kind: str
+    call_site: CallSite
+    command: str
+    path: str
+    calls: int
+    targets: int
+    seconds: float
+    suggestion: str
+
+
+def _is_internal(filename: str) -> bool:
+    if not filename.startswith(_PACKAGE_DIR):
+        return False
+    return not filename.startswith(_API_CLIENT_PATHS)
+
+
+def _find_call_site(frame) -> CallSite:
+    outermost = frame
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not _is_internal(filename):
+            return CallSite(filename, frame.f_lineno, frame.f_code.co_name)
+        outermost = frame
+        frame = frame.f_back
+    # Everything is internal - for example, calls made while a session is
+    # being set up.
+    return CallSite(
+        outermost.f_code.co_filename, outermost.f_lineno, outermost.f_code.co_name
+    )
+
+
+def _split_child(path: str):
+    """Split the path of a named object, or of an object below a named object,
+    at its last named object, returning the container path, the child name,
+    and the remainder of the path.
+
+    For example, ``"/SystemCoupling/CouplingInterface:intf/DataTransfer:t1"``
+    is split into ``"/SystemCoupling/CouplingInterface:intf/DataTransfer"``,
+    ``"t1"`` and ``""``. ``None`` is returned if the path has no named objects.
+    """
+    sep = path.rfind(":")
+    if sep < 0:
+        return None
+    end = path.find("/", sep)
+    if end < 0:
+        end = len(path)
+    return path[:sep], path[sep + 1 : end], path[end:]
+
+
+def _suggestion(kind: str, command: str, path: str) -> str:
+    if command in _WRITES:
+        if kind == "per_child":
+            return (
+                f"build the state of all children and make one set_state() "
+                f"call on {path}"
+            )
+        return f"combine the values and make one set_state() call on {path}"
+    if kind == "repeated":
+        return f"make the query once and reuse the result, or use get_state() on {path}"
+    return f"make one get_state() call on {path} and look up the values locally"
+
+
+class RpcTrace:
+    """Records RPCs made while it is active and reports chatty access
+    patterns. See the module documentation.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__records: List[RpcRecord] = []
+
+    def record(self, command: str, kwargs: dict, seconds: Optional[float] = None):
+        """Record a call of ``command`` with arguments ``kwargs``, taking
+        ``seconds`` to complete, if known.
+
+        The call site is found from the current Python stack.
+        """
+        record = RpcRecord(
+            command,
+            kwargs.get("ObjectPath"),
+            kwargs.get("Name"),
+            _find_call_site(sys._getframe(1)),
+            seconds,
+        )
+        with self.__lock:
+            self.__records.append(record)
+
+    @property
+    def records(self) -> List[RpcRecord]:
+        """Copy of the records made so far, in call order."""
+        with self.__lock:
+            return list(self.__records)
+
+    def clear(self) -> None:
+        """Discard the records made so far."""
+        with self.__lock:
+            self.__records.clear()
+
+    def hot_spots(self, min_calls: int = 3) -> List[HotSpot]:
+        """Return the chatty access patterns involving at least ``min_calls``
+        calls, ranked by the number of calls.
+
+        Each call is attributed to at most one pattern. Patterns across
+        children are preferred, as they tend to scale with the size of the
+        setup.
+        """
+        by_child = defaultdict(list)
+        by_object = defaultdict(list)
+        by_call = defaultdict(list)
+        for r in self.records:
+            if r.command not in _READS and r.command not in _WRITES:
+                continue
+            if r.object_path is None:
+                continue
+            by_call[(r.call_site, r.command, r.object_path, r.name)].append(r)
+            parts = _split_child(r.object_path)
+            if parts is not None:
+                container, _, rest = parts
+                by_child[(r.call_site, r.command, container, rest, r.name)].append(r)
+            if r.command == "GetParameter" or r.command in _WRITES:
+                by_object[(r.call_site, r.command, r.object_path)].append(r)
+
+        spots = []
+        assigned = set()
+
+        def add(kind, key, records, path, targets):
+            records = [r for r in records if id(r) not in assigned]
+            if len(records) < min_calls or targets < min_calls:
+                return
+            assigned.update(id(r) for r in records)
+            call_site, command = key[0], key[1]
+            spots.append(
+                HotSpot(
+                    kind,
+                    call_site,
+                    command,
+                    path,
+                    len(records),
+                    targets,
+                    sum(r.seconds or 0.0 for r in records),
+                    _suggestion(kind, command, path),
+                )
+            )
+
+        for key, records in by_child.items():
+            children = {_split_child(r.object_path)[1] for r in records}
+            add("per_child", key, records, key[2], len(children))
+        for key, records in by_object.items():
+            if key[1] in _WRITES:
+                # Writes to the same object are only repeated calls.
+                continue
+            names = {r.name for r in records}
+            add("per_property", key, records, key[2], len(names))
+        for key, records in by_call.items():
+            add("repeated", key, records, key[2], len(records))
+
+        spots.sort(key=lambda s: -s.calls)
+        return spots
+
+    def report(self, top: int = 10, min_calls: int = 3) -> str:
+        """Return a report of the ``top`` hot spots found by ``hot_spots``."""
+        records = self.records
+        sites = {r.call_site for r in records}
+        lines = [f"RPC trace: {len(records)} calls from {len(sites)} call sites."]
+        spots = self.hot_spots(min_calls)
+        if not spots:
+            lines.append("No chatty access patterns found.")
+            return "\n".join(lines)
+
+        lines.append("")
+        lines.append("Hot spots:")
+        for i, spot in enumerate(spots[:top], 1):
+            if spot.kind == "per_child":
+                what = f"one {spot.command} per child of {spot.path} ({spot.targets} children)"
+            elif spot.kind == "per_property":
+                what = f"one {spot.command} per property of {spot.path} ({spot.targets} properties)"
+            else:
+                what = f"{spot.command} on {spot.path} repeated"
+            lines.append(f"{i:>3}. {spot.call_site}")
+            lines.append(
+                f"     {spot.calls} calls, {spot.seconds * 1000:.1f} ms: {what}"
+            )
+            lines.append(f"     -> {spot.suggestion}")
+        if len(spots) > top:
+            lines.append(f"... and {len(spots) - top} more.")
+        return "\n".join(lines)
+
+    def print_report(self, top: int = 10, min_calls: int = 3) -> None:
+        """Print the report returned by ``report``."""
+        print(self.report(top, min_calls))
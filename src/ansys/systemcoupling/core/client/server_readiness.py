@@ -0,0 +1,99 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Event-driven detection of server readiness during connection."""
+
+import threading
+
+import grpc
+
+
+class ServerReadiness:
+    """Combines the signals indicating that a server might have become ready
+    to accept calls into a single event that a connecting thread can wait on.
+
+    The signals are changes in the connectivity state of the channel being
+    connected, and notifications from a locally launched server process that
+    it is listening or has exited.
+    """
+
+    def __init__(self):
+        self.__event = threading.Event()
+        self.__channel = None
+        self.__channel_ready = False
+        self.__server_listening = False
+        self.__process_exited = False
+
+    def watch_channel(self, channel: grpc.Channel) -> None:
+        """Watch the connectivity of ``channel``, replacing any channel that
+        was previously watched. A connection attempt is started immediately.
+        """
+        self.close()
+        self.__channel_ready = False
+        self.__channel = channel
+        channel.subscribe(self._on_connectivity, try_to_connect=True)
+
+    def close(self) -> None:
+        """Stop watching the current channel."""
+        if self.__channel is not None:
+            self.__channel.unsubscribe(self._on_connectivity)
+            self.__channel = None
+
+    def notify_listening(self) -> None:
+        """Notify that the server process reports that it is listening."""
+        self.__server_listening = True
+        self.__event.set()
+
+    def notify_process_exited(self) -> None:
+        """Notify that the server process has exited."""
+        self.__process_exited = True
+        self.__event.set()
+
+    def wait(self, timeout: float) -> None:
+        """Wait until any signal is received or ``timeout`` seconds elapse.
+
+        The state after waiting is queried via the properties of this class.
+        """
+        self.__event.wait(timeout)
+        self.__event.clear()
+
+    @property
+    def channel_ready(self) -> bool:
+        """Whether the watched channel is ready."""
+        return self.__channel_ready
+
+    @property
+    def server_listening(self) -> bool:
+        """Whether the server process has reported that it is listening."""
+        return self.__server_listening
+
+    def take_process_exited(self) -> bool:
+        """Return whether a process exit has been notified since the last
+        call of this method."""
+        exited, self.__process_exited = self.__process_exited, False
+        return exited
+
+    def _on_connectivity(self, connectivity: grpc.ChannelConnectivity) -> None:
+        if connectivity == grpc.ChannelConnectivity.READY:
+            self.__channel_ready = True
+            self.__event.set()
@@ -21,7 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Generator, Union
+from typing import AsyncGenerator, Generator, Union
 
 import ansys.api.systemcoupling.v0.chart_pb2 as chart_pb2
 import ansys.api.systemcoupling.v0.chart_pb2_grpc as chart_pb2_grpc
@@ -133,6 +133,22 @@ def _convert_all_series_data(
     return result
 
 
+def _convert_chart_event(
+    chart_event: chart_pb2.ChartDataEvent,
+) -> list[Union[InterfaceInfo, SeriesData, TimestepBeginData, TimestepEndData]]:
+    """Convert a streamed protobuf ChartDataEvent to a list of native items."""
+    match chart_event.WhichOneof("event_data"):
+        case "metadata":
+            return _convert_interface_info(chart_event.metadata)
+        case "series_data":
+            return [_convert_series_data(chart_event.series_data)]
+        case "timestep_start":
+            return [_convert_timestep_begin_data(chart_event.timestep_start)]
+        case "timestep_end":
+            return [_convert_timestep_end_data(chart_event.timestep_end)]
+    return []
+
+
 class ChartService:
     """Client for interacting with System Coupling chart data via gRPC.
 
@@ -168,18 +184,8 @@ class ChartService:
 
         try:
             for chart_event in self._stream_chart_data():
-                match chart_event.WhichOneof("event_data"):
-                    case "metadata":
-                        # Convert metadata and yield each interface info
-                        interface_infos = _convert_interface_info(chart_event.metadata)
-                        for interface_info in interface_infos:
-                            yield interface_info
-                    case "series_data":
-                        yield _convert_series_data(chart_event.series_data)
-                    case "timestep_start":
-                        yield _convert_timestep_begin_data(chart_event.timestep_start)
-                    case "timestep_end":
-                        yield _convert_timestep_end_data(chart_event.timestep_end)
+                # Metadata converts to one item per interface
+                yield from _convert_chart_event(chart_event)
         finally:
             self.__chart_stream = None
 
@@ -189,6 +195,11 @@ class ChartService:
             self.__chart_stream.cancel()
             self.__chart_stream = None
 
+    @property
+    def is_streaming(self) -> bool:
+        """Whether a chart data stream is active."""
+        return self.__chart_stream is not None
+
     def get_chart_metadata(self) -> list[InterfaceInfo]:
         """Retrieves the chart metadata for all available series."""
         request = chart_pb2.ChartMetadataRequest()
@@ -203,3 +214,51 @@ class ChartService:
         """Retrieves all chart timestep data."""
         request = chart_pb2.ChartTimestepDataRequest()
         return _convert_timestep_data(self.__stub.GetChartTimestepData(request))
+
+
+class AsyncChartService:
+    """Counterpart of ``ChartService`` for use with a ``grpc.aio`` channel."""
+
+    def __init__(self, channel):
+        self.__stub = chart_pb2_grpc.ChartDataStub(channel)
+        self.__chart_stream = None
+
+    async def stream_chart_data(
+        self,
+    ) -> AsyncGenerator[
+        Union[InterfaceInfo, SeriesData, TimestepBeginData, TimestepEndData], None
+    ]:
+        """Streams chart data events from System Coupling and converts them to
+        appropriate datatypes."""
+        if self.__chart_stream is not None:
+            raise RuntimeError("Chart data stream is already active.")
+
+        request = chart_pb2.ChartDataRequest()
+        self.__chart_stream = self.__stub.StreamChartData(request)
+        try:
+            async for chart_event in self.__chart_stream:
+                for item in _convert_chart_event(chart_event):
+                    yield item
+        finally:
+            self.__chart_stream = None
+
+    def cancel_stream(self) -> None:
+        """Cancels the active chart data stream."""
+        if self.__chart_stream is not None:
+            self.__chart_stream.cancel()
+            self.__chart_stream = None
+
+    async def get_chart_metadata(self) -> list[InterfaceInfo]:
+        """Retrieves the chart metadata for all available series."""
+        request = chart_pb2.ChartMetadataRequest()
+        return _convert_interface_info(await self.__stub.GetChartMetadata(request))
+
+    async def get_chart_series_data(self) -> list[SeriesData]:
+        """Retrieves all chart series data."""
+        request = chart_pb2.ChartSeriesDataRequest()
+        return _convert_all_series_data(await self.__stub.GetChartSeriesData(request))
+
+    async def get_chart_timestep_data(self) -> TimestepData:
+        """Retrieves all chart timestep data."""
+        request = chart_pb2.ChartTimestepDataRequest()
+        return _convert_timestep_data(await self.__stub.GetChartTimestepData(request))
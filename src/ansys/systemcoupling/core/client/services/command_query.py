@@ -40,3 +40,29 @@ class CommandQueryService:
                 rpc_error, operation=f"InvokeCommand({request.command})"
             )
             raise RuntimeError(msg) from None
+
+    def execute_command_future(self, request) -> grpc.Future:
+        """Issue the command without waiting for its response.
+
+        The returned object is both a ``grpc.Future`` and a ``grpc.Call``. Any
+        error is raised as a ``grpc.RpcError`` from its ``result`` method.
+        """
+        return self.__stub.InvokeCommand.future(request)
+
+
+class AsyncCommandQueryService:
+    """Counterpart of ``CommandQueryService`` for use with a ``grpc.aio`` channel."""
+
+    def __init__(self, channel):
+        self.__stub = command_pb2_grpc.CommandStub(channel)
+
+    async def execute_command(self, request):
+        try:
+            call = self.__stub.InvokeCommand(request)
+            response = await call
+            return response, await call.trailing_metadata()
+        except grpc.RpcError as rpc_error:
+            msg = handle_rpc_error(
+                rpc_error, operation=f"InvokeCommand({request.command})"
+            )
+            raise RuntimeError(msg) from None
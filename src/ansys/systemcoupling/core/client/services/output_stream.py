@@ -21,8 +21,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+
 import ansys.api.systemcoupling.v0.output_stream_pb2 as output_stream_pb2
 import ansys.api.systemcoupling.v0.output_stream_pb2_grpc as output_stream_pb2_grpc
+import grpc
+
+from ansys.systemcoupling.core.util.logging import LOG
 
 
 class OutputStreamService:
@@ -34,6 +39,39 @@ class OutputStreamService:
         """Begins streaming combined standard output streams from
         System Coupling.
 
+        Yields
+        ------
+        str
+             A line of output.
+        """
+        request = output_stream_pb2.StdStreamRequest()
+        self.__stream = stream = self.__stub.BeginStdStreaming(request)
+
+        try:
+            yield from stream
+        except grpc.RpcError as e:
+            # Cancellation via ``end_streaming`` just ends the stream.
+            if not stream.cancelled():
+                LOG.info(f"Output stream ended: {e.code()}: {e.details()}")
+
+    def end_streaming(self):
+        """Cancels streaming of System Coupling output streams."""
+        if self.__stream and not self.__stream.cancelled():
+            self.__stream.cancel()
+            self.__stream = None
+
+
+class AsyncOutputStreamService:
+    """Counterpart of ``OutputStreamService`` for use with a ``grpc.aio`` channel."""
+
+    def __init__(self, channel):
+        self.__stub = output_stream_pb2_grpc.OutputStreamStub(channel)
+        self.__stream = None
+
+    async def begin_streaming(self):
+        """Begins streaming combined standard output streams from
+        System Coupling.
+
         Yields
         ------
         str
@@ -42,11 +80,19 @@ class OutputStreamService:
         request = output_stream_pb2.StdStreamRequest()
         self.__stream = self.__stub.BeginStdStreaming(request)
 
-        while True:
-            try:
-                yield next(self.__stream)
-            except:
-                break
+        stream = self.__stream
+        try:
+            async for response in stream:
+                yield response
+        except grpc.RpcError as e:
+            # Cancellation via ``end_streaming`` just ends the stream.
+            if not stream.cancelled():
+                LOG.info(f"Output stream ended: {e.code()}: {e.details()}")
+        except asyncio.CancelledError:
+            # Cancellation of the call via ``end_streaming`` just ends the
+            # stream. Anything else is a cancellation of the consuming task.
+            if not stream.cancelled():
+                raise
 
     def end_streaming(self):
         """Cancels streaming of System Coupling output streams."""
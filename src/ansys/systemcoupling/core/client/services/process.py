@@ -29,12 +29,29 @@ class SycProcessService:
     def __init__(self, channel):
         self.__stub = sycprocess_pb2_grpc.ProcessStub(channel)
 
-    def ping(self):
+    def ping(self, timeout=None):
         request = sycprocess_pb2.PingRequest()
-        response = self.__stub.Ping(request)
+        response = self.__stub.Ping(request, timeout=timeout)
         return True
 
     def quit(self):
         request = sycprocess_pb2.QuitRequest()
         response = self.__stub.Quit(request)
         return True
+
+
+class AsyncSycProcessService:
+    """Counterpart of ``SycProcessService`` for use with a ``grpc.aio`` channel."""
+
+    def __init__(self, channel):
+        self.__stub = sycprocess_pb2_grpc.ProcessStub(channel)
+
+    async def ping(self):
+        request = sycprocess_pb2.PingRequest()
+        await self.__stub.Ping(request)
+        return True
+
+    async def quit(self):
+        request = sycprocess_pb2.QuitRequest()
+        await self.__stub.Quit(request)
+        return True
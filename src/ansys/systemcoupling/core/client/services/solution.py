@@ -40,10 +40,33 @@ class SolutionService:
             msg = handle_rpc_error(rpc_error, operation="Solution.Solve")
             raise RuntimeError(msg) from None
 
-    def interrupt(self, reason):
+    def interrupt(self, reason, timeout=None):
         request = solution_pb2.InterruptRequest(reason=reason)
-        self.__stub.Interrupt(request)
+        self.__stub.Interrupt(request, timeout=timeout)
 
-    def abort(self, reason):
+    def abort(self, reason, timeout=None):
         request = solution_pb2.AbortRequest(reason=reason)
-        self.__stub.Abort(request)
+        self.__stub.Abort(request, timeout=timeout)
+
+
+class AsyncSolutionService:
+    """Counterpart of ``SolutionService`` for use with a ``grpc.aio`` channel."""
+
+    def __init__(self, channel):
+        self.__stub = solution_pb2_grpc.SolutionStub(channel)
+
+    async def solve(self):
+        request = solution_pb2.SolveRequest()
+        try:
+            await self.__stub.Solve(request)
+        except grpc.RpcError as rpc_error:
+            msg = handle_rpc_error(rpc_error, operation="Solution.Solve")
+            raise RuntimeError(msg) from None
+
+    async def interrupt(self, reason):
+        request = solution_pb2.InterruptRequest(reason=reason)
+        await self.__stub.Interrupt(request)
+
+    async def abort(self, reason):
+        request = solution_pb2.AbortRequest(reason=reason)
+        await self.__stub.Abort(request)
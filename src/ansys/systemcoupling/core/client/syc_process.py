@@ -23,16 +23,30 @@
 
 from copy import deepcopy
 import os
+import re
 
 # Exclude Bandit check. Subprocess is needed to start the System Coupling.
 import subprocess  # nosec B404
 import threading
 import time
+from typing import Callable
 
 import psutil
 
+from ansys.systemcoupling.core.client.output_pipeline import OutputPipeline
 from ansys.systemcoupling.core.util.logging import LOG
 
+# Pattern matching the whole line of server output reporting that it is
+# listening for connections, of the form "<server> listening on <address>".
+# Other lines mentioning "listening" are not matched. The pattern may be
+# overridden for a server reporting this in a different form.
+_LISTENING_PATTERN = re.compile(
+    os.environ.get(
+        "PYSYC_SERVER_LISTENING_PATTERN", r"^[\w .-]*\bserver listening on \S+$"
+    ),
+    re.IGNORECASE,
+)
+
 # NB: Coverage disabled in this file as coverage is obtained in context of
 #     GitHub CI where we are restricted to launching SyC in container mode.
 
@@ -44,15 +58,33 @@ class SycProcess:  # pragma: no cover
         grpc_args: list[str],
         grpc_args_fallback: list[str],
         working_dir: str,
+        on_listening: Callable[[], None] | None = None,
+        on_exit: Callable[[], None] | None = None,
         **kwargs,
     ):
+        """Start the System Coupling process.
+
+        The output of the process is watched for the message reporting that
+        the server is listening, in which case ``on_listening`` is called. If
+        the process exits, ``on_exit`` is called. Both are called from a
+        separate thread.
+        """
+        watcher = self.__watcher = _OutputWatcher(on_listening, on_exit)
         self.__starter = _ProcessStarter(
-            exe_path, grpc_args, grpc_args_fallback, working_dir, **kwargs
+            exe_path, grpc_args, grpc_args_fallback, working_dir, watcher, **kwargs
         )
 
     def is_running(self) -> bool:
         return self.__starter.get_running_process() is not None
 
+    def set_output(self, pipeline: OutputPipeline | None) -> None:
+        """Deliver the output of the process to ``pipeline``, or stop doing so
+        if it is ``None``.
+
+        Any pipeline previously set is closed.
+        """
+        self.__watcher.set_output(pipeline)
+
     def end(self):
         if not self.__starter:
             return
@@ -79,6 +111,7 @@ class _ProcessStarter:
         grpc_args: list[str],
         grpc_args_fallback: list[str],
         working_dir: str,
+        watcher: "_OutputWatcher",
         **kwargs,
     ):
         # This class handles the complication of trying to start a version of
@@ -103,9 +136,11 @@ class _ProcessStarter:
         self.__default_process: subprocess.Popen | None = None
         self.__fallback_process: subprocess.Popen | None = None
 
+        self.__watcher = watcher
         self.__default_process = _start_system_coupling(
             exe_path, grpc_args, working_dir, **deepcopy(kwargs)
         )
+        watcher.watch(self.__default_process)
 
         self.__fallback_thread = None
         if grpc_args_fallback:
@@ -157,6 +192,60 @@ class _ProcessStarter:
         self.__fallback_process = _start_system_coupling(
             exe_path, grpc_args, working_dir, **kwargs
         )
+        self.__watcher.watch(self.__fallback_process)
+
+
+class _OutputWatcher:
+    """Reads the output of a process on a separate thread, looking out for the
+    message reporting that the server is listening.
+
+    The output must be read continuously, including after the server has
+    reported that it is listening, to prevent the process from blocking on a
+    full pipe. Once an output pipeline is set, the lines of output are also
+    delivered to it.
+    """
+
+    def __init__(
+        self,
+        on_listening: Callable[[], None] | None,
+        on_exit: Callable[[], None] | None,
+    ):
+        self.__on_listening = on_listening
+        self.__on_exit = on_exit
+        self.__lock = threading.Lock()
+        self.__pipeline = None
+
+    def watch(self, process: subprocess.Popen) -> None:
+        thread = threading.Thread(target=self._read, args=(process,), daemon=True)
+        thread.start()
+
+    def set_output(self, pipeline: OutputPipeline | None) -> None:
+        with self.__lock:
+            previous, self.__pipeline = self.__pipeline, pipeline
+        if previous is not None:
+            previous.close()
+
+    def _read(self, process: subprocess.Popen) -> None:
+        listening = False
+        for line in process.stdout:
+            pipeline = self.__pipeline
+            if listening and pipeline is None:
+                continue
+            text = line.decode(errors="replace").rstrip("\r\n")
+            if pipeline is not None:
+                pipeline.put_lines([text])
+            if not listening and _LISTENING_PATTERN.search(text):
+                listening = True
+                LOG.debug("System Coupling process reports it is listening")
+                if self.__on_listening:
+                    self.__on_listening()
+        process.stdout.close()
+        if self.__pipeline is not None:
+            # Delivers any remaining output
+            self.set_output(None)
+        if self.__on_exit:
+            # End of output normally indicates the process has exited.
+            self.__on_exit()
 
 
 def _start_system_coupling(
@@ -198,7 +287,7 @@ def _start_system_coupling(
         args,
         env=env,
         cwd=working_dir,
-        stdout=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
     )
 
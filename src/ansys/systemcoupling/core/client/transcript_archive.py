@@ -0,0 +1,324 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Block-compressed transcript archive, indexed by coupling step and iteration.
+
+A ``TranscriptArchiveSink`` is a batch output handler that writes the output
+of a session to an archive::
+
+    session.start_output(TranscriptArchiveSink("run.sta"), batch=True)
+
+The lines of output are compressed in independent blocks. The archive's index,
+held in a companion file with an ``.index`` suffix, is appended to as each
+block is written. It records the position of each block and the lines at
+which each coupling step and coupling iteration begins.
+
+A ``TranscriptArchive`` reads an archive, decompressing only the blocks that
+hold the requested lines. An archive can be read while it is being written,
+up to the last block written::
+
+    with TranscriptArchive("run.sta") as archive:
+        lines = archive.read_steps(1200, 1210)
+
+The archive file comprises a header, followed by the blocks, each of which is
+a 4-byte big-endian length followed by a zlib-compressed sequence of
+newline-terminated, UTF-8 encoded lines. Each line of the index file is a JSON
+object with one of the following forms:
+
+- ``{"block": [offset, size, first_line, line_count]}``
+- ``{"step": [step, line]}``
+- ``{"iteration": [iteration, line]}``
+"""
+
+import bisect
+import json
+import re
+import struct
+import threading
+import zlib
+
+from ansys.systemcoupling.core.client.output_pipeline import OutputSink
+
+# Patterns matching the lines of output at which a coupling step or iteration
+# begins, the single group of which captures its number.
+DEFAULT_STEP_PATTERN = r"coupling step\s*=?\s*(\d+)"
+DEFAULT_ITERATION_PATTERN = r"coupling iteration\s*=?\s*(\d+)"
+
+_HEADER = b"PYSYC-TRANSCRIPT 1\n"
+_BLOCK_HEADER = struct.Struct(">I")
+
+
+def index_path(path: str) -> str:
+    """Return the path of the index file of the archive at ``path``."""
+    return f"{path}.index"
+
+
+class TranscriptArchiveSink(OutputSink):
+    """Batch output handler writing a transcript archive.
+
+    Parameters
+    ----------
+    path : str
+        Path of the archive file. An existing archive is overwritten.
+    block_size : int, optional
+        Uncompressed size, in bytes, at which a block is written.
+    compression_level : int, optional
+        zlib compression level.
+    step_pattern : str, optional
+        Regular expression matching the line at which a coupling step begins,
+        with a single group capturing the step number. Matching is not
+        case sensitive.
+    iteration_pattern : str, optional
+        Regular expression matching the line at which a coupling iteration
+        begins, with a single group capturing the iteration number.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        block_size: int = 1 << 20,
+        compression_level: int = 6,
+        step_pattern: str = DEFAULT_STEP_PATTERN,
+        iteration_pattern: str = DEFAULT_ITERATION_PATTERN,
+    ):
+        for pattern in (step_pattern, iteration_pattern):
+            if re.compile(pattern).groups != 1:
+                raise ValueError(
+                    f"Pattern '{pattern}' must have exactly one capturing group."
+                )
+        # A single search per line finds either kind of marker.
+        self.__marker_re = re.compile(
+            f"(?:{step_pattern})|(?:{iteration_pattern})", re.IGNORECASE
+        )
+        self.__block_size = block_size
+        self.__compression_level = compression_level
+        self.__lock = threading.Lock()
+        self.__data = open(path, "wb")
+        self.__data.write(_HEADER)
+        self.__index = open(index_path(path), "w", encoding="utf-8")
+        self.__lines = []
+        self.__size = 0
+        self.__line_count = 0
+        self.__markers = []
+
+    def __call__(self, lines: list[str]) -> None:
+        with self.__lock:
+            search = self.__marker_re.search
+            for line in lines:
+                m = search(line)
+                if m:
+                    line_number = self.__line_count + len(self.__lines)
+                    if m.group(1) is not None:
+                        self.__markers.append(("step", int(m.group(1)), line_number))
+                    else:
+                        self.__markers.append(
+                            ("iteration", int(m.group(2)), line_number)
+                        )
+                self.__lines.append(line)
+                self.__size += len(line) + 1
+                if self.__size >= self.__block_size:
+                    self._write_block()
+
+    def flush(self) -> None:
+        """Write any buffered lines as a block, making them readable."""
+        with self.__lock:
+            if self.__lines:
+                self._write_block()
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__data.closed:
+                return
+            if self.__lines:
+                self._write_block()
+            self.__data.close()
+            self.__index.close()
+
+    def _write_block(self):
+        text = "\n".join(self.__lines) + "\n"
+        data = zlib.compress(text.encode("utf-8"), self.__compression_level)
+        offset = self.__data.tell()
+        self.__data.write(_BLOCK_HEADER.pack(len(data)))
+        self.__data.write(data)
+        self.__data.flush()
+
+        records = [
+            json.dumps({kind: [number, line]}) for kind, number, line in self.__markers
+        ]
+        records.append(
+            json.dumps(
+                {
+                    "block": [
+                        offset + _BLOCK_HEADER.size,
+                        len(data),
+                        self.__line_count,
+                        len(self.__lines),
+                    ]
+                }
+            )
+        )
+        # The block record comes last so that a reader never sees markers of
+        # lines that are not yet readable.
+        self.__index.write("\n".join(records) + "\n")
+        self.__index.flush()
+
+        self.__line_count += len(self.__lines)
+        self.__lines = []
+        self.__size = 0
+        self.__markers = []
+
+
+class TranscriptArchive:
+    """Reader of a transcript archive written by ``TranscriptArchiveSink``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the archive file.
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+        self.__file = open(path, "rb")
+        if self.__file.read(len(_HEADER)) != _HEADER:
+            self.__file.close()
+            raise ValueError(f"'{path}' is not a transcript archive.")
+        self.__index_offset = 0
+        self.__blocks = []
+        self.__block_first_lines = []
+        self.__steps = []
+        self.__iterations = []
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Read any additions to the index made since the archive was opened,
+        as happens while it is still being written."""
+        with open(index_path(self.__path), "rb") as f:
+            f.seek(self.__index_offset)
+            index_offset = self.__index_offset
+            pending = []
+            for record in f:
+                if not record.endswith(b"\n"):
+                    # Incompletely written
+                    break
+                index_offset += len(record)
+                item = json.loads(record)
+                if "block" in item:
+                    offset, size, first_line, count = item["block"]
+                    self.__blocks.append((offset, size, first_line, count))
+                    self.__block_first_lines.append(first_line)
+                    for kind, value in pending:
+                        (self.__steps if kind == "step" else self.__iterations).append(
+                            value
+                        )
+                    pending = []
+                    self.__index_offset = index_offset
+                else:
+                    ((kind, value),) = item.items()
+                    pending.append((kind, tuple(value)))
+
+    @property
+    def line_count(self) -> int:
+        """Number of readable lines in the archive."""
+        if not self.__blocks:
+            return 0
+        _, _, first_line, count = self.__blocks[-1]
+        return first_line + count
+
+    @property
+    def steps(self) -> list[int]:
+        """Numbers of the coupling steps recorded in the archive."""
+        return [step for step, _ in self.__steps]
+
+    @property
+    def iterations(self) -> list[int]:
+        """Numbers of the coupling iterations recorded in the archive."""
+        return [iteration for iteration, _ in self.__iterations]
+
+    def read_lines(self, start: int = 0, stop: int | None = None) -> list[str]:
+        """Return the lines numbered from ``start`` up to, but excluding,
+        ``stop``, or to the end of the archive if ``stop`` is ``None``."""
+        stop = self.line_count if stop is None else min(stop, self.line_count)
+        if start >= stop:
+            return []
+        lines = []
+        i = bisect.bisect_right(self.__block_first_lines, start) - 1
+        while i < len(self.__blocks):
+            offset, size, first_line, count = self.__blocks[i]
+            if first_line >= stop:
+                break
+            block_lines = self._read_block(offset, size)
+            lines.extend(block_lines[max(start - first_line, 0) : stop - first_line])
+            i += 1
+        return lines
+
+    def read_steps(self, first: int, last: int | None = None) -> list[str]:
+        """Return the lines of output of the coupling steps numbered from
+        ``first`` to ``last``, inclusive.
+
+        The output of a step extends to the start of the next step.
+        """
+        last = first if last is None else last
+        return self._read_marked(self.__steps, first, last, ())
+
+    def read_iterations(self, first: int, last: int | None = None) -> list[str]:
+        """Return the lines of output of the coupling iterations numbered from
+        ``first`` to ``last``, inclusive.
+
+        The output of an iteration extends to the start of the next iteration
+        or step.
+        """
+        last = first if last is None else last
+        return self._read_marked(self.__iterations, first, last, self.__steps)
+
+    def _read_marked(self, markers, first, last, boundaries):
+        start = last_start = stop = None
+        for number, line in markers:
+            if first <= number <= last:
+                if start is None:
+                    start = line
+                last_start = line
+            elif start is not None:
+                # The next marker, or a restart from an earlier number.
+                stop = line
+                break
+        if start is None:
+            return []
+        i = bisect.bisect_right([line for _, line in boundaries], last_start)
+        if i < len(boundaries):
+            stop = boundaries[i][1] if stop is None else min(stop, boundaries[i][1])
+        return self.read_lines(start, stop)
+
+    def _read_block(self, offset, size) -> list[str]:
+        self.__file.seek(offset)
+        text = zlib.decompress(self.__file.read(size)).decode("utf-8")
+        return text.split("\n")[:-1]
+
+    def close(self) -> None:
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -21,15 +21,85 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+"""Conversion between Python values and the ``Variant`` protobuf type.
+
+Conversion in both directions traverses nested values iteratively. Lists
+whose items are all of the same scalar type, as well as 1-dimensional NumPy
+arrays, are encoded as the packed ``*_vector_state`` types rather than as a
+``VariantVector`` holding one sub-message per item.
+
+Decoding can optionally be *lazy*, returning read-only ``Mapping`` and
+``Sequence`` views over the ``Variant`` that decode each item only when it
+is accessed.
+"""
+
+from collections.abc import Mapping, Sequence
+from copy import deepcopy
+import os
+
 from ansys.api.systemcoupling.v0 import variant_pb2
 
 # See to_variant() for use of this
 _DUMMY_KEY = "__@!%$__"
 
+# Packed vectors may be disabled in case of a server not supporting them.
+_PACK_LISTS = os.environ.get("PYSYC_DISABLE_PACKED_VARIANT_LISTS") != "1"
 
-def to_variant(val, var, convert_key=None):
-    """Convert Python data type to Variant data type."""
-    if val is None:
+# Packed vector field for each scalar type. bool must be distinguished from int.
+_PACKED_FIELD = {
+    bool: "bool_vector_state",
+    int: "int64_vector_state",
+    float: "double_vector_state",
+    str: "string_vector_state",
+}
+
+# Packed vector field for each NumPy dtype kind.
+_NUMPY_PACKED_FIELD = {
+    "b": "bool_vector_state",
+    "i": "int64_vector_state",
+    "u": "int64_vector_state",
+    "f": "double_vector_state",
+}
+
+# Scalar field for each exact scalar type, used as a fast path.
+_SCALAR_FIELD = {
+    bool: "bool_state",
+    int: "int64_state",
+    float: "double_state",
+    str: "string_state",
+}
+
+_PACKED_FIELDS = frozenset(_PACKED_FIELD.values())
+
+_SCALAR_FIELDS = frozenset(
+    ("bool_state", "int64_state", "double_state", "string_state")
+)
+
+
+def _is_ndarray(val) -> bool:
+    # Avoids importing NumPy, which is only needed if it is already in use.
+    return type(val).__name__ == "ndarray" and type(val).__module__ == "numpy"
+
+
+def _homogeneous_type(val):
+    """Return the scalar type of the items of ``val`` if they all have the same
+    type, supported in a packed vector, else ``None``."""
+    item_type = type(val[0])
+    if item_type not in _PACKED_FIELD:
+        return None
+    for item in val:
+        if type(item) is not item_type:
+            return None
+    return item_type
+
+
+def _set_scalar(val, var) -> bool:
+    """Set ``var`` to the scalar ``val``, returning ``False`` if ``val`` is not
+    a scalar."""
+    field = _SCALAR_FIELD.get(type(val))
+    if field is not None:
+        setattr(var, field, val)
+    elif val is None:
         var.none_state = variant_pb2.NONE_VALUE
     elif isinstance(val, bool):
         var.bool_state = val
@@ -39,35 +109,261 @@ def to_variant(val, var, convert_key=None):
         var.double_state = val
     elif isinstance(val, str):
         var.string_state = val
-    elif isinstance(val, list) or isinstance(val, tuple):
-        if len(val) == 0:
-            # We need to force the one_of type to be set
-            var.variant_vector_state.item.add()
-            var.variant_vector_state.item.pop()
-        for item in val:
-            item_var = var.variant_vector_state.item.add()
-            to_variant(item, item_var, convert_key)
-    elif isinstance(val, dict):
-        if len(val) == 0:
-            # Analogous to list case - force map type to be set
-            var.variant_map_state.item[_DUMMY_KEY].none_state = variant_pb2.NONE_VALUE
-            del var.variant_map_state.item[_DUMMY_KEY]
-        for k, v in val.items():
-            k = convert_key(k) if convert_key else k
-            to_variant(v, var.variant_map_state.item[k], convert_key)
-
-
-def from_variant(var, convert_key=None):
-    """Convert Variant data type to Python data type."""
+    elif type(val).__module__ == "numpy" and getattr(val, "ndim", None) == 0:
+        # NumPy scalar or 0-d array - convert to its Python equivalent.
+        return _set_scalar(val.item(), var)
+    else:
+        return False
+    return True
+
+
+def to_variant(val, var, convert_key=None):
+    """Convert Python data type to Variant data type.
+
+    In addition to the Python scalar types, lists, tuples and dictionaries,
+    NumPy arrays and scalars are accepted.
+    """
+    stack = [(val, var)]
+    while stack:
+        val, var = stack.pop()
+        if _set_scalar(val, var):
+            continue
+        if _is_ndarray(val):
+            field = _NUMPY_PACKED_FIELD.get(val.dtype.kind)
+            if _PACK_LISTS and field and val.ndim == 1 and len(val):
+                getattr(var, field).item.extend(val.tolist())
+                continue
+            val = val.tolist() if val.ndim <= 1 else list(val)
+        if isinstance(val, (list, tuple)):
+            if len(val) == 0:
+                # We need to force the one_of type to be set
+                var.variant_vector_state.item.add()
+                var.variant_vector_state.item.pop()
+                continue
+            if _PACK_LISTS:
+                item_type = _homogeneous_type(val)
+                if item_type is not None:
+                    getattr(var, _PACKED_FIELD[item_type]).item.extend(val)
+                    continue
+            items = var.variant_vector_state.item
+            for item in val:
+                item_var = items.add()
+                if not _set_scalar(item, item_var):
+                    stack.append((item, item_var))
+        elif isinstance(val, dict):
+            items = var.variant_map_state.item
+            if len(val) == 0:
+                # Analogous to list case - force map type to be set
+                items[_DUMMY_KEY].none_state = variant_pb2.NONE_VALUE
+                del items[_DUMMY_KEY]
+            for k, v in val.items():
+                k = convert_key(k) if convert_key else k
+                item_var = items[k]
+                if not _set_scalar(v, item_var):
+                    stack.append((v, item_var))
+
+
+def from_variant(var, convert_key=None, as_numpy=False, lazy=False):
+    """Convert Variant data type to Python data type.
+
+    If ``as_numpy`` is ``True``, packed numeric vectors are returned as
+    NumPy arrays rather than lists. NumPy must be installed in this case.
+
+    If ``lazy`` is ``True``, maps and vectors are returned as read-only
+    ``VariantMapView`` and ``VariantListView`` objects rather than as
+    dictionaries and lists. This avoids the cost of converting parts of a
+    large value that are never accessed.
+    """
+    if lazy:
+        return _decode_lazy(var, convert_key, as_numpy)
+    if as_numpy:
+        import numpy as np
+
+    scalar_fields = _SCALAR_FIELDS
+    root = [None]
+    stack = [(var, root, 0)]
+    push = stack.append
+    while stack:
+        var, parent, key = stack.pop()
+        what = var.WhichOneof("as")
+        if what in scalar_fields:
+            parent[key] = getattr(var, what)
+        elif what in _PACKED_FIELDS:
+            items = getattr(var, what).item
+            if as_numpy and what != "string_vector_state":
+                parent[key] = np.array(items)
+            else:
+                parent[key] = list(items)
+        elif what == "variant_vector_state":
+            items = var.variant_vector_state.item
+            out = [None] * len(items)
+            parent[key] = out
+            for i, item in enumerate(items):
+                item_what = item.WhichOneof("as")
+                if item_what in scalar_fields:
+                    out[i] = getattr(item, item_what)
+                elif item_what != "none_state":
+                    push((item, out, i))
+        elif what == "variant_map_state":
+            out = {}
+            parent[key] = out
+            for k, item in var.variant_map_state.item.items():
+                if convert_key:
+                    k = convert_key(k)
+                item_what = item.WhichOneof("as")
+                if item_what in scalar_fields:
+                    out[k] = getattr(item, item_what)
+                else:
+                    # Insert now to retain the order of the keys.
+                    out[k] = None
+                    if item_what != "none_state":
+                        push((item, out, k))
+    return root[0]
+
+
+def _decode_lazy(var, convert_key, as_numpy):
     what = var.WhichOneof("as")
-    if what == "none_state":
-        return None
-    if not what.startswith("variant_"):
+    if what in _SCALAR_FIELDS:
         return getattr(var, what)
-    if what == "variant_vector_state":
-        return [from_variant(val, convert_key) for val in var.variant_vector_state.item]
-    elif what == "variant_map_state":
-        return {
-            convert_key(k) if convert_key else k: from_variant(v, convert_key)
-            for k, v in var.variant_map_state.item.items()
-        }
+    if what == "variant_map_state":
+        return VariantMapView(var, convert_key, as_numpy)
+    if what in _PACKED_FIELDS and as_numpy and what != "string_vector_state":
+        import numpy as np
+
+        return np.array(getattr(var, what).item)
+    if what == "variant_vector_state" or what in _PACKED_FIELDS:
+        return VariantListView(var, convert_key, as_numpy)
+    return None
+
+
+class VariantMapView(Mapping):
+    """Read-only ``Mapping`` view of a ``Variant`` holding a map.
+
+    Values are decoded on first access and retained. Nested maps and vectors
+    are themselves returned as views. A shallow copy is a dictionary and a
+    deep copy is fully converted to dictionaries and lists.
+    """
+
+    __slots__ = ("_var", "_items", "_convert_key", "_as_numpy", "_keys", "_values")
+
+    def __init__(self, var, convert_key=None, as_numpy=False):
+        self._var = var
+        self._items = var.variant_map_state.item
+        self._convert_key = convert_key
+        self._as_numpy = as_numpy
+        # Maps converted keys to native keys, if there is a key conversion.
+        self._keys = None
+        self._values = {}
+
+    def _native_key(self, key):
+        if self._convert_key is None:
+            return key
+        if self._keys is None:
+            self._keys = {self._convert_key(k): k for k in self._items}
+        return self._keys.get(key)
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        native_key = self._native_key(key)
+        # Accessing a missing key of a protobuf map inserts it, so check first.
+        if not isinstance(native_key, str) or native_key not in self._items:
+            raise KeyError(key)
+        value = _decode_lazy(self._items[native_key], self._convert_key, self._as_numpy)
+        self._values[key] = value
+        return value
+
+    def __iter__(self):
+        if self._convert_key is None:
+            return iter(self._items)
+        return map(self._convert_key, self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return from_variant(self._var, self._convert_key, self._as_numpy)
+
+
+class VariantListView(Sequence):
+    """Read-only ``Sequence`` view of a ``Variant`` holding a vector.
+
+    Items are decoded on first access and retained. Nested maps and vectors
+    are themselves returned as views. A shallow copy is a list and a deep
+    copy is fully converted to dictionaries and lists.
+    """
+
+    __slots__ = ("_var", "_items", "_convert_key", "_as_numpy", "_packed", "_values")
+
+    def __init__(self, var, convert_key=None, as_numpy=False):
+        what = var.WhichOneof("as")
+        self._var = var
+        self._items = getattr(var, what).item
+        self._convert_key = convert_key
+        self._as_numpy = as_numpy
+        # Items of packed vectors are scalars, which need no decoding.
+        self._packed = what in _PACKED_FIELDS
+        self._values = None
+
+    def __getitem__(self, index):
+        if self._packed:
+            return self._items[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._values is None:
+            self._values = [_NOT_DECODED] * len(self._items)
+        value = self._values[index]
+        if value is _NOT_DECODED:
+            value = _decode_lazy(self._items[index], self._convert_key, self._as_numpy)
+            self._values[index] = value
+        return value
+
+    def __len__(self):
+        return len(self._items)
+
+    def __eq__(self, other):
+        # As for a list, only a list or another view compares equal.
+        if isinstance(other, (list, VariantListView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return from_variant(self._var, self._convert_key, self._as_numpy)
+
+
+_NOT_DECODED = object()
+
+
+def materialize(value):
+    """Return ``value`` with any ``VariantMapView`` and ``VariantListView``
+    objects it holds fully converted to dictionaries and lists.
+
+    Dictionaries and lists holding views are updated in place.
+    """
+    if isinstance(value, (VariantMapView, VariantListView)):
+        return deepcopy(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if isinstance(v, (dict, list, VariantMapView, VariantListView)):
+                value[k] = materialize(v)
+    elif isinstance(value, list):
+        for i, v in enumerate(value):
+            if isinstance(v, (dict, list, VariantMapView, VariantListView)):
+                value[i] = materialize(v)
+    return value
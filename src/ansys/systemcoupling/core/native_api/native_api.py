@@ -21,6 +21,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from typing import ContextManager
+
 from ansys.systemcoupling.core.native_api.command_metadata import CommandMetadata
 from ansys.systemcoupling.core.native_api.datamodel_metadata import (
     build as build_dm_meta,
@@ -49,15 +51,20 @@ class NativeApi:
     Coupling CLI.)
     """
 
-    def __init__(self, rpc_impl):
+    def __init__(self, rpc_impl, metadata=None):
         """Create an instance of the ``NativeApi`` class.
 
         Parameters
         ----------
         rpc_impl
             Provider of remote command and query services.
+        metadata : MetadataRepository, optional
+            Source of the server metadata, which may be shared with the
+            other APIs of the session. The default is ``None``, in which case
+            the metadata is queried.
         """
         self.__rpc_impl = rpc_impl
+        self.__metadata = metadata
         LOG.debug("NativeApi: initialize datamodel...")
         self._init_datamodel()
         LOG.debug("NativeApi: initialize commands...")
@@ -93,6 +100,23 @@ class NativeApi:
         """
         return self.__rpc_impl.execute_command(name, **kwargs)
 
+    def batch(self) -> ContextManager:
+        """Context manager within which commands are recorded and then executed
+        by the server in a single call on leaving the context.
+
+        Each command made within the context returns a ``BatchResult`` handle,
+        whose ``result()`` method provides the command result once the batch
+        has been executed. A query made within the context first executes
+        the commands recorded so far.
+
+        For example::
+
+            with syc.batch():
+                for name in interface_names:
+                    syc.CouplingInterface[name].DataTransfer["temp"] = {...}
+        """
+        return self.__rpc_impl.batch()
+
     def __getattr__(self, name):
         """Provides access to the native System Coupling commands and queries API
         as attributes of this class's instance.
@@ -171,6 +195,9 @@ class NativeApi:
         return self.__root.make_path(join_path_strs(self.__root, name))
 
     def _init_datamodel(self):
+        if self.__metadata is not None:
+            self.__dm_meta = self.__metadata.native_datamodel_metadata()
+            return
         LOG.debug("Query for metadata")
         dm_meta_raw = self.__rpc_impl.GetMetadata(json_ret=True)
         LOG.debug("Build local metadata")
@@ -178,6 +205,9 @@ class NativeApi:
         LOG.debug("...datamodel metadata initialized for native API")
 
     def _init_cmds(self):
+        if self.__metadata is not None:
+            self.__cmd_meta = self.__metadata.native_cmd_metadata()
+            return
         cmd_meta = self.__rpc_impl.GetCommandAndQueryMetadata()
         self.__cmd_meta = CommandMetadata(cmd_meta)
 
@@ -23,13 +23,19 @@
 
 import importlib
 import os
-from typing import Callable
+import threading
+from typing import Callable, ContextManager
 
 from ansys.systemcoupling.core.adaptor.impl.injected_commands_provider import (
     get_commands_for_mode,
 )
+from ansys.systemcoupling.core.adaptor.impl.metadata_repository import (
+    MetadataRepository,
+)
 from ansys.systemcoupling.core.adaptor.impl.root_source import get_root
 from ansys.systemcoupling.core.adaptor.impl.syc_proxy import SycProxy
+from ansys.systemcoupling.core.client.health_monitor import HealthMonitor
+from ansys.systemcoupling.core.client.output_pipeline import DEFAULT_MAX_QUEUED_LINES
 from ansys.systemcoupling.core.native_api import NativeApi
 from ansys.systemcoupling.core.types import SystemCouplingMode
 
@@ -80,11 +86,15 @@ class Session:
         mode : SystemCouplingMode, optional
             Mode for the session. The default is ``SystemCouplingMode.COSIM``.
         """
+        # Guards the lazy creation of the API roots and other data, so that a
+        # session can be shared between threads.
+        self.__lock = threading.RLock()
         self.__case_root = None
         self.__setup_root = None
         self.__solution_root = None
         self.__rpc = rpc
         self.__native_api = None
+        self.__metadata = None
         self.__syc_version = None
         self.__injected_cmd_map = None
         self.__mode = mode
@@ -96,23 +106,34 @@ class Session:
         this class is not usable. Create a new instance if required.
         """
         self.__rpc.exit()
-        self.__rpc = _DefunctRpcImpl()
-        if self.__native_api:
-            # Pass in defunct RPC for better behaviour if
-            # anyone has held on to a native API reference
-            self.__native_api._exit(self.__rpc)
-            self.__native_api = None
-        if self.__case_root:
-            self.__case_proxy.reset_rpc(self.__rpc)
-            self.__case_root = None
-        if self.__setup_root:
-            self.__setup_proxy.reset_rpc(self.__rpc)
-            self.__setup_root = None
-        if self.__solution_root:
-            self.__solution_proxy.reset_rpc(self.__rpc)
-            self.__solution_root = None
-
-    def start_output(self, handle_output: Callable[[str], None] | None = None) -> None:
+        with self.__lock:
+            self.__rpc = _DefunctRpcImpl()
+            if self.__metadata:
+                self.__metadata.reset_rpc(self.__rpc)
+            if self.__native_api:
+                # Pass in defunct RPC for better behaviour if
+                # anyone has held on to a native API reference
+                self.__native_api._exit(self.__rpc)
+                self.__native_api = None
+            if self.__case_root:
+                self.__case_proxy.reset_rpc(self.__rpc)
+                self.__case_root = None
+            if self.__setup_root:
+                self.__setup_proxy.reset_rpc(self.__rpc)
+                self.__setup_root = None
+            if self.__solution_root:
+                self.__solution_proxy.reset_rpc(self.__rpc)
+                self.__solution_root = None
+
+    def start_output(
+        self,
+        handle_output: Callable[[str], None] | None = None,
+        *,
+        batch: bool = False,
+        max_queued_lines: int = DEFAULT_MAX_QUEUED_LINES,
+        overflow: str = "block",
+        source: str = "stream",
+    ) -> None:
         """Start streaming the standard output written by the System Coupling server.
 
         The *stdout* and *stderr* streams of the server process are
@@ -136,8 +157,40 @@ class Session:
             lines of text, with no final newline character. The callback
             should therefore be consistent with a simple call to the
             ``print(text) method``.
+        batch : bool, optional
+            Whether ``handle_output`` is called with a list of lines rather
+            than a string. A list holds all lines received since the previous
+            call, up to a limit, which reduces the overhead of verbose output.
+            The ``FileSink``, ``RotatingFileSink`` and ``RingBufferSink``
+            classes in ``ansys.systemcoupling.core.client.output_pipeline``
+            are handlers of this kind, as is ``TranscriptArchiveSink`` in
+            ``ansys.systemcoupling.core.client.transcript_archive``, which
+            writes a compressed archive of the output, indexed by coupling
+            step and iteration. These handlers are closed when output ends.
+            The default is ``False``.
+        max_queued_lines : int, optional
+            Maximum number of lines of output held while waiting for
+            ``handle_output`` to process them.
+        overflow : str, optional
+            What to do when ``max_queued_lines`` lines are waiting to be
+            processed. The default, ``"block"``, stops reading output until
+            there is space, slowing the server if necessary. With
+            ``"drop_oldest"`` or ``"drop_newest"``, the oldest waiting lines
+            or the newly received lines are discarded instead.
+        source : str, optional
+            Where the output is read from. The default, ``"stream"``, reads
+            the output streamed by the server. For a server started with
+            ``launch()``, ``"pipe"`` reads the output directly from the
+            server process instead, which is cheaper for large volumes of
+            output.
         """
-        self.__rpc.start_output(handle_output)
+        self.__rpc.start_output(
+            handle_output,
+            batch=batch,
+            max_queued_lines=max_queued_lines,
+            overflow=overflow,
+            source=source,
+        )
 
     def end_output(self) -> None:
         """Cancel output streaming previously started by the ``start_output`` method."""
@@ -147,6 +200,150 @@ class Session:
         """Simple test that the server is alive and responding."""
         return self.__rpc.ping()
 
+    def start_health_monitor(
+        self,
+        interval: float = 5.0,
+        timeout: float | None = None,
+        stall_after: int = 2,
+        on_stall: Callable[[Exception], None] | None = None,
+        on_recover: Callable[[], None] | None = None,
+        reconnect: bool = True,
+    ) -> HealthMonitor:
+        """Start monitoring the health of the connection to the server.
+
+        A background thread pings the server every ``interval`` seconds. A
+        ping that does not complete within ``timeout`` seconds, by default
+        the interval, fails. After ``stall_after`` consecutive failures, the
+        connection is considered to be stalled, ``on_stall`` is called with
+        the last error and, if ``reconnect`` is ``True``, the connection is
+        rebuilt. ``on_recover`` is called when a ping next succeeds.
+
+        Rebuilding the connection leaves the API objects of the session
+        usable, but ends any streaming of output.
+
+        Returns
+        -------
+        HealthMonitor
+            The monitor, which provides round trip time statistics via its
+            ``snapshot()`` method.
+        """
+        return self.__rpc.start_health_monitor(
+            interval=interval,
+            timeout=timeout,
+            stall_after=stall_after,
+            on_stall=on_stall,
+            on_recover=on_recover,
+            reconnect=reconnect,
+        )
+
+    def stop_health_monitor(self) -> None:
+        """Stop monitoring the health of the connection to the server."""
+        self.__rpc.stop_health_monitor()
+
+    def set_compression(self, mode: str, threshold: int | None = None) -> None:
+        """Set the compression of the requests sent to the server, and of
+        its responses.
+
+        Compression reduces the transfer time of large messages, such as
+        setting or getting the state of a large part of the data model or
+        executing a batch of commands, on links of limited bandwidth. On a
+        local connection it is usually not worthwhile. Responses are
+        compressed only if the server honours the request to compress them.
+
+        Parameters
+        ----------
+        mode : str
+            ``"none"`` to disable compression, ``"gzip"`` or ``"deflate"`` to
+            compress all requests with the given algorithm, or ``"auto"`` to
+            compress only the requests of at least ``threshold`` bytes.
+        threshold : int, optional
+            Size in bytes from which requests are compressed in ``"auto"``
+            mode. The default is ``None``, in which case the current
+            threshold, 64 KiB unless set otherwise, is kept.
+        """
+        self.__rpc.set_compression(mode, threshold)
+
+    def call_compression(self, mode: str) -> ContextManager:
+        """Context manager applying the compression ``mode`` to the calls made
+        by the current thread within its scope.
+
+        For example, to send a large state compressed on a session that
+        otherwise does not use compression:
+
+        >>> with session.call_compression("gzip"):
+        ...     session.setup.set_state(state)
+        """
+        return self.__rpc.call_compression(mode)
+
+    def batch(self) -> ContextManager:
+        """Context manager within which commands are recorded and then executed
+        by the server in a single call on leaving the context.
+
+        This reduces the cost of a long sequence of data model edits and
+        commands to a single round trip. Each command made within the context
+        returns a ``BatchResult`` handle, whose ``result()`` method provides
+        the command result once the batch has been executed. A query made
+        within the context first executes the commands recorded so far.
+
+        For example::
+
+            interface = session.setup.coupling_interface["intf"]
+            with session.batch():
+                for name in variable_names:
+                    interface.add_data_transfer(
+                        target_side="One",
+                        source_variable=name,
+                        target_variable=name,
+                    )
+        """
+        return self.__rpc.batch()
+
+    def trace_rpcs(self) -> ContextManager:
+        """Context manager within which the remote calls made by this session
+        are traced to find chatty access patterns.
+
+        The ``RpcTrace`` provided by the context records each call along with
+        the line of the script that made it. Its ``print_report()`` method
+        reports the places in the script that make one call per child object
+        or per property, ranked by the number of calls, and suggests the bulk
+        ``get_state`` or ``set_state`` call that may replace them.
+
+        For example::
+
+            interface = session.setup.coupling_interface["intf"]
+            with session.trace_rpcs() as trace:
+                for name in interface.data_transfer:
+                    print(interface.data_transfer[name].display_name)
+            trace.print_report()
+
+        All calls made by a session are traced, and the report printed when
+        the session exits, if the ``PYSYC_RPC_TRACE`` environment variable is
+        set to ``1``.
+        """
+        return self.__rpc.trace_rpcs()
+
+    def rpc_stats(self) -> dict:
+        """Return statistics of the remote calls made by this session.
+
+        For each kind of call, including each individual command and query,
+        this provides the number of calls and errors, the total latency and a
+        latency histogram, and the total request and response payload sizes.
+        See ``RpcMetrics.snapshot`` for the format. The statistics may be
+        exported with the ``stats_to_json``, ``stats_to_prometheus`` and
+        ``write_prometheus_textfile`` functions of the
+        ``ansys.systemcoupling.core.client.rpc_metrics`` module.
+
+        Collection of statistics is enabled by setting the ``PYSYC_RPC_METRICS``
+        environment variable to ``1`` before the session is started.
+        """
+        metrics = self.__rpc.rpc_metrics
+        if metrics is None:
+            raise RuntimeError(
+                "RPC statistics are not being collected. Set the "
+                "PYSYC_RPC_METRICS environment variable to 1 to enable them."
+            )
+        return metrics.snapshot()
+
     @property
     def version(self) -> str:
         """Return the server version as a string.
@@ -161,36 +358,55 @@ class Session:
     def case(self) -> case_root:
         """Pythonic client-side form of the System Coupling case persistence API."""
         if self.__case_root is None:
-            self.__case_root, self.__case_proxy = self._get_api_root(category="case")
+            with self.__lock:
+                if self.__case_root is None:
+                    self.__case_root, self.__case_proxy = self._get_api_root(
+                        category="case"
+                    )
         return self.__case_root
 
     @property
     def setup(self) -> setup_root:
         """Pythonic client-side form of the System Coupling setup API and data model."""
         if self.__setup_root is None:
-            self.__setup_root, self.__setup_proxy = self._get_api_root(category="setup")
+            with self.__lock:
+                if self.__setup_root is None:
+                    self.__setup_root, self.__setup_proxy = self._get_api_root(
+                        category="setup"
+                    )
         return self.__setup_root
 
     @property
     def solution(self) -> solution_root:
         """Pythonic client-side form of the System Coupling solution API."""
         if self.__solution_root is None:
-            self.__solution_root, self.__solution_proxy = self._get_api_root(
-                category="solution"
-            )
+            with self.__lock:
+                if self.__solution_root is None:
+                    self.__solution_root, self.__solution_proxy = self._get_api_root(
+                        category="solution"
+                    )
         return self.__solution_root
 
     def _get_version(self):
         if self.__syc_version is None:
-            proxy = SycProxy(self.__rpc)
-            version = proxy.get_version()
-            self.__syc_version = version.replace(".", "_")
+            with self.__lock:
+                if self.__syc_version is None:
+                    version = self._get_metadata().version()
+                    self.__syc_version = version.replace(".", "_")
         return self.__syc_version
 
+    def _get_metadata(self) -> MetadataRepository:
+        # Server metadata, shared by the API roots and the native API.
+        if self.__metadata is None:
+            with self.__lock:
+                if self.__metadata is None:
+                    self.__metadata = MetadataRepository(self.__rpc, self.__mode)
+        return self.__metadata
+
     def _get_api_root(self, category):
         if isinstance(self.__rpc, _DefunctRpcImpl):
             self.__rpc.trigger_error
-        sycproxy = SycProxy(self.__rpc, self.__mode)
+        sycproxy = SycProxy(self.__rpc, self.__mode, self._get_metadata())
         version = self._get_version()
         root = get_root(sycproxy, category=category, version=version)
         self._set_injected_cmds(sycproxy, category)
@@ -201,10 +417,11 @@ class Session:
             return
 
         version = self._get_version()
-        if self.__injected_cmd_map is None:
-            self.__injected_cmd_map = get_commands_for_mode(
-                self.__mode, version, self, self.__rpc
-            )
+        with self.__lock:
+            if self.__injected_cmd_map is None:
+                self.__injected_cmd_map = get_commands_for_mode(
+                    self.__mode, version, self, self.__rpc
+                )
         proxy.set_injected_commands(
             self.__injected_cmd_map.get_injected_cmd_map(category)
         )
@@ -227,7 +444,9 @@ class Session:
         For more information, see the `NativeApi` class itself.
         """
         if self.__native_api is None:
-            self.__native_api = NativeApi(self.__rpc)
+            with self.__lock:
+                if self.__native_api is None:
+                    self.__native_api = NativeApi(self.__rpc, self._get_metadata())
         return self.__native_api
 
     @property
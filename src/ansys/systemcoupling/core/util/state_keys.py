@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections.abc import Mapping
 import copy
 from typing import Any, Dict, Set
 
@@ -45,7 +46,7 @@ def adapt_native_named_object_keys(state):
     """
     state_mod = {}
     for k, v in state.items():
-        if isinstance(v, dict):
+        if isinstance(v, Mapping):
             if ":" in k:
                 t, _, n = k.partition(":")
                 state_mod.setdefault(t, {})[n] = adapt_native_named_object_keys(v)
@@ -28,10 +28,12 @@ import yaml
 
 """Simple utility wrappers for common YAML functionality."""
 
-# try:
-#    from yaml import CLoader as Loader
-# except ImportError:
-#    from yaml import Loader
+# Use the libyaml based loader and dumper if PyYAML was built with them.
+try:
+    from yaml import CDumper as Dumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import Dumper, SafeLoader
 
 # Define and add a "representer" so that we get the "|" format
 # for multiline strings.
@@ -44,7 +46,7 @@ def _str_presenter(dumper, data):
     return dumper.represent_scalar("tag:yaml.org,2002:str", data)
 
 
-yaml.add_representer(str, _str_presenter)
+yaml.add_representer(str, _str_presenter, Dumper=Dumper)
 
 
 def yaml_dump_to_file(
@@ -70,15 +72,15 @@ def yaml_dump_to_string(data: Any, sort_keys: bool = False) -> str:
 
 
 def _yaml_dump_to_stream(data: Any, stream: TextIO, sort_keys: bool) -> None:
-    yaml.dump(data, stream=stream, indent=4, sort_keys=sort_keys)
+    yaml.dump(data, stream=stream, Dumper=Dumper, indent=4, sort_keys=sort_keys)
 
 
 def yaml_load_from_file(filepath: str) -> Any:  # pragma: no cover
     """Load the content in a specified YAML file."""
     with open(filepath, "r") as f:
-        return yaml.safe_load(stream=f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def yaml_load_from_string(strdata: str) -> Any:
     """Load the YAML content from a provided string."""
-    return yaml.safe_load(strdata)
+    return yaml.load(strdata, Loader=SafeLoader)
@@ -21,13 +21,95 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent import futures
 import os
 
+import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
+import ansys.api.systemcoupling.v0.command_pb2_grpc as command_pb2_grpc
+import ansys.api.systemcoupling.v0.output_stream_pb2 as output_stream_pb2
+import ansys.api.systemcoupling.v0.output_stream_pb2_grpc as output_stream_pb2_grpc
+import grpc
 import pytest
 
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.variant import from_variant, to_variant
+
 pytest_plugins = []
 
 
+class _CommandServicer(
+    command_pb2_grpc.CommandServicer, output_stream_pb2_grpc.OutputStreamServicer
+):
+    """Command and output stream services delegating to a test function.
+
+    Commands are run by ``invoke(command, **kwargs)``. An exception raised by
+    it fails the call. Commands whose names start with ``Get`` are reported
+    as not changing the server state.
+    """
+
+    def __init__(self, invoke, output_lines):
+        self.__invoke = invoke
+        self.__output_lines = output_lines
+
+    def InvokeCommand(self, request, context):
+        args = {arg.name: from_variant(arg.val) for arg in request.args}
+        try:
+            result = self.__invoke(request.command, **args)
+        except Exception as e:
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+        context.set_trailing_metadata(
+            (("nosync", str(request.command.startswith("Get"))),)
+        )
+        response = command_pb2.CommandResponse()
+        to_variant(result, response.result)
+        return response
+
+    def BeginStdStreaming(self, request, context):
+        for line in self.__output_lines:
+            yield output_stream_pb2.StdStreamResponse(text=f"{line}\n")
+
+
+@pytest.fixture(autouse=True)
+def metadata_cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    # Keep each test's persistent metadata cache out of the user's cache.
+    cache_dir = str(tmp_path / "metadata_cache")
+    monkeypatch.setenv("PYSYC_METADATA_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def connect_fake_rpc():
+    """Return a function that starts a local server whose commands are run by
+    ``invoke(command, **kwargs)``, optionally streaming ``output_lines``,
+    and returns a ``SycGrpc`` connected to it.
+
+    For tests of the client only. See ``fake_syc_server`` for a server that
+    behaves as System Coupling.
+    """
+    servers = []
+    rpcs = []
+
+    def connect(invoke, output_lines=()):
+        servicer = _CommandServicer(invoke, output_lines)
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        command_pb2_grpc.add_CommandServicer_to_server(servicer, server)
+        output_stream_pb2_grpc.add_OutputStreamServicer_to_server(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        servers.append(server)
+        rpc = SycGrpc()
+        rpc._connect(channel=grpc.insecure_channel(f"127.0.0.1:{port}"))
+        rpc._skip_exit = True
+        rpcs.append(rpc)
+        return rpc
+
+    yield connect
+    for rpc in rpcs:
+        rpc.exit()
+    for server in servers:
+        server.stop(None)
+
+
 @pytest.fixture
 def with_launching_container(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SYC_LAUNCH_CONTAINER", "1")
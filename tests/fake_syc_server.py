@@ -0,0 +1,952 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pure-Python stand-in for a System Coupling server.
+
+The server implements the Command, Solution, ChartData, OutputStream and
+Process gRPC services with an in-memory data model defined by the test
+metadata in ``dm_raw_metadata.py`` and ``cmd_raw_metadata.py``. Solving
+produces synthetic output and chart data. This allows the whole client to be
+exercised, and load tested, without a System Coupling installation.
+
+The server can be run in-process::
+
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        session = pysystemcoupling.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+
+It can also be launched by ``pysystemcoupling.launch()``, unchanged, from a
+fake installation whose launch script runs this module::
+
+    os.environ["SYSC_ROOT"] = make_fake_installation(tmp_dir)
+    session = pysystemcoupling.launch()
+
+In this case, the command line arguments ``--fake-think-time`` and
+``--fake-iteration-time``, which may be passed via the ``extra_args`` argument
+of ``launch()``, set the time in seconds taken to process each command and
+each coupling iteration.
+"""
+
+import argparse
+from concurrent import futures
+from copy import deepcopy
+import functools
+import json
+import math
+import os
+import pathlib
+import re
+import sys
+import threading
+import time
+import traceback
+
+import ansys.api.systemcoupling.v0.chart_pb2 as chart_pb2
+import ansys.api.systemcoupling.v0.chart_pb2_grpc as chart_pb2_grpc
+import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
+import ansys.api.systemcoupling.v0.command_pb2_grpc as command_pb2_grpc
+import ansys.api.systemcoupling.v0.error_pb2 as error_pb2
+import ansys.api.systemcoupling.v0.output_stream_pb2 as output_stream_pb2
+import ansys.api.systemcoupling.v0.output_stream_pb2_grpc as output_stream_pb2_grpc
+import ansys.api.systemcoupling.v0.process_pb2 as process_pb2
+import ansys.api.systemcoupling.v0.process_pb2_grpc as process_pb2_grpc
+import ansys.api.systemcoupling.v0.solution_pb2 as solution_pb2
+import ansys.api.systemcoupling.v0.solution_pb2_grpc as solution_pb2_grpc
+import grpc
+
+from ansys.systemcoupling.core.client.rpc_compression import (
+    RESPONSE_COMPRESSION_KEY,
+    RESPONSE_THRESHOLD_KEY,
+)
+from ansys.systemcoupling.core.client.variant import from_variant, to_variant
+from ansys.systemcoupling.core.syc_version import SYC_MAJOR_VERSION, SYC_MINOR_VERSION
+from ansys.systemcoupling.core.util.name_util import to_python_name
+import cmd_raw_metadata
+import dm_raw_metadata
+from state import StateForTesting
+
+_ROOT = "SystemCoupling"
+
+# Poll interval of streams waiting for new data, allowing them to notice
+# cancellation and server shutdown.
+_STREAM_POLL_SEC = 0.1
+
+_RESPONSE_ALGORITHMS = {
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+# Exposure of the native commands in the PySystemCoupling API. Commands not
+# listed are exposed in the setup API, unless unexposed.
+_CASE_COMMANDS = {
+    "Open",
+    "Save",
+    "ClearState",
+    "SaveSnapshot",
+    "OpenSnapshot",
+    "DeleteSnapshot",
+    "PrintSnapshots",
+}
+_SOLUTION_COMMANDS = {
+    "Solve",
+    "Step",
+    "Initialize",
+    "Shutdown",
+    "StartParticipants",
+    "CreateRestartPoint",
+    "OpenResultsInEnSight",
+    "WriteEnSight",
+    "WriteCsvChartFiles",
+}
+_UNEXPOSED_COMMANDS = {
+    "ExecuteCommandString",
+    "ReadScriptFile",
+    "DeleteObject",
+    "SetState",
+    "GetState",
+    "GetChildren",
+    "GetChildNames",
+    "DatamodelRoot",
+    "GetCommandAndQueryNames",
+    "PrintState",
+    "GetParameter",
+    "GetParameterOptions",
+    "GetErrors",
+    "GetErrorsXML",
+}
+
+# Queries that are used by the client but not described by the test metadata.
+_EXTRA_QUERIES = (
+    "GetChildNamesStr",
+    "GetCommandAndQueryMetadata",
+    "GetMetadata",
+    "GetPySycCommandMetadata",
+    "GetPySycDatamodelMetadata",
+    "GetSetupSummary",
+    "GetVersion",
+)
+_EXTRA_COMMANDS = ("ExecPythonString",)
+
+# Argument types in the native metadata mapped to PySystemCoupling types.
+_ARG_TYPES = {
+    "<class 'int'>": "Integer",
+    "<class 'float'>": "Real",
+    "<class 'bool'>": "Logical",
+    "<class 'list'>": "String List",
+    "<class 'dict'>": "StrOrIntDictListDict",
+    "<class 'kernel.commands.ListTypes.StrList'>": "String List",
+    "<class 'kernel.commands.ListTypes.TupleList'>": "StrFloatPairList",
+    "<class 'kernel.commands.ListTypes.DictList'>": "StrOrIntDictList",
+}
+
+_DEFAULT_STATE = {
+    "AnalysisControl": {"AnalysisType": "Steady"},
+    "SolutionControl": {
+        "DurationOption": "NumberOfSteps",
+        "NumberOfSteps": 1,
+        "MaximumIterations": 5,
+        "MinimumIterations": 1,
+    },
+    "OutputControl": {},
+    "Library": {},
+}
+
+_REGIONS = ("Region1", "Region2")
+_VARIABLES = ("Force", "Displacement", "Temperature", "Heat Flow")
+
+
+def _leading_number(value, default: float) -> float:
+    # Real values may be given as strings with units, like "0.1 [s]".
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    m = re.match(r"\s*([-+0-9.eE]+)", str(value))
+    return float(m.group(1)) if m else default
+
+
+def _command_metadata() -> tuple:
+    """Return the native command metadata and the PySystemCoupling command
+    metadata, as returned by ``GetCommandAndQueryMetadata`` and
+    ``GetPySycCommandMetadata``."""
+    native = deepcopy(cmd_raw_metadata.cmd_metadata)
+    extended_types = {
+        cmd["name"]: dict(cmd["args"]) for cmd in dm_raw_metadata.cmd_metadata
+    }
+    names = {cmd["name"] for cmd in native}
+    for name in _EXTRA_QUERIES + _EXTRA_COMMANDS:
+        if name not in names:
+            native.append(
+                {
+                    "name": name,
+                    "args": [],
+                    "defaults": (),
+                    "essentialArgNames": [],
+                    "optionalArgNames": [],
+                    "isQuery": name in _EXTRA_QUERIES,
+                    "retType": "<class 'object'>",
+                }
+            )
+
+    pysyc = {}
+    for cmd in native:
+        name = cmd["name"]
+        if name in _UNEXPOSED_COMMANDS or name in _EXTRA_QUERIES + _EXTRA_COMMANDS:
+            exposure = "unexposed"
+        elif name in _CASE_COMMANDS:
+            exposure = "case"
+        elif name in _SOLUTION_COMMANDS:
+            exposure = "solution"
+        else:
+            exposure = "setup"
+        arg_types = extended_types.get(name, {})
+        pysyc[name] = {
+            "pyname": to_python_name(name),
+            "exposure": exposure,
+            "doc": f"{name} command.",
+            "args": [
+                {
+                    "name": arg,
+                    "type": arg_types.get(arg, {}).get("type")
+                    or _ARG_TYPES.get(info.get("Type"), "String"),
+                    "doc": f"{arg} argument.",
+                }
+                for arg, info in cmd["args"]
+            ],
+        }
+    return native, pysyc
+
+
+def _datamodel_docs(info: dict) -> dict:
+    """Return the ``GetPySycDatamodelMetadata`` data for a data model object."""
+    ret = {}
+    for name, child in info.get("__children", {}).items():
+        ret[name] = {"doc": f"{name} object.", **_datamodel_docs(child)}
+    for name in info.get("__parameters", {}):
+        ret[name] = {"doc": f"{name} setting."}
+    return ret
+
+
+class _Log:
+    """Append-only sequence of items that streams can follow."""
+
+    def __init__(self, max_items: int = 100000):
+        self.__items = []
+        self.__start = 0
+        self.__max_items = max_items
+        self.__cond = threading.Condition()
+
+    def append(self, item):
+        with self.__cond:
+            self.__items.append(item)
+            if len(self.__items) > self.__max_items:
+                del self.__items[0]
+                self.__start += 1
+            self.__cond.notify_all()
+
+    def follow(self, is_active):
+        """Yield the retained items, then new items as they are appended, for
+        as long as ``is_active()`` is true."""
+        index = self.__start
+        while is_active():
+            with self.__cond:
+                index = max(index, self.__start)
+                items = self.__items[index - self.__start :]
+                if not items:
+                    self.__cond.wait(_STREAM_POLL_SEC)
+                    continue
+            index += len(items)
+            yield from items
+
+
+class SolveStopped(Exception):
+    """Raised when a solve is interrupted or aborted."""
+
+
+class FakeSystemCoupling:
+    """In-memory System Coupling engine behind the fake server.
+
+    Parameters
+    ----------
+    think_time : float, optional
+        Time in seconds taken to process each command or query.
+    iteration_time : float, optional
+        Time in seconds taken by each coupling iteration of a solve.
+    """
+
+    def __init__(self, think_time: float = 0.0, iteration_time: float = 0.0):
+        self.think_time = think_time
+        self.iteration_time = iteration_time
+        self.output = _Log()
+        self.chart_events = _Log()
+        self.echo_output = False
+        self.compressed_responses = 0
+        self.__lock = threading.RLock()
+        self.__cmd_metadata, self.__pysyc_cmd_metadata = _command_metadata()
+        self.__queries = {c["name"] for c in self.__cmd_metadata if c["isQuery"]}
+        self.__names = {c["name"] for c in self.__cmd_metadata}
+        self.__stop_reason = None
+        self._reset()
+
+    def _reset(self):
+        self.__state = StateForTesting(native_state_format=True)
+        self.__state.set_state(f"/{_ROOT}", deepcopy(_DEFAULT_STATE))
+        self.__counters = {}
+        self.__series = {}
+        self.__timestep_to_iteration = []
+        self.__time_values = []
+        self.__iteration = 0
+
+    # Command dispatch
+
+    def is_query(self, name: str) -> bool:
+        return name in self.__queries
+
+    def invoke(self, name: str, **kwargs):
+        """Run a command or query."""
+        if self.think_time:
+            time.sleep(self.think_time)
+        impl = getattr(self, f"_cmd_{name}", None)
+        if impl is None:
+            if name not in self.__names:
+                raise NameError(f"name '{name}' is not defined")
+            # Commands without an implementation are accepted and do nothing.
+            return None
+        if name == "Solve":
+            # Not locked so that the state may be queried while solving.
+            return impl(**kwargs)
+        with self.__lock:
+            return impl(**kwargs)
+
+    def write(self, text: str):
+        """Write a line of output."""
+        self.output.append(text + "\n")
+        if self.echo_output:
+            print(text, flush=True)
+
+    def _namespace(self) -> dict:
+        return {name: functools.partial(self.invoke, name) for name in self.__names}
+
+    # Metadata
+
+    def _cmd_GetMetadata(self, json_ret=False):
+        metadata = dm_raw_metadata.dm_metadata
+        return json.dumps(metadata) if json_ret else deepcopy(metadata)
+
+    def _cmd_GetPySycDatamodelMetadata(self):
+        info = dm_raw_metadata.dm_metadata[_ROOT]
+        return {_ROOT: {"doc": "Root object.", **_datamodel_docs(info)}}
+
+    def _cmd_GetCommandAndQueryMetadata(self):
+        return deepcopy(self.__cmd_metadata)
+
+    def _cmd_GetPySycCommandMetadata(self):
+        return deepcopy(self.__pysyc_cmd_metadata)
+
+    def _cmd_GetCommandAndQueryNames(self):
+        return sorted(self.__names)
+
+    def _cmd_GetVersion(self):
+        return f"20{SYC_MAJOR_VERSION} R{SYC_MINOR_VERSION}"
+
+    def _cmd_DatamodelRoot(self):
+        return f"/{_ROOT}"
+
+    # Data model
+
+    def _cmd_GetState(self, ObjectPath):
+        return deepcopy(self.__state.get_state(ObjectPath))
+
+    def _cmd_SetState(self, ObjectPath, State):
+        self.__state.set_state(ObjectPath, deepcopy(State))
+        return True
+
+    def _cmd_GetParameter(self, ObjectPath, Name):
+        return deepcopy(self.__state.get_parameter(ObjectPath, Name))
+
+    def _cmd_DeleteObject(self, ObjectPath):
+        self.__state.delete_object(ObjectPath)
+
+    def _cmd_GetChildNamesStr(self, ObjectPath):
+        parent, _, obj_type = ObjectPath.rpartition("/")
+        return [
+            key.partition(":")[2]
+            for key in self.__state.get_state(parent)
+            if key.startswith(f"{obj_type}:")
+        ]
+
+    def _cmd_GetChildNames(self, ObjectPath):
+        return self._cmd_GetChildNamesStr(ObjectPath)
+
+    def _cmd_GetParameterOptions(self, ObjectPath, Name):
+        parameters = self._type_info(ObjectPath)["__parameters"]
+        return list(parameters[Name].get("staticOptions", ()))
+
+    def _type_info(self, path: str) -> dict:
+        comps = [c.partition(":")[0] for c in path.split("/")[1:]]
+        info = dm_raw_metadata.dm_metadata[comps[0]]
+        for comp in comps[1:]:
+            info = info["__children"][comp]
+        return info
+
+    def _cmd_ClearState(self):
+        self._reset()
+
+    # Setup commands
+
+    def _new_name(self, prefix: str) -> str:
+        count = self.__counters[prefix] = self.__counters.get(prefix, 0) + 1
+        return f"{prefix}-{count}"
+
+    def _cmd_AddParticipant(
+        self,
+        ParticipantType=None,
+        InputFile=None,
+        Executable=None,
+        AdditionalArguments=None,
+        WorkingDirectory=None,
+    ):
+        participant_type = ParticipantType or "DEFAULT"
+        name = self._new_name(participant_type)
+        state = {
+            "DisplayName": name,
+            "ParticipantType": participant_type,
+            "ParticipantAnalysisType": "Steady",
+            "ExecutionControl": {
+                "Executable": Executable,
+                "AdditionalArguments": AdditionalArguments,
+                "WorkingDirectory": WorkingDirectory or ".",
+                "InitialInput": InputFile,
+            },
+        }
+        for region in _REGIONS:
+            state[f"Region:{region}"] = {"DisplayName": region}
+        for variable in _VARIABLES:
+            state[f"Variable:{variable}"] = {"DisplayName": variable}
+        self.__state.set_state(f"/{_ROOT}/CouplingParticipant:{name}", state)
+        return name
+
+    def _cmd_GetRegionNamesForParticipant(self, ParticipantName):
+        state = self.__state.get_state(
+            f"/{_ROOT}/CouplingParticipant:{ParticipantName}"
+        )
+        return {
+            key.partition(":")[2]: value.get("DisplayName")
+            for key, value in state.items()
+            if key.startswith("Region:")
+        }
+
+    def _cmd_AddInterface(
+        self, SideOneParticipant, SideOneRegions, SideTwoParticipant, SideTwoRegions
+    ):
+        name = self._new_name("Interface")
+        self.__state.set_state(
+            f"/{_ROOT}/CouplingInterface:{name}",
+            {
+                "DisplayName": name,
+                "Side:One": {
+                    "CouplingParticipant": SideOneParticipant,
+                    "RegionList": list(SideOneRegions),
+                },
+                "Side:Two": {
+                    "CouplingParticipant": SideTwoParticipant,
+                    "RegionList": list(SideTwoRegions),
+                },
+            },
+        )
+        return name
+
+    def _cmd_AddInterfaceByDisplayNames(self, **kwargs):
+        return self._cmd_AddInterface(**kwargs)
+
+    def _cmd_AddDataTransfer(
+        self,
+        Interface,
+        TargetSide,
+        SourceVariable=None,
+        TargetVariable=None,
+        SideOneVariable=None,
+        SideTwoVariable=None,
+        Value=None,
+        ValueX=None,
+        ValueY=None,
+        ValueZ=None,
+    ):
+        path = f"/{_ROOT}/CouplingInterface:{Interface}"
+        if not self.__state.get_state(path):
+            raise RuntimeError(f"Interface '{Interface}' does not exist.")
+        if SideOneVariable is not None:
+            source, target = (
+                (SideTwoVariable, SideOneVariable)
+                if TargetSide == "One"
+                else (SideOneVariable, SideTwoVariable)
+            )
+        else:
+            source, target = SourceVariable, TargetVariable
+        base = target or "Expression"
+        existing = self._cmd_GetChildNamesStr(f"{path}/DataTransfer")
+        name = base
+        i = 0
+        while name in existing:
+            i += 1
+            name = f"{base}-{i}"
+        state = {
+            "DisplayName": name,
+            "TargetSide": TargetSide,
+            "Option": "UsingVariable" if Value is None else "UsingExpression",
+            "SourceVariable": source,
+            "TargetVariable": target,
+        }
+        if Value is not None:
+            state["Value"] = Value
+        self.__state.set_state(f"{path}/DataTransfer:{name}", state)
+        return name
+
+    def _cmd_AddDataTransferByDisplayNames(self, **kwargs):
+        return self._cmd_AddDataTransfer(**kwargs)
+
+    def _cmd_GetErrors(self):
+        return []
+
+    def _cmd_GetExecutionCommand(self, ParticipantName):
+        return f"fake-solver --participant {ParticipantName}"
+
+    def _cmd_GetSetupSummary(self, **kwargs):
+        lines = ["Setup summary", ""]
+        for kind in ("CouplingParticipant", "CouplingInterface"):
+            for name in self._cmd_GetChildNamesStr(f"/{_ROOT}/{kind}"):
+                lines.append(f"{kind}: {name}")
+        return "\n".join(lines)
+
+    def _cmd_PrintSetup(self):
+        for line in self._cmd_GetSetupSummary().split("\n"):
+            self.write(line)
+
+    def _cmd_PrintState(self, ObjectPath=None, **kwargs):
+        state = self.__state.get_state(ObjectPath or f"/{_ROOT}")
+        for line in json.dumps(state, indent=2).split("\n"):
+            self.write(line)
+
+    def _cmd_Save(self, FilePath="."):
+        return True
+
+    def _cmd_ExecuteCommandString(self, CommandString):
+        namespace = self._namespace()
+        try:
+            code = compile(CommandString, "<string>", "eval")
+        except SyntaxError:
+            exec(CommandString, namespace)
+            return None
+        return eval(code, namespace)
+
+    def _cmd_ExecPythonString(self, PythonString, **kwargs):
+        exec(PythonString, self._namespace())
+
+    # Solution
+
+    def _cmd_Solve(self):
+        self.solve()
+
+    def _cmd_Step(self, Count=1):
+        self.solve(max_steps=Count)
+
+    def interrupt(self, reason: str):
+        self.__stop_reason = f"Solution interrupted: {reason}"
+
+    def abort(self, reason: str):
+        self.__stop_reason = f"Solution aborted: {reason}"
+
+    def _chart_metadata(self) -> chart_pb2.ChartMetadata:
+        with self.__lock:
+            transient = (
+                self.__state.get_parameter(f"/{_ROOT}/AnalysisControl", "AnalysisType")
+                == "Transient"
+            )
+            metadata = chart_pb2.ChartMetadata(is_transient=transient)
+            for intf in self._cmd_GetChildNamesStr(f"/{_ROOT}/CouplingInterface"):
+                intf_path = f"/{_ROOT}/CouplingInterface:{intf}"
+                info = metadata.interface_info.add(interface_name=intf)
+                for transfer in self._cmd_GetChildNamesStr(f"{intf_path}/DataTransfer"):
+                    info.transfer_info.add(
+                        series_type=chart_pb2.SERIES_TYPE_CONVERGENCE,
+                        transfer_name=transfer,
+                    )
+                    target_side = self.__state.get_parameter(
+                        f"{intf_path}/DataTransfer:{transfer}", "TargetSide"
+                    )
+                    source_side = "Two" if target_side == "One" else "One"
+                    participant = self.__state.get_parameter(
+                        f"{intf_path}/Side:{source_side}", "CouplingParticipant"
+                    )
+                    info.transfer_info.add(
+                        series_type=chart_pb2.SERIES_TYPE_SUM,
+                        transfer_name=transfer,
+                        participant_name=participant or "",
+                    )
+        return metadata
+
+    def _solve_settings(self):
+        solution_control = self.__state.get_state(f"/{_ROOT}/SolutionControl")
+        max_iterations = int(solution_control.get("MaximumIterations") or 5)
+        time_step = _leading_number(solution_control.get("TimeStepSize"), 1.0)
+        if solution_control.get("DurationOption") == "EndTime":
+            end_time = _leading_number(solution_control.get("EndTime"), time_step)
+            steps = max(1, round(end_time / time_step))
+        else:
+            steps = int(solution_control.get("NumberOfSteps") or 1)
+        return steps, max_iterations, time_step
+
+    def solve(self, max_steps=None):
+        """Run a synthetic coupled analysis, producing output and chart data."""
+        self.__stop_reason = None
+        with self.__lock:
+            steps, max_iterations, time_step = self._solve_settings()
+        metadata = self._chart_metadata()
+        if max_steps is not None:
+            steps = min(steps, max_steps)
+        if not metadata.is_transient:
+            steps = 1
+        self.chart_events.append(chart_pb2.ChartDataEvent(metadata=metadata))
+        self.write("Starting coupled analysis")
+
+        for step in range(steps):
+            timestep = len(self.__timestep_to_iteration) + 1
+            current_time = timestep * time_step
+            if metadata.is_transient:
+                self.write(f"Coupling step {timestep}, time {current_time:g}")
+                self.chart_events.append(
+                    chart_pb2.ChartDataEvent(
+                        timestep_start=chart_pb2.TimestepStart(
+                            timestep_count=timestep, time=current_time
+                        )
+                    )
+                )
+            for k in range(max_iterations):
+                if self.__stop_reason:
+                    self.write(self.__stop_reason)
+                    raise SolveStopped(self.__stop_reason)
+                if self.iteration_time:
+                    time.sleep(self.iteration_time)
+                self._iterate(metadata, k)
+            self.__timestep_to_iteration.append(self.__iteration)
+            self.__time_values.append(current_time)
+            self.chart_events.append(
+                chart_pb2.ChartDataEvent(
+                    timestep_end=chart_pb2.TimestepEnd(
+                        timestep_count=timestep, iteration_count=self.__iteration
+                    )
+                )
+            )
+        self.write("Coupled analysis completed")
+
+    def _iterate(self, metadata: chart_pb2.ChartMetadata, k: int):
+        index = self.__iteration
+        self.__iteration += 1
+        self.write(f"Coupling iteration {self.__iteration}")
+        for intf in metadata.interface_info:
+            for i, info in enumerate(intf.transfer_info):
+                if info.series_type == chart_pb2.SERIES_TYPE_CONVERGENCE:
+                    value = 0.5 ** (k + 1) * (1.0 + 0.1 * i)
+                else:
+                    value = 100.0 + 10.0 * math.sin(0.5 * index + i)
+                self.__series.setdefault((intf.interface_name, i), []).append(value)
+                self.chart_events.append(
+                    chart_pb2.ChartDataEvent(
+                        series_data=chart_pb2.SeriesData(
+                            interface_name=intf.interface_name,
+                            transfer_series_index=i,
+                            start_index=index,
+                            data=[value],
+                        )
+                    )
+                )
+
+    def chart_series_data(self) -> chart_pb2.AllSeriesData:
+        all_data = chart_pb2.AllSeriesData()
+        for (intf, i), values in list(self.__series.items()):
+            all_data.series_data.add(
+                interface_name=intf, transfer_series_index=i, start_index=0, data=values
+            )
+        return all_data
+
+    def chart_timestep_data(self) -> chart_pb2.TimestepData:
+        return chart_pb2.TimestepData(
+            timestep_to_iteration=self.__timestep_to_iteration,
+            time_values=self.__time_values,
+        )
+
+
+def _abort_with_exception(context, e: Exception):
+    # Errors are reported as System Coupling reports them, with the details
+    # of the exception in the trailing metadata.
+    details = error_pb2.ErrorDetails(
+        exception_classname=type(e).__name__, stack_trace=traceback.format_exc()
+    )
+    context.set_trailing_metadata((("syc-exception-bin", details.SerializeToString()),))
+    context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+
+def _compress_response(context, response, engine: FakeSystemCoupling):
+    # Honour the client's request to compress the response.
+    metadata = dict(context.invocation_metadata())
+    mode = metadata.get(RESPONSE_COMPRESSION_KEY, "none")
+    if mode == "auto":
+        if response.ByteSize() < int(metadata[RESPONSE_THRESHOLD_KEY]):
+            return response
+        mode = "gzip"
+    if mode != "none":
+        context.set_compression(_RESPONSE_ALGORITHMS[mode])
+        engine.compressed_responses += 1
+    return response
+
+
+class _CommandServicer(command_pb2_grpc.CommandServicer):
+    def __init__(self, engine: FakeSystemCoupling):
+        self.__engine = engine
+
+    def InvokeCommand(self, request, context):
+        kwargs = {arg.name: from_variant(arg.val) for arg in request.args}
+        try:
+            result = self.__engine.invoke(request.command, **kwargs)
+        except Exception as e:
+            _abort_with_exception(context, e)
+        nosync = self.__engine.is_query(request.command)
+        context.set_trailing_metadata((("nosync", str(nosync)),))
+        response = command_pb2.CommandResponse()
+        to_variant(result, response.result)
+        return _compress_response(context, response, self.__engine)
+
+
+class _SolutionServicer(solution_pb2_grpc.SolutionServicer):
+    def __init__(self, engine: FakeSystemCoupling):
+        self.__engine = engine
+
+    def Solve(self, request, context):
+        try:
+            self.__engine.solve()
+        except Exception as e:
+            _abort_with_exception(context, e)
+        return solution_pb2.SolveResponse()
+
+    def Interrupt(self, request, context):
+        self.__engine.interrupt(request.reason)
+        return solution_pb2.InterruptResponse()
+
+    def Abort(self, request, context):
+        self.__engine.abort(request.reason)
+        return solution_pb2.AbortResponse()
+
+
+class _ChartServicer(chart_pb2_grpc.ChartDataServicer):
+    def __init__(self, engine: FakeSystemCoupling, is_serving):
+        self.__engine = engine
+        self.__is_serving = is_serving
+
+    def StreamChartData(self, request, context):
+        yield from self.__engine.chart_events.follow(
+            lambda: context.is_active() and self.__is_serving()
+        )
+
+    def GetChartMetadata(self, request, context):
+        return _compress_response(
+            context, self.__engine._chart_metadata(), self.__engine
+        )
+
+    def GetChartSeriesData(self, request, context):
+        return _compress_response(
+            context, self.__engine.chart_series_data(), self.__engine
+        )
+
+    def GetChartTimestepData(self, request, context):
+        return _compress_response(
+            context, self.__engine.chart_timestep_data(), self.__engine
+        )
+
+
+class _OutputStreamServicer(output_stream_pb2_grpc.OutputStreamServicer):
+    def __init__(self, engine: FakeSystemCoupling, is_serving):
+        self.__engine = engine
+        self.__is_serving = is_serving
+
+    def BeginStdStreaming(self, request, context):
+        for text in self.__engine.output.follow(
+            lambda: context.is_active() and self.__is_serving()
+        ):
+            yield output_stream_pb2.StdStreamResponse(text=text)
+
+
+class _ProcessServicer(process_pb2_grpc.ProcessServicer):
+    def __init__(self, server: "FakeSycServer"):
+        self.__server = server
+
+    def Ping(self, request, context):
+        return process_pb2.PingResponse()
+
+    def Quit(self, request, context):
+        # Stop once the response has been sent.
+        threading.Thread(target=self.__server.stop, args=(0.5,), daemon=True).start()
+        return process_pb2.QuitResponse()
+
+
+class FakeSycServer:
+    """gRPC server serving a ``FakeSystemCoupling`` engine.
+
+    Addresses to listen on are added with ``listen`` before calling ``start``.
+    The server stops when a client calls ``Quit``, as happens when a session
+    exits, or when ``stop`` is called.
+    """
+
+    def __init__(self, engine: FakeSystemCoupling = None, max_workers: int = 10):
+        self.engine = engine or FakeSystemCoupling()
+        self.__serving = False
+        self.__stopped = threading.Event()
+        self.__server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+        is_serving = lambda: self.__serving
+        command_pb2_grpc.add_CommandServicer_to_server(
+            _CommandServicer(self.engine), self.__server
+        )
+        solution_pb2_grpc.add_SolutionServicer_to_server(
+            _SolutionServicer(self.engine), self.__server
+        )
+        chart_pb2_grpc.add_ChartDataServicer_to_server(
+            _ChartServicer(self.engine, is_serving), self.__server
+        )
+        output_stream_pb2_grpc.add_OutputStreamServicer_to_server(
+            _OutputStreamServicer(self.engine, is_serving), self.__server
+        )
+        process_pb2_grpc.add_ProcessServicer_to_server(
+            _ProcessServicer(self), self.__server
+        )
+
+    def listen(self, address: str, credentials=None) -> int:
+        """Listen on ``address``, such as ``"127.0.0.1:0"`` or
+        ``"unix:/tmp/syc.sock"``, returning the port."""
+        if credentials is None:
+            return self.__server.add_insecure_port(address)
+        return self.__server.add_secure_port(address, credentials)
+
+    def start(self):
+        self.__serving = True
+        self.__server.start()
+
+    def stop(self, grace=None):
+        self.__serving = False
+        self.__server.stop(grace).wait()
+        self.__stopped.set()
+
+    def wait(self, timeout=None) -> bool:
+        """Wait for the server to stop."""
+        return self.__stopped.wait(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+
+def make_fake_installation(root) -> str:
+    """Create a fake System Coupling installation under the ``root``
+    directory, whose launch script starts the fake server.
+
+    The returned path is suitable as the value of the ``SYSC_ROOT`` environment
+    variable, from which ``launch()`` locates the launch script.
+    """
+    sysc_root = pathlib.Path(root) / "SystemCoupling"
+    bin_dir = sysc_root / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    python, this_file = sys.executable, os.path.abspath(__file__)
+    if os.name == "nt":
+        script = bin_dir / "systemcoupling.bat"
+        script.write_text(f'@"{python}" "{this_file}" %*\n')
+    else:
+        script = bin_dir / "systemcoupling"
+        script.write_text(f'#!/bin/sh\nexec "{python}" "{this_file}" "$@"\n')
+        script.chmod(0o755)
+    return str(sysc_root)
+
+
+def _server_credentials(certs_folder: str):
+    certs = pathlib.Path(certs_folder)
+    return grpc.ssl_server_credentials(
+        [((certs / "server.key").read_bytes(), (certs / "server.crt").read_bytes())],
+        root_certificates=(certs / "ca.crt").read_bytes(),
+        require_client_auth=True,
+    )
+
+
+def _listen_address(args) -> tuple:
+    """Return the address to listen on, and the credentials, from the parsed
+    command line arguments."""
+    if args.grpcport:
+        # Old-style arguments
+        return args.grpcport, None
+    host = args.host or "127.0.0.1"
+    match args.transport_mode:
+        case "uds":
+            uds_dir = pathlib.Path(args.uds_dir or pathlib.Path.home() / ".conn")
+            uds_dir.mkdir(parents=True, exist_ok=True)
+            name = f"systemcoupling-{args.uds_id}" if args.uds_id else "systemcoupling"
+            path = uds_dir / f"{name}.sock"
+            if path.exists():
+                path.unlink()
+            return f"unix:{path}", None
+        case "mtls":
+            certs = args.certs_folder or os.environ.get(
+                "ANSYS_GRPC_CERTIFICATES", "certs"
+            )
+            return f"{host}:{args.port}", _server_credentials(certs)
+        case _:
+            return f"{host}:{args.port}", None
+
+
+def main(argv=None):
+    """Run the fake server with the command line arguments of System Coupling."""
+    parser = argparse.ArgumentParser(description="Fake System Coupling server.")
+    parser.add_argument("-m", dest="mode", default="cosim")
+    parser.add_argument("--grpc", action="store_true")
+    parser.add_argument("--grpcport")
+    parser.add_argument("--transport-mode", default="insecure")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--allow-remote-host", action="store_true")
+    parser.add_argument("--uds-dir")
+    parser.add_argument("--uds-id")
+    parser.add_argument("--certs-folder")
+    parser.add_argument("--fake-think-time", type=float, default=0.0)
+    parser.add_argument("--fake-iteration-time", type=float, default=0.0)
+    args, _ = parser.parse_known_args(argv)
+
+    engine = FakeSystemCoupling(args.fake_think_time, args.fake_iteration_time)
+    engine.echo_output = True
+    server = FakeSycServer(engine)
+    address, credentials = _listen_address(args)
+    server.listen(address, credentials)
+    server.start()
+    print(f"Fake System Coupling server listening on {address}", flush=True)
+    server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+from ansys.systemcoupling.core.async_session import AsyncSession
+from ansys.systemcoupling.core.client.async_grpc_client import AsyncSycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.types import SystemCouplingMode
+from dm_raw_metadata import cmd_metadata, dm_metadata
+from fake_syc_server import FakeSycServer
+from state import StateForTesting
+
+# Solve is exposed in the solution API. The injected commands also override
+# the server's ClearState command, which is not in the basic test metadata.
+_cmd_metadata = [
+    dict(cmd, exposure="solution") if cmd["name"] == "Solve" else cmd
+    for cmd in cmd_metadata
+] + [
+    {
+        "name": "ClearState",
+        "args": [],
+        "essentialArgNames": [],
+        "optionalArgNames": [],
+        "isQuery": False,
+        "exposure": "case",
+    }
+]
+
+
+class _MockAsyncRpc:
+    """Asynchronous stand-in for ``AsyncSycGrpc``."""
+
+    def __init__(self):
+        self.__state = StateForTesting(native_state_format=True)
+        self.calls = []
+        self.solved = False
+        self.exited = False
+
+    async def GetMetadata(self, json_ret=None):
+        return deepcopy(dm_metadata)
+
+    async def GetPySycDatamodelMetadata(self):
+        return {"SystemCoupling": {}}
+
+    async def GetCommandAndQueryMetadata(self):
+        return deepcopy(_cmd_metadata)
+
+    async def GetPySycCommandMetadata(self):
+        return {
+            cmd["name"]: {
+                "exposure": cmd["exposure"],
+                "doc": f"{cmd['name']} command.",
+                "args": [
+                    {"name": arg, "type": info["type"], "doc": f"{arg} argument."}
+                    for arg, info in cmd["args"]
+                ],
+            }
+            for cmd in _cmd_metadata
+        }
+
+    async def SetState(self, ObjectPath, State):
+        self.__state.set_state(ObjectPath, State)
+
+    async def GetState(self, ObjectPath):
+        return self.__state.get_state(ObjectPath)
+
+    async def GetParameter(self, ObjectPath, Name):
+        return self.__state.get_parameter(ObjectPath, Name)
+
+    async def GetChildNamesStr(self, ObjectPath):
+        parent, _, obj_type = ObjectPath.rpartition("/")
+        return [
+            k.partition(":")[2]
+            for k in self.__state.get_state(parent)
+            if k.startswith(f"{obj_type}:")
+        ]
+
+    async def DeleteObject(self, ObjectPath):
+        self.__state.delete_object(ObjectPath)
+
+    async def AddParticipant(self, **kwargs):
+        return "MAPDL-1"
+
+    async def solve(self):
+        self.solved = True
+
+    async def exit(self):
+        self.exited = True
+
+    async def execute_command(self, name, **kwargs):
+        self.calls.append(name)
+        return await getattr(self, name)(**kwargs)
+
+
+@pytest.fixture
+def session():
+    return AsyncSession(_MockAsyncRpc(), SystemCouplingMode.COSIM)
+
+
+def test_setup_root_state(session):
+    async def run():
+        setup = await session.setup
+        await setup.solution_control.set_state({"time_step_size": "0.1 [s]"})
+        assert await setup.solution_control.time_step_size == "0.1 [s]"
+        state = await setup.solution_control.get_state()
+        assert state["time_step_size"] == "0.1 [s]"
+
+    asyncio.run(run())
+
+
+def test_setup_root_is_cached(session):
+    async def run():
+        roots = await asyncio.gather(session.setup, session.setup)
+        assert roots[0] is roots[1]
+        assert session._grpc.calls.count("GetMetadata") == 1
+
+    asyncio.run(run())
+
+
+def test_cached_metadata_not_queried(session):
+    async def run(session):
+        await session.setup
+        return session._grpc.calls
+
+    assert "GetMetadata" in asyncio.run(run(session))
+    calls = asyncio.run(run(AsyncSession(_MockAsyncRpc(), SystemCouplingMode.COSIM)))
+    assert calls.count("GetCommandAndQueryMetadata") == 1
+    assert "GetMetadata" not in calls
+    assert "GetPySycCommandMetadata" not in calls
+
+
+def test_named_objects(session):
+    async def run():
+        setup = await session.setup
+        intf = await setup.coupling_interface.create("intf-1")
+        await intf.set_state({"display_name": "Interface 1"})
+        assert await setup.coupling_interface.get_object_names() == ["intf-1"]
+        assert await setup.coupling_interface["intf-1"].display_name == "Interface 1"
+        await setup.coupling_interface.delete("intf-1")
+        assert not await setup.coupling_interface.contains("intf-1")
+
+    asyncio.run(run())
+
+
+def test_property_assignment_not_allowed(session):
+    async def run():
+        setup = await session.setup
+        with pytest.raises(AttributeError):
+            setup.solution_control.time_step_size = "0.1 [s]"
+
+    asyncio.run(run())
+
+
+def test_commands(session):
+    async def run():
+        setup = await session.setup
+        assert await setup.add_participant(input_file="mapdl.scp") == "MAPDL-1"
+        solution = await session.solution
+        await solution.solve()
+        assert session._grpc.solved
+
+    asyncio.run(run())
+
+
+def test_exit(session):
+    async def run():
+        setup = await session.setup
+        rpc = session._grpc
+        await session.exit()
+        assert rpc.exited
+        with pytest.raises(RuntimeError):
+            await setup.solution_control.get_state()
+
+    asyncio.run(run())
+
+
+def test_end_output_awaits_stream_task():
+    async def run():
+        with FakeSycServer() as server:
+            port = server.listen("127.0.0.1:0")
+            server.start()
+            rpc = AsyncSycGrpc()
+            await rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+            lines = []
+            rpc.start_output(lines.append)
+            await rpc.PrintSetup()
+            for _ in range(500):
+                if "Setup summary" in lines:
+                    break
+                await asyncio.sleep(0.01)
+            (reader,) = [
+                task
+                for task in asyncio.all_tasks()
+                if task.get_coro().__name__ == "_read_stdstreams"
+            ]
+            await rpc.end_output()
+            assert reader.done()
+            await rpc.exit()
+
+    asyncio.run(run())
@@ -0,0 +1,241 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+import pytest
+
+from ansys.systemcoupling.core.client.command_batch import compile_batch
+
+
+class _FakeServer:
+    """Minimal stand-in for the server-side command environment."""
+
+    def __init__(self):
+        self.state = {}
+        self.invoked = []
+        self.batch_error = None
+        self.batch_reply = None
+        self.namespace = {
+            "SetState": self._set_state,
+            "GetState": self._get_state,
+            "IsSet": self._is_set,
+            "Fail": self._fail,
+        }
+
+    def _set_state(self, ObjectPath, State):
+        self.state.setdefault(ObjectPath, {}).update(State)
+
+    def _get_state(self, ObjectPath):
+        return self.state.get(ObjectPath, {})
+
+    def _is_set(self, ObjectPath):
+        return ObjectPath in self.state
+
+    def _fail(self):
+        raise ValueError("Failed as requested.")
+
+    def invoke(self, command, **kwargs):
+        self.invoked.append(command)
+        if command == "GetCommandAndQueryMetadata":
+            return [
+                {"name": name, "isQuery": name.startswith("Get")}
+                for name in self.namespace
+            ]
+        if command == "ExecuteCommandString":
+            if self.batch_error is not None:
+                raise self.batch_error
+            if self.batch_reply is not None:
+                eval(kwargs["CommandString"], dict(self.namespace))
+                return self.batch_reply
+            return eval(kwargs["CommandString"], dict(self.namespace))
+        if command not in self.namespace:
+            self.namespace[command] = lambda **kwargs: command
+        return self.namespace[command](**kwargs)
+
+
+@pytest.fixture
+def rpc_and_server(connect_fake_rpc):
+    fake_server = _FakeServer()
+    return connect_fake_rpc(fake_server.invoke), fake_server
+
+
+def test_compile_batch():
+    fake_server = _FakeServer()
+    script = compile_batch(
+        [
+            ("SetState", {"ObjectPath": "/A", "State": {"x": 1}}),
+            ("GetState", {"ObjectPath": "/A"}),
+        ]
+    )
+    assert (
+        eval(script, dict(fake_server.namespace)) == '[[true, null], [true, {"x": 1}]]'
+    )
+
+
+def test_batch_single_round_trip(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    with rpc.batch() as batch:
+        handles = [rpc.SetState(ObjectPath=f"/A{i}", State={"x": i}) for i in range(20)]
+        assert len(batch) == 20
+        assert not handles[0].done()
+        assert fake_server.state == {}
+    assert fake_server.invoked == ["GetCommandAndQueryMetadata", "ExecuteCommandString"]
+    assert fake_server.state == {f"/A{i}": {"x": i} for i in range(20)}
+    assert all(h.done() and h.result() is None for h in handles)
+
+
+def test_query_executes_recorded_commands(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    with rpc.batch():
+        set_state = rpc.SetState(ObjectPath="/A", State={"x": 1})
+        assert rpc.GetState(ObjectPath="/A") == {"x": 1}
+        assert set_state.done()
+        assert rpc.state_generation is not None
+        rpc.SetState(ObjectPath="/A", State={"y": 2})
+        assert rpc.state_generation is None
+    assert fake_server.state == {"/A": {"x": 1, "y": 2}}
+
+
+def test_batch_stops_at_first_failure(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    with pytest.raises(RuntimeError, match="Command 'Fail' failed: ValueError"):
+        with rpc.batch():
+            before = rpc.SetState(ObjectPath="/A", State={"x": 1})
+            fail = rpc.Fail()
+            after = rpc.SetState(ObjectPath="/B", State={"x": 2})
+    assert before.result() is None
+    with pytest.raises(RuntimeError, match="Failed as requested"):
+        fail.result()
+    with pytest.raises(RuntimeError, match="not executed"):
+        after.result()
+    assert fake_server.state == {"/A": {"x": 1}}
+
+
+def test_batch_discarded_on_exception(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    with pytest.raises(KeyError):
+        with rpc.batch():
+            handle = rpc.SetState(ObjectPath="/A", State={"x": 1})
+            raise KeyError("abandon")
+    with pytest.raises(RuntimeError, match="discarded"):
+        handle.result()
+    assert fake_server.invoked == ["GetCommandAndQueryMetadata"]
+    # Commands run immediately once the batch has ended.
+    assert rpc.SetState(ObjectPath="/A", State={"x": 1}) is None
+    assert fake_server.state == {"/A": {"x": 1}}
+
+
+def test_nested_batch_joins_outer(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    with rpc.batch() as outer:
+        with rpc.batch() as inner:
+            assert inner is outer
+            rpc.SetState(ObjectPath="/A", State={"x": 1})
+        assert fake_server.state == {}
+    assert fake_server.state == {"/A": {"x": 1}}
+
+
+def test_query_names_are_barriers(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    with rpc.batch():
+        rpc.SetState(ObjectPath="/A", State={"x": 1})
+        # Not flagged as a query by the metadata, but named as one.
+        assert rpc.IsSet(ObjectPath="/A") is True
+        rpc.SetState(ObjectPath="/B", State={"x": 1})
+        # Unknown to the metadata.
+        assert rpc.Unlisted() == "Unlisted"
+        assert fake_server.state == {"/A": {"x": 1}, "/B": {"x": 1}}
+
+
+def test_unbatched_fallback(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    fake_server.batch_error = SyntaxError("invalid syntax")
+    with pytest.raises(RuntimeError, match="Command 'Fail' failed"):
+        with rpc.batch():
+            before = rpc.SetState(ObjectPath="/A", State={"x": 1})
+            fail = rpc.Fail()
+            after = rpc.SetState(ObjectPath="/B", State={"x": 2})
+    assert fake_server.invoked == [
+        "GetCommandAndQueryMetadata",
+        "ExecuteCommandString",
+        "SetState",
+        "Fail",
+    ]
+    assert before.result() is None
+    with pytest.raises(RuntimeError, match="Failed as requested"):
+        fail.result()
+    with pytest.raises(RuntimeError, match="not executed"):
+        after.result()
+    assert fake_server.state == {"/A": {"x": 1}}
+
+
+def test_batch_only_records_own_thread(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    recorded, other_done = threading.Event(), threading.Event()
+    generations = []
+
+    def record():
+        with rpc.batch():
+            rpc.SetState(ObjectPath="/A", State={"x": 1})
+            recorded.set()
+            other_done.wait(10)
+            generations.append(rpc.state_generation)
+
+    thread = threading.Thread(target=record)
+    thread.start()
+    try:
+        assert recorded.wait(10)
+        # Run immediately, rather than being recorded in the other thread's
+        # batch, which does not affect the state generation seen here.
+        assert rpc.SetState(ObjectPath="/B", State={"x": 2}) is None
+        assert fake_server.state == {"/B": {"x": 2}}
+        assert rpc.state_generation is not None
+    finally:
+        other_done.set()
+        thread.join(10)
+    assert generations == [None]
+    assert fake_server.state == {"/A": {"x": 1}, "/B": {"x": 2}}
+
+
+def test_undecodable_reply_not_executed_again(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    fake_server.batch_reply = "<truncated"
+    with pytest.raises(RuntimeError, match="could not be decoded"):
+        with rpc.batch():
+            handle = rpc.SetState(ObjectPath="/A", State={"x": 1})
+    assert fake_server.invoked == ["GetCommandAndQueryMetadata", "ExecuteCommandString"]
+    with pytest.raises(RuntimeError, match="unknown"):
+        handle.result()
+    assert fake_server.state == {"/A": {"x": 1}}
+
+
+def test_failed_batch_not_executed_again(rpc_and_server):
+    rpc, fake_server = rpc_and_server
+    fake_server.batch_error = MemoryError("out of memory")
+    with pytest.raises(RuntimeError, match="out of memory"):
+        with rpc.batch():
+            handle = rpc.SetState(ObjectPath="/A", State={"x": 1})
+    assert fake_server.invoked == ["GetCommandAndQueryMetadata", "ExecuteCommandString"]
+    with pytest.raises(RuntimeError, match="unknown"):
+        handle.result()
@@ -0,0 +1,80 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+
+@pytest.fixture
+def rpc_and_received(connect_fake_rpc):
+    received = []
+
+    def invoke(command, Value=None, **kwargs):
+        received.append(command)
+        if command == "Fail":
+            raise RuntimeError("Failed as requested.")
+        return Value
+
+    return connect_fake_rpc(invoke), received
+
+
+def test_pipeline_results(rpc_and_received):
+    rpc, received = rpc_and_received
+    with rpc.pipeline() as p:
+        handles = [p.SetThing(Value=i) for i in range(10)]
+        last = p.GetThing(Value="last")
+        assert len(p) == 11
+    assert [h.result() for h in handles] == list(range(10))
+    assert last.result() == "last"
+    assert sorted(received) == ["GetThing"] + ["SetThing"] * 10
+
+
+def test_pipeline_flush_returns_results_in_order(rpc_and_received):
+    rpc, _ = rpc_and_received
+    with rpc.pipeline() as p:
+        for i in range(5):
+            p.execute_command("SetThing", Value=i)
+        assert p.flush() == [0, 1, 2, 3, 4]
+        assert len(p) == 0
+
+
+def test_pipeline_raises_first_error(rpc_and_received):
+    rpc, received = rpc_and_received
+    with pytest.raises(RuntimeError, match=r"InvokeCommand\(Fail\)"):
+        with rpc.pipeline() as p:
+            before = p.SetThing(Value=1)
+            p.Fail()
+            after = p.SetThing(Value=2)
+    assert before.result() == 1
+    assert after.result() == 2
+    assert sorted(received) == ["Fail", "SetThing", "SetThing"]
+
+
+def test_pipeline_updates_state_generation(rpc_and_received):
+    rpc, _ = rpc_and_received
+    generation = rpc.state_generation
+    with rpc.pipeline() as p:
+        p.GetThing()
+    assert rpc.state_generation == generation
+    with rpc.pipeline() as p:
+        p.SetThing()
+    assert rpc.state_generation == generation + 1
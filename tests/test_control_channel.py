@@ -0,0 +1,108 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent import futures
+
+import ansys.api.systemcoupling.v0.process_pb2 as process_pb2
+import ansys.api.systemcoupling.v0.process_pb2_grpc as process_pb2_grpc
+import ansys.api.systemcoupling.v0.solution_pb2 as solution_pb2
+import ansys.api.systemcoupling.v0.solution_pb2_grpc as solution_pb2_grpc
+import grpc
+import pytest
+
+from ansys.systemcoupling.core.client import grpc_client
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+
+
+class _Recorder(solution_pb2_grpc.SolutionServicer, process_pb2_grpc.ProcessServicer):
+    def __init__(self):
+        self.calls = []
+
+    def Interrupt(self, request, context):
+        self.calls.append(("Interrupt", context.time_remaining()))
+        return solution_pb2.InterruptResponse()
+
+    def Abort(self, request, context):
+        self.calls.append(("Abort", context.time_remaining()))
+        return solution_pb2.AbortResponse()
+
+    def Ping(self, request, context):
+        self.calls.append(("Ping", context.time_remaining()))
+        return process_pb2.PingResponse()
+
+
+def _start_server():
+    recorder = _Recorder()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    solution_pb2_grpc.add_SolutionServicer_to_server(recorder, server)
+    process_pb2_grpc.add_ProcessServicer_to_server(recorder, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, recorder, grpc.insecure_channel(f"127.0.0.1:{port}")
+
+
+@pytest.fixture
+def servers():
+    main = _start_server()
+    control = _start_server()
+    yield main, control
+    main[0].stop(None)
+    control[0].stop(None)
+
+
+def _connect(main_channel, control_channel=None):
+    rpc = SycGrpc()
+    rpc._connect(channel=main_channel, control_channel=control_channel)
+    rpc._skip_exit = True
+    return rpc
+
+
+def test_control_calls_use_control_channel(servers, monkeypatch):
+    monkeypatch.setattr(grpc_client, "_CONTROL_TIMEOUT_SEC", 7.0)
+    (_, main_recorder, main_channel), (_, control_recorder, control_channel) = servers
+    rpc = _connect(main_channel, control_channel)
+    assert rpc.ping()
+    rpc.interrupt("stop")
+    rpc.abort("stop now")
+    rpc.exit()
+
+    assert main_recorder.calls == []
+    assert [name for name, _ in control_recorder.calls] == [
+        "Ping",
+        "Interrupt",
+        "Abort",
+    ]
+    assert all(0 < remaining < 7.5 for _, remaining in control_recorder.calls)
+
+
+def test_control_calls_share_main_channel_by_default(servers):
+    (_, main_recorder, main_channel), (_, control_recorder, _) = servers
+    rpc = _connect(main_channel)
+    assert rpc.ping()
+    rpc.interrupt("stop")
+    rpc.exit()
+
+    assert [name for name, _ in main_recorder.calls] == ["Ping", "Interrupt"]
+    # No deadline is applied on the main channel.
+    assert all(remaining > 3600 for _, remaining in main_recorder.calls)
+    assert control_recorder.calls == []
@@ -23,6 +23,7 @@
 
 from copy import deepcopy
 from io import StringIO
+import json
 
 from dm_raw_metadata import cmd_metadata, dm_metadata
 
@@ -49,8 +50,9 @@ def _make_metadata():
 
 
 class SycProxy(SycProxyInterface):
-    def __init__(self, force_dynamic_datamodel=False):
+    def __init__(self, force_dynamic_datamodel=False, class_specs=None):
         self.__force_dynamic_datamodel = force_dynamic_datamodel
+        self.__class_specs = class_specs
         self.__state = StateForTesting()
         self.__metadata = None
         self.clear_last_cmd()
@@ -74,6 +76,13 @@ class SycProxy(SycProxyInterface):
         info[next(iter(info))]["__dummy__"] = None
         return info, "SystemCoupling"
 
+    def get_api_class_spec(self, category, make_spec):
+        if self.__class_specs is None:
+            return None
+        if category not in self.__class_specs:
+            self.__class_specs[category] = json.loads(json.dumps(make_spec()))
+        return self.__class_specs[category]
+
     def get_version(self):
         return ""
 
@@ -118,8 +127,17 @@ class SycProxy(SycProxyInterface):
         self.__state.set_parameter_options(path, name, options)
 
 
-def _get_dm_and_proxy(force_dynamic: bool):
-    proxy = SycProxy(force_dynamic_datamodel=force_dynamic)
+def _get_dm_and_proxy(classes: str):
+    force_dynamic = classes != "pre-generated"
+    class_specs = None
+    if classes == "cached-dynamically-generated":
+        # Populate the cache, so that the classes are created from it.
+        class_specs = {}
+        get_root(
+            SycProxy(force_dynamic_datamodel=True, class_specs=class_specs),
+            generated_module=generated_testing_datamodel,
+        )
+    proxy = SycProxy(force_dynamic_datamodel=force_dynamic, class_specs=class_specs)
     is_actually_dynamic = False
 
     def report(is_dynamic):
@@ -136,16 +154,21 @@ def _get_dm_and_proxy(force_dynamic: bool):
     return (root, proxy)
 
 
-@pytest.fixture(name="dm", params=("pre-generated", "dynamically-generated"))
+_CLASSES = (
+    "pre-generated",
+    "dynamically-generated",
+    "cached-dynamically-generated",
+)
+
+
+@pytest.fixture(name="dm", params=_CLASSES)
 def _dm(request):
-    force_dynamic = request.param == "dynamically-generated"
-    return _get_dm_and_proxy(force_dynamic)[0]
+    return _get_dm_and_proxy(request.param)[0]
 
 
-@pytest.fixture(name="dm_and_proxy", params=("pre-generated", "dynamically-generated"))
+@pytest.fixture(name="dm_and_proxy", params=_CLASSES)
 def _dm_and_proxy(request):
-    force_dynamic = request.param == "dynamically-generated"
-    return _get_dm_and_proxy(force_dynamic)
+    return _get_dm_and_proxy(request.param)
 
 
 def test_empty(dm):
@@ -394,3 +417,18 @@ output_control :
 """
     actual = str_io.getvalue()
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "classes", ("dynamically-generated", "cached-dynamically-generated")
+)
+def test_dynamic_children_created_on_access(classes):
+    dm = _get_dm_and_proxy(classes)[0]
+    assert "library" not in vars(dm)
+    dm.library.expression["bob"] = {"expression_string": "1.0"}
+    assert "library" in vars(dm)
+    assert "solution_control" not in vars(dm)
+    assert dm.library is dm.library
+    assert dm.get_state() == {
+        "library": {"expression": {"bob": {"expression_string": "1.0"}}}
+    }
@@ -0,0 +1,216 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import pytest
+
+import ansys.systemcoupling.core as pysyc
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.session import Session
+from fake_syc_server import FakeSycServer, FakeSystemCoupling, make_fake_installation
+
+
+@pytest.fixture
+def server():
+    with FakeSycServer() as server:
+        server.port = server.listen("127.0.0.1:0")
+        server.start()
+        yield server
+
+
+@pytest.fixture
+def rpc(server):
+    rpc = SycGrpc()
+    rpc.connect("127.0.0.1", server.port, ConnectionType.INSECURE_LOCAL)
+    yield rpc
+    rpc.exit()
+
+
+@pytest.fixture
+def session(rpc):
+    return Session(rpc)
+
+
+def _add_setup(setup):
+    mapdl = setup.add_participant(participant_type="MAPDL", input_file="mapdl.scp")
+    fluent = setup.add_participant(participant_type="FLUENT", input_file="fluent.scp")
+    interface = setup.add_interface(
+        side_one_participant=mapdl,
+        side_one_regions=["Region1"],
+        side_two_participant=fluent,
+        side_two_regions=["Region2"],
+    )
+    transfer = setup.add_data_transfer(
+        interface=interface,
+        target_side="One",
+        source_variable="Force",
+        target_variable="Force",
+    )
+    return mapdl, fluent, interface, transfer
+
+
+def test_setup(session):
+    setup = session.setup
+    mapdl, fluent, interface, transfer = _add_setup(setup)
+
+    assert setup.coupling_participant.get_object_names() == [mapdl, fluent]
+    assert setup.coupling_participant[mapdl].participant_type == "MAPDL"
+    assert (
+        setup.coupling_interface[interface].data_transfer[transfer].target_side == "One"
+    )
+    assert setup.analysis_control.analysis_type == "Steady"
+
+    setup.solution_control.maximum_iterations = 3
+    assert setup.solution_control.maximum_iterations == 3
+
+    session.case.clear_state()
+    assert setup.coupling_participant.get_object_names() == []
+
+
+def test_command_error(rpc):
+    with pytest.raises(RuntimeError, match="NoSuchCommand"):
+        rpc.execute_command("NoSuchCommand")
+
+
+def test_steady_solve_chart_data(session, rpc):
+    _add_setup(session.setup)
+    session.setup.solution_control.maximum_iterations = 4
+    session.solution.solve()
+
+    (interface_info,) = rpc.get_chart_metadata()
+    assert not interface_info.is_transient
+    assert len(interface_info.transfer_info) == 2
+    series = rpc.get_chart_series_data()
+    assert [len(s.data) for s in series] == [4, 4]
+    # The convergence series decreases with each iteration.
+    assert series[0].data == sorted(series[0].data, reverse=True)
+
+
+def test_transient_solve_streams(session, rpc):
+    _add_setup(session.setup)
+    solution_control = session.setup.solution_control
+    session.setup.analysis_control.analysis_type = "Transient"
+    solution_control.duration_option = "EndTime"
+    solution_control.time_step_size = "0.5 [s]"
+    solution_control.end_time = "1.5 [s]"
+    solution_control.maximum_iterations = 2
+
+    lines = []
+    session.start_output(lines.append)
+    session.solution.solve()
+
+    timestep_data = rpc.get_chart_timestep_data()
+    assert timestep_data.last_iterations == [1, 3, 5]
+    assert timestep_data.times == pytest.approx([0.5, 1.0, 1.5])
+
+    items = []
+    for item in rpc.stream_chart_data():
+        items.append(item)
+        if type(item).__name__ == "TimestepEndData" and item.timestep == 3:
+            break
+    rpc.cancel_stream()
+    assert type(items[0]).__name__ == "InterfaceInfo"
+    assert sum(type(item).__name__ == "SeriesData" for item in items) == 12
+
+    deadline = time.time() + 5
+    while "Coupled analysis completed" not in lines and time.time() < deadline:
+        time.sleep(0.05)
+    assert lines[0] == "Starting coupled analysis"
+    assert "Coupling step 3, time 1.5" in lines
+    assert "Coupled analysis completed" in lines
+
+
+def test_interrupt():
+    engine = FakeSystemCoupling(iteration_time=0.05)
+    with FakeSycServer(engine) as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        session = pysyc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            session.setup.solution_control.maximum_iterations = 1000
+            errors = []
+
+            def solve():
+                try:
+                    session.solution.solve()
+                except RuntimeError as e:
+                    errors.append(e)
+
+            thread = threading.Thread(target=solve)
+            thread.start()
+            time.sleep(0.2)
+            session.solution.interrupt(reason_msg="test")
+            thread.join(5)
+            assert not thread.is_alive()
+            assert "interrupted" in str(errors[0])
+        finally:
+            session.exit()
+
+
+def test_launch(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYSC_ROOT", make_fake_installation(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("AWP_ROOT", raising=False)
+    session = pysyc.launch(
+        connection_type=ConnectionType.INSECURE_LOCAL,
+        working_dir=str(tmp_path),
+        extra_args=["--fake-think-time", "0.001"],
+    )
+    try:
+        assert session.ping()
+        assert session.version == "26.1"
+        name = session.setup.add_participant(
+            participant_type="MAPDL", input_file="mapdl.scp"
+        )
+        assert session.setup.coupling_participant.get_object_names() == [name]
+    finally:
+        session.exit()
+
+
+def test_launch_output_from_pipe(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYSC_ROOT", make_fake_installation(tmp_path))
+    monkeypatch.delenv("AWP_ROOT", raising=False)
+    session = pysyc.launch(
+        connection_type=ConnectionType.INSECURE_LOCAL, working_dir=str(tmp_path)
+    )
+    try:
+        lines = []
+        session.start_output(lines.append, source="pipe")
+        session.setup.add_participant(participant_type="MAPDL", input_file="a.scp")
+        session.setup.print_setup()
+        deadline = time.time() + 10
+        while "CouplingParticipant: MAPDL-1" not in lines:
+            assert time.time() < deadline
+            time.sleep(0.05)
+        session.end_output()
+        assert lines[0] == "Setup summary"
+    finally:
+        session.exit()
+
+
+def test_output_from_pipe_requires_local_process(rpc):
+    with pytest.raises(RuntimeError, match="locally launched"):
+        rpc.start_output(print, source="pipe")
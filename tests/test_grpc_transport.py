@@ -417,6 +417,67 @@ class TestStartupAndConnectionInfo:
         # The channel should be what create_channel returns
         assert channel == self.mock_create_channel.return_value
 
+    @patch.dict(
+        os.environ,
+        {
+            "PYSYC_GRPC_KEEPALIVE_TIME_MS": "60000",
+            "PYSYC_GRPC_KEEPALIVE_TIMEOUT_MS": "20000",
+            "PYSYC_GRPC_CONTROL_KEEPALIVE_TIME_MS": "5000",
+        },
+    )
+    def test_get_server_channel_control(self):
+        """Test a control channel gets its own connection and keepalive options."""
+        info = StartupAndConnectionInfo(
+            launching=False, connection_type=ConnectionType.SECURE_LOCAL
+        )
+
+        info.get_server_channel(control=True)
+
+        options = dict(self.mock_create_channel.call_args.kwargs["grpc_options"])
+        assert options["grpc.keepalive_time_ms"] == 5000
+        assert options["grpc.keepalive_timeout_ms"] == 20000
+        assert options["grpc.use_local_subchannel_pool"] == 1
+
+    @patch("ansys.systemcoupling.core.client.grpc_transport.grpc.aio.insecure_channel")
+    def test_get_server_aio_channel(self, mock_aio_channel):
+        """Test an asyncio channel gets the same options as a synchronous one."""
+        info = StartupAndConnectionInfo(
+            launching=False, connection_type=ConnectionType.SECURE_LOCAL
+        )
+
+        info.get_server_aio_channel()
+
+        target = mock_aio_channel.call_args.args[0]
+        socket_name = f"systemcoupling-{info._options.uds_id}.sock"
+        assert target == f"unix:{Path('/tmp/uds') / socket_name}"
+        options = dict(mock_aio_channel.call_args.kwargs["options"])
+        assert options["grpc.default_authority"] == "localhost"
+        assert options["grpc.initial_reconnect_backoff_ms"] == 250
+        assert options["grpc.max_reconnect_backoff_ms"] == 1000
+
+    @patch("ansys.systemcoupling.core.client.grpc_transport.grpc.aio.insecure_channel")
+    @patch("ansys.systemcoupling.core.client.grpc_transport._find_port")
+    def test_get_server_aio_channel_wnua(self, mock_find_port, mock_aio_channel):
+        """Test an asyncio WNUA channel is checked and created as a synchronous one."""
+        mock_find_port.return_value = 8080
+        with patch("ansys.systemcoupling.core.client.grpc_transport._IS_WINDOWS", True):
+            info = StartupAndConnectionInfo(
+                launching=False,
+                connection_type=ConnectionType.WINDOWS_NAMED_USER_AUTHENTICATION,
+                port=8080,
+            )
+            info.get_server_aio_channel()
+        assert mock_aio_channel.call_args.args[0] == "127.0.0.1:8080"
+        options = dict(mock_aio_channel.call_args.kwargs["options"])
+        assert options["grpc.default_authority"] == "localhost"
+        assert options["grpc.initial_reconnect_backoff_ms"] == 250
+
+        with patch(
+            "ansys.systemcoupling.core.client.grpc_transport._IS_WINDOWS", False
+        ):
+            with pytest.raises(ValueError, match="only supported on Windows"):
+                info.get_server_aio_channel()
+
     @patch("ansys.systemcoupling.core.client.grpc_transport.LOG")
     @patch("ansys.systemcoupling.core.client.grpc_transport._find_port")
     def test_get_server_channel_insecure_warning(self, mock_find_port, mock_log):
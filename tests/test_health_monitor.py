@@ -0,0 +1,194 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import pytest
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.client.health_monitor import HealthMonitor
+from ansys.systemcoupling.core.session import Session
+from fake_syc_server import FakeSycServer, FakeSystemCoupling
+
+
+class _ScriptedPing:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        if not self.outcomes.pop(0):
+            raise RuntimeError("ping failed")
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_stall_and_recovery():
+    ping = _ScriptedPing([True, False, False, False, False, True])
+    reconnects = []
+    stalls = []
+    recoveries = []
+    monitor = HealthMonitor(
+        ping,
+        interval=1.0,
+        timeout=0.5,
+        stall_after=2,
+        reconnect=lambda: reconnects.append(1),
+    )
+    monitor.add_stall_callback(stalls.append)
+    monitor.add_recovery_callback(lambda: recoveries.append(1))
+
+    assert monitor.check()
+    assert not monitor.check()
+    assert not monitor.stalled
+    assert not monitor.check()
+    assert monitor.stalled
+    assert [str(e) for e in stalls] == ["ping failed"]
+    assert len(reconnects) == 1
+    assert not monitor.check()
+    assert not monitor.check()
+    # Reconnection is attempted once per stall_after failures.
+    assert len(reconnects) == 2
+    assert len(stalls) == 1
+    assert monitor.check()
+    assert not monitor.stalled
+    assert recoveries == [1]
+    assert ping.timeouts == [0.5] * 6
+
+    stats = monitor.snapshot()
+    assert stats["pings"] == 6
+    assert stats["failures"] == 4
+    assert stats["stalls"] == 1
+    assert stats["reconnects"] == 2
+    assert stats["rtt"]["+Inf"] == 2
+
+
+def test_callback_errors_are_contained():
+    monitor = HealthMonitor(_ScriptedPing([False]), stall_after=1)
+    monitor.add_stall_callback(lambda e: 1 / 0)
+    assert not monitor.check()
+    assert monitor.stalled
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        HealthMonitor(lambda t: None, interval=0)
+    with pytest.raises(ValueError):
+        HealthMonitor(lambda t: None, stall_after=0)
+
+
+@pytest.fixture
+def server():
+    with FakeSycServer() as server:
+        server.port = server.listen("127.0.0.1:0")
+        server.start()
+        yield server
+
+
+@pytest.fixture
+def rpc(server):
+    rpc = SycGrpc()
+    rpc.connect("127.0.0.1", server.port, ConnectionType.INSECURE_LOCAL)
+    yield rpc
+    rpc.exit()
+
+
+def test_monitor_thread(rpc):
+    monitor = rpc.start_health_monitor(interval=0.02)
+    assert rpc.health_monitor is monitor
+    _wait_for(lambda: monitor.snapshot()["pings"] >= 3)
+    rpc.stop_health_monitor()
+    assert not monitor.is_running
+    assert rpc.health_monitor is None
+    stats = monitor.snapshot()
+    assert stats["failures"] == 0
+    assert stats["rtt"]["+Inf"] == stats["pings"]
+    assert stats["last_rtt"] > 0
+
+
+def test_rebuild_channel_keeps_session(rpc):
+    session = Session(rpc)
+    participant = session.setup.add_participant(
+        participant_type="MAPDL", input_file="mapdl.scp"
+    )
+    participants = session.setup.coupling_participant
+    assert participants[participant].participant_type == "MAPDL"
+    rpc.rebuild_channel()
+    assert participants[participant].participant_type == "MAPDL"
+    session.setup.solution_control.maximum_iterations = 7
+    assert session.setup.solution_control.maximum_iterations == 7
+
+
+def test_reconnect_after_server_restart(server):
+    rpc = SycGrpc()
+    rpc.connect("127.0.0.1", server.port, ConnectionType.INSECURE_LOCAL)
+    stalled = threading.Event()
+    recovered = threading.Event()
+    engine = FakeSystemCoupling()
+    try:
+        monitor = rpc.start_health_monitor(
+            interval=0.05,
+            timeout=0.2,
+            on_stall=lambda e: stalled.set(),
+            on_recover=recovered.set,
+        )
+        _wait_for(lambda: monitor.snapshot()["pings"] >= 1)
+        server.stop()
+        assert stalled.wait(5)
+
+        with FakeSycServer(engine) as new_server:
+            new_server.listen(f"127.0.0.1:{server.port}")
+            new_server.start()
+            assert recovered.wait(10)
+            assert monitor.snapshot()["reconnects"] >= 1
+            assert rpc.GetVersion() == engine.invoke("GetVersion")
+            rpc.exit()
+    finally:
+        rpc.exit()
+
+
+def test_call_in_progress_survives_rebuild(server, rpc):
+    output = []
+    rpc.start_output(output.append)
+    server.engine.think_time = 1.0
+    result = {}
+    call = threading.Thread(target=lambda: result.update(version=rpc.GetVersion()))
+    call.start()
+    # Pings cannot meet the deadline, so the monitor rebuilds the channel.
+    monitor = rpc.start_health_monitor(interval=0.05, timeout=1.0e-6, stall_after=1)
+    _wait_for(lambda: monitor.snapshot()["reconnects"] >= 1)
+    rpc.stop_health_monitor()
+    call.join(10)
+    assert result["version"] == server.engine.invoke("GetVersion")
+    server.engine.think_time = 0.0
+    server.engine.write("after rebuild")
+    _wait_for(lambda: "after rebuild" in output)
+    assert rpc.GetVersion() == result["version"]
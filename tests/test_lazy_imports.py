@@ -0,0 +1,66 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import subprocess
+import sys
+
+# Modules only needed by ``show_plot``, ``solve_with_plot`` and PIM launches.
+_DEFERRED_MODULES = (
+    "matplotlib",
+    "ansys.platform.instancemanagement",
+    "ansys.systemcoupling.core.charts.plot_functions",
+    "ansys.systemcoupling.core.charts.plotter",
+)
+
+_SCRIPT = f"""
+import sys
+
+import ansys.systemcoupling.core as pysyc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from fake_syc_server import FakeSycServer
+
+with FakeSycServer() as server:
+    port = server.listen("127.0.0.1:0")
+    server.start()
+    session = pysyc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+    session.setup.solution_control.maximum_iterations = 7
+    session.setup.solution_control.get_state()
+    session.solution
+    print([name for name in {_DEFERRED_MODULES!r} if name in sys.modules])
+    session.exit()
+"""
+
+
+def test_deferred_modules_not_imported_by_setup():
+    path = [os.path.dirname(__file__), os.environ.get("PYTHONPATH")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, path)))
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    ).stdout
+    assert out.splitlines()[-1] == "[]"
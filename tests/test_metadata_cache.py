@@ -0,0 +1,231 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import gzip
+import os
+
+from ansys.api.systemcoupling.v0 import variant_pb2
+
+from ansys.systemcoupling.core.adaptor.impl import (
+    injected_cmd_data_cosim,
+    injected_commands_cosim,
+    metadata_cache,
+    metadata_repository,
+)
+from ansys.systemcoupling.core.adaptor.impl.metadata_cache import (
+    MetadataCache,
+    get_compiled,
+    metadata_fingerprint,
+)
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.client.variant import from_variant, to_variant
+from ansys.systemcoupling.core.session import Session
+from fake_syc_server import FakeSycServer
+
+_METADATA_QUERIES = {
+    "GetMetadata",
+    "GetPySycDatamodelMetadata",
+    "GetPySycCommandMetadata",
+}
+
+
+def _cache(fingerprint="abc", **kwargs):
+    return MetadataCache("25.2", "cosim", fingerprint, **kwargs)
+
+
+def test_store_and_load(metadata_cache_dir):
+    _cache().store("commands", [{"name": "Solve", "args": [["A", {}]]}])
+    assert _cache().load("commands") == [{"name": "Solve", "args": [["A", {}]]}]
+    assert _cache().load("datamodel") is None
+    assert _cache(fingerprint="other").load("commands") is None
+    assert MetadataCache("26.1", "cosim", "abc").load("commands") is None
+
+
+def test_get_computes_once():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"SystemCoupling": {}}
+
+    assert _cache().get("datamodel", compute) == {"SystemCoupling": {}}
+    assert _cache().get("datamodel", compute) == {"SystemCoupling": {}}
+    assert len(calls) == 1
+
+
+def test_unreadable_entry_is_replaced(metadata_cache_dir):
+    _cache().store("commands", ["original"])
+    (path,) = os.listdir(metadata_cache_dir)
+    with open(os.path.join(metadata_cache_dir, path), "wb") as f:
+        f.write(gzip.compress(b"{not json"))
+    assert _cache().load("commands") is None
+    assert _cache().get("commands", lambda: ["recomputed"]) == ["recomputed"]
+    assert _cache().load("commands") == ["recomputed"]
+
+
+def test_prebuilt(tmp_path, monkeypatch, metadata_cache_dir):
+    prebuilt = str(tmp_path / "prebuilt")
+    _cache().write_prebuilt("commands", ["prebuilt"], prebuilt)
+    # Prebuilt entries are shipped with the package that generated them.
+    monkeypatch.setattr(metadata_cache, "_client_version", lambda: "other")
+    assert _cache(prebuilt_directory=prebuilt).load("commands") == ["prebuilt"]
+    assert (
+        _cache(fingerprint="other", prebuilt_directory=prebuilt).load("commands")
+        is None
+    )
+    # An entry in the user cache directory is used before a prebuilt entry.
+    _cache().store("commands", ["cached"])
+    assert _cache(prebuilt_directory=prebuilt).load("commands") == ["cached"]
+    assert not os.path.exists(os.path.join(metadata_cache_dir, "prebuilt"))
+
+
+def test_disabled(monkeypatch, metadata_cache_dir):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    _cache().store("commands", ["data"])
+    assert _cache().load("commands") is None
+    assert not os.path.exists(metadata_cache_dir)
+
+
+def test_compiled_once():
+    calls = []
+
+    def compute(source):
+        calls.append(source)
+        return source.split()
+
+    assert get_compiled("words", "a b", compute) == ["a", "b"]
+    assert get_compiled("words", "a b", compute) == ["a", "b"]
+    assert calls == ["a b"]
+    assert get_compiled("words", "a b c", compute) == ["a", "b", "c"]
+    assert calls == ["a b", "a b c"]
+
+
+def test_compiled_disabled(monkeypatch):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    calls = []
+
+    def compute(source):
+        calls.append(source)
+        return source.upper()
+
+    assert get_compiled("upper", "x", compute) == "X"
+    assert get_compiled("upper", "x", compute) == "X"
+    assert calls == ["x", "x"]
+
+
+def test_generated_injected_cmd_data_up_to_date():
+    source = injected_commands_cosim.get_injected_cmd_source()
+    assert injected_cmd_data_cosim.SOURCE_HASH == (
+        injected_commands_cosim.hash_cmd_source(source)
+    ), "Regenerate with 'python scripts/generate_datamodel.py -i'."
+    assert injected_cmd_data_cosim.DATA == injected_commands_cosim._parse_cmd_yaml(
+        source
+    )
+
+
+def test_out_of_date_injected_cmd_data_parsed(monkeypatch):
+    monkeypatch.setattr(injected_cmd_data_cosim, "SOURCE_HASH", "stale")
+    monkeypatch.setattr(injected_cmd_data_cosim, "DATA", [])
+    monkeypatch.setattr(injected_commands_cosim.get_injected_cmd_data, "data", None)
+    data = injected_commands_cosim.get_injected_cmd_data()
+    assert data == injected_commands_cosim._parse_cmd_yaml(
+        injected_commands_cosim.get_injected_cmd_source()
+    )
+
+
+def test_fingerprint_identifies_metadata():
+    metadata = [{"name": "Solve", "args": [], "isQuery": False}]
+    assert metadata_fingerprint(metadata) == metadata_fingerprint(
+        [{"isQuery": False, "args": [], "name": "Solve"}]
+    )
+    assert metadata_fingerprint(metadata) != metadata_fingerprint(
+        [{"name": "Solve", "args": [], "isQuery": True}]
+    )
+    assert metadata_fingerprint(metadata, {"a": 1}) != metadata_fingerprint(
+        metadata, {"a": 2}
+    )
+
+
+def test_fingerprint_of_lazy_views():
+    value = {"SystemCoupling": {"doc": "Root", "items": [1, {"a": "b"}]}}
+    var = variant_pb2.Variant()
+    to_variant(value, var)
+    assert metadata_fingerprint(from_variant(var, lazy=True)) == (
+        metadata_fingerprint(value)
+    )
+
+
+def _session_queries():
+    # Exiting the session stops the server, so each session has its own.
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            with rpc.trace_rpcs() as trace:
+                session = Session(rpc)
+                session.setup.solution_control.maximum_iterations = 7
+                session.case
+                state = session.setup.solution_control.get_state()
+            return {record.command for record in trace.records}, state
+        finally:
+            rpc.exit()
+
+
+def test_second_session_uses_cache(monkeypatch, metadata_cache_dir):
+    queries, state = _session_queries()
+    assert _METADATA_QUERIES <= queries
+    # The API classes are created from the cache in the second session, so
+    # the queried metadata is not processed.
+    assert any("-classes-setup-" in name for name in os.listdir(metadata_cache_dir))
+
+    def not_processed(*args, **kwargs):
+        raise AssertionError("metadata processed")
+
+    for name in ("get_dm_metadata", "get_extended_cmd_metadata"):
+        monkeypatch.setattr(metadata_repository, name, not_processed)
+    cached_queries, cached_state = _session_queries()
+    assert cached_state == state
+    # Only the metadata needed to identify the server build is queried.
+    assert not _METADATA_QUERIES & cached_queries
+    assert "GetCommandAndQueryMetadata" in cached_queries
+
+
+def test_session_uses_prebuilt(tmp_path, monkeypatch, metadata_cache_dir):
+    prebuilt = str(tmp_path / "prebuilt")
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            paths = metadata_repository.MetadataRepository(rpc).write_prebuilt(prebuilt)
+        finally:
+            rpc.exit()
+    assert len(paths) == 5
+    monkeypatch.setattr(metadata_cache, "_PREBUILT_DIR", prebuilt)
+    monkeypatch.setenv("PYSYC_METADATA_CACHE_DIR", str(tmp_path / "empty"))
+    queries, _ = _session_queries()
+    assert not _METADATA_QUERIES & queries
@@ -0,0 +1,186 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import Counter
+import copy
+import hashlib
+import json
+
+from ansys.api.systemcoupling.v0 import variant_pb2
+import pytest
+
+from ansys.systemcoupling.core.adaptor.impl import metadata_cache, metadata_repository
+from ansys.systemcoupling.core.adaptor.impl.metadata_repository import (
+    MetadataRepository,
+)
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.client.variant import to_variant
+from ansys.systemcoupling.core.session import Session
+from ansys.systemcoupling.core.types import SystemCouplingMode
+from fake_syc_server import FakeSycServer
+
+_METADATA_QUERIES = (
+    "GetMetadata",
+    "GetPySycDatamodelMetadata",
+    "GetCommandAndQueryMetadata",
+    "GetPySycCommandMetadata",
+    "GetVersion",
+)
+
+
+@pytest.fixture
+def rpc():
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        yield rpc
+
+
+@pytest.mark.parametrize("cache", ["enabled", "disabled"])
+def test_session_queries_metadata_once(monkeypatch, rpc, cache):
+    if cache == "disabled":
+        monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    with rpc.trace_rpcs() as trace:
+        session = Session(rpc)
+        session.setup.solution_control.maximum_iterations = 7
+        session.case
+        session.solution
+        session._native_api.SolutionControl.MaximumIterations
+        session.setup.solution_control.get_state()
+    counts = Counter(record.command for record in trace.records)
+    for query in _METADATA_QUERIES:
+        assert counts[query] <= 1, query
+    session.exit()
+
+
+def test_queried_metadata_is_not_modified(monkeypatch, rpc):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    repository = MetadataRepository(rpc)
+    raw_cmd_metadata = copy.deepcopy(repository.query("GetCommandAndQueryMetadata"))
+    repository.static_info("setup")
+    repository.static_info("case")
+    repository.native_cmd_metadata()
+    assert repository.query("GetCommandAndQueryMetadata") == raw_cmd_metadata
+    rpc.exit()
+
+
+def test_unknown_category(rpc):
+    with pytest.raises(RuntimeError):
+        MetadataRepository(rpc).static_info("unknown")
+    rpc.exit()
+
+
+def test_setup_static_info_shares_datamodel_metadata(rpc):
+    repository = MetadataRepository(rpc)
+    info, root_type = repository.static_info("setup")
+    dm_metadata = repository.datamodel_metadata()
+    assert info[root_type]["__children"] is dm_metadata[root_type]["__children"]
+    assert "__commands" in info[root_type]
+    assert "__commands" not in dm_metadata[root_type]
+    rpc.exit()
+
+
+class _RawMetadataRpc:
+    """Mock rpc providing the raw metadata queries."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.queries = []
+
+    def GetMetadata(self, json_ret):
+        self.queries.append("GetMetadata")
+        return {"SystemCoupling": {"__parameters": {}}}
+
+    def GetPySycDatamodelMetadata(self, lazy_result=False):
+        self.queries.append("GetPySycDatamodelMetadata")
+        return {"SystemCoupling": {"doc": self.doc}}
+
+    def GetCommandAndQueryMetadata(self):
+        self.queries.append("GetCommandAndQueryMetadata")
+        return [{"name": "Solve", "args": [], "isQuery": False}]
+
+    def GetPySycCommandMetadata(self):
+        self.queries.append("GetPySycCommandMetadata")
+        return {"Solve": {"doc": "Solve.", "args": []}}
+
+
+def test_fingerprint_identifies_server_build(monkeypatch):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    rpc = _RawMetadataRpc("Root.")
+    repository = MetadataRepository(rpc)
+    fingerprint = repository.fingerprint()
+    assert rpc.queries == ["GetCommandAndQueryMetadata"]
+    # Only the data model documentation differs, which the static info hash
+    # covers but the fingerprint does not.
+    other = MetadataRepository(_RawMetadataRpc("Other."))
+    assert other.fingerprint() == fingerprint
+    assert other.static_info_hash("setup") != repository.static_info_hash("setup")
+
+
+def test_static_info_hash(monkeypatch, rpc):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    hashes = [MetadataRepository(rpc).static_info_hash(c) for c in ("setup", "case")]
+    assert MetadataRepository(rpc).static_info_hash("setup") == hashes[0]
+    assert hashes[0] != hashes[1]
+    rpc.exit()
+
+
+def test_static_info_hash_independent_of_processing(monkeypatch, rpc):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    before = MetadataRepository(rpc).static_info_hash("setup")
+    # The data model processing modifies the raw GetMetadata result.
+    repository = MetadataRepository(rpc)
+    repository.static_info("setup")
+    assert repository.static_info_hash("setup") == before
+    rpc.exit()
+
+
+def test_digest_of_received_result(rpc):
+    result, digest = rpc.execute_command_with_digest("GetMetadata", json_ret=True)
+    assert result == rpc.GetMetadata(json_ret=True)
+    var = variant_pb2.Variant()
+    to_variant(json.dumps(result), var)
+    assert digest == hashlib.sha256(var.SerializeToString()).hexdigest()
+    rpc.exit()
+
+
+def test_static_info_hash_from_received_metadata(monkeypatch, rpc):
+    monkeypatch.setenv("PYSYC_DISABLE_METADATA_CACHE", "1")
+    hashes = {c: MetadataRepository(rpc).static_info_hash(c) for c in ("setup", "case")}
+
+    def not_serialized(*args):
+        raise AssertionError("metadata serialized")
+
+    # The hash does not depend on the format of the metadata cache, and the
+    # received metadata is not serialized again to obtain it.
+    monkeypatch.setattr(metadata_cache, "_CACHE_FORMAT", 99)
+    monkeypatch.setattr(metadata_repository, "metadata_fingerprint", not_serialized)
+    repository = MetadataRepository(rpc)
+    assert {c: repository.static_info_hash(c) for c in hashes} == hashes
+    # Without injected commands, the API classes differ.
+    other = MetadataRepository(rpc, SystemCouplingMode.FILEIO)
+    assert other.static_info_hash("case") != hashes["case"]
+    rpc.exit()
@@ -0,0 +1,232 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import pytest
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.client.output_pipeline import (
+    FileSink,
+    LineAssembler,
+    OutputPipeline,
+    OutputSink,
+    RingBufferSink,
+    RotatingFileSink,
+)
+from fake_syc_server import FakeSycServer
+
+
+def test_line_assembly():
+    assembler = LineAssembler()
+    assert assembler.feed("ab") == []
+    assert assembler.feed("c") == []
+    assert assembler.feed("d\ne") == ["abcd"]
+    assert assembler.feed("\n\nf\ng") == ["e", "", "f"]
+    assert assembler.feed("") == []
+    assert assembler.flush() == ["g"]
+    assert assembler.flush() == []
+
+
+def test_pipeline_per_line():
+    lines = []
+    pipeline = OutputPipeline(lines.append)
+    pipeline.put_text("one\ntw")
+    pipeline.put_text("o\nthree")
+    pipeline.close()
+    assert lines == ["one", "two", "three"]
+
+
+def test_pipeline_batches():
+    batches = []
+    pipeline = OutputPipeline(batches.append, batch=True, max_batch_size=4)
+    pipeline.put_lines([str(i) for i in range(10)])
+    pipeline.close()
+    assert [line for batch in batches for line in batch] == [str(i) for i in range(10)]
+    assert all(len(batch) <= 4 for batch in batches)
+
+
+class _SlowHandler:
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.lines = []
+
+    def __call__(self, lines):
+        self.entered.set()
+        self.release.wait()
+        self.lines.extend(lines)
+
+
+@pytest.mark.parametrize(
+    "overflow, expected",
+    [
+        ("drop_oldest", ["0", "7", "8", "9"]),
+        ("drop_newest", ["0", "1", "2", "3"]),
+    ],
+)
+def test_pipeline_drops(overflow, expected):
+    handler = _SlowHandler()
+    pipeline = OutputPipeline(
+        handler, batch=True, max_queued_lines=3, overflow=overflow
+    )
+    pipeline.put_lines(["0"])
+    # Wait for the dispatcher to take the first line and block in the handler.
+    assert handler.entered.wait(5)
+    pipeline.put_lines([str(i) for i in range(1, 10)])
+    assert pipeline.dropped == 6
+    handler.release.set()
+    pipeline.close()
+    assert handler.lines == expected
+
+
+def test_pipeline_blocks():
+    handler = _SlowHandler()
+    pipeline = OutputPipeline(handler, batch=True, max_queued_lines=2)
+    writer = threading.Thread(
+        target=pipeline.put_lines, args=([str(i) for i in range(10)],)
+    )
+    writer.start()
+    writer.join(0.2)
+    # The writer waits for the handler to make space.
+    assert writer.is_alive()
+    handler.release.set()
+    writer.join(5)
+    pipeline.close()
+    assert handler.lines == [str(i) for i in range(10)]
+    assert pipeline.dropped == 0
+
+
+def test_pipeline_blocked_writer_closed():
+    handler = _SlowHandler()
+    pipeline = OutputPipeline(handler, batch=True, max_queued_lines=2)
+    writer = threading.Thread(
+        target=pipeline.put_lines, args=([str(i) for i in range(10)],)
+    )
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()
+    closer = threading.Thread(target=pipeline.close)
+    closer.start()
+    writer.join(5)
+    # The writer gives up once the pipeline is closed.
+    assert not writer.is_alive()
+    handler.release.set()
+    closer.join(5)
+    assert len(handler.lines) < 10
+    assert handler.lines == [str(i) for i in range(len(handler.lines))]
+
+
+def test_pipeline_handler_error():
+    lines = []
+
+    def handler(line):
+        if line == "bad":
+            raise ValueError(line)
+        lines.append(line)
+
+    pipeline = OutputPipeline(handler)
+    pipeline.put_lines(["a", "bad"])
+    pipeline.put_lines(["b"])
+    pipeline.close()
+    assert lines == ["a", "b"]
+
+
+def test_invalid_overflow():
+    with pytest.raises(ValueError, match="overflow"):
+        OutputPipeline(print, overflow="discard")
+
+
+def test_file_sink(tmp_path):
+    path = tmp_path / "out.txt"
+    sink = FileSink(str(path))
+    sink(["a", "b"])
+    sink(["c"])
+    sink.close()
+    assert path.read_text() == "a\nb\nc\n"
+
+
+def test_rotating_file_sink(tmp_path):
+    path = tmp_path / "out.txt"
+    sink = RotatingFileSink(str(path), max_bytes=10, backup_count=2)
+    for i in range(5):
+        sink([f"line{i}"])
+    sink.close()
+    assert path.read_text() == "line4\n"
+    assert (tmp_path / "out.txt.1").read_text() == "line3\n"
+    assert (tmp_path / "out.txt.2").read_text() == "line2\n"
+    assert not (tmp_path / "out.txt.3").exists()
+
+
+def test_sink_is_batch_handler(tmp_path):
+    path = tmp_path / "out.txt"
+    pipeline = OutputPipeline(FileSink(str(path)))
+    pipeline.put_lines(["first line", "second line"])
+    pipeline.close()
+    assert path.read_text() == "first line\nsecond line\n"
+
+
+def test_rotating_file_sink_counts_bytes(tmp_path):
+    path = tmp_path / "out.txt"
+    sink = RotatingFileSink(str(path), max_bytes=10, backup_count=1)
+    # Each line is 4 characters, but 6 bytes, in UTF-8.
+    for line in ("aéé", "béé"):
+        sink([line])
+    sink.close()
+    assert path.read_text(encoding="utf-8") == "béé\n"
+    assert (tmp_path / "out.txt.1").read_text(encoding="utf-8") == "aéé\n"
+
+
+def test_output_sink_is_abstract():
+    with pytest.raises(TypeError):
+        OutputSink()
+
+
+def test_ring_buffer_sink():
+    sink = RingBufferSink(3)
+    sink(["a", "b"])
+    sink(["c", "d"])
+    assert sink.lines() == ["b", "c", "d"]
+    assert sink.text() == "b\nc\nd"
+
+
+def test_start_output_batches():
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            sink = RingBufferSink(100)
+            rpc.start_output(sink, batch=True)
+            rpc.PrintSetup()
+            rpc.solve()
+            deadline = time.time() + 5
+            while "Coupled analysis completed" not in sink.lines():
+                assert time.time() < deadline
+                time.sleep(0.05)
+            assert sink.lines()[0] == "Setup summary"
+        finally:
+            rpc.exit()
@@ -0,0 +1,185 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
+import grpc
+import pytest
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.client.rpc_compression import (
+    CompressionInterceptor,
+    CompressionPolicy,
+)
+from ansys.systemcoupling.core.client.variant import to_variant
+from ansys.systemcoupling.core.session import Session
+from fake_syc_server import FakeSycServer
+
+_COMMAND_METHOD = "/ansys.api.systemcoupling.v0.Command/InvokeCommand"
+
+
+class _CallDetails:
+    def __init__(self):
+        self.method = _COMMAND_METHOD
+        self.timeout = 10.0
+        self.metadata = [("key", "value")]
+        self.credentials = None
+        self.wait_for_ready = None
+        self.compression = None
+
+
+def _intercept(policy, payload_size=0):
+    request = command_pb2.CommandRequest(command="SetState")
+    arg = request.args.add()
+    arg.name = "State"
+    to_variant("x" * payload_size, arg.val)
+    calls = []
+    CompressionInterceptor(policy).intercept_unary_unary(
+        lambda details, request: calls.append(details), _CallDetails(), request
+    )
+    return calls[0]
+
+
+def test_none_leaves_calls_unchanged():
+    details = _intercept(CompressionPolicy(), payload_size=100000)
+    assert isinstance(details, _CallDetails)
+
+
+@pytest.mark.parametrize(
+    "mode, algorithm",
+    [("gzip", grpc.Compression.Gzip), ("deflate", grpc.Compression.Deflate)],
+)
+def test_explicit_algorithm(mode, algorithm):
+    details = _intercept(CompressionPolicy(mode))
+    assert details.compression == algorithm
+    assert details.method == _COMMAND_METHOD
+    assert details.timeout == 10.0
+    assert details.metadata == (
+        ("key", "value"),
+        ("syc-response-compression", mode),
+    )
+
+
+def test_auto_compresses_large_requests():
+    policy = CompressionPolicy("auto", threshold=1000)
+    assert _intercept(policy, payload_size=10).compression is None
+    assert _intercept(policy, payload_size=2000).compression == grpc.Compression.Gzip
+    assert _intercept(policy, payload_size=10).metadata[1:] == (
+        ("syc-response-compression", "auto"),
+        ("syc-response-compression-threshold", "1000"),
+    )
+
+
+def test_auto_sizes_only_large_candidates(monkeypatch):
+    sized = []
+    byte_size = command_pb2.CommandRequest.ByteSize
+    monkeypatch.setattr(
+        command_pb2.CommandRequest,
+        "ByteSize",
+        lambda self: sized.append(self.command) or byte_size(self),
+    )
+    policy = CompressionPolicy("auto", threshold=1000)
+    request = command_pb2.CommandRequest(command="GetState")
+    arg = request.args.add()
+    arg.name = "ObjectPath"
+    to_variant("/SystemCoupling/Solution", arg.val)
+    assert policy.algorithm(request) is None
+    assert policy.algorithm(command_pb2.CommandRequest(command="Solve")) is None
+    assert sized == []
+    assert _intercept(policy, payload_size=300).compression is None
+    assert sized == ["SetState"]
+
+
+def test_override_applies_to_current_thread_only():
+    policy = CompressionPolicy("none")
+    seen = []
+    with policy.override("gzip"):
+        seen.append(policy.current_mode())
+        thread = threading.Thread(target=lambda: seen.append(policy.current_mode()))
+        thread.start()
+        thread.join()
+    seen.append(policy.current_mode())
+    assert seen == ["gzip", "none", "none"]
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        CompressionPolicy("brotli")
+    policy = CompressionPolicy()
+    with pytest.raises(ValueError):
+        policy.set("zstd")
+    with pytest.raises(ValueError):
+        with policy.override("lz4"):
+            pass
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("PYSYC_GRPC_COMPRESSION", "auto")
+    monkeypatch.setenv("PYSYC_GRPC_COMPRESSION_THRESHOLD", "4096")
+    policy = CompressionPolicy.from_env()
+    assert (policy.mode, policy.threshold) == ("auto", 4096)
+
+
+def test_response_compression_requested():
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            rpc.GetState(ObjectPath="/SystemCoupling")
+            assert server.engine.compressed_responses == 0
+            rpc.set_compression("auto", threshold=1 << 20)
+            rpc.GetState(ObjectPath="/SystemCoupling")
+            assert server.engine.compressed_responses == 0
+            rpc.set_compression("auto", threshold=16)
+            rpc.GetState(ObjectPath="/SystemCoupling")
+            assert server.engine.compressed_responses == 1
+        finally:
+            rpc.exit()
+
+
+@pytest.mark.parametrize("mode", ["none", "gzip", "deflate", "auto"])
+def test_session_with_compression(mode):
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            session = Session(rpc)
+            session.set_compression(mode, threshold=16)
+            setup = session.setup
+            setup.add_participant(participant_type="MAPDL", input_file="mapdl.scp")
+            state = setup.get_state()
+            assert list(state["coupling_participant"]) == ["MAPDL-1"]
+            compressed = server.engine.compressed_responses
+            with session.call_compression("gzip"):
+                assert setup.get_state() == state
+                rpc.GetState(ObjectPath="/SystemCoupling")
+            assert server.engine.compressed_responses == compressed + 1
+            assert rpc.compression.mode == mode
+        finally:
+            rpc.exit()
@@ -0,0 +1,130 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+import ansys.api.systemcoupling.v0.output_stream_pb2 as output_stream_pb2
+import pytest
+
+from ansys.systemcoupling.core.client import grpc_client
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.output_pipeline import OutputPipeline
+from ansys.systemcoupling.core.client.rpc_metrics import (
+    RpcMetrics,
+    stats_to_json,
+    stats_to_prometheus,
+    write_prometheus_textfile,
+)
+from ansys.systemcoupling.core.session import Session
+
+
+def _invoke(command, **kwargs):
+    if command == "Fail":
+        raise RuntimeError("Failed as requested.")
+    return "x" * 100
+
+
+@pytest.fixture
+def rpc(monkeypatch, connect_fake_rpc):
+    monkeypatch.setattr(grpc_client, "RPC_METRICS_ENABLED", True)
+    return connect_fake_rpc(_invoke, output_lines=["line"] * 3)
+
+
+def test_command_metrics(rpc):
+    with rpc.pipeline() as p:
+        p.GetState(ObjectPath="/SystemCoupling")
+    for _ in range(3):
+        rpc.GetState(ObjectPath="/SystemCoupling")
+    with pytest.raises(RuntimeError):
+        rpc.Fail()
+
+    stats = rpc.rpc_metrics.snapshot()
+    get_state = stats["InvokeCommand.GetState"]
+    assert get_state["count"] == 4
+    assert get_state["errors"] == 0
+    assert get_state["request_bytes"] > 0
+    assert get_state["response_bytes"] >= 4 * 100
+    assert get_state["latency"]["+Inf"] == 4
+    assert stats["InvokeCommand.Fail"]["errors"] == 1
+
+
+def test_stream_metrics(rpc):
+    lines = []
+    rpc._read_stdstreams(OutputPipeline(lines.append))
+    assert lines == ["line"] * 3
+    stats = rpc.rpc_metrics.snapshot()["OutputStream.BeginStdStreaming"]
+    assert stats["count"] == 1
+    assert stats["errors"] == 0
+    assert stats["response_bytes"] == 3 * len(
+        output_stream_pb2.StdStreamResponse(text="line\n").SerializeToString()
+    )
+
+
+def test_session_rpc_stats(rpc):
+    session = Session(rpc)
+    rpc.GetState(ObjectPath="/SystemCoupling")
+    assert session.rpc_stats()["InvokeCommand.GetState"]["count"] == 1
+
+
+def test_session_rpc_stats_disabled(monkeypatch):
+    monkeypatch.setattr(grpc_client, "RPC_METRICS_ENABLED", False)
+    with pytest.raises(RuntimeError, match="PYSYC_RPC_METRICS"):
+        Session(SycGrpc()).rpc_stats()
+
+
+def test_histogram_buckets():
+    metrics = RpcMetrics()
+    metrics.record("A", 0.0005, 10, 20)
+    metrics.record("A", 0.2, 10, 20)
+    metrics.record("A", 100.0, 10, 20, ok=False)
+    stats = metrics.snapshot()["A"]
+    assert stats["count"] == 3
+    assert stats["errors"] == 1
+    assert stats["request_bytes"] == 30
+    assert stats["latency"]["0.001"] == 1
+    assert stats["latency"]["0.25"] == 2
+    assert stats["latency"]["10.0"] == 2
+    assert stats["latency"]["+Inf"] == 3
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_exporters(tmp_path):
+    metrics = RpcMetrics()
+    metrics.record("InvokeCommand.GetState", 0.002, 10, 20)
+    stats = metrics.snapshot()
+
+    assert json.loads(stats_to_json(stats)) == stats
+
+    text = stats_to_prometheus(stats)
+    assert "# TYPE pysyc_rpc_latency_seconds histogram" in text
+    assert 'pysyc_rpc_calls_total{method="InvokeCommand.GetState"} 1' in text
+    assert (
+        'pysyc_rpc_latency_seconds_bucket{method="InvokeCommand.GetState",le="+Inf"} 1'
+        in text
+    )
+
+    path = tmp_path / "syc.prom"
+    write_prometheus_textfile(stats, str(path))
+    assert path.read_text() == text
+    assert [p.name for p in tmp_path.iterdir()] == ["syc.prom"]
@@ -0,0 +1,158 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+import ansys.api.systemcoupling.v0.command_pb2 as command_pb2
+import ansys.api.systemcoupling.v0.command_pb2_grpc as command_pb2_grpc
+import grpc
+import pytest
+
+from ansys.systemcoupling.core.client import grpc_client
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.rpc_replay import (
+    ReplayChannel,
+    ReplayMismatchError,
+    load_trace,
+)
+
+
+def _invoke(command, **kwargs):
+    if command == "Fail":
+        raise RuntimeError("Failed as requested.")
+    time.sleep(kwargs.get("Sleep", 0))
+    return {"command": command, **kwargs}
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch, connect_fake_rpc):
+    """Record a session against a local server and return the trace file."""
+    path = str(tmp_path / "session.pysyctrace")
+    monkeypatch.setattr(grpc_client, "_RPC_RECORD_FILE", path)
+    rpc = connect_fake_rpc(_invoke, output_lines=[f"line {i}" for i in range(3)])
+
+    assert rpc.GetState(ObjectPath="/A") == {"command": "GetState", "ObjectPath": "/A"}
+    rpc.SetState(ObjectPath="/A", State={"x": 1}, Sleep=0.2)
+    assert rpc.GetState(ObjectPath="/B")["ObjectPath"] == "/B"
+    with pytest.raises(RuntimeError, match="Failed as requested"):
+        rpc.Fail()
+    output = []
+    rpc.start_output(output.append)
+    rpc._SycGrpc__output_thread.join()
+    assert output == ["line 0", "line 1", "line 2"]
+
+    rpc.exit()
+    return path
+
+
+@pytest.fixture
+def replay():
+    instances = []
+
+    def connect(trace, **kwargs):
+        rpc = SycGrpc()
+        instances.append(rpc)
+        rpc.connect_replay(trace, **kwargs)
+        return rpc
+
+    yield connect
+    for rpc in instances:
+        rpc.exit()
+
+
+def test_trace_file_contents(trace_file):
+    calls = load_trace(trace_file)
+    assert [c["method"].rpartition("/")[2] for c in calls] == [
+        "InvokeCommand",
+        "InvokeCommand",
+        "InvokeCommand",
+        "InvokeCommand",
+        "BeginStdStreaming",
+    ]
+    assert [c["code"] for c in calls] == ["OK", "OK", "OK", "INTERNAL", "OK"]
+    assert calls[1]["seconds"] >= 0.2
+    assert len(calls[4]["responses"]) == 3
+
+
+def test_replay(trace_file, replay):
+    rpc = replay(trace_file)
+    generation = rpc.state_generation
+    assert rpc.GetState(ObjectPath="/A") == {"command": "GetState", "ObjectPath": "/A"}
+    # The recorded trailing metadata marks the query as not state changing.
+    assert rpc.state_generation == generation
+    start = time.perf_counter()
+    rpc.SetState(ObjectPath="/A", State={"x": 1}, Sleep=0.2)
+    assert time.perf_counter() - start < 0.2
+    assert rpc.state_generation == generation + 1
+    assert rpc.GetState(ObjectPath="/B")["ObjectPath"] == "/B"
+    with pytest.raises(RuntimeError, match="Failed as requested"):
+        rpc.Fail()
+    output = []
+    rpc.start_output(output.append)
+    rpc._SycGrpc__output_thread.join()
+    assert output == ["line 0", "line 1", "line 2"]
+
+
+def test_replay_matches_requests(trace_file, replay):
+    rpc = replay(trace_file)
+    # Out of order, but matched by request.
+    assert rpc.GetState(ObjectPath="/B")["ObjectPath"] == "/B"
+    assert rpc.GetState(ObjectPath="/A")["ObjectPath"] == "/A"
+
+
+def test_replay_falls_back_to_method_order(trace_file):
+    rpc = SycGrpc()
+    channel = rpc.connect_replay(trace_file)
+    assert rpc.GetState(ObjectPath="/C")["ObjectPath"] == "/A"
+    assert channel.mismatches == 1
+    rpc.exit()
+
+
+def test_strict_replay(trace_file, replay):
+    rpc = replay(trace_file, strict=True)
+    with pytest.raises(ReplayMismatchError):
+        rpc.GetState(ObjectPath="/C")
+
+
+def test_replay_exhausted(trace_file, replay):
+    rpc = replay(trace_file)
+    for _ in range(4):
+        rpc._submit_command("GetState", ObjectPath="/D")
+    with pytest.raises(ReplayMismatchError, match="No more recorded calls"):
+        rpc.GetState(ObjectPath="/D")
+
+
+def test_replay_think_time(trace_file, replay):
+    rpc = replay(trace_file, time_scale=1.0)
+    start = time.perf_counter()
+    rpc.SetState(ObjectPath="/A", State={"x": 1}, Sleep=0.2)
+    assert time.perf_counter() - start >= 0.2
+
+
+def test_replay_channel_from_calls(trace_file):
+    channel = ReplayChannel(load_trace(trace_file))
+    stub = command_pb2_grpc.CommandStub(channel)
+    request = command_pb2.CommandRequest(command="Fail")
+    future = stub.InvokeCommand.future(request)
+    assert future.done()
+    assert future.exception().code() == grpc.StatusCode.INTERNAL
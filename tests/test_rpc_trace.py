@@ -0,0 +1,159 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.systemcoupling.core.client.rpc_trace import RpcTrace, _split_child
+
+_INTF = "/SystemCoupling/CouplingInterface:intf"
+
+
+@pytest.fixture
+def rpc(connect_fake_rpc):
+    return connect_fake_rpc(lambda command, Name=None, **kwargs: Name)
+
+
+def test_split_child():
+    assert _split_child(f"{_INTF}/DataTransfer:t1") == (
+        f"{_INTF}/DataTransfer",
+        "t1",
+        "",
+    )
+    assert _split_child(f"{_INTF}/DataTransfer:t1/Stabilization") == (
+        f"{_INTF}/DataTransfer",
+        "t1",
+        "/Stabilization",
+    )
+    assert _split_child("/SystemCoupling/SolutionControl") is None
+
+
+def test_trace_records_call_site(rpc):
+    with rpc.trace_rpcs() as trace:
+        rpc.GetParameter(ObjectPath=_INTF, Name="DisplayName")
+    rpc.GetParameter(ObjectPath=_INTF, Name="DisplayName")
+
+    (record,) = trace.records
+    assert record.command == "GetParameter"
+    assert record.object_path == _INTF
+    assert record.name == "DisplayName"
+    assert record.call_site.filename == __file__
+    assert record.call_site.function == "test_trace_records_call_site"
+    assert record.seconds > 0
+
+
+def test_nested_trace_is_shared(rpc):
+    with rpc.trace_rpcs() as outer:
+        with rpc.trace_rpcs() as inner:
+            rpc.GetState(ObjectPath=_INTF)
+        rpc.GetState(ObjectPath=_INTF)
+    assert inner is outer
+    assert len(outer.records) == 2
+
+
+def test_pipelined_calls_are_traced(rpc):
+    with rpc.trace_rpcs() as trace:
+        with rpc.pipeline() as p:
+            for i in range(3):
+                p.GetState(ObjectPath=f"{_INTF}/DataTransfer:t{i}")
+    assert [r.object_path for r in trace.records] == [
+        f"{_INTF}/DataTransfer:t{i}" for i in range(3)
+    ]
+
+
+def test_per_child_reads(rpc):
+    with rpc.trace_rpcs() as trace:
+        for i in range(5):
+            rpc.GetChildNamesStr(ObjectPath=f"{_INTF}/DataTransfer")
+            rpc.GetParameter(
+                ObjectPath=f"{_INTF}/DataTransfer:t{i}", Name="DisplayName"
+            )
+
+    per_child, repeated = trace.hot_spots()
+    assert per_child.kind == "per_child"
+    assert per_child.command == "GetParameter"
+    assert per_child.path == f"{_INTF}/DataTransfer"
+    assert per_child.calls == per_child.targets == 5
+    assert "get_state()" in per_child.suggestion
+    assert repeated.kind == "repeated"
+    assert repeated.command == "GetChildNamesStr"
+    assert repeated.calls == 5
+
+
+def test_per_child_writes():
+    trace = RpcTrace()
+    for i in range(4):
+        trace.record(
+            "SetState", {"ObjectPath": f"{_INTF}/DataTransfer:t{i}", "State": {}}
+        )
+    (spot,) = trace.hot_spots()
+    assert spot.kind == "per_child"
+    assert spot.calls == 4
+    assert "set_state()" in spot.suggestion
+
+
+def test_per_property_reads():
+    trace = RpcTrace()
+    for name in ("DisplayName", "SideOneParticipant", "SideTwoParticipant"):
+        trace.record("GetParameter", {"ObjectPath": _INTF, "Name": name})
+    (spot,) = trace.hot_spots()
+    assert spot.kind == "per_property"
+    assert spot.path == _INTF
+    assert spot.targets == 3
+
+
+def test_different_call_sites_are_separate():
+    trace = RpcTrace()
+    for i in range(2):
+        trace.record("GetState", {"ObjectPath": f"{_INTF}/DataTransfer:t{i}"})
+    trace.record("GetState", {"ObjectPath": f"{_INTF}/DataTransfer:t2"})
+    assert trace.hot_spots() == []
+    assert len(trace.hot_spots(min_calls=2)) == 1
+
+
+def test_commands_are_not_analyzed():
+    trace = RpcTrace()
+    for _ in range(5):
+        trace.record("Solve", {})
+    assert trace.hot_spots() == []
+
+
+def test_report_ranks_hot_spots():
+    trace = RpcTrace()
+    for i in range(3):
+        trace.record("GetState", {"ObjectPath": f"{_INTF}/DataTransfer:t{i}"})
+    for i in range(6):
+        trace.record("SetState", {"ObjectPath": f"/SystemCoupling/Library:l{i}"})
+
+    report = trace.report()
+    assert report.startswith("RPC trace: 9 calls from 2 call sites.")
+    assert report.index("6 calls") < report.index("3 calls")
+    assert "set_state() call on /SystemCoupling/Library" in report
+    assert "get_state() call on " + f"{_INTF}/DataTransfer" in report
+
+
+def test_report_without_hot_spots():
+    trace = RpcTrace()
+    trace.record("GetState", {"ObjectPath": _INTF})
+    assert trace.report() == (
+        "RPC trace: 1 calls from 1 call sites.\nNo chatty access patterns found."
+    )
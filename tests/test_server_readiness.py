@@ -0,0 +1,155 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent import futures
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc, _find_port
+from ansys.systemcoupling.core.client.grpc_transport import (
+    ConnectionType,
+    StartupAndConnectionInfo,
+)
+from ansys.systemcoupling.core.client.server_readiness import ServerReadiness
+from ansys.systemcoupling.core.client.syc_process import (
+    _LISTENING_PATTERN,
+    _OutputWatcher,
+)
+
+
+class _MockChannel:
+    """Mock channel that becomes ready on subscription if ``ready``."""
+
+    def __init__(self, ready=False):
+        self.ready = ready
+        self.closed = False
+
+    def subscribe(self, callback, try_to_connect=False):
+        if self.ready:
+            callback(grpc.ChannelConnectivity.READY)
+        else:
+            callback(grpc.ChannelConnectivity.TRANSIENT_FAILURE)
+
+    def unsubscribe(self, callback):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _after(delay, fn):
+    timer = threading.Timer(delay, fn)
+    timer.start()
+    return timer
+
+
+def test_connect_when_server_starts_late():
+    port = _find_port()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    _after(1.0, server.start)
+    info = StartupAndConnectionInfo(
+        launching=False,
+        connection_type=ConnectionType.INSECURE_REMOTE,
+        host="127.0.0.1",
+        port=port,
+    )
+    rpc = SycGrpc()
+    start = time.monotonic()
+    try:
+        rpc._connect(connection_info=info)
+        assert time.monotonic() - start < 3.0
+    finally:
+        rpc._skip_exit = True
+        rpc.exit()
+        server.stop(None)
+
+
+def test_listening_notification_reconnects():
+    first_channel = _MockChannel()
+    info = Mock()
+    info.get_server_channel.return_value = _MockChannel(ready=True)
+    readiness = ServerReadiness()
+    rpc = SycGrpc()
+    rpc._SycGrpc__channel = first_channel
+    _after(0.2, readiness.notify_listening)
+    start = time.monotonic()
+    rpc._wait_for_grpc(connection_info=info, readiness=readiness)
+    assert time.monotonic() - start < 2.0
+    assert first_channel.closed
+    info.get_server_channel.assert_called_once()
+
+
+def test_process_exit_is_checked_promptly():
+    def check_process():
+        raise RuntimeError("Process exited.")
+
+    readiness = ServerReadiness()
+    rpc = SycGrpc()
+    rpc._SycGrpc__channel = _MockChannel()
+    _after(0.2, readiness.notify_process_exited)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="Process exited."):
+        rpc._wait_for_grpc(check_process=check_process, readiness=readiness)
+    assert time.monotonic() - start < 2.0
+
+
+@pytest.mark.parametrize(
+    "line, listening",
+    [
+        ("Fake System Coupling server listening on 127.0.0.1:50051", True),
+        ("Server listening on unix:/tmp/syc.sock", True),
+        ("Not listening for connections yet", False),
+        ("Server listening on 127.0.0.1:50051 failed: address in use", False),
+        ("Warning: license server listening on port 1055 unreachable", False),
+    ],
+)
+def test_listening_pattern(line, listening):
+    assert bool(_LISTENING_PATTERN.search(line)) == listening
+
+
+def test_output_drained_after_listening():
+    # Enough output after the listening message to fill the pipe, which
+    # would block the process if it were no longer read.
+    script = (
+        "import sys\n"
+        "print('Fake System Coupling server listening on 127.0.0.1:1', flush=True)\n"
+        "for i in range(20000):\n"
+        "    print('x' * 100)\n"
+    )
+    on_listening, exited = Mock(), threading.Event()
+    watcher = _OutputWatcher(on_listening, exited.set)
+    process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+    try:
+        watcher.watch(process)
+        assert process.wait(timeout=30) == 0
+        assert exited.wait(timeout=10)
+    finally:
+        process.kill()
+    on_listening.assert_called_once()
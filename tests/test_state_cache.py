@@ -0,0 +1,161 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+from ansys.api.systemcoupling.v0 import variant_pb2
+import pytest
+
+from ansys.systemcoupling.core.adaptor.impl import syc_proxy
+from ansys.systemcoupling.core.adaptor.impl.syc_proxy import SycProxy
+from ansys.systemcoupling.core.client.grpc_client import _is_state_changing
+from ansys.systemcoupling.core.client.variant import from_variant, to_variant
+from state import StateForTesting
+
+
+class _MockRpc:
+    """Mock rpc that reports a state generation in the same way as
+    ``SycGrpc``."""
+
+    def __init__(self):
+        self.__state = StateForTesting(native_state_format=True)
+        self.state_generation = 0
+        self.query_count = 0
+
+    def GetState(self, ObjectPath):
+        self.query_count += 1
+        return self.__state.get_state(ObjectPath)
+
+    def GetParameter(self, ObjectPath, Name):
+        self.query_count += 1
+        return self.__state.get_parameter(ObjectPath, Name)
+
+    def SetState(self, ObjectPath, State):
+        self.__state.set_state(ObjectPath, State)
+        self.state_generation += 1
+
+
+@pytest.fixture
+def proxy_and_rpc():
+    rpc = _MockRpc()
+    proxy = SycProxy(rpc)
+    # Avoid metadata queries for named object key adaptation
+    proxy.get_named_object_level_map = lambda: {0: set()}
+    return proxy, rpc
+
+
+def test_repeated_queries_use_cache(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    proxy.set_state("/SystemCoupling/SolutionControl", {"TimeStepSize": "0.1"})
+    for _ in range(3):
+        assert proxy.get_state("/SystemCoupling/SolutionControl") == {
+            "TimeStepSize": "0.1"
+        }
+        assert (
+            proxy.get_property_state("/SystemCoupling/SolutionControl", "TimeStepSize")
+            == "0.1"
+        )
+    assert rpc.query_count == 2
+
+
+def test_state_change_invalidates_cache(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    path = "/SystemCoupling/SolutionControl"
+    proxy.set_state(path, {"TimeStepSize": "0.1"})
+    assert proxy.get_property_state(path, "TimeStepSize") == "0.1"
+    proxy.set_state(path, {"TimeStepSize": "0.2"})
+    assert proxy.get_property_state(path, "TimeStepSize") == "0.2"
+    assert rpc.query_count == 2
+
+
+def test_cached_state_is_not_shared(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    path = "/SystemCoupling/SolutionControl"
+    proxy.set_state(path, {"Values": [1, 2]})
+    proxy.get_property_state(path, "Values").append(3)
+    assert proxy.get_property_state(path, "Values") == [1, 2]
+
+
+def test_no_caching_while_call_in_progress(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    rpc.state_generation = None
+    proxy.get_state("/SystemCoupling")
+    proxy.get_state("/SystemCoupling")
+    assert rpc.query_count == 2
+
+
+@pytest.mark.parametrize(
+    "meta, expected",
+    [
+        ((("nosync", "True"),), False),
+        ((("nosync", "False"),), True),
+        ((), True),
+        (None, True),
+    ],
+)
+def test_is_state_changing(meta, expected):
+    assert _is_state_changing(meta) == expected
+
+
+class _LazyMockRpc(_MockRpc):
+    """Mock rpc that returns query results as lazy views when requested."""
+
+    def GetState(self, ObjectPath, lazy_result=False):
+        state = super().GetState(ObjectPath)
+        var = variant_pb2.Variant()
+        to_variant(state, var)
+        return from_variant(var, lazy=lazy_result)
+
+
+def test_lazy_get_state(monkeypatch):
+    monkeypatch.setattr(syc_proxy, "_LAZY_VIEWS_ENABLED", True)
+    rpc = _LazyMockRpc()
+    proxy = SycProxy(rpc)
+    proxy.get_named_object_level_map = lambda: {0: set()}
+    path = "/SystemCoupling/SolutionControl"
+    proxy.set_state(path, {"TimeStepSize": "0.1"})
+    state = proxy.get_state(path)
+    assert type(state) is dict
+    assert state == {"TimeStepSize": "0.1"}
+    state["TimeStepSize"] = "0.2"
+    assert proxy.get_state(path) == {"TimeStepSize": "0.1"}
+    assert rpc.query_count == 1
+
+
+def test_lazy_get_state_is_json_serializable(monkeypatch):
+    monkeypatch.setattr(syc_proxy, "_LAZY_VIEWS_ENABLED", True)
+    rpc = _LazyMockRpc()
+    proxy = SycProxy(rpc)
+    proxy.get_named_object_level_map = lambda: {0: set()}
+    path = "/SystemCoupling/SolutionControl"
+    state = {
+        "Items": [
+            {"Name": "a", "Values": [1.0, 2.0]},
+            {"Name": "b", "Mixed": [1, "x"]},
+        ],
+        "Nested": {"Labels": ["p", "q"]},
+    }
+    proxy.set_state(path, state)
+    for _ in range(2):
+        returned = proxy.get_state(path)
+        assert json.loads(json.dumps(returned)) == state
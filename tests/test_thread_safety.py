@@ -0,0 +1,205 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import pytest
+
+from ansys.systemcoupling.core.adaptor.impl.syc_proxy import SycProxy
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.session import Session
+from fake_syc_server import FakeSycServer
+
+
+class _BlockingRpc:
+    """Mock rpc with queries that block until released, reporting a state
+    generation in the same way as ``SycGrpc`` while calls are in progress."""
+
+    def __init__(self):
+        self.state_generation = None
+        self.last_state_generation = 0
+        self.release = threading.Event()
+        self.calls = []
+        self.error = None
+
+    def GetState(self, ObjectPath):
+        self.calls.append(("GetState", ObjectPath))
+        self.release.wait()
+        if self.error:
+            raise self.error
+        return {"Path": ObjectPath, "Values": [1, 2]}
+
+    def GetChildNamesStr(self, ObjectPath):
+        self.calls.append(("GetChildNamesStr", ObjectPath))
+        self.release.wait()
+        return ["One", "Two"]
+
+
+def _run_threads(n, target):
+    results = [None] * n
+    errors = []
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def proxy_and_rpc():
+    rpc = _BlockingRpc()
+    proxy = SycProxy(rpc)
+    # Avoid metadata queries for named object key adaptation
+    proxy.get_named_object_level_map = lambda: {0: set()}
+    return proxy, rpc
+
+
+def test_concurrent_identical_queries_share_call(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    threads, results, errors = _run_threads(
+        8, lambda: proxy.get_state("/SystemCoupling/SolutionControl")
+    )
+    _wait_for(lambda: rpc.calls)
+    # Give the other threads time to join the call in progress.
+    time.sleep(0.1)
+    rpc.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert rpc.calls == [("GetState", "/SystemCoupling/SolutionControl")]
+    assert all(r == results[0] for r in results)
+    # Each thread gets its own copy of the result.
+    results[0]["Values"].append(3)
+    assert results[1]["Values"] == [1, 2]
+
+
+def test_different_queries_are_not_shared(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    rpc.release.set()
+    threads, results, errors = _run_threads(
+        2, lambda: proxy.get_object_names("/SystemCoupling/CouplingParticipant")
+    )
+    proxy.get_state("/SystemCoupling")
+    for thread in threads:
+        thread.join()
+    assert ("GetState", "/SystemCoupling") in rpc.calls
+    assert results == [["One", "Two"], ["One", "Two"]]
+
+
+def test_query_after_state_change_is_not_shared(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    path = "/SystemCoupling/CouplingParticipant"
+    threads, _, _ = _run_threads(1, lambda: proxy.get_object_names(path))
+    _wait_for(lambda: rpc.calls)
+    # A state changing call completes before the next query is made, so the
+    # query in progress might not reflect it.
+    rpc.last_state_generation += 1
+    more_threads, _, _ = _run_threads(1, lambda: proxy.get_object_names(path))
+    _wait_for(lambda: len(rpc.calls) == 2)
+    rpc.release.set()
+    for thread in threads + more_threads:
+        thread.join()
+
+
+def test_error_is_shared(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    rpc.error = RuntimeError("query failed")
+    threads, _, errors = _run_threads(4, lambda: proxy.get_state("/SystemCoupling"))
+    _wait_for(lambda: rpc.calls)
+    time.sleep(0.1)
+    rpc.release.set()
+    for thread in threads:
+        thread.join()
+    assert len(rpc.calls) == 1
+    assert [str(e) for e in errors] == ["query failed"] * 4
+
+
+def test_no_sharing_without_generation(proxy_and_rpc):
+    proxy, rpc = proxy_and_rpc
+    rpc.last_state_generation = None
+    threads, _, errors = _run_threads(2, lambda: proxy.get_state("/SystemCoupling"))
+    _wait_for(lambda: len(rpc.calls) == 2)
+    rpc.release.set()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+@pytest.fixture
+def session():
+    with FakeSycServer() as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        session = Session(rpc)
+        yield session
+        session.exit()
+
+
+def test_shared_session(session):
+    threads, roots, errors = _run_threads(8, lambda: session.setup)
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert all(root is roots[0] for root in roots)
+
+    participants = session.setup.coupling_participant
+    stop = threading.Event()
+
+    def monitor():
+        seen = set()
+        while not stop.is_set():
+            for name, participant in participants.items():
+                assert participant.obj_name == name
+                seen.add(name)
+        return seen
+
+    monitors, seen, errors = _run_threads(4, monitor)
+    names = [
+        session.setup.add_participant(participant_type="DEFAULT", input_file="a.scp")
+        for _ in range(10)
+    ]
+    time.sleep(0.1)
+    stop.set()
+    for thread in monitors:
+        thread.join()
+    assert not errors
+    assert all(s <= set(names) for s in seen)
+    assert list(participants) == names
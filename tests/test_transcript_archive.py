@@ -0,0 +1,197 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+import pytest
+
+from ansys.systemcoupling.core.client.grpc_client import SycGrpc
+from ansys.systemcoupling.core.client.grpc_transport import ConnectionType
+from ansys.systemcoupling.core.client.output_pipeline import OutputPipeline
+from ansys.systemcoupling.core.client.transcript_archive import (
+    TranscriptArchive,
+    TranscriptArchiveSink,
+)
+from fake_syc_server import FakeSycServer, FakeSystemCoupling
+
+
+def _transcript(steps, iterations_per_step):
+    lines = ["Header"]
+    iteration = 0
+    for step in range(1, steps + 1):
+        lines.append(f"| COUPLING STEP = {step}   SIMULATION TIME = {step * 0.1:g} |")
+        for _ in range(iterations_per_step):
+            iteration += 1
+            lines.append(f"| COUPLING ITERATION = {iteration} |")
+            lines.extend(
+                f"step {step} iteration {iteration} line {k}" for k in range(3)
+            )
+    lines.append("Footer")
+    return lines
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / "transcript.sta")
+
+
+def _write(path, lines, block_size=200, batch_size=7):
+    sink = TranscriptArchiveSink(path, block_size=block_size)
+    for i in range(0, len(lines), batch_size):
+        sink(lines[i : i + batch_size])
+    sink.close()
+
+
+def test_read_all(archive_path):
+    lines = _transcript(5, 2)
+    _write(archive_path, lines)
+    with TranscriptArchive(archive_path) as archive:
+        assert archive.line_count == len(lines)
+        assert archive.read_lines() == lines
+        assert archive.read_lines(3, 10) == lines[3:10]
+        assert archive.steps == [1, 2, 3, 4, 5]
+        assert archive.iterations == list(range(1, 11))
+
+
+def test_read_steps(archive_path):
+    lines = _transcript(20, 2)
+    _write(archive_path, lines)
+    with TranscriptArchive(archive_path) as archive:
+        step_lines = archive.read_steps(12, 13)
+        assert step_lines[0].startswith("| COUPLING STEP = 12 ")
+        assert step_lines[-1] == "step 13 iteration 26 line 2"
+        assert len(step_lines) == 2 * 9
+        assert archive.read_steps(20)[-1] == "Footer"
+        assert archive.read_steps(21) == []
+
+
+def test_read_iterations(archive_path):
+    lines = _transcript(4, 3)
+    _write(archive_path, lines)
+    with TranscriptArchive(archive_path) as archive:
+        # The last iteration of a step ends at the next step.
+        assert archive.read_iterations(3) == [
+            "| COUPLING ITERATION = 3 |",
+            "step 1 iteration 3 line 0",
+            "step 1 iteration 3 line 1",
+            "step 1 iteration 3 line 2",
+        ]
+        spanning = archive.read_iterations(3, 4)
+        assert "| COUPLING STEP = 2   SIMULATION TIME = 0.2 |" in spanning
+        assert spanning[-1] == "step 2 iteration 4 line 2"
+
+
+def test_reads_only_needed_blocks(archive_path, monkeypatch):
+    lines = _transcript(100, 2)
+    _write(archive_path, lines, block_size=1000)
+    with TranscriptArchive(archive_path) as archive:
+        decompressed = []
+        read_block = archive._read_block
+        monkeypatch.setattr(
+            archive,
+            "_read_block",
+            lambda offset, size: decompressed.append(offset)
+            or read_block(offset, size),
+        )
+        assert archive.read_steps(50)[0].startswith("| COUPLING STEP = 50 ")
+        assert 1 <= len(decompressed) <= 2
+
+
+def test_read_while_writing(archive_path):
+    sink = TranscriptArchiveSink(archive_path, block_size=100)
+    lines = _transcript(3, 1)
+    sink(lines[:5])
+    sink.flush()
+    with TranscriptArchive(archive_path) as archive:
+        assert archive.read_lines() == lines[:5]
+        sink(lines[5:])
+        sink.close()
+        archive.refresh()
+        assert archive.read_lines() == lines
+        assert archive.steps == [1, 2, 3]
+
+
+def test_invalid_pattern(archive_path):
+    with pytest.raises(ValueError, match="one capturing group"):
+        TranscriptArchiveSink(archive_path, step_pattern="STEP")
+
+
+def test_not_an_archive(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_text("text")
+    with pytest.raises(ValueError, match="not a transcript archive"):
+        TranscriptArchive(str(path))
+
+
+def test_pipeline_closes_sink(archive_path):
+    pipeline = OutputPipeline(TranscriptArchiveSink(archive_path), batch=True)
+    pipeline.put_text("Coupling step 1\nCoupling iteration 1\ntext")
+    pipeline.close()
+    with TranscriptArchive(archive_path) as archive:
+        assert archive.read_steps(1) == [
+            "Coupling step 1",
+            "Coupling iteration 1",
+            "text",
+        ]
+
+
+class _WatchedSink(TranscriptArchiveSink):
+    def __init__(self, path):
+        super().__init__(path)
+        self.completed = threading.Event()
+
+    def __call__(self, lines):
+        super().__call__(lines)
+        if "Coupled analysis completed" in lines:
+            self.completed.set()
+
+
+def test_session_output(archive_path):
+    with FakeSycServer(FakeSystemCoupling()) as server:
+        port = server.listen("127.0.0.1:0")
+        server.start()
+        rpc = SycGrpc()
+        rpc.connect("127.0.0.1", port, ConnectionType.INSECURE_LOCAL)
+        try:
+            rpc.SetState(
+                ObjectPath="/SystemCoupling/AnalysisControl",
+                State={"AnalysisType": "Transient"},
+            )
+            rpc.SetState(
+                ObjectPath="/SystemCoupling/SolutionControl",
+                State={"NumberOfSteps": 3, "MaximumIterations": 2},
+            )
+            sink = _WatchedSink(archive_path)
+            rpc.start_output(sink, batch=True)
+            rpc.solve()
+            assert sink.completed.wait(5)
+        finally:
+            rpc.exit()
+
+    with TranscriptArchive(archive_path) as archive:
+        assert archive.steps == [1, 2, 3]
+        assert archive.read_steps(2) == [
+            "Coupling step 2, time 2",
+            "Coupling iteration 3",
+            "Coupling iteration 4",
+        ]
@@ -0,0 +1,205 @@
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import copy
+
+from ansys.api.systemcoupling.v0 import variant_pb2
+import numpy as np
+import pytest
+
+from ansys.systemcoupling.core.client.variant import (
+    VariantListView,
+    VariantMapView,
+    from_variant,
+    to_variant,
+)
+
+
+def _round_trip(val, **kwargs):
+    var = variant_pb2.Variant()
+    to_variant(val, var)
+    return var, from_variant(var, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "val",
+    [
+        None,
+        True,
+        42,
+        1.5,
+        "text",
+        [],
+        {},
+        [1, "a", None, 2.5, False],
+        [1, True],
+        {"a": {"b": [1, 2, {"c": None}], "d": []}, "e": {}},
+        [[1.0, 2.0], [3.0, 4.0]],
+    ],
+)
+def test_round_trip(val):
+    _, result = _round_trip(val)
+    assert result == val
+    if isinstance(val, list):
+        assert [type(v) for v in result] == [type(v) for v in val]
+
+
+@pytest.mark.parametrize(
+    "val, field",
+    [
+        ([1, 2, 3], "int64_vector_state"),
+        ([1.0, 2.5], "double_vector_state"),
+        ([True, False], "bool_vector_state"),
+        (["a", "b"], "string_vector_state"),
+        ((1, 2), "int64_vector_state"),
+        ([1, 2.0], "variant_vector_state"),
+        ([1, True], "variant_vector_state"),
+    ],
+)
+def test_homogeneous_lists_packed(val, field):
+    var, result = _round_trip(val)
+    assert var.WhichOneof("as") == field
+    assert result == list(val)
+
+
+def test_deep_nesting():
+    depth = 5000
+    val = [1]
+    for _ in range(depth):
+        val = [val]
+    _, result = _round_trip(val)
+    for _ in range(depth):
+        assert len(result) == 1
+        result = result[0]
+    assert result == [1]
+
+
+def test_tuple_decodes_as_list():
+    _, result = _round_trip({"a": (1, "b")})
+    assert result == {"a": [1, "b"]}
+
+
+def test_convert_key():
+    var = variant_pb2.Variant()
+    to_variant({"a": {"b": 1}}, var, convert_key=str.upper)
+    assert set(var.variant_map_state.item) == {"A"}
+    assert from_variant(var, convert_key=str.lower) == {"a": {"b": 1}}
+
+
+def test_numpy_input():
+    var, result = _round_trip(
+        {
+            "real": np.linspace(0.0, 1.0, 5),
+            "int": np.arange(3, dtype=np.int32),
+            "table": np.arange(6.0).reshape(3, 2),
+            "scalar": np.float32(0.5),
+            "strings": np.array(["x", "y"]),
+        }
+    )
+    item = var.variant_map_state.item
+    assert item["real"].WhichOneof("as") == "double_vector_state"
+    assert item["int"].WhichOneof("as") == "int64_vector_state"
+    assert result == {
+        "real": [0.0, 0.25, 0.5, 0.75, 1.0],
+        "int": [0, 1, 2],
+        "table": [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]],
+        "scalar": 0.5,
+        "strings": ["x", "y"],
+    }
+
+
+def test_numpy_output():
+    _, result = _round_trip({"real": [0.5, 1.5], "names": ["a"]}, as_numpy=True)
+    assert isinstance(result["real"], np.ndarray)
+    assert result["real"].tolist() == [0.5, 1.5]
+    assert result["names"] == ["a"]
+
+
+def _lazy(val, **kwargs):
+    var = variant_pb2.Variant()
+    to_variant(val, var)
+    return from_variant(var, lazy=True, **kwargs)
+
+
+def test_lazy_views():
+    val = {
+        "a": {"b": [1, "x", {"c": None}], "d": []},
+        "reals": [0.5, 1.5],
+        "s": "text",
+    }
+    view = _lazy(val)
+    assert isinstance(view, VariantMapView)
+    assert isinstance(view["a"]["b"], VariantListView)
+    assert view["a"] is view["a"]
+    assert len(view) == 3
+    assert set(view) == {"a", "reals", "s"}
+    assert view["reals"][-1] == 1.5
+    assert view["a"]["b"][1:] == ["x", {"c": None}]
+    assert view == val
+    assert "missing" not in view
+    with pytest.raises(KeyError):
+        view["missing"]
+    assert len(view) == 3
+
+
+def test_lazy_list_equality_matches_list():
+    view = _lazy({"a": [1, {"b": 2}]})["a"]
+    assert view == [1, {"b": 2}]
+    assert view == _lazy({"a": [1, {"b": 2}]})["a"]
+    assert view != (1, {"b": 2})
+    assert ([1, {"b": 2}] == (1, {"b": 2})) == (view == (1, {"b": 2}))
+
+
+def test_lazy_views_read_only():
+    view = _lazy({"a": [1, 2]})
+    with pytest.raises(TypeError):
+        view["a"] = 1
+    with pytest.raises(TypeError):
+        view["a"][0] = 1
+
+
+def test_lazy_views_copy():
+    val = {"a": {"b": [1, {"c": 2}]}}
+    view = _lazy(val)
+    shallow = copy.copy(view)
+    assert type(shallow) is dict
+    assert isinstance(shallow["a"], VariantMapView)
+    deep = copy.deepcopy(view)
+    assert deep == val
+    assert type(deep["a"]) is dict
+    assert type(deep["a"]["b"]) is list
+    assert copy.copy(view["a"]["b"]) == [1, {"c": 2}]
+
+
+def test_lazy_views_convert_key():
+    var = variant_pb2.Variant()
+    to_variant({"a": {"b": 1}}, var, convert_key=str.upper)
+    view = from_variant(var, convert_key=str.lower, lazy=True)
+    assert list(view) == ["a"]
+    assert view["a"]["b"] == 1
+    assert "A" not in view
+
+
+def test_lazy_scalar():
+    assert _lazy(3) == 3
+    assert _lazy(None) is None